@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark for linux-armoury-cli cold start
+
+Runs `python -X importtime` on the CLI module in fresh interpreters and
+reports the slowest imports, plus the wall-clock time of `--version` and
+`--list`. With --budget the script exits non-zero when the import time of
+linux_armoury.cli goes over the budget, so it can gate CI.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_cli_startup.py [--runs N] [--budget MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+MODULE = "linux_armoury.cli"
+
+
+def import_times(module: str = MODULE) -> Dict[str, Tuple[float, float]]:
+    """Self and cumulative import time in ms per module, from one cold start"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return times
+
+
+def cold_start_ms(runs: int) -> Tuple[float, Dict[str, Tuple[float, float]]]:
+    """Best cumulative import time of the CLI over several cold starts"""
+    best = None
+    best_times: Dict[str, Tuple[float, float]] = {}
+    for _ in range(runs):
+        times = import_times()
+        total = times[MODULE][1]
+        if best is None or total < best:
+            best, best_times = total, times
+    return best, best_times
+
+
+def command_ms(args: List[str], runs: int) -> float:
+    """Best wall-clock time of a CLI invocation, interpreter start included"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", MODULE, *args],
+            stdout=subprocess.DEVNULL,
+            env=env,
+            check=True,
+        )
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    parser.add_argument(
+        "--budget", type=float, help="fail if importing the CLI takes longer (ms)"
+    )
+    args = parser.parse_args()
+
+    total, times = cold_start_ms(args.runs)
+    print(f"import {MODULE}: {total:.1f} ms (best of {args.runs})")
+    slowest = sorted(times.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_ms, cumulative_ms) in slowest[:8]:
+        print(f"  {self_ms:7.1f} ms self {cumulative_ms:7.1f} ms total  {name}")
+
+    for command in (["--version"], ["--list"]):
+        elapsed = command_ms(command, args.runs)
+        print(f"linux-armoury-cli {command[0]}: {elapsed:.1f} ms wall clock")
+
+    if args.budget is not None and total > args.budget:
+        print(f"FAIL: cold start {total:.1f} ms is over budget ({args.budget:.0f} ms)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
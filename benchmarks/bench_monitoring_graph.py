@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the monitoring graph renderer
+
+Compares the previous full-redraw update (new fill_between every sample,
+draw_idle of the whole figure) with the blitting GraphRenderer, headless
+on the Agg backend.
+
+Usage:
+    PYTHONPATH=src python3 benchmarks/bench_monitoring_graph.py [updates]
+"""
+
+import sys
+import time
+from collections import deque
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from linux_armoury.widgets.graph_base import GraphBuffer
+from linux_armoury.widgets.monitoring_graph import GraphRenderer, create_graph_figure
+
+MAX_POINTS = 60
+
+
+def samples(count: int) -> np.ndarray:
+    """Deterministic load-like values in 0-100"""
+    rng = np.random.default_rng(42)
+    return np.clip(50 + np.cumsum(rng.normal(0, 5, count)), 0, 100)
+
+
+def bench_full_redraw(values: np.ndarray) -> float:
+    """Seconds taken by the previous update_data() drawing path"""
+    fig, ax = create_graph_figure(MAX_POINTS, "%", 0, 100)
+    canvas = FigureCanvasAgg(fig)
+    (line,) = ax.plot([], [], color="#ff0066", linewidth=2)
+    data = deque([0] * MAX_POINTS, maxlen=MAX_POINTS)
+    fill = None
+    canvas.draw()
+
+    start = time.perf_counter()
+    for value in values:
+        data.append(value)
+        x = np.arange(len(data))
+        y = list(data)
+        line.set_data(x, y)
+        if fill:
+            fill.remove()
+        fill = ax.fill_between(x, y, 0, alpha=0.3, color="#ff0066")
+        valid = [d for d in data if d > 0]
+        if valid:
+            min(valid), sum(valid) / len(valid), max(valid)
+        canvas.draw_idle()
+    return time.perf_counter() - start
+
+
+def bench_blit(values: np.ndarray) -> float:
+    """Seconds taken by GraphBuffer + GraphRenderer"""
+    fig, ax = create_graph_figure(MAX_POINTS, "%", 0, 100)
+    canvas = FigureCanvasAgg(fig)
+    buffer = GraphBuffer(MAX_POINTS)
+    renderer = GraphRenderer(fig, ax, buffer, "#ff0066")
+    canvas.draw()
+
+    start = time.perf_counter()
+    for value in values:
+        buffer.push(value)
+        renderer.render()
+        buffer.stats()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    values = samples(count)
+    print(f"{count} updates, {MAX_POINTS}-point window (Agg backend)")
+    for name, bench in (("full redraw", bench_full_redraw), ("blit", bench_blit)):
+        elapsed = bench(values)
+        print(
+            f"  {name:<12} {count / elapsed:8.1f} frames/s "
+            f"{elapsed / count * 1000:7.2f} ms/update"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,14 @@ __version__ = "0.6.2"
 __author__ = "th3cavalry"
 
 from .config import Config
-from .system_utils import DisplayBackend, SystemUtils
 
 __all__ = ["Config", "SystemUtils", "DisplayBackend", "__version__", "__author__"]
+
+
+def __getattr__(name):
+    # system_utils is slow to import; the CLI and GUI load it only when needed
+    if name in ("SystemUtils", "DisplayBackend"):
+        from . import system_utils
+
+        return getattr(system_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
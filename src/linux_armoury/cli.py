@@ -14,50 +14,25 @@ License: GPL-3.0
 """
 
 import argparse
+import importlib
 import subprocess
 import sys
 
 from .config import Config
-from .system_utils import SystemUtils
 
-# typing imports not required here
+# Hardware modules are imported by the subcommands that need them, so
+# --list, --version and --help never load (or probe) any hardware
 
+# Preset names for argparse; apply_tdp_preset checks them against TDP_PRESETS
+TDP_PRESET_NAMES = ["silent", "balanced", "performance", "turbo"]
 
-# Optional new feature modules
-try:
-    from .modules.battery_control import get_battery_controller
 
-    HAS_BATTERY_CONTROL = True
-except ImportError:
-    HAS_BATTERY_CONTROL = False
-
-try:
-    from .modules.fan_control import get_fan_controller
-
-    HAS_FAN_CONTROL = True
-except ImportError:
-    HAS_FAN_CONTROL = False
-
-try:
-    from .modules.keyboard_control import get_keyboard_controller
-
-    HAS_KEYBOARD_CONTROL = True
-except ImportError:
-    HAS_KEYBOARD_CONTROL = False
-
-try:
-    from .modules.hardware_detection import HardwareFeature, detect_hardware
-
-    HAS_HARDWARE_DETECTION = True
-except ImportError:
-    HAS_HARDWARE_DETECTION = False
-
-try:
-    from .modules.overclocking_control import TDP_PRESETS, OverclockingController
-
-    HAS_OVERCLOCKING = True
-except ImportError:
-    HAS_OVERCLOCKING = False
+def _feature(module: str):
+    """Import an optional feature module, None if it isn't installed"""
+    try:
+        return importlib.import_module(f"{__package__}.modules.{module}")
+    except ImportError:
+        return None
 
 
 class LinuxArmouryCLI:
@@ -238,16 +213,7 @@ https://github.com/th3cavalry/Linux-Armoury
         parser.add_argument(
             "--tdp",
             type=str,
-            choices=(
-                list(TDP_PRESETS.keys())
-                if HAS_OVERCLOCKING
-                else [
-                    "silent",
-                    "balanced",
-                    "performance",
-                    "turbo",
-                ]
-            ),
+            choices=TDP_PRESET_NAMES,
             metavar="PRESET",
             help="Apply TDP preset (requires RyzenAdj)",
         )
@@ -294,6 +260,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def apply_profile(self, profile: str) -> bool:
         """Apply a power profile"""
+        from .system_utils import SystemUtils
+
         # Try to get profile info if available in config, but don't fail if not
         profile_info = Config.POWER_PROFILES.get(profile)
         if profile_info:
@@ -335,6 +303,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_refresh_rate(self, rate: int) -> bool:
         """Set display refresh rate"""
+        from .system_utils import SystemUtils
+
         print(f"[*] Setting refresh rate to {rate}Hz...")
 
         try:
@@ -353,6 +323,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_status(self):
         """Show current system status"""
+        from .system_utils import SystemUtils
+
         print("=" * 60)
         print(f"  {Config.APP_NAME} v{Config.VERSION} - System Status")
         print("=" * 60)
@@ -401,6 +373,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_temperature(self):
         """Show temperature readings"""
+        from .system_utils import SystemUtils
+
         cpu_temp = SystemUtils.get_cpu_temperature()
         gpu_temp = SystemUtils.get_gpu_temperature()
 
@@ -427,6 +401,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_battery(self):
         """Show battery information"""
+        from .system_utils import SystemUtils
+
         battery = SystemUtils.get_battery_percentage()
         on_ac = SystemUtils.is_on_ac_power()
 
@@ -474,21 +450,46 @@ https://github.com/th3cavalry/Linux-Armoury
         """Monitor system in real-time"""
         import time
 
+        from .modules.process_index import get_process_index
+        from .system_utils import SystemUtils
+
         print("\n🔍 Real-time System Monitoring")
         print("   Press Ctrl+C to exit\n")
         print("-" * 60)
 
+        # Follow process events when permitted (root) instead of rescanning /proc
+        get_process_index().start_listener()
+
+        # Hardware is read by the shared sampler; this loop only renders frames
+        sampler_module = _feature("sampler")
+        sampler = sampler_module.get_sampler() if sampler_module else None
+        if sampler:
+            sampler.acquire()
+        last_seq = 0
+        interval = Config.MONITOR_INTERVAL / 1000
+
         try:
             iteration = 0
             while True:
+                # Get current stats
+                if sampler:
+                    frame = sampler.wait_for_frame(last_seq, timeout=interval * 2)
+                    if frame is None:
+                        continue
+                    last_seq = frame.seq
+                    cpu_temp = frame.cpu_temp
+                    gpu_temp = frame.gpu_temp
+                    battery = frame.battery_percent
+                    on_ac = frame.on_ac if frame.on_ac is not None else True
+                else:
+                    cpu_temp = SystemUtils.get_cpu_temperature()
+                    gpu_temp = SystemUtils.get_gpu_temperature()
+                    battery = SystemUtils.get_battery_percentage()
+                    on_ac = SystemUtils.is_on_ac_power()
+
                 # Clear previous lines (simple version)
                 print("\r" + " " * 80, end="")
 
-                # Get current stats
-                cpu_temp = SystemUtils.get_cpu_temperature()
-                gpu_temp = SystemUtils.get_gpu_temperature()
-                battery = SystemUtils.get_battery_percentage()
-                on_ac = SystemUtils.is_on_ac_power()
                 refresh = SystemUtils.get_current_refresh_rate()
                 gaming = SystemUtils.detect_gaming_apps()
 
@@ -521,10 +522,20 @@ https://github.com/th3cavalry/Linux-Armoury
                     print("\r" + " | ".join(stats), end="", flush=True)
 
                 iteration += 1
-                time.sleep(2)
+                if not sampler:
+                    time.sleep(interval)
 
         except KeyboardInterrupt:
             print("\n\n✓ Monitoring stopped")
+            if sampler:
+                stats = sampler.stats()
+                print(
+                    f"   Sampler: {stats.wakeups} wakeups, "
+                    f"{stats.cpu_time_s:.2f}s CPU time"
+                )
+        finally:
+            if sampler:
+                sampler.release()
 
     def launch_gui(self):
         """Launch the graphical interface"""
@@ -537,6 +548,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def detect_hardware(self):
         """Detect and display laptop hardware information"""
+        from .system_utils import SystemUtils
+
         print("\n🔍 Hardware Detection")
         print("=" * 70)
 
@@ -620,11 +633,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_charge_limit(self, limit: int):
         """Set battery charge limit"""
-        if not HAS_BATTERY_CONTROL:
+        battery = _feature("battery_control")
+        if battery is None:
             print("✗ Battery control module not available")
             return False
 
-        battery = get_battery_controller()
+        battery = battery.get_battery_controller()
         if not battery.is_supported():
             print("✗ Battery charge limit control not supported on this system")
             return False
@@ -641,11 +655,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_fan_info(self):
         """Show fan speeds and temperatures"""
-        if not HAS_FAN_CONTROL:
+        fan = _feature("fan_control")
+        if fan is None:
             print("✗ Fan control module not available")
             return
 
-        fan = get_fan_controller()
+        fan = fan.get_fan_controller()
 
         print("\n🌡️  Cooling Information")
         print("=" * 50)
@@ -686,11 +701,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_keyboard_brightness(self, level: int):
         """Set keyboard backlight brightness"""
-        if not HAS_KEYBOARD_CONTROL:
+        keyboard = _feature("keyboard_control")
+        if keyboard is None:
             print("✗ Keyboard control module not available")
             return False
 
-        kbd = get_keyboard_controller()
+        kbd = keyboard.get_keyboard_controller()
         if not kbd.is_supported():
             print("✗ Keyboard backlight not supported on this system")
             return False
@@ -712,11 +728,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_keyboard_color(self, color: str):
         """Set keyboard RGB color"""
-        if not HAS_KEYBOARD_CONTROL:
+        keyboard = _feature("keyboard_control")
+        if keyboard is None:
             print("✗ Keyboard control module not available")
             return False
 
-        kbd = get_keyboard_controller()
+        kbd = keyboard.get_keyboard_controller()
         if not kbd.has_rgb():
             print("✗ RGB keyboard control not supported on this system")
             return False
@@ -733,6 +750,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_srgb_clamp(self, state: str):
         """Enable, disable, or toggle sRGB gamut clamp"""
+        from .system_utils import SystemUtils
+
         if state == "toggle":
             success, message = SystemUtils.toggle_srgb_clamp()
         else:
@@ -746,6 +765,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_color_profile(self, profile: str):
         """Set color profile"""
+        from .system_utils import SystemUtils
+
         print(f"Setting color profile to {profile}...")
         success, message = SystemUtils.set_color_profile(profile)
 
@@ -756,6 +777,8 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_color_settings(self):
         """Show current display color settings"""
+        from .system_utils import SystemUtils
+
         print("\n🎨 Display Color Settings")
         print("=" * 50)
 
@@ -770,11 +793,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_cpu_governor(self, governor: str):
         """Set CPU governor"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         available = oc.get_available_governors()
 
         if governor not in available:
@@ -789,11 +813,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_turbo_boost(self, enabled: bool):
         """Enable or disable turbo boost"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         if oc.set_turbo_boost(enabled):
             print(f"✓ Turbo Boost {'enabled' if enabled else 'disabled'}")
         else:
@@ -801,21 +826,23 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def apply_tdp_preset(self, preset_name: str):
         """Apply a TDP preset"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         if not oc.ryzenadj_available:
             print("✗ RyzenAdj not available")
             return
 
-        if preset_name not in TDP_PRESETS:
+        presets = overclocking.TDP_PRESETS
+        if preset_name not in presets:
             print(f"✗ Unknown preset '{preset_name}'")
-            print(f"  Available: {', '.join(TDP_PRESETS.keys())}")
+            print(f"  Available: {', '.join(presets.keys())}")
             return
 
-        preset = TDP_PRESETS[preset_name]
+        preset = presets[preset_name]
         if oc.set_ryzenadj_tdp(
             stapm_limit=preset["stapm"],
             fast_limit=preset["fast"],
@@ -830,11 +857,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def apply_custom_tdp(self, tdp_string: str):
         """Apply custom TDP values (STAPM,FAST,SLOW)"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         if not oc.ryzenadj_available:
             print("✗ RyzenAdj not available")
             return
@@ -858,11 +886,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def set_gpu_perf_level(self, level: str):
         """Set AMD GPU performance level"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         if not oc.amd_gpu_path:
             print("✗ AMD GPU not detected")
             return
@@ -874,11 +903,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_cpu_info(self):
         """Display CPU information"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         info = oc.get_cpu_info()
 
         print("\n🔧 CPU Information")
@@ -909,11 +939,12 @@ https://github.com/th3cavalry/Linux-Armoury
 
     def show_gpu_info(self):
         """Display AMD GPU information"""
-        if not HAS_OVERCLOCKING:
+        overclocking = _feature("overclocking_control")
+        if overclocking is None:
             print("✗ Overclocking module not available")
             return
 
-        oc = OverclockingController()
+        oc = overclocking.get_overclocking_controller()
         if not oc.amd_gpu_path:
             print("✗ AMD GPU not detected")
             return
@@ -947,8 +978,10 @@ https://github.com/th3cavalry/Linux-Armoury
         print("\n🔧 Hardware Capabilities")
         print("=" * 50)
 
-        if HAS_HARDWARE_DETECTION:
-            caps = detect_hardware()
+        hardware_detection = _feature("hardware_detection")
+        if hardware_detection:
+            HardwareFeature = hardware_detection.HardwareFeature
+            caps = hardware_detection.detect_hardware()
             print("\n  System Information:")
             print(f"    ASUS Laptop: {'Yes ✓' if caps.is_asus_laptop else 'No'}")
             print(f"    Model: {caps.laptop_model or 'Unknown'}")
@@ -983,18 +1016,23 @@ https://github.com/th3cavalry/Linux-Armoury
 
         # Check available control modules
         print("\n  Control Modules:")
-        bat_status = "✓ Available" if HAS_BATTERY_CONTROL else "✗ Not installed"
-        fan_status = "✓ Available" if HAS_FAN_CONTROL else "✗ Not installed"
-        kbd_status = "✓ Available" if HAS_KEYBOARD_CONTROL else "✗ Not installed"
-        oc_status = "✓ Available" if HAS_OVERCLOCKING else "✗ Not installed"
+
+        def installed(module):
+            return "✓ Available" if module else "✗ Not installed"
+
+        overclocking = _feature("overclocking_control")
+        bat_status = installed(_feature("battery_control"))
+        fan_status = installed(_feature("fan_control"))
+        kbd_status = installed(_feature("keyboard_control"))
+        oc_status = installed(overclocking)
         print(f"    Battery Control: {bat_status}")
         print(f"    Fan Control: {fan_status}")
         print(f"    Keyboard Control: {kbd_status}")
         print(f"    Overclocking: {oc_status}")
 
         # Show overclocking tools if module available
-        if HAS_OVERCLOCKING:
-            oc = OverclockingController()
+        if overclocking:
+            oc = overclocking.get_overclocking_controller()
             print("\n  Overclocking Tools:")
             cpupower_status = (
                 "✓ Available" if oc.cpupower_available else "✗ Not installed"
@@ -112,9 +112,19 @@ class Config:
     CMD_XRANDR = "xrandr"
     CMD_PKEXEC = "pkexec"
 
+    # D-Bus service (also the privileged helper for batched sysfs writes)
+    DBUS_NAME = "com.github.th3cavalry.LinuxArmoury"
+    DBUS_PATH = "/com/github/th3cavalry/LinuxArmoury"
+    DBUS_INTERFACE = "com.github.th3cavalry.LinuxArmoury"
+
     # Timeouts
     COMMAND_TIMEOUT = 10  # seconds
     MONITOR_INTERVAL = 2000  # milliseconds
+    MONITOR_HISTORY = 60  # samples kept in the shared telemetry ring
+    LOW_POWER_WAKEUP_BUDGET = 6  # sampler wakeups per minute, hidden on battery
+
+    # Dashboard graphs: "sparkline" (Tk canvas) or "matplotlib"
+    GRAPH_BACKEND = "sparkline"
 
     # Help URLs
     HELP_MODEL_SCRIPTS = (
@@ -26,4 +26,6 @@ class ConfigManager:
             "fan_curve": "Balanced",
             "window_size": [1000, 650],
             "startup_section": "Dashboard",
+            "low_power_wakeup_budget": 6,
+            "graph_backend": "sparkline",
         }
@@ -68,6 +68,16 @@ class LinuxArmouryClient:
         except dbus.exceptions.DBusException:
             return None
 
+    def get_telemetry_path(self) -> Optional[str]:
+        """Get the shared-memory telemetry segment path from the service"""
+        if not self._connect():
+            return None
+
+        try:
+            return str(self._interface.GetTelemetryPath()) or None
+        except dbus.exceptions.DBusException:
+            return None
+
     def get_version(self) -> Optional[str]:
         """Get service version"""
         if not self._connect():
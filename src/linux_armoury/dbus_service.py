@@ -6,20 +6,29 @@ Provides a D-Bus interface for privileged operations
 This service runs as root and handles:
 - TDP/power profile changes
 - System configuration that requires elevated privileges
+- Batched, whitelisted sysfs writes and commands for unprivileged clients
 """
 
-import os
+import threading
 
 import dbus
 import dbus.mainloop.glib
 import dbus.service
 from gi.repository import GLib
 
+from .config import Config
+from .modules.privileged_helper import (
+    PolkitAuthorizer,
+    SysfsWriter,
+    run_command,
+)
+from .modules.sampler import get_sampler
+from .modules.telemetry_shm import TelemetryExporter
 from .system_utils import SystemUtils
 
-DBUS_NAME = "com.github.th3cavalry.LinuxArmoury"
-DBUS_PATH = "/com/github/th3cavalry/LinuxArmoury"
-DBUS_INTERFACE = "com.github.th3cavalry.LinuxArmoury"
+DBUS_NAME = Config.DBUS_NAME
+DBUS_PATH = Config.DBUS_PATH
+DBUS_INTERFACE = Config.DBUS_INTERFACE
 
 
 class LinuxArmouryService(dbus.service.Object):
@@ -45,6 +54,20 @@ class LinuxArmouryService(dbus.service.Object):
         dbus.service.Object.__init__(self, bus_name, DBUS_PATH)
         print(f"Linux Armoury D-Bus service started on {DBUS_NAME}")
 
+        # Privileged helper: one polkit check per client connection
+        self.sysfs_writer = SysfsWriter()
+        self.authorizer = PolkitAuthorizer(bus)
+        bus.add_signal_receiver(
+            self._on_name_owner_changed,
+            signal_name="NameOwnerChanged",
+            dbus_interface="org.freedesktop.DBus",
+        )
+
+        # Shared-memory telemetry for high-rate readers (overlays, bars)
+        self.telemetry = TelemetryExporter()
+        if self.telemetry.start():
+            print(f"Publishing telemetry at {self.telemetry.path}")
+
     @dbus.service.method(DBUS_INTERFACE, in_signature="s", out_signature="bs")
     def SetPowerProfile(self, profile):
         """Set the power profile"""
@@ -67,33 +90,95 @@ class LinuxArmouryService(dbus.service.Object):
         """Get current system status"""
         status = {}
 
-        # Read CPU temperature
+        # Served from the shared sampler; a fresh tick is only taken when
+        # no other consumer has sampled within the last interval
         try:
-            for path in [
-                "/sys/class/thermal/thermal_zone0/temp",
-                "/sys/class/hwmon/hwmon0/temp1_input",
-            ]:
-                if os.path.exists(path):
-                    with open(path, "r") as f:
-                        temp = int(f.read().strip()) / 1000
-                        status["cpu_temperature"] = dbus.Double(temp)
-                        break
+            frame = get_sampler().latest(max_age=Config.MONITOR_INTERVAL / 1000)
         except Exception:
-            pass
-
-        # Check if on AC power
-        try:
-            ac_path = SystemUtils.find_ac_path()
-            if ac_path:
-                online_path = os.path.join(ac_path, "online")
-                if os.path.exists(online_path):
-                    with open(online_path, "r") as f:
-                        status["on_ac_power"] = dbus.Boolean(f.read().strip() == "1")
-        except Exception:
-            pass
+            frame = None
+        if frame is None:
+            return status
+
+        if frame.cpu_temp is not None:
+            status["cpu_temperature"] = dbus.Double(frame.cpu_temp)
+        if frame.gpu_temp is not None:
+            status["gpu_temperature"] = dbus.Double(frame.gpu_temp)
+        status["dgpu_suspended"] = dbus.Boolean(frame.gpu_suspended)
+        status["cpu_usage"] = dbus.Double(frame.cpu_usage)
+        status["memory_usage"] = dbus.Double(frame.ram_usage)
+        if frame.battery_percent is not None:
+            status["battery_percentage"] = dbus.Int32(frame.battery_percent)
+        if frame.on_ac is not None:
+            status["on_ac_power"] = dbus.Boolean(frame.on_ac)
+
+        # The monitor's own cost, to confirm it isn't draining the battery
+        stats = get_sampler().stats()
+        status["monitor_low_power"] = dbus.Boolean(stats.low_power)
+        status["monitor_wakeups_per_minute"] = dbus.Int32(stats.wakeups_last_minute)
+        status["monitor_cpu_seconds"] = dbus.Double(stats.cpu_time_s)
 
         return status
 
+    @dbus.service.method(DBUS_INTERFACE, in_signature="", out_signature="s")
+    def GetTelemetryPath(self):
+        """Return the shared-memory telemetry segment path ("" if disabled)"""
+        return self.telemetry.path if self.telemetry.is_active else ""
+
+    @dbus.service.method(
+        DBUS_INTERFACE,
+        in_signature="a(ss)",
+        out_signature="a(bs)",
+        sender_keyword="sender",
+        async_callbacks=("reply", "error"),
+    )
+    def WriteSysfs(self, writes, sender=None, reply=None, error=None):
+        """Apply a batch of whitelisted sysfs writes"""
+        batch = [(str(p), str(v)) for p, v in writes]
+
+        def authorized(ok):
+            if not ok:
+                reply([(False, "Not authorized")] * len(batch))
+                return
+            try:
+                reply(self.sysfs_writer.write_batch(batch))
+            except Exception as e:
+                error(e)
+
+        self.authorizer.check(sender, authorized)
+
+    @dbus.service.method(
+        DBUS_INTERFACE,
+        in_signature="as",
+        out_signature="bss",
+        sender_keyword="sender",
+        async_callbacks=("reply", "error"),
+    )
+    def RunCommand(self, argv, sender=None, reply=None, error=None):
+        """Run a whitelisted command"""
+        argv = [str(arg) for arg in argv]
+
+        def run():
+            # Off the main loop: ryzenadj/cpupower may take up to 30 s
+            try:
+                result = run_command(argv)
+            except Exception as e:
+                GLib.idle_add(error, e)
+                return
+            GLib.idle_add(lambda: reply(*result))
+
+        def authorized(ok):
+            if not ok:
+                reply(False, "", "Not authorized")
+                return
+            threading.Thread(target=run, name="run-command", daemon=True).start()
+
+        self.authorizer.check(sender, authorized)
+
+    def _on_name_owner_changed(self, name, old_owner, new_owner):
+        """Forget authorizations of clients that disconnected"""
+        if not new_owner:
+            self.authorizer.forget(name)
+
     @dbus.service.method(DBUS_INTERFACE, in_signature="", out_signature="s")
     def GetVersion(self):
         """Return service version"""
@@ -103,6 +188,8 @@ class LinuxArmouryService(dbus.service.Object):
 def main():
     """Start the D-Bus service"""
     dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+    # RunCommand works on threads; replies are sent from the main loop
+    dbus.mainloop.glib.threads_init()
 
     # Try system bus first (for privileged operations), fall back to session
     try:
@@ -113,8 +200,7 @@ def main():
         print("Falling back to session bus")
 
     # keep a reference to the service object so it isn't garbage collected
-    # and flagged by linters as unused
-    service = LinuxArmouryService(bus)  # noqa: F841
+    service = LinuxArmouryService(bus)
 
     mainloop = GLib.MainLoop()
     print("Entering main loop...")
@@ -122,6 +208,8 @@ def main():
         mainloop.run()
     except KeyboardInterrupt:
         print("\nShutting down service")
+    finally:
+        service.telemetry.stop()
 
 
 if __name__ == "__main__":
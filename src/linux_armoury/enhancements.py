@@ -10,6 +10,7 @@ from typing import Optional
 import customtkinter as ctk
 
 # Import our new modules
+from .config import Config
 from .config_manager import ConfigManager
 from .profile_manager import ProfileManager
 from .widgets import MultiGraphPanel, ToastManager
@@ -226,7 +227,8 @@ class EnhancedAppMixin:
                 },
             ]
 
-            panel = MultiGraphPanel(parent, graphs_config)
+            backend = self.config.get("graph_backend", Config.GRAPH_BACKEND)
+            panel = MultiGraphPanel(parent, graphs_config, backend=backend)
             self.logger.info("Monitoring graphs created")
             return panel
 
@@ -12,24 +12,34 @@ import threading
 import time
 from pathlib import Path
 
-import customtkinter as ctk
-
-from .config_manager import ConfigManager
-from .theme import (
-    COLOR_ACCENT,
-    COLOR_ACCENT_HOVER,
-    COLOR_BG_CARD,
-    COLOR_BG_DARK,
-    COLOR_BG_HOVER,
-    COLOR_BG_MAIN,
-    COLOR_SUCCESS,
-    COLOR_TEXT_PRIMARY,
-    COLOR_TEXT_SECONDARY,
-    COLOR_WARNING,
-    CORNER_RADIUS,
-)
-from .widgets.monitoring_graph import LiveMonitoringGraph
-from .widgets.toast import ToastNotification
+from .startup_profiler import get_startup_profiler
+
+# Imports are timed for `--profile-startup`; only what the first frame needs
+# is imported here, hardware controllers are loaded on first use
+_profiler = get_startup_profiler()
+
+with _profiler.measure("customtkinter", "import"):
+    import customtkinter as ctk
+
+with _profiler.measure("config, theme and widgets", "import"):
+    from .config import Config
+    from .config_manager import ConfigManager
+    from .theme import (
+        COLOR_ACCENT,
+        COLOR_ACCENT_HOVER,
+        COLOR_BG_CARD,
+        COLOR_BG_DARK,
+        COLOR_BG_HOVER,
+        COLOR_BG_MAIN,
+        COLOR_SUCCESS,
+        COLOR_TEXT_PRIMARY,
+        COLOR_TEXT_SECONDARY,
+        COLOR_WARNING,
+        CORNER_RADIUS,
+    )
+    from .widgets.graph_base import GraphResampler
+    from .widgets.graph_panel import create_graph
+    from .widgets.toast import ToastNotification
 
 
 def setup_logging():
@@ -49,13 +59,12 @@ def setup_logging():
     return logging.getLogger("LinuxArmoury")
 
 
-# Try to import system modules
+# Try to import system modules (the monitoring ones the dashboard needs)
 try:
-    from .modules.asusd_client import AsusdClient, ThrottlePolicy
-    from .modules.battery_control import get_battery_controller
-    from .modules.fan_control import get_fan_controller
-    from .modules.keyboard_control import KeyboardController
-    from .modules.system_monitor import SystemMonitor
+    with _profiler.measure("monitoring modules", "import"):
+        from .modules.hwmon_index import get_hwmon_index
+        from .modules.sampler import get_sampler
+        from .modules.system_monitor import get_monitor
 
     HAS_MODULES = True
 except ImportError:
@@ -66,6 +75,11 @@ except ImportError:
 
 def get_cpu_temperature() -> float:
     """Get CPU temperature from hwmon or thermal zones"""
+    if HAS_MODULES:
+        temp = get_hwmon_index().cpu_temperature()
+        if temp is not None:
+            return temp
+
     try:
         # Try hwmon first (more accurate)
         hwmon_paths = glob.glob("/sys/class/hwmon/hwmon*/temp*_input")
@@ -92,39 +106,6 @@ def get_cpu_temperature() -> float:
     return 0.0
 
 
-def get_gpu_temperature() -> float:
-    """Get GPU temperature (NVIDIA or AMD)"""
-    try:
-        # Try NVIDIA first
-        import subprocess
-
-        result = subprocess.run(
-            [
-                "nvidia-smi",
-                "--query-gpu=temperature.gpu",
-                "--format=csv,noheader,nounits",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=2,
-        )
-        if result.returncode == 0:
-            return float(result.stdout.strip())
-    except Exception:
-        pass
-
-    try:
-        # Try AMD
-        amd_paths = glob.glob("/sys/class/drm/card*/device/hwmon/hwmon*/temp1_input")
-        if amd_paths:
-            with open(amd_paths[0]) as f:
-                return float(f.read().strip()) / 1000
-    except Exception:
-        pass
-
-    return 0.0
-
-
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
@@ -137,18 +118,13 @@ class PerformanceCard(ctk.CTkFrame):
             master, fg_color=COLOR_BG_CARD, corner_radius=CORNER_RADIUS, **kwargs
         )
 
-        self.asusd_client = asusd_client
-        self.keyboard_controller = None
+        self.asusd_client = None
         self.oc_controller = None
         if HAS_MODULES:
             try:
-                self.keyboard_controller = KeyboardController()
-            except Exception:
-                pass
-            try:
-                from .modules.overclocking_control import OverclockingController
+                from .modules.overclocking_control import get_overclocking_controller
 
-                self.oc_controller = OverclockingController()
+                self.oc_controller = get_overclocking_controller()
             except Exception:
                 pass
 
@@ -196,20 +172,28 @@ class PerformanceCard(ctk.CTkFrame):
         )
         self.status_label.pack(pady=(5, 10), padx=20)
 
-        # Get current mode from asusctl if available
         self.current_profile = "Balanced"
-        if self.asusd_client:
-            try:
-                policy = self.asusd_client.get_throttle_policy()
-                if policy == ThrottlePolicy.QUIET:
-                    self.current_profile = "Battery Saver"
-                elif policy == ThrottlePolicy.PERFORMANCE:
-                    self.current_profile = "Gaming"
-                else:
-                    self.current_profile = "Balanced"
-            except Exception:
-                pass
+        self.update_selection()
 
+        # The asusd client may still be connecting in the warm-up thread
+        if asusd_client:
+            self.set_asusd_client(asusd_client)
+
+    def set_asusd_client(self, asusd_client):
+        """Attach the asusd client and show its current throttle policy"""
+        from .modules.asusd_client import ThrottlePolicy
+
+        self.asusd_client = asusd_client
+        try:
+            policy = self.asusd_client.get_throttle_policy()
+            if policy == ThrottlePolicy.QUIET:
+                self.current_profile = "Battery Saver"
+            elif policy == ThrottlePolicy.PERFORMANCE:
+                self.current_profile = "Gaming"
+            else:
+                self.current_profile = "Balanced"
+        except Exception:
+            pass
         self.update_selection()
 
     def set_profile(self, name: str, stapm: int, fast: int, slow: int):
@@ -220,7 +204,7 @@ class PerformanceCard(ctk.CTkFrame):
         # Set TDP via RyzenAdj if available
         if self.oc_controller and self.oc_controller.ryzenadj_available:
             try:
-                success = self.oc_controller.set_ryzenadj_tdp(
+                success = self.oc_controller.apply_tdp(
                     stapm_limit=stapm, fast_limit=fast, slow_limit=slow
                 )
                 if success:
@@ -246,6 +230,8 @@ class PerformanceCard(ctk.CTkFrame):
         # Also set asusd throttle policy for appropriate profiles
         if self.asusd_client:
             try:
+                from .modules.asusd_client import ThrottlePolicy
+
                 logger = logging.getLogger("LinuxArmoury")
                 if name in ["Emergency", "Battery Saver", "Efficient"]:
                     self.asusd_client.set_throttle_policy(ThrottlePolicy.QUIET)
@@ -391,6 +377,7 @@ class SystemMonitorCard(ctk.CTkFrame):
         disk_usage: float = 0,
         disk_used_gb: float = 0,
         disk_total_gb: float = 0,
+        gpu_asleep: bool = False,
     ):
         # CPU
         self.cpu_label.configure(text=f"CPU: {cpu_usage:.0f} %")
@@ -398,9 +385,14 @@ class SystemMonitorCard(ctk.CTkFrame):
         self.cpu_temp.configure(text=f"Temp: {cpu_temp:.0f} °C")
 
         # GPU
-        self.gpu_label.configure(text=f"GPU: {gpu_usage:.0f} %")
-        self.gpu_bar.set(gpu_usage / 100)
-        self.gpu_temp.configure(text=f"Temp: {gpu_temp:.0f} °C")
+        if gpu_asleep:
+            self.gpu_label.configure(text="GPU: dGPU asleep")
+            self.gpu_bar.set(0)
+            self.gpu_temp.configure(text="Temp: -- °C")
+        else:
+            self.gpu_label.configure(text=f"GPU: {gpu_usage:.0f} %")
+            self.gpu_bar.set(gpu_usage / 100)
+            self.gpu_temp.configure(text=f"Temp: {gpu_temp:.0f} °C")
 
         # RAM
         self.ram_label.configure(text=f"RAM: {ram_usage:.0f} %")
@@ -456,61 +448,33 @@ class App(ctk.CTk):
         # Initialize system monitor
         if HAS_MODULES:
             try:
-                self.system_monitor = SystemMonitor()
+                self.system_monitor = get_monitor()
+                self.sampler = get_sampler()
+                self.sampler.wakeup_budget = self.settings.get(
+                    "low_power_wakeup_budget", Config.LOW_POWER_WAKEUP_BUDGET
+                )
                 self.logger.info("System monitor initialized successfully")
             except Exception as e:
                 self.logger.error(f"Failed to initialize system monitor: {e}")
                 self.system_monitor = None
+                self.sampler = None
         else:
             self.system_monitor = None
+            self.sampler = None
 
-        # Initialize asusd client
-        if HAS_MODULES:
-            try:
-                self.asusd_client = AsusdClient()
-                if self.asusd_client.is_available():
-                    self.logger.info("Asusd client connected successfully")
-                else:
-                    self.logger.info("Asusd daemon not available")
-                    self.asusd_client = None
-            except Exception as e:
-                self.logger.error(f"Failed to initialize asusd client: {e}")
-                self.asusd_client = None
-        else:
-            self.asusd_client = None
+        # Hardware controllers are built on first use (see _controller) or by
+        # the warm-up thread once the first frame is on screen
+        self._controllers = {}
+        self._controller_lock = threading.Lock()
 
         # Initialize auto profile switching
         self.auto_profile_switching = False
         self.last_ac_status = None  # Track AC adapter state
+        self._ac_lock = threading.Lock()
 
-        # Initialize controllers for profile management
-        self.gpu_controller = None
-        self.fan_controller = None
-        self.keyboard_controller = None
-        self.battery_controller = None
-
-        if HAS_MODULES:
-            try:
-                from .modules.gpu_control import GpuController
-
-                self.gpu_controller = GpuController()
-            except Exception:
-                pass
-
-            try:
-                self.fan_controller = get_fan_controller()
-            except Exception:
-                pass
-
-            try:
-                self.keyboard_controller = KeyboardController()
-            except Exception:
-                pass
-
-            try:
-                self.battery_controller = get_battery_controller()
-            except Exception:
-                pass
+        # AC plug/unplug arrives as a power_supply uevent; polling the
+        # sampler's frames is only the fallback. Started by the warm-up thread
+        self.power_monitor = None
 
         # Sidebar
         self.create_sidebar()
@@ -523,18 +487,153 @@ class App(ctk.CTk):
 
         # Start monitoring thread
         self.monitoring = True
+        self._ui_lock = threading.Lock()
+        self._ui_update = None  # Newest render callback awaiting after()
+        # Graph points not drawn yet; renders are coalesced, points are not
+        self._graph_points = {"cpu": [], "gpu": []}
+        # One graph point per monitor interval, however often sources run
+        self._graph_resamplers = {
+            name: GraphResampler(Config.MONITOR_INTERVAL / 1000)
+            for name in self._graph_points
+        }
         self.monitor_thread = threading.Thread(target=self.update_loop, daemon=True)
         self.monitor_thread.start()
 
         # Setup keyboard shortcuts
         self.setup_keybindings()
 
-        # Initialize tray icon
-        self.setup_tray_icon()
+        self.tray_icon = None
 
         # Setup window close behavior (minimize to tray)
         self.protocol("WM_DELETE_WINDOW", self.on_window_close)
 
+        # Back off sampling while the window is hidden or minimized to tray
+        self.bind("<Map>", lambda e: self.on_visibility_change(e, True), add="+")
+        self.bind("<Unmap>", lambda e: self.on_visibility_change(e, False), add="+")
+
+        # Everything else waits until the window has been painted
+        self.after(0, self.on_first_frame)
+
+    def on_first_frame(self):
+        """Finish startup once the first frame is on screen"""
+        _profiler.mark("first frame")
+        with _profiler.measure("tray icon", "init"):
+            self.setup_tray_icon()
+        threading.Thread(target=self.warm_up, name="warm-up", daemon=True).start()
+
+    def warm_up(self):
+        """Build the hardware controllers in the background"""
+        with _profiler.measure("warm-up", "warmup"):
+            for name in (
+                "asusd_client",
+                "gpu_controller",
+                "fan_controller",
+                "keyboard_controller",
+                "battery_controller",
+            ):
+                getattr(self, name)
+            self.start_power_monitor()
+        _profiler.mark("warm-up done")
+
+        asusd_client = self.asusd_client
+        if asusd_client:
+            self.after(0, lambda: self._attach_asusd_client(asusd_client))
+
+    def _attach_asusd_client(self, asusd_client):
+        """Hand the connected asusd client to the performance card"""
+        perf_card = getattr(self, "perf_card", None)
+        if perf_card is not None and perf_card.winfo_exists():
+            perf_card.set_asusd_client(asusd_client)
+
+    def start_power_monitor(self):
+        """Start listening for AC adapter uevents"""
+        if not HAS_MODULES or self.power_monitor is not None:
+            return
+        try:
+            with _profiler.measure("power supply monitor", "init"):
+                from .modules.uevent_monitor import get_power_supply_monitor
+
+                monitor = get_power_supply_monitor()
+                monitor.add_callback(self.on_ac_changed)
+                monitor.start()
+            self.power_monitor = monitor
+        except Exception as e:
+            self.logger.error(f"Failed to start power supply monitor: {e}")
+
+    def _controller(self, name, factory):
+        """Build a hardware controller on first use, None if unavailable"""
+        with self._controller_lock:
+            if name not in self._controllers:
+                controller = None
+                if HAS_MODULES:
+                    try:
+                        with _profiler.measure(name, "init"):
+                            controller = factory()
+                    except Exception as e:
+                        self.logger.error(f"Failed to initialize {name}: {e}")
+                self._controllers[name] = controller
+            return self._controllers[name]
+
+    @property
+    def asusd_client(self):
+        """asusd D-Bus client, None if the daemon isn't running"""
+
+        def factory():
+            from .modules.asusd_client import AsusdClient
+
+            client = AsusdClient()
+            if client.is_available():
+                self.logger.info("Asusd client connected successfully")
+                return client
+            self.logger.info("Asusd daemon not available")
+            return None
+
+        return self._controller("asusd_client", factory)
+
+    @property
+    def gpu_controller(self):
+        """GPU switching controller, shared with the telemetry sampler"""
+
+        def factory():
+            from .modules.gpu_control import get_controller
+
+            return get_controller()
+
+        return self._controller("gpu_controller", factory)
+
+    @property
+    def fan_controller(self):
+        """Fan controller"""
+
+        def factory():
+            from .modules.fan_control import get_fan_controller
+
+            return get_fan_controller()
+
+        return self._controller("fan_controller", factory)
+
+    @property
+    def keyboard_controller(self):
+        """Keyboard backlight and Aura controller"""
+
+        def factory():
+            from .modules.keyboard_control import KeyboardController
+
+            return KeyboardController()
+
+        return self._controller("keyboard_controller", factory)
+
+    @property
+    def battery_controller(self):
+        """Battery charge limit controller"""
+
+        def factory():
+            from .modules.battery_control import get_battery_controller
+
+            return get_battery_controller()
+
+        return self._controller("battery_controller", factory)
+
     def setup_tray_icon(self):
         """Initialize system tray icon"""
         try:
@@ -613,6 +712,13 @@ class App(ctk.CTk):
         # If no tray or minimize to tray disabled, quit
         self.quit()
 
+    def on_visibility_change(self, event, visible: bool):
+        """Tell the shared sampler whether anyone is looking at the data"""
+        # Child widgets' Map/Unmap events also reach the toplevel binding
+        if event.widget is not self or not self.sampler:
+            return
+        self.sampler.set_background(not visible)
+
     def toggle_minimize_to_tray(self, enabled: bool):
         """Toggle minimize to tray setting"""
         self.settings["minimize_to_tray"] = enabled
@@ -692,7 +798,10 @@ class App(ctk.CTk):
     def show_toast(
         self, message: str, notification_type: str = "info", duration: int = 3000
     ):
-        """Display a toast notification"""
+        """Display a toast notification (callable from any thread)"""
+        if threading.current_thread() is not threading.main_thread():
+            self.after(0, lambda: self.show_toast(message, notification_type, duration))
+            return
         try:
             ToastNotification(self, message, notification_type, duration)
             self.logger.info(f"Toast shown: [{notification_type}] {message}")
@@ -724,7 +833,10 @@ class App(ctk.CTk):
         left_col.pack(side="left", fill="both", expand=True, padx=(0, 10))
 
         # Performance card with asusd client integration
-        self.perf_card = PerformanceCard(left_col, asusd_client=self.asusd_client)
+        # Don't block the dashboard on D-Bus; warm_up attaches the client later
+        self.perf_card = PerformanceCard(
+            left_col, asusd_client=self._controllers.get("asusd_client")
+        )
         self.perf_card.pack(fill="x", pady=(0, 10))
 
         # Quick Profiles card
@@ -783,10 +895,10 @@ class App(ctk.CTk):
             """Cycle through GPU modes"""
             if HAS_MODULES:
                 try:
-                    from .modules.gpu_control import GpuController, GpuMode
+                    from .modules.gpu_control import GpuMode
 
-                    gpu_ctrl = GpuController()
-                    if gpu_ctrl.supergfxctl_available:
+                    gpu_ctrl = self.gpu_controller
+                    if gpu_ctrl and gpu_ctrl.supergfxctl_available:
                         status = gpu_ctrl.get_switching_status()
                         if status.current_mode == GpuMode.INTEGRATED:
                             gpu_ctrl.set_gpu_mode(GpuMode.HYBRID)
@@ -809,8 +921,8 @@ class App(ctk.CTk):
             if HAS_MODULES:
                 try:
                     logger = logging.getLogger("LinuxArmoury")
-                    kbd = KeyboardController()
-                    if kbd.is_supported():
+                    kbd = self.keyboard_controller
+                    if kbd and kbd.is_supported():
                         success, msg = kbd.cycle_brightness()
                         logger.info(f"Keyboard brightness: {msg}")
                     else:
@@ -878,10 +990,15 @@ class App(ctk.CTk):
         graphs_frame.pack(fill="x", pady=(0, 10))
 
         # CPU and GPU graphs side by side
-        self.cpu_graph = LiveMonitoringGraph(graphs_frame, "CPU Usage", color="#ff0066")
+        backend = self.settings.get("graph_backend", Config.GRAPH_BACKEND)
+        self.cpu_graph = create_graph(
+            graphs_frame, "CPU Usage", backend=backend, color="#ff0066"
+        )
         self.cpu_graph.pack(side="left", fill="both", expand=True, padx=(0, 5))
 
-        self.gpu_graph = LiveMonitoringGraph(graphs_frame, "GPU Usage", color="#00ff88")
+        self.gpu_graph = create_graph(
+            graphs_frame, "GPU Usage", backend=backend, color="#00ff88"
+        )
         self.gpu_graph.pack(side="right", fill="both", expand=True, padx=(5, 0))
 
         # System Monitor card below graphs
@@ -899,13 +1016,8 @@ class App(ctk.CTk):
         )
         title.pack(pady=(0, 20), anchor="w")
 
-        # Initialize keyboard controller if available
-        kbd = None
-        if HAS_MODULES:
-            try:
-                kbd = KeyboardController()
-            except Exception:
-                pass
+        # Keyboard controller, if available
+        kbd = self.keyboard_controller
 
         # Brightness Control
         brightness_frame = ctk.CTkFrame(
@@ -1202,15 +1314,8 @@ class App(ctk.CTk):
         )
         title.pack(pady=(0, 20), anchor="w")
 
-        # Initialize GPU controller
-        gpu_ctrl = None
-        if HAS_MODULES:
-            try:
-                from .modules.gpu_control import GpuController
-
-                gpu_ctrl = GpuController()
-            except Exception:
-                pass
+        # GPU controller, if available
+        gpu_ctrl = self.gpu_controller
 
         # GPU Mode Switching
         gpu_frame = ctk.CTkFrame(
@@ -1336,20 +1441,27 @@ class App(ctk.CTk):
                 info_grid = ctk.CTkFrame(stats_frame, fg_color="transparent")
                 info_grid.pack(pady=10, padx=20, fill="x")
 
-                stats_items = [
-                    ("GPU:", stats.gpu_name or "Unknown"),
-                    ("Usage:", f"{stats.gpu_usage_percent}%"),
-                    ("Temperature:", f"{stats.gpu_temp_c}°C"),
-                    ("Clock:", f"{stats.gpu_clock_mhz} MHz"),
-                    (
-                        "VRAM Used:",
-                        f"{stats.vram_used_mb} MB / {stats.vram_total_mb} MB",
-                    ),
-                    (
-                        "Power:",
-                        f"{stats.power_draw_w:.1f}W / {stats.power_limit_w:.1f}W",
-                    ),
-                ]
+                if stats.dgpu_suspended:
+                    # Reading live values would wake the dGPU
+                    stats_items = [
+                        ("GPU:", stats.gpu_name or "Unknown"),
+                        ("Status:", "dGPU asleep"),
+                    ]
+                else:
+                    stats_items = [
+                        ("GPU:", stats.gpu_name or "Unknown"),
+                        ("Usage:", f"{stats.gpu_usage_percent}%"),
+                        ("Temperature:", f"{stats.gpu_temp_c}°C"),
+                        ("Clock:", f"{stats.gpu_clock_mhz} MHz"),
+                        (
+                            "VRAM Used:",
+                            f"{stats.vram_used_mb} MB / {stats.vram_total_mb} MB",
+                        ),
+                        (
+                            "Power:",
+                            f"{stats.power_draw_w:.1f}W / {stats.power_limit_w:.1f}W",
+                        ),
+                    ]
 
                 row = 0
                 for label_text, value_text in stats_items:
@@ -1401,13 +1513,8 @@ class App(ctk.CTk):
         )
         title.pack(pady=(0, 20), anchor="w")
 
-        # Initialize fan controller
-        fan_ctrl = None
-        if HAS_MODULES:
-            try:
-                fan_ctrl = get_fan_controller()
-            except Exception:
-                pass
+        # Fan controller, if available
+        fan_ctrl = self.fan_controller
 
         # Fan Status Card
         status_frame = ctk.CTkFrame(
@@ -1642,13 +1749,8 @@ class App(ctk.CTk):
         )
         title.pack(pady=(0, 20), anchor="w")
 
-        # Initialize battery controller
-        battery_ctrl = None
-        if HAS_MODULES:
-            try:
-                battery_ctrl = get_battery_controller()
-            except Exception:
-                pass
+        # Battery controller, if available
+        battery_ctrl = self.battery_controller
 
         # Battery Info Card
         info_frame = ctk.CTkFrame(
@@ -2019,6 +2121,13 @@ class App(ctk.CTk):
                     text_color=COLOR_SUCCESS,
                 )
                 print("Auto profile switching enabled")
+                # Apply the profile for the current AC state right away
+                self.last_ac_status = None
+                if self.power_monitor:
+                    threading.Thread(
+                        target=lambda: self.on_ac_changed(self.power_monitor.on_ac),
+                        daemon=True,
+                    ).start()
             else:
                 status_label.configure(
                     text="Auto profile switching disabled",
@@ -2058,214 +2167,237 @@ class App(ctk.CTk):
         )
         status_label.pack(pady=(5, 15), padx=20, anchor="w")
 
-    def update_loop(self):
-        """Background thread for updating system stats"""
-        # Initialize GPU controller once
-        gpu_ctrl = None
-        if HAS_MODULES:
+    def on_ac_changed(self, on_ac):
+        """Auto-switch profiles when the AC adapter is plugged or unplugged"""
+        if on_ac is None or not self.auto_profile_switching or not self.asusd_client:
+            return
+        with self._ac_lock:
+            # Only switch if status changed
+            if on_ac == self.last_ac_status:
+                return
+            self.last_ac_status = on_ac
             try:
-                from .modules.gpu_control import GpuController
+                from .modules.asusd_client import ThrottlePolicy
 
-                gpu_ctrl = GpuController()
-            except Exception:
-                pass
-
-        while self.monitoring:
-            try:
-                if self.system_monitor:
-                    # Get CPU stats
-                    cpu_stats = self.system_monitor.get_cpu_stats()
-                    cpu_usage = cpu_stats.usage_percent
-                    cpu_temp = get_cpu_temperature()
-
-                    # Get GPU stats using GpuController
-                    gpu_usage = 0.0
-                    gpu_temp = 0.0
-
-                    if gpu_ctrl:
-                        try:
-                            gpu_stats = gpu_ctrl.get_live_stats()
-                            gpu_usage = float(gpu_stats.gpu_usage_percent)
-                            gpu_temp = float(gpu_stats.gpu_temp_c)
-
-                            # If GPU stats are zero, try to get temperature at least
-                            if gpu_temp == 0:
-                                gpu_temp = get_gpu_temperature()
-                        except Exception:
-                            # Fallback to basic temperature reading
-                            gpu_temp = get_gpu_temperature()
-                    else:
-                        # Fallback to basic temperature reading
-                        gpu_temp = get_gpu_temperature()
-
-                    # Get RAM stats
-                    mem_stats = self.system_monitor.get_memory_stats()
-                    ram_usage = mem_stats.usage_percent
-                    ram_used_gb = mem_stats.used_mb / 1024
-                    ram_total_gb = mem_stats.total_mb / 1024
-
-                    # Get Disk stats (root partition)
-                    disk_stats_list = self.system_monitor.get_disk_stats()
-                    disk_usage = 0.0
-                    disk_used_gb = 0.0
-                    disk_total_gb = 0.0
-
-                    if disk_stats_list:
-                        # Find root partition
-                        for disk in disk_stats_list:
-                            if disk.mountpoint == "/":
-                                disk_usage = disk.usage_percent
-                                disk_used_gb = disk.used_gb
-                                disk_total_gb = disk.total_gb
-                                break
-                        # If no root found, use first partition
-                        if disk_usage == 0.0 and disk_stats_list:
-                            disk = disk_stats_list[0]
-                            disk_usage = disk.usage_percent
-                            disk_used_gb = disk.used_gb
-                            disk_total_gb = disk.total_gb
-                else:
-                    # Fallback to random data in demo mode
-                    import random
-
-                    cpu_usage = random.randint(20, 60)
-                    cpu_temp = random.randint(50, 75)
-                    gpu_usage = random.randint(10, 40)
-                    gpu_temp = random.randint(45, 65)
-                    ram_usage = random.randint(40, 70)
-                    ram_used_gb = random.randint(8, 14)
-                    ram_total_gb = 16
-                    disk_usage = random.randint(50, 80)
-                    disk_used_gb = random.randint(100, 300)
-                    disk_total_gb = 512
-
-                # Update UI on main thread
-                if hasattr(self, "monitor_card"):
-                    # Update monitor UI via a small helper (keeps lines short)
-                    def _update_monitor():
-                        if hasattr(self, "monitor_card") and self.monitor_card.winfo_exists():
-                            self.monitor_card.update_stats(
-                                cpu_usage,
-                                cpu_temp,
-                                gpu_usage,
-                                gpu_temp,
-                                ram_usage,
-                                ram_used_gb,
-                                ram_total_gb,
-                                disk_usage,
-                                disk_used_gb,
-                                disk_total_gb,
-                            )
+                if on_ac:
+                    # Plugged in - switch to Gaming (70W Performance)
+                    print("AC adapter connected - switching to Gaming")
+                    self.asusd_client.set_throttle_policy(ThrottlePolicy.PERFORMANCE)
 
-                        # Update real-time graphs
-                        if hasattr(self, "cpu_graph") and self.cpu_graph.winfo_exists():
-                            self.cpu_graph.update_data(cpu_usage)
-                        if hasattr(self, "gpu_graph") and self.gpu_graph.winfo_exists():
-                            self.gpu_graph.update_data(gpu_usage)
+                    # Also set TDP if overclocking controller available
+                    try:
+                        from .modules.overclocking_control import (
+                            get_overclocking_controller,
+                        )
 
-                    self.after(0, _update_monitor)
+                        oc_ctrl = get_overclocking_controller()
+                        if oc_ctrl.ryzenadj_available:
+                            oc_ctrl.apply_tdp(
+                                stapm_limit=70,
+                                fast_limit=75,
+                                slow_limit=70,
+                            )
+                            print("TDP set to Gaming profile (70W)")
+                    except Exception:
+                        pass
+                else:
+                    # On battery - switch to Battery Saver (18W)
+                    print("On battery - switching to Battery Saver")
+                    self.asusd_client.set_throttle_policy(ThrottlePolicy.QUIET)
 
-                # Auto profile switching based on AC adapter
-                if self.auto_profile_switching and self.asusd_client and HAS_MODULES:
+                    # Also set TDP if overclocking controller available
                     try:
-                        # Check AC adapter status via battery controller
-                        battery_ctrl = get_battery_controller()
-                        if battery_ctrl and battery_ctrl.is_supported():
-                            battery_status = battery_ctrl.get_battery_status()
-
-                            # Determine if on AC (Charging or Full means plugged in)
-                            on_ac = battery_status in [
-                                "Charging",
-                                "Full",
-                                "Not charging",
-                            ]
-
-                            # Only switch if status changed
-                            if on_ac != self.last_ac_status:
-                                self.last_ac_status = on_ac
-
-                                if on_ac:
-                                    # Plugged in - switch to Gaming (70W Performance)
-                                    print("AC adapter connected - switching to Gaming")
-                                    self.asusd_client.set_throttle_policy(
-                                        ThrottlePolicy.PERFORMANCE
-                                    )
+                        from .modules.overclocking_control import (
+                            get_overclocking_controller,
+                        )
 
-                                    # Also set TDP if overclocking controller available
-                                    try:
-                                        from .modules.overclocking_control import (
-                                            OverclockingController,
-                                        )
-
-                                        oc_ctrl = OverclockingController()
-                                        if oc_ctrl.ryzenadj_available:
-                                            oc_ctrl.set_ryzenadj_tdp(
-                                                stapm_limit=70,
-                                                fast_limit=75,
-                                                slow_limit=70,
-                                            )
-                                            print("TDP set to Gaming profile (70W)")
-                                    except Exception:
-                                        pass
-                                else:
-                                    # On battery - switch to Battery Saver (18W)
-                                    print("On battery - switching to Battery Saver")
-                                    self.asusd_client.set_throttle_policy(
-                                        ThrottlePolicy.QUIET
-                                    )
+                        oc_ctrl = get_overclocking_controller()
+                        if oc_ctrl.ryzenadj_available:
+                            oc_ctrl.apply_tdp(
+                                stapm_limit=18,
+                                fast_limit=20,
+                                slow_limit=18,
+                            )
+                            print("TDP set to Battery Saver (18W)")
+                    except Exception:
+                        pass
+            except Exception as e:
+                print(f"Auto profile switching error: {e}")
 
-                                    # Also set TDP if overclocking controller available
-                                    try:
-                                        from .modules.overclocking_control import (
-                                            OverclockingController,
-                                        )
-
-                                        oc_ctrl = OverclockingController()
-                                        if oc_ctrl.ryzenadj_available:
-                                            oc_ctrl.set_ryzenadj_tdp(
-                                                stapm_limit=18,
-                                                fast_limit=20,
-                                                slow_limit=18,
-                                            )
-                                            print("TDP set to Battery Saver (18W)")
-                                    except Exception:
-                                        pass
-                    except Exception as e:
-                        print(f"Auto profile switching error: {e}")
+    def _run_ui_update(self):
+        """Render the newest snapshot handed over by update_loop"""
+        with self._ui_lock:
+            update, self._ui_update = self._ui_update, None
+        if update:
+            update()
 
-                time.sleep(2)
-            except Exception as e:
-                print(f"Monitoring error: {e}")
-                time.sleep(2)
+    def update_loop(self):
+        """Background thread that renders frames from the shared sampler"""
+        sampler = self.sampler if self.system_monitor else None
+        if sampler:
+            # Keep the shared sampler running while the window is alive
+            sampler.acquire()
+        last_seq = 0
+        interval = Config.MONITOR_INTERVAL / 1000
+
+        try:
+            while self.monitoring:
+                try:
+                    frame = None
+                    if sampler:
+                        # Hidden or on battery in the background: only wake
+                        # for frames (destroy() releases the wait)
+                        timeout = interval * 2
+                        if sampler.low_power or sampler.background:
+                            timeout = None
+                        frame = sampler.wait_for_frame(last_seq, timeout=timeout)
+                        if frame is None:
+                            continue
+                        last_seq = frame.seq
+
+                        cpu_usage = frame.cpu_usage
+                        cpu_temp = frame.cpu_temp or 0.0
+                        gpu_usage = frame.gpu_usage
+                        gpu_temp = frame.gpu_temp or 0.0
+                        gpu_asleep = frame.gpu_suspended
+                        ram_usage = frame.ram_usage
+                        ram_used_gb = frame.ram_used_mb / 1024
+                        ram_total_gb = frame.ram_total_mb / 1024
+                        disk_usage = frame.disk_usage
+                        disk_used_gb = frame.disk_used_gb
+                        disk_total_gb = frame.disk_total_gb
+                        battery = frame.battery_percent
+                    else:
+                        # Fallback to random data in demo mode
+                        import random
+
+                        cpu_usage = random.randint(20, 60)
+                        cpu_temp = random.randint(50, 75)
+                        gpu_usage = random.randint(10, 40)
+                        gpu_temp = random.randint(45, 65)
+                        gpu_asleep = False
+                        ram_usage = random.randint(40, 70)
+                        ram_used_gb = random.randint(8, 14)
+                        ram_total_gb = 16
+                        disk_usage = random.randint(50, 80)
+                        disk_used_gb = random.randint(100, 300)
+                        disk_total_gb = 512
+                        battery = None
+                        time.sleep(interval)
+
+                    # Update UI on main thread
+                    if hasattr(self, "monitor_card"):
+                        # Update monitor UI via a small helper (keeps lines short)
+                        def _update_monitor():
+                            if (
+                                hasattr(self, "monitor_card")
+                                and self.monitor_card.winfo_exists()
+                            ):
+                                self.monitor_card.update_stats(
+                                    cpu_usage,
+                                    cpu_temp,
+                                    gpu_usage,
+                                    gpu_temp,
+                                    ram_usage,
+                                    ram_used_gb,
+                                    ram_total_gb,
+                                    disk_usage,
+                                    disk_used_gb,
+                                    disk_total_gb,
+                                    gpu_asleep=gpu_asleep,
+                                )
+
+                            # Update real-time graphs
+                            with self._ui_lock:
+                                points = self._graph_points
+                                self._graph_points = {"cpu": [], "gpu": []}
+                            for name in ("cpu", "gpu"):
+                                graph = getattr(self, f"{name}_graph", None)
+                                if graph and graph.winfo_exists():
+                                    for value in points[name][-graph.max_points :]:
+                                        graph.update_data(value)
+
+                            # Tray tooltip reads the same frame
+                            tray_icon = getattr(self, "tray_icon", None)
+                            if tray_icon and tray_icon.is_active:
+                                perf_card = getattr(self, "perf_card", None)
+                                tray_icon.update_status_text(
+                                    cpu_temp,
+                                    battery,
+                                    perf_card.current_profile if perf_card else None,
+                                    gpu_asleep=gpu_asleep,
+                                )
+
+                        # Graphs take new cpu/gpu results only (other frames
+                        # repeat the last values), resampled to a fixed step
+                        fresh = frame.fresh_sources if frame else ("cpu", "gpu")
+                        now = frame.timestamp if frame else time.time()
+                        usage = {"cpu": cpu_usage, "gpu": gpu_usage}
+
+                        # Coalesce: one pending after() renders the newest frame
+                        with self._ui_lock:
+                            for name, value in usage.items():
+                                if name in fresh:
+                                    self._graph_points[name].extend(
+                                        self._graph_resamplers[name].feed(now, value)
+                                    )
+                            scheduled = self._ui_update is not None
+                            self._ui_update = _update_monitor
+                        if not scheduled:
+                            self.after(0, self._run_ui_update)
+
+                    # Polling fallback when AC changes aren't event-driven
+                    monitor = self.power_monitor
+                    event_driven = monitor is not None and monitor.is_event_driven
+                    if frame is not None and not event_driven:
+                        self.on_ac_changed(frame.on_ac)
+                except Exception as e:
+                    print(f"Monitoring error: {e}")
+                    time.sleep(interval)
+        finally:
+            if sampler:
+                sampler.release()
 
     def apply_profile_from_dashboard(self, profile):
         """Apply a system profile from the dashboard"""
-        if self.profile_manager:
-            try:
-                success = self.profile_manager.apply_profile(profile, self)
-                if success:
-                    self.show_toast(
-                        f"Profile '{profile.name}' applied successfully", "success"
-                    )
-                    # Update performance card to show current profile
-                    if hasattr(self, "perf_card"):
-                        self.perf_card.current_profile = profile.name
-                        self.perf_card.update_selection()
-                else:
-                    self.show_toast(
-                        f"Failed to apply profile '{profile.name}'", "warning"
-                    )
-            except Exception as e:
-                self.logger.error(f"Error applying profile from dashboard: {e}")
-                self.show_toast(f"Error applying profile: {e}", "error")
-        else:
+        if not self.profile_manager:
             self.show_toast("Profile manager not available", "warning")
+            return
+        # Reading and writing the hardware can take seconds; keep Tk responsive
+        threading.Thread(
+            target=self._apply_dashboard_profile,
+            args=(profile,),
+            name="apply-profile",
+            daemon=True,
+        ).start()
+
+    def _apply_dashboard_profile(self, profile):
+        """Apply a profile off the Tk thread and post the result back"""
+        try:
+            success = self.profile_manager.apply_profile(profile, self)
+        except Exception as e:
+            self.logger.error(f"Error applying profile from dashboard: {e}")
+            self.show_toast(f"Error applying profile: {e}", "error")
+            return
+        self.after(0, lambda: self._dashboard_profile_applied(profile, success))
+
+    def _dashboard_profile_applied(self, profile, success: bool):
+        """Update the dashboard once a profile has been applied"""
+        if success:
+            self.show_toast(f"Profile '{profile.name}' applied successfully", "success")
+            # Update performance card to show current profile
+            perf_card = getattr(self, "perf_card", None)
+            if perf_card is not None and perf_card.winfo_exists():
+                perf_card.current_profile = profile.name
+                perf_card.update_selection()
+        else:
+            self.show_toast(f"Failed to apply profile '{profile.name}'", "warning")
 
     def set_tdp(self, watts: int) -> bool:
         """Set TDP using RyzenAdj if available"""
         if hasattr(self, "perf_card") and self.perf_card.oc_controller:
             try:
-                success = self.perf_card.oc_controller.set_ryzenadj_tdp(
+                success = self.perf_card.oc_controller.apply_tdp(
                     stapm_limit=watts, fast_limit=watts + 5, slow_limit=watts
                 )
                 if success:
@@ -2283,6 +2415,8 @@ class App(ctk.CTk):
 
     def destroy(self):
         self.monitoring = False
+        if self.sampler:
+            self.sampler.wake_waiters()
         # Save current window size to settings
         self.settings["window_size"] = [self.winfo_width(), self.winfo_height()]
         self.config_manager.save_settings(self.settings)
@@ -2290,7 +2424,27 @@ class App(ctk.CTk):
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Linux Armoury control center")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print import and initialization times per component",
+    )
+    args, _ = parser.parse_known_args()
+
     app = App()
+    if args.profile_startup:
+        # Report once the first frame is drawn and again after warm-up
+        def report():
+            if _profiler.milestone("warm-up done") is None:
+                app.after(100, report)
+                return
+            print(_profiler.report())
+
+        app.after(0, lambda: print(_profiler.report()))
+        app.after(100, report)
     app.mainloop()
 
 
@@ -6,11 +6,11 @@ Provides battery charge limit control for ASUS laptops.
 """
 
 import os
-import subprocess
 from enum import IntEnum
 from typing import Any, Dict, Optional, Tuple
 
 from ..system_utils import SystemUtils
+from .privileged_helper import get_privileged_helper
 
 
 class ChargeLimitPreset(IntEnum):
@@ -93,27 +93,13 @@ class BatteryController:
         if not self._charge_limit_path:
             return False, "Charge limit control not supported"
 
-        try:
-            # Try direct write first (if running as root)
-            with open(self._charge_limit_path, "w") as f:
-                f.write(str(limit))
+        # Direct write when permitted, else the privileged helper
+        success, error = get_privileged_helper().write(
+            self._charge_limit_path, str(limit)
+        )
+        if success:
             return True, f"Charge limit set to {limit}%"
-        except PermissionError:
-            # Use pkexec for elevated privileges
-            try:
-                cmd = ["pkexec", "tee", self._charge_limit_path]
-                result = subprocess.run(
-                    cmd, input=str(limit), capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    return True, f"Charge limit set to {limit}%"
-                return False, f"Failed to set charge limit: {result.stderr}"
-            except subprocess.TimeoutExpired:
-                return False, "Command timed out"
-            except Exception as e:
-                return False, f"Failed to set charge limit: {e}"
-        except Exception as e:
-            return False, f"Failed to set charge limit: {e}"
+        return False, f"Failed to set charge limit: {error}"
 
     def set_preset(self, preset: ChargeLimitPreset) -> Tuple[bool, str]:
         """Set charge limit to a preset value"""
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Capability Cache Module for Linux Armoury
+Keeps hardware capability probe results in ~/.cache/linux-armoury so the
+CLI and GUI don't re-glob sysfs or fork probe commands on every start.
+
+The cache is keyed by the DMI product name, the kernel release, the ASUS
+and GPU kernel modules that are loaded (out-of-tree drivers such as
+asus-armoury add sysfs features) and where the probed tools resolve to
+along with their binaries' mtimes (a tool was installed, removed or
+upgraded). When any of them changes, everything is probed again.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .tool_registry import get_tool_registry
+
+# Bump when the layout of cached values changes
+CACHE_VERSION = 2
+
+DMI_PRODUCT_NAME = "/sys/class/dmi/id/product_name"
+
+SYS_MODULE = "/sys/module"
+
+# Kernel modules whose presence (or version) changes the probed features
+KEY_MODULES = (
+    "asus_wmi",
+    "asus_nb_wmi",
+    "asus_armoury",
+    "hid_asus",
+    "amdgpu",
+    "nvidia",
+)
+
+
+def default_cache_path() -> str:
+    """Cache file under ~/.cache/linux-armoury (or $XDG_CACHE_HOME)"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(cache_home, "linux-armoury", "capabilities.json")
+
+
+class CapabilityCache:
+    """Probe results shared by the hardware controllers and kept across runs"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_cache_path()
+        self._key: Dict[str, Any] = {}
+        # Loaded on first use; None means not read yet
+        self._entries: Optional[Dict[str, Any]] = None
+        # Tool name -> [resolved path, mtime] (None if not found) for the
+        # tools behind the cached results
+        self._binaries: Dict[str, Any] = {}
+        # Results kept for this process only, see get()
+        self._volatile: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _read_key(self) -> Dict[str, Any]:
+        """Current values of everything the cache is keyed by, except binaries"""
+        try:
+            with open(DMI_PRODUCT_NAME) as f:
+                product_name = f.read().strip()
+        except OSError:
+            product_name = ""
+
+        modules = {}
+        for module in KEY_MODULES:
+            module_dir = os.path.join(SYS_MODULE, module)
+            if not os.path.isdir(module_dir):
+                continue
+            # Built-in modules have no srcversion; DKMS rebuilds change it
+            try:
+                with open(os.path.join(module_dir, "srcversion")) as f:
+                    modules[module] = f.read().strip()
+            except OSError:
+                modules[module] = ""
+
+        return {
+            "version": CACHE_VERSION,
+            "product_name": product_name,
+            "kernel": os.uname().release,
+            "modules": modules,
+        }
+
+    @staticmethod
+    def _resolve(tool: str) -> Optional[List[Any]]:
+        """Where a tool resolves to and its binary's mtime, None if not found"""
+        path = get_tool_registry().which(tool)
+        if path is None:
+            return None
+        try:
+            return [path, os.stat(path).st_mtime]
+        except OSError:
+            return None
+
+    def _binaries_unchanged(self, binaries: Dict[str, Any]) -> bool:
+        """Check that no recorded tool was installed, removed or replaced"""
+        return all(
+            self._resolve(tool) == resolved for tool, resolved in binaries.items()
+        )
+
+    def _load(self):
+        """Read the cache file once per process, discarding it if stale"""
+        if self._entries is not None:
+            return
+        self._key = self._read_key()
+        self._entries = {}
+        self._binaries = {}
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            binaries = data["binaries"]
+            if data["key"] == self._key and self._binaries_unchanged(binaries):
+                self._entries = data["entries"]
+                self._binaries = binaries
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save(self):
+        """Write the cache file atomically"""
+        data = {"key": self._key, "binaries": self._binaries, "entries": self._entries}
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Read-only home etc.: results stay cached for this process only
+            pass
+
+    def get(
+        self,
+        name: str,
+        probe: Callable[[], Any],
+        tools: Iterable[str] = (),
+        persist_if: Optional[Callable[[Any], bool]] = None,
+    ):
+        """
+        Get a capability, running its probe only when it isn't cached
+
+        Args:
+            name: Entry name, e.g. "keyboard.aura"
+            probe: Returns the capability as a JSON serializable value
+            tools: External tools the probe depends on; the cache is
+                discarded when one of them is installed, removed or upgraded
+            persist_if: Results it rejects (e.g. ones that depend on a
+                daemon running) are cached for this process only
+        """
+        with self._lock:
+            self._load()
+            if name in self._entries:
+                return self._entries[name]
+            if name in self._volatile:
+                return self._volatile[name]
+
+            value = probe()
+            if persist_if is not None and not persist_if(value):
+                self._volatile[name] = value
+                return value
+
+            for tool in tools:
+                self._binaries[tool] = self._resolve(tool)
+            self._entries[name] = value
+            self._save()
+            return value
+
+    def invalidate(self, name: Optional[str] = None):
+        """Forget one capability (or all) so the next get() probes again"""
+        with self._lock:
+            self._load()
+            if name is None:
+                self._entries.clear()
+                self._binaries.clear()
+                self._volatile.clear()
+            else:
+                self._entries.pop(name, None)
+                self._volatile.pop(name, None)
+            self._save()
+
+
+# Global singleton
+_capability_cache: Optional[CapabilityCache] = None
+
+
+def get_capability_cache() -> CapabilityCache:
+    """Get singleton capability cache instance"""
+    global _capability_cache
+    if _capability_cache is None:
+        _capability_cache = CapabilityCache()
+    return _capability_cache
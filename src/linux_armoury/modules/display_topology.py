@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Display Topology Module for Linux Armoury
+Parses xrandr / wlr-randr / kscreen-doctor output once into a
+DisplayTopology (outputs, modes, current mode, primary output) and caches
+it, so display queries and refresh rate changes need at most one fork.
+"""
+
+import glob
+import re
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Re-query after this many seconds even if no change was detected
+TOPOLOGY_TTL = 5.0
+
+DRM_STATUS_GLOB = "/sys/class/drm/card*-*/status"
+
+QUERY_COMMANDS = {
+    "xrandr": ["xrandr", "--query"],
+    "wlr-randr": ["wlr-randr"],
+    "kscreen-doctor": ["kscreen-doctor", "-o"],
+}
+
+
+@dataclass
+class DisplayOutput:
+    """A single display output and its modes"""
+
+    name: str
+    connected: bool = True
+    primary: bool = False
+    # "WIDTHxHEIGHT" -> refresh rates in Hz, in the order reported
+    modes: Dict[str, List[float]] = field(default_factory=dict)
+    current_mode: Optional[str] = None
+    current_rate: Optional[float] = None
+
+    @property
+    def resolution(self) -> Optional[Tuple[int, int]]:
+        """Current (width, height), if known"""
+        if not self.current_mode:
+            return None
+        width, height = self.current_mode.split("x")
+        return (int(width), int(height))
+
+    def rates_for(self, mode: Optional[str] = None) -> List[int]:
+        """Supported refresh rates (rounded Hz) for a mode (default: current)"""
+        mode = mode or self.current_mode
+        if not mode:
+            return []
+        return sorted({int(round(rate)) for rate in self.modes.get(mode, [])})
+
+    def _add_mode(self, mode: str, rate: float, current: bool = False):
+        rates = self.modes.setdefault(mode, [])
+        if rate not in rates:
+            rates.append(rate)
+        if current:
+            self.current_mode = mode
+            self.current_rate = rate
+
+
+@dataclass
+class DisplayTopology:
+    """Parsed display configuration from one query"""
+
+    tool: str = ""
+    outputs: List[DisplayOutput] = field(default_factory=list)
+    timestamp: float = 0.0
+
+    @property
+    def primary(self) -> Optional[DisplayOutput]:
+        """Primary output, else the first connected one"""
+        connected = [o for o in self.outputs if o.connected]
+        for output in connected:
+            if output.primary:
+                return output
+        return connected[0] if connected else None
+
+    def get_output(self, name: str) -> Optional[DisplayOutput]:
+        """Look up an output by name"""
+        for output in self.outputs:
+            if output.name == name:
+                return output
+        return None
+
+    # ========== Parsers ==========
+
+    @classmethod
+    def parse_xrandr(cls, text: str) -> "DisplayTopology":
+        """Parse `xrandr --query` output"""
+        topology = cls(tool="xrandr")
+        output = None
+        for line in text.split("\n"):
+            if not line.strip() or line.startswith("Screen "):
+                continue
+            if not line[0].isspace():
+                parts = line.split()
+                if len(parts) < 2 or parts[1] not in ("connected", "disconnected"):
+                    output = None
+                    continue
+                output = DisplayOutput(
+                    name=parts[0],
+                    connected=parts[1] == "connected",
+                    primary=len(parts) > 2 and parts[2] == "primary",
+                )
+                topology.outputs.append(output)
+                continue
+
+            # Mode line: "   1920x1080     60.00*+  120.00   144.00"
+            if output is None:
+                continue
+            parts = line.split()
+            if not re.match(r"^\d+x\d+", parts[0]):
+                continue
+            mode = re.match(r"^(\d+x\d+)", parts[0]).group(1)
+            for part in parts[1:]:
+                current = "*" in part
+                try:
+                    rate = float(part.replace("*", "").replace("+", ""))
+                except ValueError:
+                    continue
+                output._add_mode(mode, rate, current)
+        return topology
+
+    @classmethod
+    def parse_wlr_randr(cls, text: str) -> "DisplayTopology":
+        """Parse `wlr-randr` output"""
+        topology = cls(tool="wlr-randr")
+        output = None
+        for line in text.split("\n"):
+            if not line.strip():
+                continue
+            if not line[0].isspace():
+                output = DisplayOutput(name=line.split()[0])
+                # wlr-randr has no primary flag; the first output is used
+                output.primary = not topology.outputs
+                topology.outputs.append(output)
+                continue
+            if output is None:
+                continue
+            if line.strip().startswith("Enabled:"):
+                output.connected = line.split(":", 1)[1].strip() == "yes"
+                continue
+            # Mode line: "    2560x1600 px, 165.000000 Hz (preferred, current)"
+            match = re.search(r"(\d+x\d+) px,\s*(\d+\.?\d*)\s*Hz", line)
+            if match:
+                output._add_mode(
+                    match.group(1),
+                    float(match.group(2)),
+                    "current" in line.lower(),
+                )
+        return topology
+
+    @classmethod
+    def parse_kscreen_doctor(cls, text: str) -> "DisplayTopology":
+        """Parse `kscreen-doctor -o` output"""
+        topology = cls(tool="kscreen-doctor")
+        # Strip terminal colour codes kscreen-doctor may emit
+        text = re.sub(r"\x1b\[[0-9;]*m", "", text)
+        output = None
+        for line in text.split("\n"):
+            match = re.search(r"Output:\s+\d+\s+(\S+)", line)
+            if match:
+                output = DisplayOutput(name=match.group(1))
+                topology.outputs.append(output)
+            if output is None:
+                continue
+            if re.search(r"\bdisconnected\b", line):
+                output.connected = False
+            if re.search(r"\bpriority 1\b", line):
+                output.primary = True
+            # Modes: "1:2560x1600@165*!  2:2560x1600@60"  (* current, ! preferred)
+            for _mode_id, mode, rate, flags in re.findall(
+                r"(\d+):(\d+x\d+)@(\d+(?:\.\d+)?)([*!]*)", line
+            ):
+                output._add_mode(mode, float(rate), "*" in flags)
+
+        for output in topology.outputs:
+            if output.current_mode is None and output.modes:
+                output.current_mode = next(iter(output.modes))
+        return topology
+
+    @classmethod
+    def parse(cls, tool: str, text: str) -> "DisplayTopology":
+        """Parse the query output of a display tool"""
+        if tool == "xrandr":
+            return cls.parse_xrandr(text)
+        if tool == "wlr-randr":
+            return cls.parse_wlr_randr(text)
+        if tool == "kscreen-doctor":
+            return cls.parse_kscreen_doctor(text)
+        return cls(tool=tool)
+
+
+def query_topology(tool: Optional[str]) -> DisplayTopology:
+    """Run the display tool once and parse its output"""
+    command = QUERY_COMMANDS.get(tool or "")
+    if not command:
+        return DisplayTopology(tool=tool or "", timestamp=time.time())
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=5)
+        topology = DisplayTopology.parse(tool, result.stdout)
+    except (
+        subprocess.CalledProcessError,
+        FileNotFoundError,
+        subprocess.TimeoutExpired,
+    ) as e:
+        print(f"Error querying displays with {tool}: {e}")
+        topology = DisplayTopology(tool=tool)
+    topology.timestamp = time.time()
+    return topology
+
+
+def drm_fingerprint() -> Tuple[Tuple[str, str], ...]:
+    """Cheap sysfs fingerprint of DRM connector hotplug state"""
+    state = []
+    for path in sorted(glob.glob(DRM_STATUS_GLOB)):
+        try:
+            with open(path, "r") as f:
+                state.append((path, f.read().strip()))
+        except OSError:
+            continue
+    return tuple(state)
+
+
+class DisplayTopologyCache:
+    """Caches the display topology until it changes or expires"""
+
+    def __init__(self, ttl: float = TOPOLOGY_TTL):
+        self.ttl = ttl
+        self._topology: Optional[DisplayTopology] = None
+        self._tool: Optional[str] = None
+        self._fingerprint: Optional[tuple] = None
+        self._expires = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, tool: Optional[str], force: bool = False) -> DisplayTopology:
+        """Get the topology for a display tool, querying only when stale"""
+        with self._lock:
+            now = time.monotonic()
+            fingerprint = drm_fingerprint()
+            if (
+                force
+                or self._topology is None
+                or tool != self._tool
+                or now >= self._expires
+                or fingerprint != self._fingerprint
+            ):
+                self._topology = query_topology(tool)
+                self._tool = tool
+                self._fingerprint = fingerprint
+                self._expires = now + self.ttl
+            return self._topology
+
+    def invalidate(self):
+        """Drop the cached topology (mode set, RandR or DRM change event)"""
+        with self._lock:
+            self._topology = None
+
+
+# Global singleton
+_topology_cache: Optional[DisplayTopologyCache] = None
+
+
+def get_topology_cache() -> DisplayTopologyCache:
+    """Get singleton display topology cache instance"""
+    global _topology_cache
+    if _topology_cache is None:
+        _topology_cache = DisplayTopologyCache()
+    return _topology_cache
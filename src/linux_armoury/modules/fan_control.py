@@ -5,13 +5,16 @@ Fan Control Module for Linux Armoury
 Provides fan curve and fan speed control for ASUS laptops.
 """
 
-import glob
 import os
-import subprocess
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+from .gpu_control import get_controller
+from .hwmon_index import ASUS_FAN_CHIPS, HwmonSensor, get_hwmon_index
+from .privileged_helper import get_privileged_helper
+from .sensor_handles import get_sensor_pool
+
 
 class FanProfile(Enum):
     """Fan control profiles"""
@@ -43,6 +46,7 @@ class FanController:
     """Controls fan behavior on ASUS laptops"""
 
     HWMON_PATH = "/sys/class/hwmon"
+    THERMAL_ZONE_PATH = "/sys/class/thermal/thermal_zone0/temp"
     PLATFORM_PATH = "/sys/devices/platform/asus-nb-wmi"
 
     # Default fan curve presets (temperature, speed %)
@@ -93,43 +97,33 @@ class FanController:
         self._hwmon_path: Optional[str] = None
         self._fan_curve_path: Optional[str] = None
         self._fans: List[Dict] = []
+        self._sensors = get_sensor_pool()
         self._detect_hardware()
 
     def _detect_hardware(self):
         """Detect fan hardware"""
         # Find ASUS hwmon device
-        for hwmon in glob.glob(f"{self.HWMON_PATH}/hwmon*"):
-            name_path = os.path.join(hwmon, "name")
-            if os.path.exists(name_path):
-                try:
-                    with open(name_path, "r") as f:
-                        name = f.read().strip()
-                    if name in ["asus", "asus-nb-wmi", "asus_wmi_sensors"]:
-                        self._hwmon_path = hwmon
-                        break
-                except Exception:
-                    pass
+        fans: List[HwmonSensor] = []
+        for chip in ASUS_FAN_CHIPS:
+            fans = get_hwmon_index().sensors(chip, "fan")
+            if fans:
+                self._hwmon_path = fans[0].hwmon_dir
+                break
 
         # Detect fans
-        if self._hwmon_path:
-            for i in range(1, 5):  # Check up to 4 fans
-                rpm_path = os.path.join(self._hwmon_path, f"fan{i}_input")
-                if os.path.exists(rpm_path):
-                    label_path = os.path.join(self._hwmon_path, f"fan{i}_label")
-                    label = "Fan " + str(i)
-                    if os.path.exists(label_path):
-                        try:
-                            with open(label_path, "r") as f:
-                                label = f.read().strip()
-                        except Exception:
-                            pass
-                    self._fans.append(
-                        {
-                            "id": i,
-                            "name": label,
-                            "rpm_path": rpm_path,
-                        }
-                    )
+        for sensor in fans:
+            if sensor.index > 4:  # Check up to 4 fans
+                continue
+            name = sensor.label
+            if name == f"fan{sensor.index}":
+                name = f"Fan {sensor.index}"
+            self._fans.append(
+                {
+                    "id": sensor.index,
+                    "name": name,
+                    "rpm_path": sensor.path,
+                }
+            )
 
         # Check for fan curve support
         curve_enable_path = os.path.join(self.PLATFORM_PATH, "fan_curve_enable")
@@ -152,80 +146,44 @@ class FanController:
         """Get current fan RPM"""
         for fan in self._fans:
             if fan["id"] == fan_id:
-                try:
-                    with open(fan["rpm_path"], "r") as f:
-                        return int(f.read().strip())
-                except Exception:
-                    return None
+                return self._sensors.read_int(fan["rpm_path"])
         return None
 
     def get_all_fan_speeds(self) -> List[FanStatus]:
         """Get speed of all detected fans"""
         result = []
         for fan in self._fans:
-            try:
-                with open(fan["rpm_path"], "r") as f:
-                    rpm = int(f.read().strip())
+            rpm = self._sensors.read_int(fan["rpm_path"])
+            if rpm is not None:
                 result.append(
                     FanStatus(rpm=rpm, pwm=0, name=fan["name"])  # Not always available
                 )
-            except Exception:
-                pass
         return result
 
     def get_cpu_temperature(self) -> Optional[float]:
         """Get CPU temperature"""
-        # Try various temperature sources
-        temp_paths = [
-            "/sys/class/thermal/thermal_zone0/temp",
-            "/sys/devices/platform/coretemp.0/hwmon/hwmon*/temp1_input",
-        ]
-
-        for pattern in temp_paths:
-            for path in glob.glob(pattern):
-                try:
-                    with open(path, "r") as f:
-                        temp = int(f.read().strip())
-                    # Convert millidegrees to degrees if needed
-                    if temp > 1000:
-                        temp = temp // 1000
-                    return temp
-                except Exception:
-                    continue
-        return None
+        temp = get_hwmon_index().cpu_temperature()
+        if temp is not None:
+            return temp
+
+        # Fall back to the first thermal zone
+        value = self._sensors.read_int(self.THERMAL_ZONE_PATH)
+        if value is None:
+            return None
+        # Convert millidegrees to degrees if needed
+        return value / 1000 if value > 1000 else float(value)
 
     def get_gpu_temperature(self) -> Optional[float]:
         """Get GPU temperature (if available)"""
-        # Try NVIDIA
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return float(result.stdout.strip())
-        except Exception:
-            pass
-
-        # Try AMD
-        for hwmon in glob.glob(f"{self.HWMON_PATH}/hwmon*"):
-            name_path = os.path.join(hwmon, "name")
-            if os.path.exists(name_path):
-                try:
-                    with open(name_path, "r") as f:
-                        name = f.read().strip()
-                    if "amdgpu" in name:
-                        temp_path = os.path.join(hwmon, "temp1_input")
-                        if os.path.exists(temp_path):
-                            with open(temp_path, "r") as f:
-                                temp = int(f.read().strip())
-                            return temp / 1000
-                except Exception:
-                    pass
+        # NVIDIA/AMD via the GPU controller, which never wakes a sleeping dGPU
+        stats = get_controller().get_live_stats()
+        if stats.dgpu_suspended:
+            return None
+        if stats.gpu_temp_c:
+            return float(stats.gpu_temp_c)
 
-        return None
+        # Other DRM drivers exposing hwmon
+        return get_hwmon_index().gpu_temperature()
 
     def enable_custom_fan_curve(self, enable: bool = True) -> Tuple[bool, str]:
         """Enable or disable custom fan curve"""
@@ -234,23 +192,10 @@ class FanController:
 
         value = "1" if enable else "0"
         status_msg = "enabled" if enable else "disabled"
-        try:
-            with open(self._fan_curve_path, "w") as f:
-                f.write(value)
+        success, error = get_privileged_helper().write(self._fan_curve_path, value)
+        if success:
             return True, f"Custom fan curve {status_msg}"
-        except PermissionError:
-            try:
-                cmd = ["pkexec", "tee", self._fan_curve_path]
-                result = subprocess.run(
-                    cmd, input=value, capture_output=True, text=True, timeout=30
-                )
-                if result.returncode == 0:
-                    return True, f"Custom fan curve {status_msg}"
-                return False, f"Failed: {result.stderr}"
-            except Exception as e:
-                return False, str(e)
-        except Exception as e:
-            return False, str(e)
+        return False, f"Failed: {error}"
 
     def get_temperatures(self) -> Dict[str, Optional[float]]:
         """Get all available temperatures"""
@@ -4,12 +4,22 @@ GPU Control Module for Linux Armoury
 Provides GPU switching via supergfxctl and live GPU stats monitoring.
 """
 
+import dataclasses
 import os
-import re
 import subprocess
+import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .capability_cache import get_capability_cache
+from .gpu_identity import GpuIdentity, parse_dpm_table, read_gpu_identity
+from .hwmon_index import get_hwmon_index
+from .sensor_handles import get_sensor_pool
+from .tool_registry import get_tool_registry
+
+if TYPE_CHECKING:
+    from .nvidia_smi import NvidiaSmiCollector
 
 
 class GpuMode(Enum):
@@ -83,6 +93,9 @@ class GpuLiveStats:
     performance_level: str = "auto"
     power_profile: str = "default"
 
+    # Runtime power management: a suspended dGPU is not sampled
+    dgpu_suspended: bool = False
+
 
 @dataclass
 class GpuSwitchingStatus:
@@ -99,27 +112,172 @@ class GpuSwitchingStatus:
     requires_reboot: bool = False
 
 
+class DgpuPowerGuard:
+    """Keeps live stats polling from waking or pinning a discrete GPU"""
+
+    # Runtime PM states in which touching the device would resume it
+    ASLEEP_STATES = ("suspended", "suspending", "off")
+
+    # Consecutive idle samples before polling pauses so the dGPU can suspend
+    IDLE_SAMPLES_BEFORE_RELEASE = 5
+    # Seconds polling stays paused after an idle release
+    RELEASE_HOLDOFF = 30.0
+
+    def __init__(self, device_path: str, use_supergfx: bool = False):
+        self.device_path = device_path
+        self.use_supergfx = use_supergfx
+        self._sensors = get_sensor_pool()
+        self._idle_samples = 0
+        self._holdoff_until = 0.0
+        # runtime_suspended_time when the last holdoff started
+        self._suspended_at_release: Optional[int] = None
+        # The last holdoff didn't let the device suspend (something else
+        # keeps it awake), so idle releases are pointless for now
+        self._release_futile = False
+
+        # Instrumentation
+        self.samples = 0
+        self.skipped_samples = 0
+        self.wakeups = 0
+
+    def _read_power_attr(self, name: str) -> str:
+        # PM core attributes never resume the device
+        return self._sensors.read(f"{self.device_path}/power/{name}").strip()
+
+    def runtime_status(self) -> str:
+        """Get the runtime PM status (active, suspended, off, ...)"""
+        status = self._read_power_attr("runtime_status")
+        if status:
+            return status
+        if self.use_supergfx:
+            from .asusd_client import get_supergfx_client
+
+            power = (get_supergfx_client().get_power_status() or "").lower()
+            if "suspend" in power:
+                return "suspended"
+            if "off" in power or "disabled" in power:
+                return "off"
+            if "active" in power:
+                return "active"
+        if not os.path.exists(self.device_path):
+            return "off"  # Removed from the bus (e.g. dGPU disabled)
+        return "unknown"
+
+    def is_asleep(self) -> bool:
+        """Check if the dGPU is runtime-suspended or powered off"""
+        return self.runtime_status() in self.ASLEEP_STATES
+
+    def can_runtime_suspend(self) -> bool:
+        """Check if runtime PM is allowed to suspend the device"""
+        return self._read_power_attr("control") == "auto"
+
+    def in_holdoff(self) -> bool:
+        """Check if polling is paused to let an idle dGPU suspend"""
+        return time.monotonic() < self._holdoff_until
+
+    def suspended_time(self) -> Optional[int]:
+        """Total milliseconds the device has spent runtime-suspended"""
+        value = self._read_power_attr("runtime_suspended_time")
+        return int(value) if value.isdigit() else None
+
+    def record_sample(self, busy_percent: int, suspended_before: Optional[int]):
+        """
+        Account for one sample of the device.
+
+        If the device spent time suspended while it was being sampled, the
+        sample resumed it and counts as a wakeup. Returns True when polling
+        should now pause so the idle device can suspend; that only happens
+        when runtime PM may suspend it and an earlier pause didn't find it
+        still active afterwards.
+        """
+        self.samples += 1
+        suspended_after = self.suspended_time()
+        if (
+            suspended_before is not None
+            and suspended_after is not None
+            and suspended_after > suspended_before
+        ):
+            self.wakeups += 1
+
+        suspended_since_release = (
+            suspended_before is not None
+            and self._suspended_at_release is not None
+            and suspended_before > self._suspended_at_release
+        )
+        if self._holdoff_until and time.monotonic() >= self._holdoff_until:
+            # First sample after a holdoff, so the device is awake again
+            self._holdoff_until = 0.0
+            self._release_futile = not suspended_since_release
+        elif self._release_futile and suspended_since_release:
+            self._release_futile = False
+
+        if busy_percent > 0:
+            self._idle_samples = 0
+            return False
+        self._idle_samples += 1
+        if self._idle_samples < self.IDLE_SAMPLES_BEFORE_RELEASE:
+            return False
+        self._idle_samples = 0
+        if self._release_futile or not self.can_runtime_suspend():
+            return False
+        self._suspended_at_release = suspended_after
+        self._holdoff_until = time.monotonic() + self.RELEASE_HOLDOFF
+        return True
+
+    def counters(self) -> Dict[str, int]:
+        """Get the instrumentation counters"""
+        return {
+            "samples": self.samples,
+            "skipped_samples": self.skipped_samples,
+            "wakeups": self.wakeups,
+        }
+
+
 class GpuController:
     """Controls GPU switching and monitors GPU stats"""
 
+    SYSFS_PCI_DEVICES = "/sys/bus/pci/devices"
+
+    # Seconds to wait for nvidia-smi to print its first row
+    NVIDIA_FIRST_ROW_TIMEOUT = 5.0
+
     def __init__(self):
         self.supergfxctl_available = self._check_supergfxctl()
+        self.nvidia_gpu_path = self._find_nvidia_gpu()
         self.nvidia_available = self._check_nvidia()
         self.amd_gpu_path = self._find_amd_gpu()
         self.intel_gpu_path = self._find_intel_gpu()
+        self._sensors = get_sensor_pool()
+        self._identities: Dict[str, GpuIdentity] = {}
+        self._nvidia_collector: Optional["NvidiaSmiCollector"] = None
+        self._supported_modes: List[GpuMode] = []
+
+        # Discrete GPUs are only sampled while they are awake
+        self._power_guards: Dict[str, DgpuPowerGuard] = {}
+        self._last_stats: Dict[str, GpuLiveStats] = {}
+        for path in (self.nvidia_gpu_path, self.amd_gpu_path):
+            if path and not read_gpu_identity(path, device_attrs=False).is_integrated:
+                self._power_guards[path] = DgpuPowerGuard(
+                    path, use_supergfx=self.supergfxctl_available
+                )
 
     def _check_supergfxctl(self) -> bool:
-        """Check if supergfxctl is installed and running"""
-        try:
-            result = subprocess.run(
-                ["supergfxctl", "--version"], capture_output=True, text=True, timeout=5
-            )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
+        """Check if supergfxctl is installed"""
+        return get_tool_registry().has("supergfxctl")
 
     def _check_nvidia(self) -> bool:
         """Check if NVIDIA GPU and nvidia-smi are available"""
+        if not get_tool_registry().has("nvidia-smi"):
+            return False
+        if self.nvidia_gpu_path is not None:
+            # Found in sysfs; don't run nvidia-smi, it would wake the dGPU
+            return True
+        return get_capability_cache().get(
+            "gpu.nvidia_smi", self._probe_nvidia_smi, tools=("nvidia-smi",)
+        )
+
+    def _probe_nvidia_smi(self) -> bool:
+        """Run nvidia-smi to check that it sees a GPU"""
         try:
             result = subprocess.run(
                 ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
@@ -131,6 +289,22 @@ class GpuController:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             return False
 
+    def _find_nvidia_gpu(self) -> Optional[str]:
+        """Find the NVIDIA GPU's PCI device path"""
+        try:
+            for device in sorted(os.listdir(self.SYSFS_PCI_DEVICES)):
+                device_path = f"{self.SYSFS_PCI_DEVICES}/{device}"
+                with open(f"{device_path}/class") as f:
+                    pci_class = f.read().strip()
+                with open(f"{device_path}/vendor") as f:
+                    vendor = f.read().strip()
+                # Display controllers (class 0x03xxxx) from NVIDIA
+                if pci_class.startswith("0x03") and vendor == "0x10de":
+                    return device_path
+        except OSError:
+            pass
+        return None
+
     def _find_amd_gpu(self) -> Optional[str]:
         """Find AMD GPU sysfs path"""
         try:
@@ -165,29 +339,66 @@ class GpuController:
             pass
         return None
 
-    # ========== GPU Switching Methods ==========
+    def _find_hwmon_dir(self, device_path: str) -> Optional[str]:
+        """Resolve the hwmon directory of a GPU device from the hwmon index"""
+        return get_hwmon_index().device_dir(device_path)
 
-    def get_switching_status(self) -> GpuSwitchingStatus:
-        """Get current GPU switching status from supergfxctl"""
-        status = GpuSwitchingStatus()
-
-        if not self.supergfxctl_available:
-            return status
+    def _read_hwmon(self, device_path: str, filename: str) -> str:
+        """Read a GPU hwmon attribute through the shared sensor pool"""
+        hwmon_dir = self._find_hwmon_dir(device_path)
+        if not hwmon_dir:
+            return ""
+        value = self._sensors.read(f"{hwmon_dir}/{filename}").strip()
+        if not value and not os.path.isdir(hwmon_dir):
+            # hwmon node was renumbered by a hotplug - resolve it again
+            get_hwmon_index().invalidate()
+        return value
+
+    def get_identity(self, device_path: str) -> GpuIdentity:
+        """Get the static identity of a GPU device (resolved once)"""
+        identity = self._identities.get(device_path)
+        if identity is None:
+            guard = self._power_guards.get(device_path)
+            if guard is not None and guard.is_asleep():
+                # Reading VRAM size/DPM tables would resume it; retry later
+                return read_gpu_identity(device_path, device_attrs=False)
+            identity = read_gpu_identity(device_path)
+            self._identities[device_path] = identity
+        return identity
+
+    @staticmethod
+    def _apply_identity(stats: GpuLiveStats, identity: GpuIdentity):
+        """Copy the static identity fields into a stats sample"""
+        stats.gpu_name = identity.name
+        stats.vendor = identity.vendor
+        stats.driver = identity.driver
+        stats.vram_total_mb = identity.vram_total_mb
+        stats.gpu_clock_max_mhz = identity.gpu_clock_max_mhz
+        stats.mem_clock_max_mhz = identity.mem_clock_max_mhz
 
-        status.available = True
+    # ========== GPU Switching Methods ==========
 
-        # Get current mode
+    def get_current_mode(self) -> Optional[GpuMode]:
+        """Get the current GPU mode (one `supergfxctl --get`)"""
+        if not self.supergfxctl_available:
+            return None
         try:
             result = subprocess.run(
                 ["supergfxctl", "--get"], capture_output=True, text=True, timeout=5
             )
             if result.returncode == 0:
-                mode_str = result.stdout.strip()
-                status.current_mode = GpuMode.from_string(mode_str)
+                return GpuMode.from_string(result.stdout.strip())
         except Exception:
             pass
+        return None
 
-        # Get supported modes
+    def get_supported_modes(self) -> List[GpuMode]:
+        """Get the GPU modes this machine supports (asked once per process)"""
+        if not self.supergfxctl_available:
+            return []
+        if self._supported_modes:
+            return list(self._supported_modes)
+        modes = []
         try:
             result = subprocess.run(
                 ["supergfxctl", "--supported"],
@@ -200,9 +411,23 @@ class GpuController:
                 for mode_str in modes_str.replace("[", "").replace("]", "").split(","):
                     mode = GpuMode.from_string(mode_str.strip())
                     if mode:
-                        status.supported_modes.append(mode)
+                        modes.append(mode)
         except Exception:
             pass
+        # Empty when supergfxd isn't running (yet): ask again next time
+        self._supported_modes = modes
+        return list(modes)
+
+    def get_switching_status(self) -> GpuSwitchingStatus:
+        """Get current GPU switching status from supergfxctl"""
+        status = GpuSwitchingStatus()
+
+        if not self.supergfxctl_available:
+            return status
+
+        status.available = True
+        status.current_mode = self.get_current_mode()
+        status.supported_modes = self.get_supported_modes()
 
         # Get vendor
         try:
@@ -280,6 +505,8 @@ class GpuController:
             )
 
             if result.returncode == 0:
+                # The set of visible GPUs changes with the mode: probe again
+                get_capability_cache().invalidate()
                 output = result.stdout.strip()
                 if "logout" in output.lower():
                     return True, "Mode change queued. Please log out and back in."
@@ -302,14 +529,16 @@ class GpuController:
 
         # Try NVIDIA first (if available and active)
         if self.nvidia_available:
-            nvidia_stats = self._get_nvidia_stats()
+            nvidia_stats = self._sample_guarded(
+                self.nvidia_gpu_path, self._get_nvidia_stats
+            )
             if nvidia_stats:
                 return nvidia_stats
 
         # Try AMD GPU
         if self.amd_gpu_path:
-            amd_stats = self._get_amd_stats()
-            if amd_stats.gpu_name != "Unknown":
+            amd_stats = self._sample_guarded(self.amd_gpu_path, self._get_amd_stats)
+            if amd_stats and amd_stats.gpu_name != "Unknown":
                 return amd_stats
 
         # Try Intel GPU
@@ -320,85 +549,78 @@ class GpuController:
 
         return stats
 
-    def _get_nvidia_stats(self) -> Optional[GpuLiveStats]:
-        """Get stats from NVIDIA GPU using nvidia-smi"""
-        try:
-            query_fields = [
-                "gpu_name",
-                "driver_version",
-                "clocks.current.graphics",
-                "clocks.current.memory",
-                "clocks.max.graphics",
-                "clocks.max.memory",
-                "utilization.gpu",
-                "utilization.memory",
-                "utilization.encoder",
-                "utilization.decoder",
-                "memory.total",
-                "memory.used",
-                "memory.free",
-                "temperature.gpu",
-                "power.draw",
-                "power.limit",
-                "fan.speed",
-            ]
+    def _sample_guarded(
+        self, device_path: Optional[str], sample: Callable[[], Optional[GpuLiveStats]]
+    ) -> Optional[GpuLiveStats]:
+        """Sample a GPU unless it is a discrete GPU that is asleep"""
+        guard = self._power_guards.get(device_path or "")
+        if guard is None:
+            return sample()
+
+        if guard.is_asleep():
+            guard.skipped_samples += 1
+            self._release_dgpu(device_path)
+            return self._suspended_stats(device_path)
+
+        cached = self._last_stats.get(device_path)
+        if guard.in_holdoff() and cached is not None:
+            # Idle: leave the device alone so it can runtime-suspend
+            guard.skipped_samples += 1
+            return dataclasses.replace(cached)
+
+        suspended_before = guard.suspended_time()
+        stats = sample()
+        if stats is None:
+            return None
+        if guard.record_sample(stats.gpu_usage_percent, suspended_before):
+            self._release_dgpu(device_path)
+        self._last_stats[device_path] = stats
+        return stats
 
-            result = subprocess.run(
-                [
-                    "nvidia-smi",
-                    f"--query-gpu={','.join(query_fields)}",
-                    "--format=csv,noheader,nounits",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+    def _release_dgpu(self, device_path: Optional[str]):
+        """Stop anything that keeps a dGPU awake between samples"""
+        if device_path == self.nvidia_gpu_path and self._nvidia_collector:
+            if self._nvidia_collector.is_running:
+                self._nvidia_collector.stop()
 
-            if result.returncode != 0:
-                return None
-
-            values = result.stdout.strip().split(", ")
-            if len(values) < len(query_fields):
-                return None
-
-            stats = GpuLiveStats()
-            stats.gpu_name = values[0]
-            stats.vendor = "NVIDIA"
-            stats.driver = values[1]
-
-            def safe_int(s):
-                try:
-                    return int(float(s))
-                except Exception:
-                    return 0
-
-            def safe_float(s):
-                try:
-                    return float(s)
-                except Exception:
-                    return 0.0
-
-            stats.gpu_clock_mhz = safe_int(values[2])
-            stats.mem_clock_mhz = safe_int(values[3])
-            stats.gpu_clock_max_mhz = safe_int(values[4])
-            stats.mem_clock_max_mhz = safe_int(values[5])
-            stats.gpu_usage_percent = safe_int(values[6])
-            stats.mem_usage_percent = safe_int(values[7])
-            stats.encoder_usage_percent = safe_int(values[8])
-            stats.decoder_usage_percent = safe_int(values[9])
-            stats.vram_total_mb = safe_int(values[10])
-            stats.vram_used_mb = safe_int(values[11])
-            stats.vram_free_mb = safe_int(values[12])
-            stats.gpu_temp_c = safe_int(values[13])
-            stats.power_draw_w = safe_float(values[14])
-            stats.power_limit_w = safe_float(values[15])
-            stats.fan_speed_percent = safe_int(values[16])
+    def _suspended_stats(self, device_path: str) -> GpuLiveStats:
+        """Stats for a sleeping dGPU: identity only, no device access"""
+        stats = GpuLiveStats(dgpu_suspended=True)
+        self._apply_identity(stats, self.get_identity(device_path))
+        return stats
 
-            return stats
+    def is_dgpu_asleep(self) -> bool:
+        """Check if a discrete GPU is present and runtime-suspended"""
+        return any(guard.is_asleep() for guard in self._power_guards.values())
 
-        except Exception as e:
-            print(f"Error getting NVIDIA stats: {e}")
+    def get_power_counters(self) -> Dict[str, int]:
+        """Sampling counters for the discrete GPUs (samples, skips, wakeups)"""
+        totals = {"samples": 0, "skipped_samples": 0, "wakeups": 0}
+        for guard in self._power_guards.values():
+            for key, value in guard.counters().items():
+                totals[key] += value
+        return totals
+
+    def _get_nvidia_stats(self) -> Optional[GpuLiveStats]:
+        """Get the latest NVIDIA stats row streamed by nvidia-smi"""
+        if self._nvidia_collector is None:
+            from .nvidia_smi import NvidiaSmiCollector
+
+            self._nvidia_collector = NvidiaSmiCollector()
+
+        collector = self._nvidia_collector
+        if not collector.start():
             return None
+        stats = collector.latest()
+        if stats is None:
+            # First row after launching nvidia-smi
+            stats = collector.wait_for_row(self.NVIDIA_FIRST_ROW_TIMEOUT)
+        return stats
+
+    def close(self):
+        """Stop background collectors"""
+        if self._nvidia_collector is not None:
+            self._nvidia_collector.stop()
 
     def _get_amd_stats(self) -> GpuLiveStats:
         """Get stats from AMD GPU via sysfs"""
@@ -408,48 +630,16 @@ class GpuController:
         if not self.amd_gpu_path:
             return stats
 
+        gpu_path = self.amd_gpu_path
+
         def read_sysfs(filename):
-            path = f"{self.amd_gpu_path}/{filename}"
-            try:
-                if os.path.exists(path):
-                    with open(path) as f:
-                        return f.read().strip()
-            except Exception:
-                pass
-            return ""
+            return self._sensors.read(f"{gpu_path}/{filename}").strip()
 
         def read_hwmon(filename):
-            hwmon_path = f"{self.amd_gpu_path}/hwmon"
-            if os.path.exists(hwmon_path):
-                for hwmon_dir in os.listdir(hwmon_path):
-                    path = f"{hwmon_path}/{hwmon_dir}/{filename}"
-                    try:
-                        if os.path.exists(path):
-                            with open(path) as f:
-                                return f.read().strip()
-                    except Exception:
-                        pass
-            return ""
+            return self._read_hwmon(gpu_path, filename)
 
-        # Get GPU name
-        try:
-            result = subprocess.run(
-                ["lspci", "-v"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                for line in result.stdout.split("\n"):
-                    if "VGA" in line and (
-                        "AMD" in line or "ATI" in line or "Radeon" in line
-                    ):
-                        match = re.search(r"\[(.+)\]", line)
-                        if match:
-                            stats.gpu_name = match.group(1)
-                            break
-        except Exception:
-            pass
-
-        if not stats.gpu_name or stats.gpu_name == "Unknown":
-            stats.gpu_name = "AMD GPU"
+        # Static identity (name, driver, VRAM size, DPM tables) is read once
+        self._apply_identity(stats, self.get_identity(gpu_path))
 
         # GPU busy percent
         busy = read_sysfs("gpu_busy_percent")
@@ -459,26 +649,18 @@ class GpuController:
             except Exception:
                 pass
 
-        # Parse clock speeds
-        sclk = read_sysfs("pp_dpm_sclk")
-        if sclk:
-            for line in sclk.split("\n"):
-                match = re.search(r"(\d+)\s*[Mm][Hh]z", line)
-                if match:
-                    clock = int(match.group(1))
-                    stats.gpu_clock_max_mhz = max(stats.gpu_clock_max_mhz, clock)
-                    if "*" in line:
-                        stats.gpu_clock_mhz = clock
-
-        mclk = read_sysfs("pp_dpm_mclk")
-        if mclk:
-            for line in mclk.split("\n"):
-                match = re.search(r"(\d+)\s*[Mm][Hh]z", line)
-                if match:
-                    clock = int(match.group(1))
-                    stats.mem_clock_max_mhz = max(stats.mem_clock_max_mhz, clock)
-                    if "*" in line:
-                        stats.mem_clock_mhz = clock
+        # Current clocks: hwmon reports them in Hz, otherwise use the DPM tables
+        sclk = read_hwmon("freq1_input")
+        if sclk.isdigit():
+            stats.gpu_clock_mhz = int(sclk) // 1_000_000
+        else:
+            stats.gpu_clock_mhz = parse_dpm_table(read_sysfs("pp_dpm_sclk"))[1] or 0
+
+        mclk = read_hwmon("freq2_input")
+        if mclk.isdigit():
+            stats.mem_clock_mhz = int(mclk) // 1_000_000
+        else:
+            stats.mem_clock_mhz = parse_dpm_table(read_sysfs("pp_dpm_mclk"))[1] or 0
 
         # Temperature
         temp = read_hwmon("temp1_input")
@@ -535,13 +717,6 @@ class GpuController:
                 pass
 
         # VRAM
-        vram_total = read_sysfs("mem_info_vram_total")
-        if vram_total:
-            try:
-                stats.vram_total_mb = int(vram_total) // (1024 * 1024)
-            except Exception:
-                pass
-
         vram_used = read_sysfs("mem_info_vram_used")
         if vram_used:
             try:
@@ -569,12 +744,6 @@ class GpuController:
                         stats.power_profile = parts[1].replace("*", "").replace(":", "")
                         break
 
-        # Driver info
-        driver_path = f"{self.amd_gpu_path}/driver"
-        if os.path.islink(driver_path):
-            driver = os.path.basename(os.readlink(driver_path))
-            stats.driver = driver
-
         return stats
 
     def _get_intel_stats(self) -> GpuLiveStats:
@@ -585,35 +754,10 @@ class GpuController:
         if not self.intel_gpu_path:
             return stats
 
-        try:
-            result = subprocess.run(
-                ["lspci", "-v"], capture_output=True, text=True, timeout=5
-            )
-            if result.returncode == 0:
-                for line in result.stdout.split("\n"):
-                    if "VGA" in line and "Intel" in line:
-                        match = re.search(r"\[(.+)\]", line)
-                        if match:
-                            stats.gpu_name = match.group(1)
-                            break
-        except Exception:
-            pass
-
-        if not stats.gpu_name or stats.gpu_name == "Unknown":
-            stats.gpu_name = "Intel Integrated Graphics"
+        self._apply_identity(stats, self.get_identity(self.intel_gpu_path))
 
         def read_hwmon(filename):
-            hwmon_path = f"{self.intel_gpu_path}/hwmon"
-            if os.path.exists(hwmon_path):
-                for hwmon_dir in os.listdir(hwmon_path):
-                    path = f"{hwmon_path}/{hwmon_dir}/{filename}"
-                    try:
-                        if os.path.exists(path):
-                            with open(path) as f:
-                                return f.read().strip()
-                    except Exception:
-                        pass
-            return ""
+            return self._read_hwmon(self.intel_gpu_path, filename)
 
         temp = read_hwmon("temp1_input")
         if temp:
@@ -629,7 +773,6 @@ class GpuController:
             except Exception:
                 pass
 
-        stats.driver = "i915"
         return stats
 
     def get_all_gpus(self) -> List[Dict]:
@@ -660,93 +803,28 @@ class GpuController:
             except Exception:
                 pass
 
-        # Check for AMD GPUs
+        # Check for AMD and Intel GPUs
         try:
-            for card in os.listdir("/sys/class/drm"):
-                if card.startswith("card") and "-" not in card:
-                    device_path = f"/sys/class/drm/{card}/device"
-                    vendor_path = f"{device_path}/vendor"
-                    if os.path.exists(vendor_path):
-                        with open(vendor_path) as f:
-                            vendor = f.read().strip()
-                            if vendor == "0x1002":
-                                name = "AMD GPU"
-                                result = subprocess.run(
-                                    ["lspci", "-v"],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=5,
-                                )
-                                if result.returncode == 0:
-                                    for line in result.stdout.split("\n"):
-                                        if "VGA" in line and (
-                                            "AMD" in line or "Radeon" in line
-                                        ):
-                                            match = re.search(r"\[(.+)\]", line)
-                                            if match:
-                                                name = match.group(1)
-                                                break
-
-                                gpu_type = "discrete"
-                                if any(
-                                    x in name
-                                    for x in [
-                                        "Vega",
-                                        "Renoir",
-                                        "Cezanne",
-                                        "Barcelo",
-                                        "Phoenix",
-                                        "Hawk",
-                                    ]
-                                ):
-                                    gpu_type = "integrated"
-
-                                gpus.append(
-                                    {
-                                        "index": int(card.replace("card", "")),
-                                        "name": name,
-                                        "vendor": "AMD",
-                                        "type": gpu_type,
-                                    }
-                                )
-        except Exception:
-            pass
-
-        # Check for Intel GPUs
-        try:
-            for card in os.listdir("/sys/class/drm"):
-                if card.startswith("card") and "-" not in card:
-                    device_path = f"/sys/class/drm/{card}/device"
-                    vendor_path = f"{device_path}/vendor"
-                    if os.path.exists(vendor_path):
-                        with open(vendor_path) as f:
-                            vendor = f.read().strip()
-                            if vendor == "0x8086":
-                                name = "Intel Graphics"
-                                result = subprocess.run(
-                                    ["lspci", "-v"],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=5,
-                                )
-                                if result.returncode == 0:
-                                    for line in result.stdout.split("\n"):
-                                        if "VGA" in line and "Intel" in line:
-                                            match = re.search(r"\[(.+)\]", line)
-                                            if match:
-                                                name = match.group(1)
-                                                break
-
-                                gpus.append(
-                                    {
-                                        "index": int(card.replace("card", "")),
-                                        "name": name,
-                                        "vendor": "Intel",
-                                        "type": "integrated",
-                                    }
-                                )
-        except Exception:
-            pass
+            cards = sorted(os.listdir("/sys/class/drm"))
+        except OSError:
+            cards = []
+        for card in cards:
+            if not card.startswith("card") or "-" in card:
+                continue
+            device_path = f"/sys/class/drm/{card}/device"
+            if not os.path.exists(f"{device_path}/vendor"):
+                continue
+            identity = self.get_identity(device_path)
+            if identity.vendor not in ("AMD", "Intel"):
+                continue
+            gpus.append(
+                {
+                    "index": int(card.replace("card", "")),
+                    "name": identity.name,
+                    "vendor": identity.vendor,
+                    "type": "integrated" if identity.is_integrated else "discrete",
+                }
+            )
 
         return gpus
 
@@ -798,3 +876,5 @@ if __name__ == "__main__":
     print(f"  Temp: {stats.gpu_temp_c}°C")
     print(f"  Power: {stats.power_draw_w:.1f}/{stats.power_limit_w:.1f}W")
     print(f"  Fan: {stats.fan_speed_rpm} RPM ({stats.fan_speed_percent}%)")
+    print(f"  dGPU asleep: {stats.dgpu_suspended}")
+    print(f"  dGPU polling: {ctrl.get_power_counters()}")
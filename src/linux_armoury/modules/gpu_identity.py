@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+GPU Identity Module for Linux Armoury
+Resolves the static description of a GPU (marketing name, vendor, PCI id,
+driver, VRAM size, DPM clock tables) once from sysfs and pci.ids, so live
+stats only have to read the values that actually change.
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+PCI_IDS_PATHS = (
+    "/usr/share/hwdata/pci.ids",
+    "/usr/share/misc/pci.ids",
+    "/usr/share/pci.ids",
+)
+
+VENDOR_NAMES = {
+    "0x1002": "AMD",
+    "0x10de": "NVIDIA",
+    "0x8086": "Intel",
+}
+
+# Generic names used when pci.ids has no entry for the device
+FALLBACK_NAMES = {
+    "AMD": "AMD GPU",
+    "NVIDIA": "NVIDIA GPU",
+    "Intel": "Intel Integrated Graphics",
+}
+
+_DPM_LEVEL_RE = re.compile(r"(\d+)\s*[Mm][Hh]z")
+
+
+@dataclass
+class GpuIdentity:
+    """Static GPU description, resolved once per device"""
+
+    device_path: str
+    vendor: str = "Unknown"
+    vendor_id: str = ""
+    device_id: str = ""
+    pci_slot: str = ""
+    # Marketing name (the bracketed part of the pci.ids entry, like lspci)
+    name: str = "Unknown"
+    # Full pci.ids device entry, including the chip code name
+    device_name: str = ""
+    driver: str = "Unknown"
+    # PCI boot_vga: the firmware drove the display with it (VGA class only)
+    boot_vga: Optional[bool] = None
+    # Runtime PM may suspend it (power/control is "auto")
+    runtime_pm: bool = False
+    vram_total_mb: int = 0
+    sclk_levels_mhz: List[int] = field(default_factory=list)
+    mclk_levels_mhz: List[int] = field(default_factory=list)
+
+    @property
+    def pci_id(self) -> str:
+        """Vendor:device id as shown by `lspci -nn` (e.g. 1002:73df)"""
+        return f"{self.vendor_id[2:]}:{self.device_id[2:]}"
+
+    @property
+    def gpu_clock_max_mhz(self) -> int:
+        """Highest core clock DPM level"""
+        return max(self.sclk_levels_mhz, default=0)
+
+    @property
+    def mem_clock_max_mhz(self) -> int:
+        """Highest memory clock DPM level"""
+        return max(self.mclk_levels_mhz, default=0)
+
+    @property
+    def is_integrated(self) -> bool:
+        """
+        Check if this is an integrated GPU.
+
+        On hybrid laptops the iGPU is the boot VGA device. dGPUs that aren't
+        VGA class (3D/display controllers) have no boot_vga, but unlike an
+        iGPU they can runtime-suspend.
+        """
+        if self.boot_vga is not None:
+            return self.boot_vga
+        return not self.runtime_pm
+
+
+def parse_dpm_table(text: str) -> Tuple[List[int], Optional[int]]:
+    """Parse a pp_dpm_* table into (levels in MHz, current level)"""
+    levels: List[int] = []
+    current = None
+    for line in text.split("\n"):
+        match = _DPM_LEVEL_RE.search(line)
+        if match:
+            clock = int(match.group(1))
+            levels.append(clock)
+            if "*" in line:
+                current = clock
+    return levels, current
+
+
+def marketing_name(device_name: str) -> str:
+    """Extract the bracketed marketing name from a pci.ids device entry"""
+    match = re.search(r"\[(.+)\]", device_name)
+    return match.group(1) if match else device_name
+
+
+_pci_name_cache: Dict[Tuple[str, str], Optional[str]] = {}
+_pci_name_lock = threading.Lock()
+
+
+def lookup_pci_name(
+    vendor_id: str, device_id: str, paths: Tuple[str, ...] = PCI_IDS_PATHS
+) -> Optional[str]:
+    """Look up a device's name in pci.ids (results are cached)"""
+    vendor = vendor_id.lower().replace("0x", "")
+    device = device_id.lower().replace("0x", "")
+    key = (vendor, device)
+    with _pci_name_lock:
+        if key in _pci_name_cache:
+            return _pci_name_cache[key]
+
+        name = None
+        for path in paths:
+            try:
+                name = _scan_pci_ids(path, vendor, device)
+            except OSError:
+                continue
+            break
+        _pci_name_cache[key] = name
+        return name
+
+
+def _scan_pci_ids(path: str, vendor: str, device: str) -> Optional[str]:
+    """Stream pci.ids until the vendor's device entry is found"""
+    in_vendor = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            if not line.startswith("\t"):
+                if in_vendor:
+                    return None  # Past the vendor's block
+                in_vendor = line[:4].lower() == vendor
+                continue
+            if in_vendor and not line.startswith("\t\t"):
+                if line[1:5].lower() == device:
+                    return line[5:].strip()
+    return None
+
+
+def _read_sysfs(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def read_gpu_identity(
+    device_path: str,
+    pci_ids_paths: Tuple[str, ...] = PCI_IDS_PATHS,
+    device_attrs: bool = True,
+) -> GpuIdentity:
+    """
+    Resolve the static identity of a GPU from its sysfs device directory.
+
+    With device_attrs=False only PCI config data is read (vendor, device,
+    driver); driver attributes such as VRAM size and DPM tables are skipped
+    because reading them resumes a runtime-suspended GPU.
+    """
+    identity = GpuIdentity(device_path=device_path)
+    identity.vendor_id = _read_sysfs(f"{device_path}/vendor").lower()
+    identity.device_id = _read_sysfs(f"{device_path}/device").lower()
+    identity.vendor = VENDOR_NAMES.get(identity.vendor_id, "Unknown")
+
+    for line in _read_sysfs(f"{device_path}/uevent").split("\n"):
+        key, _, value = line.partition("=")
+        if key == "PCI_SLOT_NAME":
+            identity.pci_slot = value
+        elif key == "DRIVER":
+            identity.driver = value
+    driver_link = f"{device_path}/driver"
+    if os.path.islink(driver_link):
+        identity.driver = os.path.basename(os.readlink(driver_link))
+
+    # PCI core and PM core attributes; reading them never resumes the device
+    boot_vga = _read_sysfs(f"{device_path}/boot_vga")
+    if boot_vga:
+        identity.boot_vga = boot_vga == "1"
+    identity.runtime_pm = _read_sysfs(f"{device_path}/power/control") == "auto"
+
+    device_name = None
+    if identity.vendor_id and identity.device_id:
+        device_name = lookup_pci_name(
+            identity.vendor_id, identity.device_id, pci_ids_paths
+        )
+    if device_name:
+        identity.device_name = device_name
+        identity.name = marketing_name(device_name)
+    else:
+        identity.name = FALLBACK_NAMES.get(identity.vendor, "Unknown")
+
+    if not device_attrs:
+        return identity
+
+    vram_total = _read_sysfs(f"{device_path}/mem_info_vram_total")
+    if vram_total.isdigit():
+        identity.vram_total_mb = int(vram_total) // (1024 * 1024)
+
+    identity.sclk_levels_mhz = parse_dpm_table(
+        _read_sysfs(f"{device_path}/pp_dpm_sclk")
+    )[0]
+    identity.mclk_levels_mhz = parse_dpm_table(
+        _read_sysfs(f"{device_path}/pp_dpm_mclk")
+    )[0]
+    return identity
@@ -8,9 +8,11 @@ Detects ASUS laptop hardware capabilities and available features.
 import glob
 import os
 import subprocess
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
+
+from .capability_cache import get_capability_cache
 
 
 class HardwareFeature(Enum):
@@ -43,6 +45,18 @@ class HardwareCapabilities:
     fan_curve_paths: List[str] = field(default_factory=list)
     dgpu_path: str = ""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON serializable dictionary"""
+        data = asdict(self)
+        data["features"] = sorted(feature.name for feature in self.features)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HardwareCapabilities":
+        """Create from a dictionary made by to_dict()"""
+        features = {HardwareFeature[name] for name in data["features"]}
+        return cls(**{**data, "features": features})
+
 
 class HardwareDetector:
     """Detects ASUS hardware and capabilities"""
@@ -73,6 +87,26 @@ class HardwareDetector:
         if self._capabilities is not None and not force:
             return self._capabilities
 
+        # Hardware only changes with the machine, kernel, drivers or tools, so it
+        # comes from the on-disk cache; daemon state is checked every time
+        cache = get_capability_cache()
+        if force:
+            cache.invalidate("hardware")
+        caps = HardwareCapabilities.from_dict(
+            cache.get("hardware", lambda: self._probe_hardware().to_dict())
+        )
+
+        # Check for asusd/supergfxctl
+        caps.asusd_available = self._check_asusd()
+        caps.supergfxctl_available = self._check_supergfxctl()
+        if caps.asusd_available:
+            caps.features.add(HardwareFeature.GPU_MUX)
+
+        self._capabilities = caps
+        return caps
+
+    def _probe_hardware(self) -> HardwareCapabilities:
+        """Probe sysfs for the machine's capabilities"""
         caps = HardwareCapabilities()
 
         # Check if this is an ASUS laptop
@@ -80,10 +114,6 @@ class HardwareDetector:
         caps.laptop_model = self._get_laptop_model()
         caps.kernel_version = self._get_kernel_version()
 
-        # Check for asusd/supergfxctl
-        caps.asusd_available = self._check_asusd()
-        caps.supergfxctl_available = self._check_supergfxctl()
-
         # Detect features
         if self._path_exists(self.SYSFS_PATHS["platform_profile"]):
             caps.features.add(HardwareFeature.PLATFORM_PROFILE)
@@ -120,11 +150,10 @@ class HardwareDetector:
         if self._path_exists(self.SYSFS_PATHS["panel_od"]):
             caps.features.add(HardwareFeature.PANEL_OVERDRIVE)
 
-        # Check GPU MUX
-        if caps.asusd_available or self._has_gpu_mux():
+        # Check GPU MUX (also assumed when asusd is running, see detect())
+        if self._has_gpu_mux():
             caps.features.add(HardwareFeature.GPU_MUX)
 
-        self._capabilities = caps
         return caps
 
     def _path_exists(self, path: str) -> bool:
@@ -154,13 +183,7 @@ class HardwareDetector:
 
     def _get_kernel_version(self) -> str:
         """Get kernel version"""
-        try:
-            result = subprocess.run(
-                ["uname", "-r"], capture_output=True, text=True, timeout=5
-            )
-            return result.stdout.strip()
-        except Exception:
-            return ""
+        return os.uname().release
 
     def _get_platform_profiles(self) -> List[str]:
         """Get available platform profiles"""
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Hwmon Index Module for Linux Armoury
+Walks /sys/class/hwmon once and maps chip name / sensor label to the
+sensor's input file (k10temp Tctl, amdgpu edge/junction/mem, nvme,
+asus fans, ...). Temperature readers then do a dict lookup followed by a
+pread through the shared sensor pool instead of rescanning sysfs.
+
+The index is rebuilt only when the set of hwmon devices changes (hotplug),
+when a cached sensor file disappears, or when invalidate() is called.
+"""
+
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from .sensor_handles import get_sensor_pool
+
+HWMON_ROOT = "/sys/class/hwmon"
+
+# Seconds between checks of the hwmon directory listing for hotplug
+HOTPLUG_CHECK_INTERVAL = 5.0
+
+# Sensor kinds and the divisor that converts raw sysfs values to units
+# (degrees C, RPM, W, V, A)
+SENSOR_SCALE = {
+    "temp": 1000.0,
+    "fan": 1.0,
+    "power": 1000000.0,
+    "in": 1000.0,
+    "curr": 1000.0,
+}
+
+_INPUT_RE = re.compile(r"^(temp|fan|power|in|curr)(\d+)_(input|average)$")
+
+# Sensor roles, as (chip, label) candidates in priority order.
+# A label of None matches the chip's first sensor of that kind.
+SENSOR_ROLES: Dict[str, List[Tuple[str, Optional[str]]]] = {
+    "cpu": [
+        ("k10temp", "Tctl"),
+        ("k10temp", "Tdie"),
+        ("zenpower", "Tdie"),
+        ("coretemp", "Package id 0"),
+        ("k10temp", None),
+        ("zenpower", None),
+        ("coretemp", None),
+        ("cpu_thermal", None),
+        ("acpitz", None),
+    ],
+    "gpu": [
+        ("amdgpu", "edge"),
+        ("amdgpu", None),
+        ("nouveau", None),
+        ("xe", None),
+        ("i915", None),
+    ],
+    "gpu_junction": [("amdgpu", "junction")],
+    "gpu_mem": [("amdgpu", "mem")],
+    "nvme": [("nvme", "Composite"), ("nvme", None)],
+}
+
+# DRM drivers whose hwmon reads resume a runtime-suspended GPU
+GPU_CHIPS = ("amdgpu", "nouveau", "xe", "i915", "radeon")
+
+# Runtime PM states in which reading the device would resume it
+_ASLEEP_STATES = ("suspended", "suspending")
+
+# hwmon chip names exposed by the ASUS platform drivers
+ASUS_FAN_CHIPS = ("asus", "asus-nb-wmi", "asus_wmi_sensors")
+
+
+@dataclass
+class HwmonSensor:
+    """A single hwmon sensor input"""
+
+    chip: str  # hwmon "name" (e.g. k10temp)
+    kind: str  # temp, fan, power, in or curr
+    index: int
+    label: str  # *_label contents, else e.g. "temp1"
+    path: str  # input file
+    hwmon_dir: str
+    # runtime_status of the GPU behind the sensor (GPU_CHIPS only)
+    pm_status: Optional[str] = None
+
+    @property
+    def scale(self) -> float:
+        """Divisor converting the raw value to display units"""
+        return SENSOR_SCALE.get(self.kind, 1.0)
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+class HwmonIndex:
+    """Chip/label -> sensor path index of /sys/class/hwmon"""
+
+    def __init__(self, root: str = HWMON_ROOT):
+        self.root = root
+        self._sensors: List[HwmonSensor] = []
+        self._by_label: Dict[Tuple[str, str, str], HwmonSensor] = {}
+        self._by_chip: Dict[Tuple[str, str], List[HwmonSensor]] = {}
+        self._chip_dirs: Dict[str, List[str]] = {}
+        self._device_dirs: Dict[str, str] = {}
+        # hwmon directories of the boot VGA device (the iGPU on hybrids)
+        self._boot_vga_dirs: Set[str] = set()
+        self._roles: Dict[str, Optional[HwmonSensor]] = {}
+        self._fingerprint: Optional[Tuple[str, ...]] = None
+        self._next_check = 0.0
+        self._built = False
+        self._sensor_pool = get_sensor_pool()
+        self._lock = threading.RLock()
+
+    # ========== Building ==========
+
+    def _list_hwmon(self) -> Tuple[str, ...]:
+        try:
+            return tuple(sorted(os.listdir(self.root)))
+        except OSError:
+            return ()
+
+    def _scan_dir(
+        self, hwmon_dir: str, chip: str, device: Optional[str] = None
+    ) -> List[HwmonSensor]:
+        """Collect the sensor inputs of one hwmon directory"""
+        sensors = []
+        pm_status = None
+        if device is not None and chip in GPU_CHIPS:
+            pm_status = f"{device}/power/runtime_status"
+        try:
+            entries = sorted(os.listdir(hwmon_dir))
+        except OSError:
+            return sensors
+        seen = set()
+        for entry in entries:
+            match = _INPUT_RE.match(entry)
+            if not match:
+                continue
+            kind, index = match.group(1), int(match.group(2))
+            if (kind, index) in seen:
+                continue  # power1_input and power1_average
+            seen.add((kind, index))
+            label = _read_text(f"{hwmon_dir}/{kind}{index}_label")
+            sensors.append(
+                HwmonSensor(
+                    chip=chip,
+                    kind=kind,
+                    index=index,
+                    label=label or f"{kind}{index}",
+                    path=f"{hwmon_dir}/{entry}",
+                    hwmon_dir=hwmon_dir,
+                    pm_status=pm_status,
+                )
+            )
+        sensors.sort(key=lambda s: (s.kind, s.index))
+        return sensors
+
+    def rebuild(self):
+        """Rescan /sys/class/hwmon"""
+        with self._lock:
+            fingerprint = self._list_hwmon()
+            sensors: List[HwmonSensor] = []
+            chip_dirs: Dict[str, List[str]] = {}
+            device_dirs: Dict[str, str] = {}
+            boot_vga_dirs: Set[str] = set()
+            for entry in fingerprint:
+                hwmon_dir = f"{self.root}/{entry}"
+                chip = _read_text(f"{hwmon_dir}/name")
+                if not chip:
+                    continue
+                chip_dirs.setdefault(chip, []).append(hwmon_dir)
+                device = None
+                if os.path.exists(f"{hwmon_dir}/device"):
+                    device = os.path.realpath(f"{hwmon_dir}/device")
+                    device_dirs.setdefault(device, hwmon_dir)
+                    if _read_text(f"{device}/boot_vga") == "1":
+                        boot_vga_dirs.add(hwmon_dir)
+                sensors.extend(self._scan_dir(hwmon_dir, chip, device))
+
+            self._sensors = sensors
+            self._by_label = {}
+            self._by_chip = {}
+            for sensor in sensors:
+                key = (sensor.chip, sensor.kind, sensor.label.lower())
+                self._by_label.setdefault(key, sensor)
+                self._by_chip.setdefault((sensor.chip, sensor.kind), []).append(sensor)
+            self._chip_dirs = chip_dirs
+            self._device_dirs = device_dirs
+            self._boot_vga_dirs = boot_vga_dirs
+            self._roles = {}
+            self._fingerprint = fingerprint
+            self._next_check = time.monotonic() + HOTPLUG_CHECK_INTERVAL
+            self._built = True
+
+    def _ensure_current(self):
+        """Build on first use and rebuild after hwmon hotplug"""
+        if not self._built:
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + HOTPLUG_CHECK_INTERVAL
+        if self._list_hwmon() != self._fingerprint:
+            self.rebuild()
+
+    def invalidate(self):
+        """Force a rebuild on the next lookup (e.g. on a hwmon uevent)"""
+        with self._lock:
+            self._built = False
+
+    # ========== Lookups ==========
+
+    def sensors(
+        self, chip: Optional[str] = None, kind: Optional[str] = None
+    ) -> List[HwmonSensor]:
+        """List sensors, optionally filtered by chip and kind"""
+        with self._lock:
+            self._ensure_current()
+            if chip is not None and kind is not None:
+                return list(self._by_chip.get((chip, kind), []))
+            return [
+                s
+                for s in self._sensors
+                if (chip is None or s.chip == chip) and (kind is None or s.kind == kind)
+            ]
+
+    def find(
+        self, chip: str, label: Optional[str] = None, kind: str = "temp"
+    ) -> Optional[HwmonSensor]:
+        """Look up a sensor by chip and label (None: the chip's first one)"""
+        with self._lock:
+            self._ensure_current()
+            if label is None:
+                candidates = self._by_chip.get((chip, kind))
+                return candidates[0] if candidates else None
+            return self._by_label.get((chip, kind, label.lower()))
+
+    def _candidates(self, chip: str, label: Optional[str]) -> List[HwmonSensor]:
+        """Sensors matching a role entry, one per hwmon directory"""
+        matches: Dict[str, HwmonSensor] = {}
+        for sensor in self._by_chip.get((chip, "temp"), []):
+            if label is None or sensor.label.lower() == label.lower():
+                matches.setdefault(sensor.hwmon_dir, sensor)
+        return list(matches.values())
+
+    def role(self, name: str) -> Optional[HwmonSensor]:
+        """
+        Resolve a sensor role from SENSOR_ROLES (e.g. "cpu", "gpu").
+
+        With several chips of one driver (iGPU and dGPU both on amdgpu), the
+        boot VGA device's chip is preferred: it is never runtime-suspended.
+        """
+        with self._lock:
+            self._ensure_current()
+            if name not in self._roles:
+                sensor = None
+                for chip, label in SENSOR_ROLES.get(name, []):
+                    candidates = self._candidates(chip, label)
+                    if candidates:
+                        boot_vga = [
+                            s for s in candidates if s.hwmon_dir in self._boot_vga_dirs
+                        ]
+                        sensor = (boot_vga or candidates)[0]
+                        break
+                self._roles[name] = sensor
+            return self._roles[name]
+
+    def chip_dirs(self, chip: str) -> List[str]:
+        """Get the hwmon directories of a chip"""
+        with self._lock:
+            self._ensure_current()
+            return list(self._chip_dirs.get(chip, []))
+
+    def chips(self) -> List[str]:
+        """Get the names of all hwmon chips"""
+        with self._lock:
+            self._ensure_current()
+            return list(self._chip_dirs)
+
+    def device_dir(self, device_path: str) -> Optional[str]:
+        """Get the hwmon directory belonging to a device (e.g. a GPU)"""
+        with self._lock:
+            self._ensure_current()
+            return self._device_dirs.get(os.path.realpath(device_path))
+
+    # ========== Reading ==========
+
+    def is_asleep(self, sensor: HwmonSensor) -> bool:
+        """Check if reading the sensor would resume a runtime-suspended GPU"""
+        if sensor.pm_status is None:
+            return False
+        # PM core attributes never resume the device
+        status = self._sensor_pool.read(sensor.pm_status).strip()
+        return status in _ASLEEP_STATES
+
+    def read(self, sensor: Optional[HwmonSensor]) -> Optional[float]:
+        """
+        Read a sensor in display units (degrees C, RPM, W, V, A).
+
+        GPU sensors read None while their device is runtime-suspended.
+        """
+        if sensor is None or self.is_asleep(sensor):
+            return None
+        raw = self._sensor_pool.read_int(sensor.path)
+        if raw is None:
+            if not os.path.exists(sensor.path):
+                # The hwmon device went away or was renumbered
+                self.invalidate()
+            return None
+        return raw / sensor.scale
+
+    def read_role(self, name: str) -> Optional[float]:
+        """Read the sensor filling a role"""
+        value = self.read(self.role(name))
+        if value is None and not self._built:
+            # Stale after a hotplug; try once more against the new index
+            value = self.read(self.role(name))
+        return value
+
+    def read_temp(self, chip: str, label: Optional[str] = None) -> Optional[float]:
+        """Read a temperature sensor in degrees Celsius"""
+        return self.read(self.find(chip, label))
+
+    def cpu_temperature(self) -> Optional[float]:
+        """CPU package temperature (k10temp Tctl, coretemp package, ...)"""
+        return self.read_role("cpu")
+
+    def gpu_temperature(self) -> Optional[float]:
+        """GPU temperature from a DRM driver hwmon (amdgpu edge, ...)"""
+        return self.read_role("gpu")
+
+
+# Global singleton
+_hwmon_index: Optional[HwmonIndex] = None
+
+
+def get_hwmon_index() -> HwmonIndex:
+    """Get singleton hwmon index instance"""
+    global _hwmon_index
+    if _hwmon_index is None:
+        _hwmon_index = HwmonIndex()
+    return _hwmon_index
@@ -11,6 +11,10 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional, Tuple
 
+from .capability_cache import get_capability_cache
+from .privileged_helper import get_privileged_helper
+from .tool_registry import get_tool_registry
+
 
 class AuraEffect(Enum):
     """Aura RGB lighting effects"""
@@ -110,6 +114,18 @@ class KeyboardController:
 
     def _detect_aura_support(self):
         """Check if Aura effects are supported via asusctl"""
+        # A negative result may only mean asusd isn't running (yet)
+        self._has_aura = get_capability_cache().get(
+            "keyboard.aura",
+            self._probe_aura_support,
+            tools=("asusctl",),
+            persist_if=bool,
+        )
+
+    def _probe_aura_support(self) -> bool:
+        """Ask asusctl whether the Aura interface is available"""
+        if not get_tool_registry().has("asusctl"):
+            return False
         try:
             # Try a simple asusctl aura command to check if the interface is available
             test_result = subprocess.run(
@@ -122,19 +138,27 @@ class KeyboardController:
             # Check if Aura interface is available
             error_output = test_result.stderr + test_result.stdout
             if "Did not find xyz.ljones.Aura" in error_output:
-                self._has_aura = False
+                return False
             elif test_result.returncode == 0:
-                self._has_aura = True
+                return True
             else:
                 # Command failed but not due to missing Aura interface
                 # Consider it available (may work with proper arguments)
-                self._has_aura = True
+                return True
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
             # asusctl not available or timed out - no Aura support
-            self._has_aura = False
+            return False
 
     def _detect_gz302_rgb_support(self):
         """Check if gz302-rgb tool is available for ROG Flow Z13"""
+        self._has_gz302_rgb = get_capability_cache().get(
+            "keyboard.gz302_rgb", self._probe_gz302_rgb_support, tools=("gz302-rgb",)
+        )
+
+    def _probe_gz302_rgb_support(self) -> bool:
+        """Run gz302-rgb to check that it is the ROG Flow Z13 tool"""
+        if not get_tool_registry().has("gz302-rgb"):
+            return False
         try:
             # Try a simple gz302-rgb command to check if the tool is available
             # gz302-rgb doesn't support --help, so we try an invalid command to see if it exists
@@ -147,12 +171,12 @@ class KeyboardController:
 
             # gz302-rgb returns 1 and shows usage for invalid commands, which means it's available
             if test_result.returncode == 1 and "GZ302 RGB Keyboard Control" in test_result.stdout:
-                self._has_gz302_rgb = True
+                return True
             else:
-                self._has_gz302_rgb = False
+                return False
         except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
             # gz302-rgb not available
-            self._has_gz302_rgb = False
+            return False
 
     def is_supported(self) -> bool:
         """Check if keyboard backlight is supported"""
@@ -193,26 +217,11 @@ class KeyboardController:
         level = max(0, min(self._max_brightness, level))
         brightness_path = os.path.join(self._backlight_path, "brightness")
 
-        # 1. Try direct write (fastest, works with udev rules)
-        try:
-            with open(brightness_path, "w") as f:
-                f.write(str(level))
+        # Direct write when udev rules allow it (fastest), else the helper
+        success, error = get_privileged_helper().write(brightness_path, str(level))
+        if success:
             return True, f"Brightness set to {level}"
-        except PermissionError:
-            pass  # Fall through to fallback
-        except Exception as e:
-            return False, str(e)
-
-        # 2. Try pkexec (fallback)
-        try:
-            # Use pkexec to write to the file
-            cmd = ["pkexec", "sh", "-c", f"echo {level} > {brightness_path}"]
-            subprocess.run(cmd, check=True)
-            return True, f"Brightness set to {level} (via pkexec)"
-        except subprocess.CalledProcessError:
-            return False, "Failed to set brightness (pkexec denied or failed)"
-        except Exception as e:
-            return False, f"Error: {e}"
+        return False, f"Failed to set brightness: {error}"
 
     def cycle_brightness(self) -> Tuple[bool, str]:
         """Cycle to next brightness level"""
@@ -248,25 +257,10 @@ class KeyboardController:
         mi_path = os.path.join(self._backlight_path, "multi_intensity")
         value = f"{color.red} {color.green} {color.blue}"
 
-        # 1. Try direct write
-        try:
-            with open(mi_path, "w") as f:
-                f.write(value)
+        success, error = get_privileged_helper().write(mi_path, value)
+        if success:
             return True, f"Color set to {color.to_hex()}"
-        except PermissionError:
-            pass  # Fall through to fallback
-        except Exception as e:
-            return False, str(e)
-
-        # 2. Try pkexec (fallback)
-        try:
-            cmd = ["pkexec", "sh", "-c", f"echo '{value}' > {mi_path}"]
-            subprocess.run(cmd, check=True)
-            return True, f"Color set to {color.to_hex()} (via pkexec)"
-        except subprocess.CalledProcessError:
-            return False, "Failed to set color (pkexec denied or failed)"
-        except Exception as e:
-            return False, f"Error: {e}"
+        return False, f"Failed to set color: {error}"
 
     def set_preset_color(self, name: str) -> Tuple[bool, str]:
         """Set a preset color by name"""
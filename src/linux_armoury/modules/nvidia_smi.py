@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+NVIDIA SMI Collector Module for Linux Armoury
+Keeps one `nvidia-smi --query-gpu=... -lms <interval>` process running in
+the background and parses its streamed CSV rows into GpuLiveStats, so live
+NVIDIA stats are a cached lookup instead of a 50-200 ms process launch.
+"""
+
+import atexit
+import dataclasses
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+from ..config import Config
+from .gpu_control import GpuLiveStats
+
+# Queried fields, in CSV column order
+NVIDIA_QUERY_FIELDS = [
+    "index",
+    "gpu_name",
+    "driver_version",
+    "clocks.current.graphics",
+    "clocks.current.memory",
+    "clocks.max.graphics",
+    "clocks.max.memory",
+    "utilization.gpu",
+    "utilization.memory",
+    "utilization.encoder",
+    "utilization.decoder",
+    "memory.total",
+    "memory.used",
+    "memory.free",
+    "temperature.gpu",
+    "power.draw",
+    "power.limit",
+    "fan.speed",
+]
+
+# Seconds to wait before relaunching nvidia-smi after it exited
+RESTART_DELAY = 10.0
+
+
+def _safe_int(value: str) -> int:
+    try:
+        return int(float(value))
+    except ValueError:
+        return 0
+
+
+def _safe_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def parse_nvidia_row(line: str) -> Optional[GpuLiveStats]:
+    """Parse one CSV row (noheader, nounits) into GpuLiveStats"""
+    values = [v.strip() for v in line.split(",")]
+    if len(values) < len(NVIDIA_QUERY_FIELDS) or not values[0].isdigit():
+        return None
+
+    stats = GpuLiveStats()
+    stats.gpu_name = values[1]
+    stats.vendor = "NVIDIA"
+    stats.driver = values[2]
+    stats.gpu_clock_mhz = _safe_int(values[3])
+    stats.mem_clock_mhz = _safe_int(values[4])
+    stats.gpu_clock_max_mhz = _safe_int(values[5])
+    stats.mem_clock_max_mhz = _safe_int(values[6])
+    stats.gpu_usage_percent = _safe_int(values[7])
+    stats.mem_usage_percent = _safe_int(values[8])
+    stats.encoder_usage_percent = _safe_int(values[9])
+    stats.decoder_usage_percent = _safe_int(values[10])
+    stats.vram_total_mb = _safe_int(values[11])
+    stats.vram_used_mb = _safe_int(values[12])
+    stats.vram_free_mb = _safe_int(values[13])
+    stats.gpu_temp_c = _safe_int(values[14])
+    stats.power_draw_w = _safe_float(values[15])
+    stats.power_limit_w = _safe_float(values[16])
+    stats.fan_speed_percent = _safe_int(values[17])
+    return stats
+
+
+class NvidiaSmiCollector:
+    """Streams NVIDIA GPU stats from a long-lived nvidia-smi process"""
+
+    def __init__(
+        self,
+        interval_ms: int = Config.MONITOR_INTERVAL,
+        command: str = "nvidia-smi",
+    ):
+        self.interval_ms = interval_ms
+        self.command = command
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._rows: Dict[int, GpuLiveStats] = {}
+        self._updated = 0.0
+        self._restart_after = 0.0
+        self._new_row = threading.Condition()
+        self._lock = threading.Lock()
+        atexit.register(self.stop)
+
+    def _build_command(self) -> List[str]:
+        return [
+            self.command,
+            f"--query-gpu={','.join(NVIDIA_QUERY_FIELDS)}",
+            "--format=csv,noheader,nounits",
+            "-lms",
+            str(self.interval_ms),
+        ]
+
+    def start(self) -> bool:
+        """Launch nvidia-smi in loop mode, False if it can't be started"""
+        with self._lock:
+            if self.is_running:
+                return True
+            if time.monotonic() < self._restart_after:
+                return False
+            try:
+                process = subprocess.Popen(
+                    self._build_command(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1,
+                )
+            except OSError as e:
+                print(f"Failed to start nvidia-smi: {e}")
+                self._restart_after = time.monotonic() + RESTART_DELAY
+                return False
+            self._process = process
+            self._thread = threading.Thread(
+                target=self._read_rows,
+                args=(process,),
+                name="nvidia-smi-collector",
+                daemon=True,
+            )
+            self._thread.start()
+        return True
+
+    def _read_rows(self, process: subprocess.Popen):
+        """Reader thread: parse rows as nvidia-smi prints them"""
+        for line in process.stdout:
+            stats = parse_nvidia_row(line)
+            if stats is None:
+                continue
+            index = int(line.split(",", 1)[0])
+            with self._new_row:
+                self._rows[index] = stats
+                self._updated = time.time()
+                self._new_row.notify_all()
+        process.wait()
+        with self._lock:
+            if self._process is process:
+                # nvidia-smi exited on its own (driver reload, GPU removed)
+                self._process = None
+                self._restart_after = time.monotonic() + RESTART_DELAY
+                with self._new_row:
+                    self._rows.clear()
+
+    def stop(self):
+        """Terminate nvidia-smi and forget the cached rows"""
+        with self._lock:
+            process, self._process = self._process, None
+            thread, self._thread = self._thread, None
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2)
+        with self._new_row:
+            self._rows.clear()
+            self._updated = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the nvidia-smi process is alive"""
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def last_update(self) -> float:
+        """Wall-clock time of the newest row (0 if none yet)"""
+        return self._updated
+
+    def latest(self, index: int = 0) -> Optional[GpuLiveStats]:
+        """Get a copy of the newest stats row for a GPU"""
+        with self._new_row:
+            stats = self._rows.get(index)
+            return dataclasses.replace(stats) if stats is not None else None
+
+    def wait_for_row(self, timeout: float, index: int = 0) -> Optional[GpuLiveStats]:
+        """Block until a row for the GPU is available"""
+        with self._new_row:
+            self._new_row.wait_for(lambda: index in self._rows, timeout)
+        return self.latest(index)
@@ -5,10 +5,32 @@ Provides CPU frequency scaling, TDP control via RyzenAdj, and AMD GPU overclocki
 """
 
 import re
-import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from .capability_cache import get_capability_cache
+from .privileged_helper import get_privileged_helper
+from .tool_registry import get_tool_registry
+from .uevent_monitor import get_power_supply_monitor, read_ac_online
+
+# Seconds of suspend after which remembered TDP limits are not trusted
+RESUME_THRESHOLD = 1.0
+
+
+def _time_suspended() -> float:
+    """Seconds the system has spent suspended since boot"""
+    return time.clock_gettime(time.CLOCK_BOOTTIME) - time.monotonic()
+
+
+# `ryzenadj -i` rows reporting the limits set by --stapm/--fast/--slow-limit
+RYZENADJ_LIMIT_ROWS = {
+    "stapm": "STAPM LIMIT",
+    "fast": "PPT LIMIT FAST",
+    "slow": "PPT LIMIT SLOW",
+}
 
 
 @dataclass
@@ -60,26 +82,28 @@ class OverclockingController:
         self.ryzenadj_available = self._check_ryzenadj()
         self.cpupower_available = self._check_cpupower()
         self.amd_gpu_path = self._find_amd_gpu()
+        # TDP limits in watts, from `ryzenadj -i` or our own writes. Firmware
+        # resets them on AC changes and resume, so they are only trusted
+        # while the AC state and suspend time they were taken at still hold
+        self._tdp_limits: Dict[str, float] = {}
+        self._tdp_context: Optional[Tuple[Optional[bool], float]] = None
+        self._tdp_lock = threading.Lock()
 
     def _check_ryzenadj(self) -> bool:
         """Check if RyzenAdj is available"""
-        try:
-            result = subprocess.run(
-                ["which", "ryzenadj"], capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return get_capability_cache().get(
+            "tools.ryzenadj",
+            lambda: get_tool_registry().has("ryzenadj"),
+            tools=("ryzenadj",),
+        )
 
     def _check_cpupower(self) -> bool:
         """Check if cpupower is available"""
-        try:
-            result = subprocess.run(
-                ["which", "cpupower"], capture_output=True, text=True
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return get_capability_cache().get(
+            "tools.cpupower",
+            lambda: get_tool_registry().has("cpupower"),
+            tools=("cpupower",),
+        )
 
     def _find_amd_gpu(self) -> Optional[str]:
         """Find AMD GPU sysfs path"""
@@ -109,31 +133,26 @@ class OverclockingController:
 
     def _write_sysfs(self, path: str, value: str) -> bool:
         """Write to a sysfs file (requires root)"""
-        try:
-            Path(path).write_text(value)
-            return True
-        except PermissionError:
-            try:
-                result = subprocess.run(
-                    ["pkexec", "tee", path], input=value, capture_output=True, text=True
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
-        except Exception:
-            return False
+        return self._write_sysfs_batch([(path, value)])
+
+    def _write_sysfs_batch(self, writes: List[Tuple[str, str]]) -> bool:
+        """Write several sysfs files with at most one privileged round trip"""
+        results = get_privileged_helper().write_batch(writes)
+        return all(success for success, _ in results)
 
     def _run_privileged(self, cmd: List[str]) -> tuple:
-        """Run a command with pkexec for privilege escalation"""
-        try:
-            result = subprocess.run(
-                ["pkexec"] + cmd, capture_output=True, text=True, timeout=30
-            )
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "", "Command timed out"
-        except Exception as e:
-            return False, "", str(e)
+        """Run a command as root through the privileged helper"""
+        return get_privileged_helper().run(cmd)
+
+    def _per_cpu_paths(self, attr: str) -> List[str]:
+        """Get an existing cpufreq attribute's path for every core"""
+        paths = []
+        for cpu in Path(self.SYSFS_CPU_BASE).iterdir():
+            if cpu.name.startswith("cpu") and cpu.name[3:].isdigit():
+                path = cpu / "cpufreq" / attr
+                if path.exists():
+                    paths.append(str(path))
+        return paths
 
     # ==================== CPU CONTROLS ====================
 
@@ -239,15 +258,8 @@ class OverclockingController:
             return success
 
         # Fallback to direct sysfs
-        cpu_path = Path(self.SYSFS_CPU_BASE)
-        success = True
-        for cpu in cpu_path.iterdir():
-            if cpu.name.startswith("cpu") and cpu.name[3:].isdigit():
-                gov_path = cpu / "cpufreq" / "scaling_governor"
-                if gov_path.exists():
-                    if not self._write_sysfs(str(gov_path), governor):
-                        success = False
-        return success
+        paths = self._per_cpu_paths("scaling_governor")
+        return self._write_sysfs_batch([(path, governor) for path in paths])
 
     def set_cpu_frequency_limits(
         self, min_mhz: Optional[int] = None, max_mhz: Optional[int] = None
@@ -271,17 +283,15 @@ class OverclockingController:
             return None
 
         try:
-            result = subprocess.run(
-                ["pkexec", "ryzenadj", "-i"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode != 0:
+            success, stdout, _ = self._run_privileged(["ryzenadj", "-i"])
+            if not success:
                 return None
 
             info: Dict[str, Any] = {}
-            for line in result.stdout.split("\n"):
-                # Parse RyzenAdj output
+            for line in stdout.split("\n"):
+                # Parse RyzenAdj output ("| STAPM LIMIT | 25.000 | stapm-limit |")
                 if "|" in line:
-                    parts = [p.strip() for p in line.split("|")]
+                    parts = [p.strip() for p in line.strip().strip("|").split("|")]
                     if len(parts) >= 3:
                         name = parts[0]
                         value = parts[1]
@@ -290,34 +300,138 @@ class OverclockingController:
                                 info[name] = float(value)
                             except ValueError:
                                 info[name] = value
+            self._remember_tdp_limits(info)
             return info
         except Exception:
             return None
 
+    @staticmethod
+    def _power_context() -> Tuple[Optional[bool], float]:
+        """AC state and time spent suspended, which firmware TDP resets follow"""
+        monitor = get_power_supply_monitor()
+        if monitor.is_event_driven:
+            on_ac = monitor.on_ac  # Kept current by power_supply uevents
+        else:
+            on_ac = read_ac_online(monitor.root)
+        return on_ac, _time_suspended()
+
+    def _remember_tdp_limits(self, info: Dict[str, Any]):
+        """Record the limits reported by `ryzenadj -i`"""
+        self._store_tdp_limits(
+            {
+                key: info[row]
+                for key, row in RYZENADJ_LIMIT_ROWS.items()
+                if isinstance(info.get(row), float)
+            }
+        )
+
+    def _drop_stale_limits(self, context: Tuple[Optional[bool], float]):
+        """
+        Forget limits remembered before an AC change or resume, which
+        restore the firmware defaults (caller holds self._tdp_lock)
+        """
+        previous = self._tdp_context
+        if previous is not None and (
+            previous[0] != context[0] or context[1] - previous[1] > RESUME_THRESHOLD
+        ):
+            self._tdp_limits.clear()
+            self._tdp_context = None
+
+    def _store_tdp_limits(self, limits: Dict[str, float]):
+        """Remember limits known to be in place now"""
+        context = self._power_context()
+        with self._tdp_lock:
+            self._drop_stale_limits(context)
+            self._tdp_limits.update(limits)
+            self._tdp_context = context
+
+    def forget_tdp_limits(self):
+        """Drop the remembered limits so the next apply writes them all"""
+        with self._tdp_lock:
+            self._tdp_limits.clear()
+            self._tdp_context = None
+
+    @property
+    def tdp_limits(self) -> Dict[str, float]:
+        """Last known TDP limits in watts (stapm, fast, slow)"""
+        context = self._power_context()
+        with self._tdp_lock:
+            self._drop_stale_limits(context)
+            return dict(self._tdp_limits)
+
+    def read_tdp_limits(self) -> Dict[str, float]:
+        """Read the TDP limits in place now (empty when they can't be read)"""
+        self.forget_tdp_limits()
+        self.get_ryzenadj_info()
+        return self.tdp_limits
+
+    def current_tdp_limits(self) -> Dict[str, float]:
+        """
+        TDP limits to diff against: read back with `ryzenadj -i` when that
+        can't show a pkexec prompt (helper service running), else the last
+        known limits.
+        """
+        if get_privileged_helper().runs_without_prompt():
+            return self.read_tdp_limits()
+        return self.tdp_limits
+
     def set_ryzenadj_tdp(
         self,
-        stapm_limit: Optional[int] = None,
-        fast_limit: Optional[int] = None,
-        slow_limit: Optional[int] = None,
+        stapm_limit: Optional[float] = None,
+        fast_limit: Optional[float] = None,
+        slow_limit: Optional[float] = None,
     ) -> bool:
         """Set TDP limits using RyzenAdj (values in watts)"""
         if not self.ryzenadj_available:
             return False
 
-        cmd = ["ryzenadj"]
-        if stapm_limit is not None:
-            cmd.extend(["--stapm-limit", str(stapm_limit * 1000)])  # Convert W to mW
-        if fast_limit is not None:
-            cmd.extend(["--fast-limit", str(fast_limit * 1000)])
-        if slow_limit is not None:
-            cmd.extend(["--slow-limit", str(slow_limit * 1000)])
-
-        if len(cmd) == 1:
+        limits = {"stapm": stapm_limit, "fast": fast_limit, "slow": slow_limit}
+        limits = {key: value for key, value in limits.items() if value is not None}
+        if not limits:
             return False
 
+        cmd = ["ryzenadj"]
+        for key, watts in limits.items():
+            cmd.extend([f"--{key}-limit", str(round(watts * 1000))])  # W to mW
+
         success, _, _ = self._run_privileged(cmd)
+        if success:
+            self._store_tdp_limits({k: float(v) for k, v in limits.items()})
+        else:
+            # A failed call may have applied some limits; trust nothing
+            self.forget_tdp_limits()
         return success
 
+    def apply_tdp(
+        self,
+        stapm_limit: Optional[int] = None,
+        fast_limit: Optional[int] = None,
+        slow_limit: Optional[int] = None,
+    ) -> bool:
+        """
+        Set TDP limits, writing only the ones that differ from the current
+        limits (see current_tdp_limits()). Nothing is run, and no pkexec
+        prompt shown, when they all match the last known limits.
+        """
+        if not self.ryzenadj_available:
+            return False
+
+        requested = {"stapm": stapm_limit, "fast": fast_limit, "slow": slow_limit}
+        current = self.current_tdp_limits()
+        changed = {
+            key: value
+            for key, value in requested.items()
+            if value is not None
+            and (key not in current or abs(current[key] - value) >= 0.5)
+        }
+        if not changed:
+            return True
+        return self.set_ryzenadj_tdp(
+            stapm_limit=changed.get("stapm"),
+            fast_limit=changed.get("fast"),
+            slow_limit=changed.get("slow"),
+        )
+
     def set_ryzenadj_temp_limit(self, temp_c: int) -> bool:
         """Set temperature limit using RyzenAdj"""
         if not self.ryzenadj_available:
@@ -481,15 +595,8 @@ class OverclockingController:
 
     def set_energy_performance_preference(self, preference: str) -> bool:
         """Set energy performance preference for all cores"""
-        cpu_path = Path(self.SYSFS_CPU_BASE)
-        success = True
-        for cpu in cpu_path.iterdir():
-            if cpu.name.startswith("cpu") and cpu.name[3:].isdigit():
-                epp_path = cpu / "cpufreq" / "energy_performance_preference"
-                if epp_path.exists():
-                    if not self._write_sysfs(str(epp_path), preference):
-                        success = False
-        return success
+        paths = self._per_cpu_paths("energy_performance_preference")
+        return self._write_sysfs_batch([(path, preference) for path in paths])
 
 
 # TDP presets for common scenarios
@@ -501,9 +608,21 @@ TDP_PRESETS = {
 }
 
 
+# Global singleton
+_overclocking_controller: Optional[OverclockingController] = None
+
+
+def get_overclocking_controller() -> OverclockingController:
+    """Get singleton overclocking controller instance"""
+    global _overclocking_controller
+    if _overclocking_controller is None:
+        _overclocking_controller = OverclockingController()
+    return _overclocking_controller
+
+
 if __name__ == "__main__":
     # Test the module
-    controller = OverclockingController()
+    controller = get_overclocking_controller()
 
     print("=== CPU Info ===")
     cpu_info = controller.get_cpu_info()
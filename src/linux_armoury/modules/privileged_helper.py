@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Privileged Helper Module for Linux Armoury
+Routes root-only sysfs writes and commands through the long-running Linux
+Armoury D-Bus service (data/systemd/linux-armoury.service). The service
+applies whole batches of whitelisted writes after a single polkit check
+per client connection, instead of one `pkexec` spawn and auth round trip
+per write. Without the service, writes fall back to `pkexec` as before.
+"""
+
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from ..config import Config
+
+SYSFS_ROOT = "/sys"
+
+# Writable sysfs attributes, relative to the sysfs root
+SYSFS_WRITE_WHITELIST = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"devices/system/cpu/cpu\d+/cpufreq/"
+        r"(scaling_governor|scaling_min_freq|scaling_max_freq"
+        r"|energy_performance_preference)",
+        r"devices/system/cpu/intel_pstate/no_turbo",
+        r"devices/system/cpu/cpufreq/boost",
+        r"class/power_supply/[^/]+/charge_control_end_threshold",
+        r"class/leds/[^/]*kbd_backlight[^/]*/(brightness|multi_intensity)",
+        r"class/drm/card\d+/device/"
+        r"(power_dpm_force_performance_level|pp_power_profile_mode"
+        r"|pp_od_clk_voltage)",
+        r"devices/platform/asus-nb-wmi/"
+        r"(fan_curve_enable|throttle_thermal_policy|panel_od)",
+        r"firmware/acpi/platform_profile",
+    )
+)
+
+# Programs the helper may run, looked up only in these directories
+COMMAND_WHITELIST = ("ryzenadj", "cpupower", "pwrcfg")
+COMMAND_DIRS = ("/usr/bin", "/usr/sbin", "/usr/local/bin", "/usr/local/sbin")
+_SAFE_ARG = re.compile(r"[A-Za-z0-9_.,:=+-]*")
+
+MAX_VALUE_LENGTH = 256
+
+HELPER_POLKIT_ACTION = "com.github.th3cavalry.linux-armoury.helper"
+
+# Seconds before retrying the helper service after it was unreachable
+HELPER_RETRY_INTERVAL = 30.0
+
+# Helper failures worth retrying through pkexec (e.g. a capability the
+# service's bounding set lacks, or a denied polkit check)
+_PERMISSION_ERRORS = re.compile(
+    r"not permitted|permission denied|not authorized|memory access|mmio",
+    re.IGNORECASE,
+)
+
+WriteResult = Tuple[bool, str]
+
+
+class SysfsWriter:
+    """Validates and applies whitelisted sysfs writes (runs as root)"""
+
+    def __init__(self, root: str = SYSFS_ROOT):
+        self.root = root
+
+    def resolve(self, path: str) -> Optional[str]:
+        """Map a /sys path onto the root, None if it isn't whitelisted"""
+        norm = os.path.normpath(path)
+        prefix = SYSFS_ROOT + "/"
+        if not norm.startswith(prefix):
+            return None
+        relative = norm[len(prefix) :]
+        if not any(p.fullmatch(relative) for p in SYSFS_WRITE_WHITELIST):
+            return None
+        target = os.path.join(self.root, relative)
+        # Symlinked class entries must still land inside the sysfs root
+        real_root = os.path.realpath(self.root)
+        if not os.path.realpath(target).startswith(real_root + os.sep):
+            return None
+        return target
+
+    def validate(self, path: str, value: str) -> Optional[str]:
+        """Get the reason a write would be rejected, None if it is allowed"""
+        if len(value) > MAX_VALUE_LENGTH or not value.isprintable():
+            return f"Invalid value for {path}"
+        if self.resolve(path) is None:
+            return f"Path not allowed: {path}"
+        return None
+
+    def write(self, path: str, value: str) -> WriteResult:
+        """Write one whitelisted attribute"""
+        return self.write_batch([(path, value)])[0]
+
+    def write_batch(self, writes: Sequence[Tuple[str, str]]) -> List[WriteResult]:
+        """
+        Apply a batch of writes in order.
+
+        The whole batch is validated first; if any entry is rejected nothing
+        is written.
+        """
+        errors = [self.validate(path, value) for path, value in writes]
+        if any(errors):
+            return [(False, error or "Batch rejected") for error in errors]
+
+        results: List[WriteResult] = []
+        for path, value in writes:
+            target = self.resolve(path)
+            try:
+                # No O_CREAT: only existing attributes can be written
+                fd = os.open(target, os.O_WRONLY | os.O_TRUNC)
+                try:
+                    os.write(fd, value.encode())
+                finally:
+                    os.close(fd)
+                results.append((True, ""))
+            except OSError as e:
+                results.append((False, f"Failed to write {path}: {e}"))
+        return results
+
+
+def resolve_command(argv: Sequence[str]) -> Optional[List[str]]:
+    """Resolve a whitelisted command to an absolute argv, None if rejected"""
+    if not argv or argv[0] not in COMMAND_WHITELIST:
+        return None
+    if not all(_SAFE_ARG.fullmatch(arg) for arg in argv[1:]):
+        return None
+    for directory in COMMAND_DIRS:
+        program = os.path.join(directory, argv[0])
+        if os.access(program, os.X_OK):
+            return [program] + list(argv[1:])
+    return None
+
+
+def run_command(argv: Sequence[str], timeout: int = 30) -> Tuple[bool, str, str]:
+    """Run a whitelisted command (runs as root)"""
+    resolved = resolve_command(argv)
+    if resolved is None:
+        return False, "", f"Command not allowed: {' '.join(argv)}"
+    try:
+        result = subprocess.run(
+            resolved, capture_output=True, text=True, timeout=timeout
+        )
+        return result.returncode == 0, result.stdout, result.stderr
+    except subprocess.TimeoutExpired:
+        return False, "", "Command timed out"
+    except OSError as e:
+        return False, "", str(e)
+
+
+class PolkitAuthorizer:
+    """Checks helper clients with polkit, once per connection (service side)"""
+
+    def __init__(self, bus):
+        self.bus = bus
+        self._authorized = set()
+        # Sender -> callbacks waiting for its (possibly interactive) check
+        self._pending = {}
+
+    def check(self, sender, callback):
+        """
+        Check the caller with polkit, once per connection.
+
+        The check may show an authentication prompt, so it runs
+        asynchronously and calls callback(authorized) from the main loop
+        instead of blocking other clients while the user types.
+        """
+        if sender is None or sender in self._authorized:
+            callback(sender is not None)
+            return
+        if sender in self._pending:
+            # One prompt per client, however many calls are waiting on it
+            self._pending[sender].append(callback)
+            return
+
+        try:
+            authority = self.bus.get_object(
+                "org.freedesktop.PolicyKit1",
+                "/org/freedesktop/PolicyKit1/Authority",
+                introspect=False,
+            )
+        except Exception as e:
+            print(f"Polkit check failed: {e}")
+            callback(False)
+            return
+        self._pending[sender] = [callback]
+
+        def on_reply(result):
+            is_authorized, _, _ = result
+            self._finish(sender, bool(is_authorized))
+
+        def on_error(e):
+            print(f"Polkit check failed: {e}")
+            self._finish(sender, False)
+
+        # Flag 1: allow an interactive authentication prompt
+        authority.CheckAuthorization(
+            ("system-bus-name", {"name": sender}),
+            HELPER_POLKIT_ACTION,
+            {},
+            1,
+            "",
+            signature="(sa{sv})sa{ss}us",
+            dbus_interface="org.freedesktop.PolicyKit1.Authority",
+            reply_handler=on_reply,
+            error_handler=on_error,
+            timeout=120,
+        )
+
+    def _finish(self, sender, authorized):
+        """Answer every call waiting on the sender's check"""
+        waiting = self._pending.pop(sender, None)
+        if waiting is None:
+            return  # The client disconnected meanwhile
+        if authorized:
+            self._authorized.add(sender)
+        for callback in waiting:
+            callback(authorized)
+
+    def forget(self, sender):
+        """Drop a disconnected client, failing calls still waiting on it"""
+        self._authorized.discard(sender)
+        for callback in self._pending.pop(sender, []):
+            callback(False)
+
+
+class PrivilegedHelperClient:
+    """Performs privileged writes: directly, via the helper, or via pkexec"""
+
+    def __init__(self):
+        self._proxy = None
+        self._retry_after = 0.0
+        self._lock = threading.Lock()
+
+    def _get_proxy(self):
+        """Get the helper service proxy, None if it isn't reachable"""
+        with self._lock:
+            if self._proxy is not None:
+                return self._proxy
+            if time.monotonic() < self._retry_after:
+                return None
+            try:
+                import dbus
+
+                bus = dbus.SystemBus()
+                self._proxy = dbus.Interface(
+                    bus.get_object(Config.DBUS_NAME, Config.DBUS_PATH),
+                    Config.DBUS_INTERFACE,
+                )
+            except Exception:
+                self._retry_after = time.monotonic() + HELPER_RETRY_INTERVAL
+            return self._proxy
+
+    def _helper_failed(self):
+        """Forget the proxy after a failed call and retry later"""
+        with self._lock:
+            self._proxy = None
+            self._retry_after = time.monotonic() + HELPER_RETRY_INTERVAL
+
+    def is_available(self) -> bool:
+        """Check if the helper service can be reached"""
+        return self._get_proxy() is not None
+
+    def runs_without_prompt(self) -> bool:
+        """Check if run() can work without spawning pkexec"""
+        return os.geteuid() == 0 or self.is_available()
+
+    def write(self, path: str, value: str) -> WriteResult:
+        """Write one sysfs attribute"""
+        return self.write_batch([(path, value)])[0]
+
+    def write_batch(self, writes: Sequence[Tuple[str, str]]) -> List[WriteResult]:
+        """
+        Write several sysfs attributes.
+
+        Attributes we may write ourselves (root, udev-granted groups) are
+        written directly; the rest go to the helper in one call.
+        """
+        results: List[Optional[WriteResult]] = [None] * len(writes)
+        pending = []
+        for i, (path, value) in enumerate(writes):
+            try:
+                with open(path, "w") as f:
+                    f.write(value)
+                results[i] = (True, "")
+            except PermissionError:
+                pending.append(i)
+            except OSError as e:
+                results[i] = (False, str(e))
+
+        if pending:
+            batch = [writes[i] for i in pending]
+            helper_results = self._helper_write(batch)
+            if helper_results is None:
+                helper_results = [self._pkexec_write(p, v) for p, v in batch]
+            for i, result in zip(pending, helper_results):
+                results[i] = result
+        return [r if r is not None else (False, "Not written") for r in results]
+
+    def run(self, argv: Sequence[str], timeout: int = 30) -> Tuple[bool, str, str]:
+        """
+        Run a whitelisted command as root.
+
+        A helper run that failed for lack of permission is retried through
+        pkexec; other failures are returned as they are.
+        """
+        if os.geteuid() == 0:
+            # Already root (e.g. inside the service itself): run it directly
+            return self._run([str(arg) for arg in argv], timeout)
+        result = self._helper_run(argv, timeout)
+        if result is not None and (
+            result[0] or not _PERMISSION_ERRORS.search(result[2])
+        ):
+            return result
+        return self._run([Config.CMD_PKEXEC] + list(argv), timeout)
+
+    @staticmethod
+    def _run(cmd: List[str], timeout: int) -> Tuple[bool, str, str]:
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=timeout
+            )
+            return result.returncode == 0, result.stdout, result.stderr
+        except subprocess.TimeoutExpired:
+            return False, "", "Command timed out"
+        except Exception as e:
+            return False, "", str(e)
+
+    def _helper_run(
+        self, argv: Sequence[str], timeout: int
+    ) -> Optional[Tuple[bool, str, str]]:
+        """Run a command through the helper service, None if it isn't reachable"""
+        proxy = self._get_proxy()
+        if proxy is None:
+            return None
+        try:
+            success, stdout, stderr = proxy.RunCommand(list(argv), timeout=timeout + 90)
+        except Exception:
+            self._helper_failed()
+            return None
+        return bool(success), str(stdout), str(stderr)
+
+    def _helper_write(
+        self, writes: Sequence[Tuple[str, str]]
+    ) -> Optional[List[WriteResult]]:
+        """Send a batch to the helper service, None if it isn't reachable"""
+        proxy = self._get_proxy()
+        if proxy is None:
+            return None
+        try:
+            # Generous timeout: the first call may wait for polkit auth
+            reply = proxy.WriteSysfs(list(writes), timeout=120)
+        except Exception:
+            self._helper_failed()
+            return None
+        return [(bool(ok), str(message)) for ok, message in reply]
+
+    @staticmethod
+    def _pkexec_write(path: str, value: str) -> WriteResult:
+        """Write one attribute through `pkexec tee`"""
+        try:
+            result = subprocess.run(
+                [Config.CMD_PKEXEC, "tee", path],
+                input=value,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+            if result.returncode == 0:
+                return True, ""
+            return False, result.stderr.strip() or "pkexec denied or failed"
+        except subprocess.TimeoutExpired:
+            return False, "Command timed out"
+        except Exception as e:
+            return False, str(e)
+
+
+# Global singleton
+_privileged_helper: Optional[PrivilegedHelperClient] = None
+
+
+def get_privileged_helper() -> PrivilegedHelperClient:
+    """Get singleton privileged helper client instance"""
+    global _privileged_helper
+    if _privileged_helper is None:
+        _privileged_helper = PrivilegedHelperClient()
+    return _privileged_helper
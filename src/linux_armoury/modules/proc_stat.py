@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+/proc/stat Snapshot Module for Linux Armoury
+Reads /proc/stat once per sampling tick and parses every field the
+monitors need (CPU times, context switches, interrupts, boot time) in a
+single pass, so all consumers of a tick share one read.
+"""
+
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .sensor_handles import get_sensor_pool
+
+PROC_STAT_PATH = "/proc/stat"
+
+# user, nice, system, idle, iowait, irq, softirq
+CPU_TIME_FIELDS = 7
+
+
+def _empty_times() -> array:
+    return array("q")
+
+
+@dataclass
+class ProcStatSnapshot:
+    """One parsed read of /proc/stat"""
+
+    # Aggregate "cpu" line (CPU_TIME_FIELDS values, empty if missing)
+    total_times: array = field(default_factory=_empty_times)
+    # Per-core "cpuN" lines, flattened row-major: core i is at
+    # [i * CPU_TIME_FIELDS:(i + 1) * CPU_TIME_FIELDS]
+    core_times: array = field(default_factory=_empty_times)
+    core_count: int = 0
+    context_switches: int = 0
+    interrupts: int = 0
+    boot_time: int = 0
+    processes: int = 0
+    procs_running: int = 0
+    procs_blocked: int = 0
+    timestamp: float = 0.0
+
+    @classmethod
+    def parse(cls, content: str, timestamp: Optional[float] = None):
+        """Parse the text of /proc/stat"""
+        snap = cls(timestamp=time.time() if timestamp is None else timestamp)
+        core_times = snap.core_times
+        width = CPU_TIME_FIELDS
+
+        for line in content.split("\n"):
+            if line.startswith("cpu"):
+                parts = line.split(None, width + 1)
+                values = array("q", map(int, parts[1 : width + 1]))
+                if len(values) < width:
+                    values.extend([0] * (width - len(values)))
+                if parts[0] == "cpu":
+                    snap.total_times = values
+                else:
+                    core_times.extend(values)
+                    snap.core_count += 1
+            elif line.startswith("intr "):
+                # Only the total is needed - skip splitting the per-IRQ list
+                end = line.find(" ", 5)
+                snap.interrupts = int(line[5 : end if end != -1 else None])
+            elif line.startswith("ctxt "):
+                snap.context_switches = int(line[5:])
+            elif line.startswith("btime "):
+                snap.boot_time = int(line[6:])
+            elif line.startswith("processes "):
+                snap.processes = int(line[10:])
+            elif line.startswith("procs_running "):
+                snap.procs_running = int(line[14:])
+            elif line.startswith("procs_blocked "):
+                snap.procs_blocked = int(line[14:])
+
+        return snap
+
+    @classmethod
+    def read(cls, path: str = PROC_STAT_PATH):
+        """Read and parse /proc/stat through the shared sensor pool"""
+        return cls.parse(get_sensor_pool().read(path))
+
+    def core(self, index: int) -> array:
+        """Get the CPU times of a single core"""
+        start = index * CPU_TIME_FIELDS
+        return self.core_times[start : start + CPU_TIME_FIELDS]
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Process Name Index Module for Linux Armoury
+Keeps an incrementally updated PID -> process name table so checks such
+as gaming app detection don't have to fork `ps` and rescan every process.
+
+The index is refreshed by diffing the PID list in /proc (only new PIDs are
+read). When the kernel proc connector is available (root), fork/exec/exit
+events mark individual PIDs instead and the /proc listing is skipped.
+"""
+
+import errno
+import os
+import re
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+# Full /proc rescan interval when polling, to catch exec() in existing PIDs
+FULL_RESCAN_INTERVAL = 30.0
+
+# Netlink proc connector constants (linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+PROC_EVENT_FORK = 0x00000001
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_COMM = 0x00000200
+PROC_EVENT_EXIT = 0x80000000
+
+NLMSG_HEADER = "=IHHII"
+CN_MSG_HEADER = "=IIIIHH"
+PROC_EVENT_HEADER = "=IIQ"
+NLMSG_DONE = 3
+
+
+def compile_name_matcher(patterns: Iterable[str]) -> Optional[Pattern]:
+    """Compile substring patterns into a single case-insensitive regex"""
+    # Longest first so the alternation prefers the most specific name
+    unique = sorted({p.lower() for p in patterns if p}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(p) for p in unique))
+
+
+class ProcessNameIndex:
+    """Incrementally maintained table of running process names"""
+
+    def __init__(self, proc_root: str = "/proc"):
+        self.proc_root = proc_root
+        self._names: Dict[int, str] = {}
+        self._matches: Set[int] = set()
+        self._patterns: Tuple[str, ...] = ()
+        self._matcher: Optional[Pattern] = None
+
+        # PIDs reported by the proc connector since the last refresh
+        self._pending: Set[int] = set()
+        self._listener: Optional["ProcConnectorListener"] = None
+        self._last_full_scan = 0.0
+        self._lock = threading.Lock()
+
+    # ========== Matching ==========
+
+    def watch(self, patterns: Iterable[str]):
+        """Set the name patterns tracked by has_match()/matching()"""
+        patterns = tuple(patterns)
+        with self._lock:
+            if patterns == self._patterns:
+                return
+            self._patterns = patterns
+            self._matcher = compile_name_matcher(patterns)
+            self._matches = {
+                pid for pid, name in self._names.items() if self._is_match(name)
+            }
+
+    def _is_match(self, name: str) -> bool:
+        return self._matcher is not None and (
+            self._matcher.search(name.lower()) is not None
+        )
+
+    def has_match(self) -> bool:
+        """Check if any running process matches the watched patterns"""
+        self.refresh()
+        return bool(self._matches)
+
+    def matching(self) -> List[str]:
+        """Get names of running processes matching the watched patterns"""
+        self.refresh()
+        with self._lock:
+            return sorted({self._names[pid] for pid in self._matches})
+
+    def names(self) -> List[str]:
+        """Get the names of all running processes"""
+        self.refresh()
+        with self._lock:
+            return list(self._names.values())
+
+    # ========== Index maintenance ==========
+
+    def _read_name(self, pid: int) -> Optional[str]:
+        try:
+            fd = os.open(f"{self.proc_root}/{pid}/comm", os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            return os.read(fd, 64).decode(errors="replace").strip()
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    def _set(self, pid: int, name: Optional[str]):
+        if name is None:
+            self._names.pop(pid, None)
+            self._matches.discard(pid)
+            return
+        self._names[pid] = name
+        if self._is_match(name):
+            self._matches.add(pid)
+        else:
+            self._matches.discard(pid)
+
+    def _list_pids(self) -> Set[int]:
+        try:
+            return {int(e) for e in os.listdir(self.proc_root) if e.isdigit()}
+        except OSError:
+            return set()
+
+    def refresh(self, full: bool = False):
+        """Bring the index up to date with the running processes"""
+        with self._lock:
+            now = time.monotonic()
+            listener = self._listener
+            listening = listener is not None and listener.is_alive()
+
+            if listening and not full and not listener.take_overrun():
+                # Event driven: only look at PIDs the kernel told us about
+                pending, self._pending = self._pending, set()
+                for pid in pending:
+                    self._set(pid, self._read_name(pid))
+                return
+
+            current = self._list_pids()
+            known = self._names.keys()
+            for pid in known - current:
+                self._set(pid, None)
+
+            rescan_all = full or now - self._last_full_scan >= FULL_RESCAN_INTERVAL
+            targets = current if rescan_all else current - known
+            for pid in targets:
+                self._set(pid, self._read_name(pid))
+            if rescan_all:
+                self._last_full_scan = now
+            self._pending.clear()
+
+    def mark(self, pid: int):
+        """Flag a PID as changed (new, exec'd, renamed or exited)"""
+        with self._lock:
+            self._pending.add(pid)
+
+    # ========== Proc connector ==========
+
+    def start_listener(self) -> bool:
+        """Start following proc connector events, False if unavailable"""
+        if self._listener is not None and self._listener.is_alive():
+            return True
+        listener = ProcConnectorListener(self.mark)
+        if not listener.connect():
+            return False
+        # Make sure nothing that started before the subscription is missed
+        self.refresh(full=True)
+        self._listener = listener
+        listener.start()
+        return True
+
+    def stop_listener(self):
+        """Stop following proc connector events"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    @property
+    def is_event_driven(self) -> bool:
+        """Check if the index is updated from proc connector events"""
+        return self._listener is not None and self._listener.is_alive()
+
+
+class ProcConnectorListener(threading.Thread):
+    """Receives process fork/exec/exit events from the kernel"""
+
+    def __init__(self, on_pid):
+        super().__init__(name="proc-connector", daemon=True)
+        self._on_pid = on_pid
+        self._sock: Optional[socket.socket] = None
+        self._running = False
+        self._overrun = False
+
+    def connect(self) -> bool:
+        """Open and subscribe the netlink socket (requires CAP_NET_ADMIN)"""
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_CONNECTOR
+            )
+        except (OSError, AttributeError):
+            return False
+        try:
+            sock.bind((0, CN_IDX_PROC))
+            sock.send(self._control_message(PROC_CN_MCAST_LISTEN))
+            sock.settimeout(1.0)
+        except OSError:
+            sock.close()
+            return False
+        self._sock = sock
+        return True
+
+    @staticmethod
+    def _control_message(op: int) -> bytes:
+        payload = struct.pack("=I", op)
+        cn_msg = struct.pack(
+            CN_MSG_HEADER, CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0
+        )
+        body = cn_msg + payload
+        header = struct.pack(
+            NLMSG_HEADER,
+            struct.calcsize(NLMSG_HEADER) + len(body),
+            NLMSG_DONE,
+            0,
+            0,
+            os.getpid(),
+        )
+        return header + body
+
+    @staticmethod
+    def parse_event(data: bytes) -> Optional[Tuple[int, int]]:
+        """Parse a proc connector datagram into (event, tgid)"""
+        offset = struct.calcsize(NLMSG_HEADER) + struct.calcsize(CN_MSG_HEADER)
+        if len(data) < offset + struct.calcsize(PROC_EVENT_HEADER):
+            return None
+        what = struct.unpack_from(PROC_EVENT_HEADER, data, offset)[0]
+        offset += struct.calcsize(PROC_EVENT_HEADER)
+        try:
+            if what == PROC_EVENT_FORK:
+                # parent pid/tgid, child pid/tgid - ignore new threads
+                child_pid, child_tgid = struct.unpack_from("=II", data, offset + 8)
+                return (what, child_tgid) if child_pid == child_tgid else None
+            if what in (PROC_EVENT_EXEC, PROC_EVENT_COMM, PROC_EVENT_EXIT):
+                pid, tgid = struct.unpack_from("=II", data, offset)
+                return (what, tgid) if pid == tgid else None
+        except struct.error:
+            pass
+        return None
+
+    def run(self):
+        self._running = True
+        while self._running and self._sock is not None:
+            try:
+                data = self._sock.recv(4096)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if e.errno == errno.ENOBUFS:
+                    # Events were dropped; the index needs a full rescan
+                    self._overrun = True
+                    continue
+                break
+            event = self.parse_event(data)
+            if event is not None:
+                self._on_pid(event[1])
+        self._close()
+
+    def take_overrun(self) -> bool:
+        """Check (and clear) whether events were lost since the last call"""
+        overrun, self._overrun = self._overrun, False
+        return overrun
+
+    def stop(self):
+        """Unsubscribe and stop the listener thread"""
+        self._running = False
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(timeout=2)
+        self._close()
+
+    def _close(self):
+        if self._sock is not None:
+            try:
+                self._sock.send(self._control_message(PROC_CN_MCAST_IGNORE))
+            except OSError:
+                pass
+            self._sock.close()
+            self._sock = None
+
+
+# Global singleton
+_process_index: Optional[ProcessNameIndex] = None
+
+
+def get_process_index() -> ProcessNameIndex:
+    """Get singleton process name index instance"""
+    global _process_index
+    if _process_index is None:
+        _process_index = ProcessNameIndex()
+    return _process_index
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Process Scanner Module for Linux Armoury
+Scans /proc/[pid]/stat natively (no `ps` fork) and computes per-process
+CPU usage over the interval since the previous scan.
+"""
+
+import heapq
+import os
+import pwd
+import threading
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional
+
+# Field positions in /proc/[pid]/stat counted after the ")" closing comm
+_STATE = 0
+_UTIME = 11
+_STIME = 12
+_NICE = 16
+_NUM_THREADS = 17
+_STARTTIME = 19
+_RSS = 21
+
+
+class ProcessSample(NamedTuple):
+    """Raw per-process values from one scan"""
+
+    pid: int
+    name: str
+    state: str
+    cpu_percent: float
+    rss_bytes: int
+    nice: int
+    threads: int
+
+
+def _read_fd(path: str, size: int = 1024) -> bytes:
+    """Read a small proc file with raw syscalls (no file object overhead)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+class ProcessScanner:
+    """Native /proc process scanner with interval CPU accounting"""
+
+    def __init__(self, proc_root: str = "/proc"):
+        self.proc_root = proc_root
+        self.clock_ticks = os.sysconf("SC_CLK_TCK")
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+
+        # Previous scan, sorted by PID. starttime guards against PID reuse.
+        self._prev_pids = array("q")
+        self._prev_ticks = array("q")
+        self._prev_start = array("q")
+        self._prev_time: Optional[float] = None
+
+        self._user_cache: Dict[int, str] = {}
+        self._mem_total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _uptime(self) -> float:
+        """Seconds since boot, used for lifetime CPU% on the first scan"""
+        try:
+            return float(_read_fd(f"{self.proc_root}/uptime").split()[0])
+        except (OSError, ValueError, IndexError):
+            return 0.0
+
+    def _list_pids(self) -> List[int]:
+        try:
+            return sorted(int(e) for e in os.listdir(self.proc_root) if e.isdigit())
+        except OSError:
+            return []
+
+    def scan(self) -> List[ProcessSample]:
+        """Scan all processes and compute CPU% since the previous scan"""
+        with self._lock:
+            return self._scan()
+
+    def _scan(self) -> List[ProcessSample]:
+        now = time.monotonic()
+        hz = self.clock_ticks
+        page_size = self.page_size
+
+        prev_pids = self._prev_pids
+        prev_ticks = self._prev_ticks
+        prev_start = self._prev_start
+        prev_len = len(prev_pids)
+        elapsed = now - self._prev_time if self._prev_time is not None else 0.0
+        uptime = self._uptime() if elapsed <= 0 else 0.0
+
+        pids = array("q")
+        ticks = array("q")
+        starts = array("q")
+        samples: List[ProcessSample] = []
+        j = 0
+
+        for pid in self._list_pids():
+            try:
+                raw = _read_fd(f"{self.proc_root}/{pid}/stat")
+            except OSError:
+                continue  # Process exited while scanning
+
+            # comm may contain spaces and parentheses; it ends at the last ")"
+            text = raw.decode(errors="replace")
+            lpar = text.find("(")
+            rpar = text.rfind(")")
+            if lpar < 0 or rpar < 0:
+                continue
+            fields = text[rpar + 2 :].split()
+            if len(fields) <= _RSS:
+                continue
+
+            total = int(fields[_UTIME]) + int(fields[_STIME])
+            start = int(fields[_STARTTIME])
+            pids.append(pid)
+            ticks.append(total)
+            starts.append(start)
+
+            # Both PID lists are sorted, so walk the previous table in step
+            while j < prev_len and prev_pids[j] < pid:
+                j += 1
+
+            if elapsed > 0:
+                if j < prev_len and prev_pids[j] == pid and prev_start[j] == start:
+                    delta = total - prev_ticks[j]
+                else:
+                    delta = total  # Started (or PID reused) during the interval
+                cpu = delta * 100.0 / (elapsed * hz)
+            else:
+                # First scan: lifetime average, like ps
+                lifetime = uptime - start / hz
+                cpu = total * 100.0 / (lifetime * hz) if lifetime > 0 else 0.0
+
+            samples.append(
+                ProcessSample(
+                    pid,
+                    text[lpar + 1 : rpar],
+                    fields[_STATE],
+                    max(0.0, cpu),
+                    int(fields[_RSS]) * page_size,
+                    int(fields[_NICE]),
+                    int(fields[_NUM_THREADS]),
+                )
+            )
+
+        self._prev_pids = pids
+        self._prev_ticks = ticks
+        self._prev_start = starts
+        self._prev_time = now
+        return samples
+
+    def top(self, count: int = 10, sort_by: str = "cpu") -> List[ProcessSample]:
+        """Scan and return the top N processes by CPU or memory"""
+        samples = self.scan()
+        if sort_by == "cpu":
+            return heapq.nlargest(count, samples, key=lambda p: p.cpu_percent)
+        return heapq.nlargest(count, samples, key=lambda p: p.rss_bytes)
+
+    def get_user(self, pid: int) -> str:
+        """Get the owner name of a process"""
+        try:
+            uid = os.stat(f"{self.proc_root}/{pid}").st_uid
+        except OSError:
+            return ""
+        user = self._user_cache.get(uid)
+        if user is None:
+            try:
+                user = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                user = str(uid)
+            self._user_cache[uid] = user
+        return user
+
+    def get_command(self, pid: int, name: str = "") -> str:
+        """Get the full command line of a process"""
+        try:
+            raw = _read_fd(f"{self.proc_root}/{pid}/cmdline", 4096)
+        except OSError:
+            raw = b""
+        command = raw.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+        # Kernel threads have no command line; ps shows them as [name]
+        return command or (f"[{name}]" if name else "")
+
+    def mem_total(self) -> int:
+        """Total system memory in bytes (read once)"""
+        if self._mem_total_bytes is None:
+            self._mem_total_bytes = 0
+            try:
+                with open(f"{self.proc_root}/meminfo", "r") as f:
+                    for line in f:
+                        if line.startswith("MemTotal:"):
+                            self._mem_total_bytes = int(line.split()[1]) * 1024
+                            break
+            except (OSError, ValueError, IndexError):
+                pass
+        return self._mem_total_bytes
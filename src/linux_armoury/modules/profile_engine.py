@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Profile Engine Module for Linux Armoury
+Applies a profile as one transaction. The current hardware state is read
+once and only the settings that differ are written. Independent settings
+are written concurrently, and when a step fails the settings already
+changed are restored. Every step's latency is reported.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class ProfileStep:
+    """One hardware setting a profile can change"""
+
+    name: str
+    # Current value, or None when it can't be read back
+    read: Callable[[], Any]
+    # Returns a bool or a (success, message) tuple
+    write: Callable[[Any], Any]
+    # Later stages only run once every earlier stage has succeeded
+    stage: int = 0
+    # Maps values to a canonical form before comparing them
+    normalize: Optional[Callable[[Any], Any]] = None
+    # A failure is reported but doesn't roll back the other settings (for
+    # steps that can't be undone themselves, e.g. a GPU mode switch)
+    best_effort: bool = False
+
+    def same(self, current: Any, target: Any) -> bool:
+        """Check if the current value already matches the target"""
+        if self.normalize is not None:
+            return self.normalize(current) == self.normalize(target)
+        return current == target
+
+
+@dataclass
+class StepResult:
+    """Outcome of writing one setting"""
+
+    name: str
+    success: bool
+    latency_ms: float
+    message: str = ""
+
+
+@dataclass
+class ApplyReport:
+    """Outcome of applying a profile"""
+
+    profile: str
+    steps: List[StepResult] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    rolled_back: List[str] = field(default_factory=list)
+    read_ms: float = 0.0
+    total_ms: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """True when every changed setting was written"""
+        return all(step.success for step in self.steps)
+
+    @property
+    def failed(self) -> List[StepResult]:
+        """Steps that failed"""
+        return [step for step in self.steps if not step.success]
+
+    def summary(self) -> str:
+        """One-line summary with per-step latency"""
+        steps = ", ".join(
+            f"{step.name} {step.latency_ms:.0f} ms"
+            + ("" if step.success else " (failed)")
+            for step in self.steps
+        )
+        text = (
+            f"{self.profile}: {len(self.steps)} changed, "
+            f"{len(self.unchanged)} unchanged in {self.total_ms:.0f} ms "
+            f"(read {self.read_ms:.0f} ms)"
+        )
+        if steps:
+            text += f" [{steps}]"
+        if self.rolled_back:
+            text += f"; rolled back {', '.join(self.rolled_back)}"
+        return text
+
+
+class ProfileEngine:
+    """Diff-based, concurrent, rolled-back profile application"""
+
+    MAX_WORKERS = 4
+
+    def __init__(self, steps: List[ProfileStep]):
+        self.steps: Dict[str, ProfileStep] = {step.name: step for step in steps}
+        # Last value written per step, for settings that can't be read back
+        self._applied: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def read_state(self) -> Dict[str, Any]:
+        """Read every setting's current value (None when unknown)"""
+        return self._run(self.steps, self._read)
+
+    def plan(self, target: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Get the target settings that differ from the current state"""
+        changes = {}
+        for name, value in target.items():
+            step = self.steps.get(name)
+            if step is None or value is None:
+                continue
+            if current.get(name) is not None and step.same(current[name], value):
+                continue
+            changes[name] = value
+        return changes
+
+    def apply(self, profile: str, target: Dict[str, Any]) -> ApplyReport:
+        """
+        Apply target settings (None values and unknown names are ignored).
+
+        Steps run stage by stage, concurrently within a stage. If any step
+        fails, later stages are skipped and every step that succeeded is
+        restored to the value it had before, unless the failed steps are
+        all best-effort ones.
+        """
+        with self._lock:
+            started = time.monotonic()
+            report = ApplyReport(profile)
+            current = self.read_state()
+            report.read_ms = (time.monotonic() - started) * 1000
+
+            changes = self.plan(target, current)
+            report.unchanged = [
+                name
+                for name, value in target.items()
+                if name in self.steps and value is not None and name not in changes
+            ]
+
+            done: List[str] = []
+            for stage in sorted({self.steps[name].stage for name in changes}):
+                names = [n for n in changes if self.steps[n].stage == stage]
+                results = self._run(names, lambda n: self._write(n, changes[n]))
+                report.steps.extend(results[name] for name in names)
+                done.extend(name for name in names if results[name].success)
+                failed = [name for name in names if not results[name].success]
+                if any(not self.steps[name].best_effort for name in failed):
+                    report.rolled_back = self._rollback(done, current)
+                    break
+
+            report.total_ms = (time.monotonic() - started) * 1000
+            return report
+
+    def _rollback(self, names: List[str], previous: Dict[str, Any]) -> List[str]:
+        """Restore the previous values of steps, returning those restored"""
+        restorable = [name for name in names if previous.get(name) is not None]
+        results = self._run(restorable, lambda n: self._write(n, previous[n]))
+        return [name for name in restorable if results[name].success]
+
+    def _run(self, names, func: Callable[[str], Any]) -> Dict[str, Any]:
+        """Call func for each name, concurrently when there are several"""
+        names = list(names)
+        if len(names) <= 1:
+            return {name: func(name) for name in names}
+        workers = min(len(names), self.MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(names, pool.map(func, names)))
+
+    def _read(self, name: str) -> Any:
+        try:
+            value = self.steps[name].read()
+        except Exception:
+            value = None
+        if value is None:
+            value = self._applied.get(name)
+        return value
+
+    def _write(self, name: str, value: Any) -> StepResult:
+        started = time.monotonic()
+        try:
+            result = self.steps[name].write(value)
+            if isinstance(result, tuple):
+                success, message = bool(result[0]), str(result[1])
+            else:
+                success, message = bool(result), ""
+        except Exception as e:
+            success, message = False, str(e)
+        if success:
+            self._applied[name] = value
+        else:
+            self._applied.pop(name, None)
+        latency_ms = (time.monotonic() - started) * 1000
+        return StepResult(name, success, latency_ms, message)
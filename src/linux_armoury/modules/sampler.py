@@ -0,0 +1,834 @@
+#!/usr/bin/env python3
+"""
+Telemetry Sampler Module for Linux Armoury
+Samples the hardware on a background thread and publishes each tick into a
+fixed-size shared ring buffer. The GUI, CLI, D-Bus service and tray all read
+from it instead of polling on their own. Every sensor family runs on its own
+worker with its own timeout and cadence, so one hung probe (a stuck
+nvidia-smi, a dead network mount) only goes stale instead of stalling the
+whole tick. Sources with an adaptive policy sample faster while their
+metric is moving or near an alert level, and back off exponentially while
+it is idle or no window is showing the data. On battery with no window
+showing, a low-power mode keeps only the sources needed for auto profile
+switching and thermal alerts, batches their timers and caps wakeups per
+minute.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from ..config import Config
+from ..system_utils import SystemUtils
+
+
+@dataclass
+class TelemetryFrame:
+    """One sampling tick worth of hardware telemetry"""
+
+    seq: int = 0
+    timestamp: float = 0.0
+
+    # CPU
+    cpu_usage: float = 0.0
+    cpu_user: float = 0.0
+    cpu_system: float = 0.0
+    cpu_iowait: float = 0.0
+    core_usage: List[float] = field(default_factory=list)
+    cpu_freq_mhz: float = 0.0
+    cpu_temp: Optional[float] = None
+    load_1min: float = 0.0
+
+    # Memory
+    ram_usage: float = 0.0
+    ram_used_mb: int = 0
+    ram_total_mb: int = 0
+
+    # Root (or first) filesystem
+    disk_usage: float = 0.0
+    disk_used_gb: float = 0.0
+    disk_total_gb: float = 0.0
+
+    # GPU
+    gpu_name: str = ""
+    gpu_usage: float = 0.0
+    gpu_temp: Optional[float] = None
+    gpu_power_w: float = 0.0
+    # Discrete GPU runtime-suspended (not sampled, so it stays asleep)
+    gpu_suspended: bool = False
+
+    # Fans
+    fan_rpms: List[int] = field(default_factory=list)
+
+    # Power
+    battery_percent: Optional[int] = None
+    battery_status: Optional[str] = None
+    on_ac: Optional[bool] = None
+
+    # Sources that missed their timeout; their fields repeat the last result
+    stale_sources: List[str] = field(default_factory=list)
+    # Sources that produced a new result this tick (others repeat old ones)
+    fresh_sources: List[str] = field(default_factory=list)
+    # Only low-power sources were sampled; other fields repeat older results
+    low_power: bool = False
+
+
+class TelemetryRing:
+    """Fixed-size ring buffer of telemetry frames"""
+
+    def __init__(self, capacity: int = Config.MONITOR_HISTORY):
+        self.capacity = max(1, capacity)
+        self._frames: List[Optional[TelemetryFrame]] = [None] * self.capacity
+        self._next_seq = 1
+        self._lock = threading.Lock()
+
+    def push(self, frame: TelemetryFrame) -> TelemetryFrame:
+        """Store a frame, overwriting the oldest slot, and stamp its sequence"""
+        with self._lock:
+            frame.seq = self._next_seq
+            self._frames[frame.seq % self.capacity] = frame
+            self._next_seq += 1
+        return frame
+
+    def latest(self) -> Optional[TelemetryFrame]:
+        """Get the most recent frame"""
+        with self._lock:
+            if self._next_seq == 1:
+                return None
+            return self._frames[(self._next_seq - 1) % self.capacity]
+
+    def history(self, count: Optional[int] = None) -> List[TelemetryFrame]:
+        """Get up to `count` most recent frames, oldest first"""
+        with self._lock:
+            available = min(self._next_seq - 1, self.capacity)
+            if count is not None:
+                available = min(available, count)
+            first = self._next_seq - available
+            return [
+                self._frames[seq % self.capacity]  # type: ignore[misc]
+                for seq in range(first, self._next_seq)
+            ]
+
+    def __len__(self) -> int:
+        return min(self._next_seq - 1, self.capacity)
+
+
+# A source fills in its part of a frame; it may raise, which only skips it
+SampleSource = Callable[[TelemetryFrame], None]
+
+# Frame fields that belong to the tick rather than to a source
+_TICK_FIELDS = ("seq", "timestamp", "stale_sources", "fresh_sources", "low_power")
+
+_DEFAULT_FRAME = TelemetryFrame()
+
+# A source due within this many seconds runs in the current tick
+SCHEDULE_SLACK = 0.05
+
+# Longest interval any source backs off to while running in the background
+BACKGROUND_MAX_INTERVAL = 30.0
+
+# In low-power mode, sources due within this many seconds share one wakeup
+LOW_POWER_BATCH_WINDOW = 10.0
+
+
+@dataclass
+class AdaptivePolicy:
+    """Adapts a source's interval to how its metrics behave"""
+
+    # Frame fields watched for changes
+    metrics: Tuple[str, ...]
+    min_interval: float
+    max_interval: float
+    # Smallest change of a metric between runs that counts as moving
+    change_threshold: float = 1.0
+    # Sample at min_interval while the first metric is within alert_margin
+    # of alert_level (e.g. a temperature approaching its warning level)
+    alert_level: Optional[float] = None
+    alert_margin: float = 0.0
+    backoff: float = 2.0
+
+    def is_changing(self, previous: Dict[str, Any], result: Dict[str, Any]) -> bool:
+        """Check if any metric moved by at least the change threshold"""
+        for name in self.metrics:
+            old = previous.get(name, getattr(_DEFAULT_FRAME, name))
+            new = result.get(name, getattr(_DEFAULT_FRAME, name))
+            if old is None or new is None:
+                if old is not new:
+                    return True
+            elif abs(float(new) - float(old)) >= self.change_threshold:
+                return True
+        return False
+
+    def near_alert(self, result: Dict[str, Any]) -> bool:
+        """Check if the first metric is close to its alert level"""
+        if self.alert_level is None:
+            return False
+        value = result.get(self.metrics[0])
+        return value is not None and value >= self.alert_level - self.alert_margin
+
+    def next_interval(
+        self,
+        current: float,
+        previous: Dict[str, Any],
+        result: Dict[str, Any],
+        background: bool = False,
+    ) -> float:
+        """Interval until the next run, given the latest result"""
+        if self.near_alert(result):
+            return self.min_interval
+        if not background and self.is_changing(previous, result):
+            return self.min_interval
+        limit = self.max_interval
+        if background:
+            limit = max(limit, BACKGROUND_MAX_INTERVAL)
+        return min(max(current, self.min_interval) * self.backoff, limit)
+
+
+@dataclass
+class SourceSpec:
+    """A sample source with its own cadence and timeout"""
+
+    sample: SampleSource
+    # Seconds between runs (0 = the sampler's tick interval)
+    interval: float = 0.0
+    # Seconds a tick waits for the source before reusing its last result
+    timeout: float = 1.0
+    # Adjusts the interval between runs (None = fixed interval)
+    policy: Optional[AdaptivePolicy] = None
+    # Keep running in low-power mode (auto profile switching, thermal alerts)
+    low_power: bool = False
+    # Releases background resources (e.g. nvidia-smi) when the sampler stops
+    stop: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class SamplerStats:
+    """The sampler's own cost, to check it isn't draining the battery"""
+
+    low_power: bool = False
+    wakeups: int = 0
+    wakeups_last_minute: int = 0
+    wakeup_budget: int = 0
+    cpu_time_s: float = 0.0
+    source_runs: Dict[str, int] = field(default_factory=dict)
+
+
+def _source_result(frame: TelemetryFrame) -> Dict[str, Any]:
+    """Get the fields a source changed from their defaults"""
+    result = {}
+    for f in fields(TelemetryFrame):
+        if f.name in _TICK_FIELDS:
+            continue
+        value = getattr(frame, f.name)
+        if value != getattr(_DEFAULT_FRAME, f.name):
+            result[f.name] = value
+    return result
+
+
+class SourceWorker:
+    """Runs one sample source on its own daemon thread"""
+
+    def __init__(self, name: str, spec: SourceSpec, base_interval: float):
+        self.name = name
+        self.spec = spec
+        self.base_interval = base_interval
+        self.interval = base_interval
+        if spec.policy is not None:
+            self.interval = min(
+                max(base_interval, spec.policy.min_interval), spec.policy.max_interval
+            )
+        self.future: Optional[Future] = None
+        self.next_due = 0.0
+        self.started = 0.0
+        self.runs = 0
+        self.cpu_time = 0.0
+        self.result: Dict[str, Any] = {}
+        self._queue: "queue.Queue[Optional[Future]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def busy(self) -> bool:
+        """Check if a run is still in flight (possibly hung)"""
+        return self.future is not None and not self.future.done()
+
+    def submit(self) -> Future:
+        """Queue a run of the source"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=f"telemetry-{self.name}", daemon=True
+            )
+            self._thread.start()
+        self.started = time.monotonic()
+        self.future = Future()
+        self._queue.put(self.future)
+        return self.future
+
+    def collect(self, background: bool = False) -> bool:
+        """Take the result of a finished run, False if none is ready"""
+        future = self.future
+        if future is None or not future.done():
+            return False
+        self.future = None
+        self.runs += 1
+        previous = self.result
+        try:
+            self.result = _source_result(future.result())
+        except Exception as e:
+            print(f"Telemetry source '{self.name}' failed: {e}")
+            self.result = {}
+        self.adapt(previous, background)
+        self.next_due = self.started + self.interval
+        return True
+
+    def adapt(self, previous: Dict[str, Any], background: bool = False):
+        """Pick the interval until the next run from the newest result"""
+        policy = self.spec.policy
+        if policy is not None:
+            self.interval = policy.next_interval(
+                self.interval, previous, self.result, background
+            )
+        elif background:
+            limit = max(self.base_interval, BACKGROUND_MAX_INTERVAL)
+            self.interval = min(self.interval * 2, limit)
+        else:
+            self.interval = self.base_interval
+
+    def reset(self):
+        """Return to the base interval and run on the next tick"""
+        self.interval = self.base_interval
+        if self.spec.policy is not None:
+            self.interval = max(self.interval, self.spec.policy.min_interval)
+        self.next_due = 0.0
+
+    def stop(self):
+        """Let the worker thread exit once its current run finishes"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread = None
+
+    def _run(self):
+        """Worker thread main loop"""
+        while True:
+            future = self._queue.get()
+            if future is None:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            frame = TelemetryFrame()
+            cpu_started = time.thread_time()
+            try:
+                self.spec.sample(frame)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(frame)
+            finally:
+                self.cpu_time += time.thread_time() - cpu_started
+
+
+class TelemetrySampler:
+    """Single background sampler shared by all front-ends"""
+
+    def __init__(
+        self,
+        interval: float = Config.MONITOR_INTERVAL / 1000,
+        capacity: int = Config.MONITOR_HISTORY,
+        sources: Optional[Dict[str, Union[SampleSource, SourceSpec]]] = None,
+        wakeup_budget: int = Config.LOW_POWER_WAKEUP_BUDGET,
+    ):
+        self.interval = interval
+        self.wakeup_budget = wakeup_budget
+        self.ring = TelemetryRing(capacity)
+        self._sources = sources
+        self._workers: Optional[Dict[str, SourceWorker]] = None
+        self._subscribers: List[Callable[[TelemetryFrame], None]] = []
+        self._refcount = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._background = False
+        self._low_power = False
+        self._wakeups: "deque[float]" = deque()
+        self._wakeup_count = 0
+        self._cpu_time = 0.0
+        self._lock = threading.Lock()
+        self._sample_lock = threading.Lock()
+        self._new_frame = threading.Condition()
+        # Bumped by wake_waiters() to release threads in wait_for_frame()
+        self._wait_generation = 0
+
+    # ========== Sources ==========
+
+    def _default_sources(self) -> Dict[str, SourceSpec]:
+        """Build the hardware sources (controllers are created lazily)"""
+        from .battery_control import get_battery_controller
+        from .fan_control import get_fan_controller
+        from .gpu_control import get_controller
+        from .hwmon_index import get_hwmon_index
+        from .system_monitor import get_monitor
+        from .uevent_monitor import get_power_supply_monitor
+
+        monitor = get_monitor()
+        fans = get_fan_controller()
+        gpu = get_controller()
+        battery = get_battery_controller()
+        hwmon = get_hwmon_index()
+
+        # AC plug/unplug resamples the power source right away
+        supplies = get_power_supply_monitor()
+        supplies.add_callback(lambda on_ac: self.request_sample("power"))
+        supplies.start()
+
+        def sample_cpu(frame: TelemetryFrame):
+            cpu = monitor.get_cpu_stats()
+            frame.cpu_usage = cpu.usage_percent
+            frame.cpu_user = cpu.user_percent
+            frame.cpu_system = cpu.system_percent
+            frame.cpu_iowait = cpu.iowait_percent
+            frame.core_usage = cpu.core_usage
+            frame.cpu_freq_mhz = cpu.current_freq_mhz
+            frame.load_1min = cpu.load_1min
+
+        def sample_thermal(frame: TelemetryFrame):
+            frame.cpu_temp = fans.get_cpu_temperature()
+
+        def sample_memory(frame: TelemetryFrame):
+            mem = monitor.get_memory_stats()
+            frame.ram_usage = mem.usage_percent
+            frame.ram_used_mb = mem.used_mb
+            frame.ram_total_mb = mem.total_mb
+
+        def sample_disk(frame: TelemetryFrame):
+            disks = monitor.get_disk_stats()
+            if not disks:
+                return
+            root = next((d for d in disks if d.mountpoint == "/"), disks[0])
+            frame.disk_usage = root.usage_percent
+            frame.disk_used_gb = root.used_gb
+            frame.disk_total_gb = root.total_gb
+
+        def sample_gpu(frame: TelemetryFrame):
+            stats = gpu.get_live_stats()
+            frame.gpu_name = stats.gpu_name
+            frame.gpu_suspended = stats.dgpu_suspended
+            if stats.dgpu_suspended:
+                return  # No temperature fallback: it could wake the dGPU
+            frame.gpu_usage = float(stats.gpu_usage_percent)
+            frame.gpu_power_w = stats.power_draw_w
+            # Other DRM drivers expose hwmon; don't ask the GPU controller again
+            frame.gpu_temp = float(stats.gpu_temp_c) or hwmon.gpu_temperature()
+
+        def sample_fans(frame: TelemetryFrame):
+            frame.fan_rpms = [fan.rpm for fan in fans.get_all_fan_speeds()]
+
+        def sample_power(frame: TelemetryFrame):
+            frame.battery_percent = battery.get_battery_capacity()
+            frame.battery_status = battery.get_battery_status()
+            frame.on_ac = supplies.on_ac
+            if frame.on_ac is None and frame.battery_status is not None:
+                # No AC-type supply exposed; infer it from the battery
+                frame.on_ac = frame.battery_status in [
+                    "Charging",
+                    "Full",
+                    "Not charging",
+                ]
+            elif frame.on_ac is None:
+                frame.on_ac = SystemUtils.is_on_ac_power()
+
+        return {
+            "cpu": SourceSpec(
+                sample_cpu,
+                timeout=0.5,
+                policy=AdaptivePolicy(
+                    metrics=("cpu_usage",),
+                    min_interval=0.5,
+                    max_interval=8.0,
+                    change_threshold=5.0,
+                ),
+            ),
+            # Temperature is read at 4 Hz while it climbs or nears the warning
+            "thermal": SourceSpec(
+                sample_thermal,
+                timeout=0.5,
+                low_power=True,
+                policy=AdaptivePolicy(
+                    metrics=("cpu_temp",),
+                    min_interval=0.25,
+                    max_interval=8.0,
+                    change_threshold=2.0,
+                    alert_level=Config.TEMP_WARNING,
+                    alert_margin=10.0,
+                ),
+            ),
+            "memory": SourceSpec(
+                sample_memory,
+                timeout=0.5,
+                policy=AdaptivePolicy(
+                    metrics=("ram_usage",), min_interval=1.0, max_interval=10.0
+                ),
+            ),
+            # statvfs can block on a dead network mount
+            "disk": SourceSpec(
+                sample_disk,
+                interval=10.0,
+                timeout=1.0,
+                policy=AdaptivePolicy(
+                    metrics=("disk_usage",),
+                    min_interval=10.0,
+                    max_interval=120.0,
+                    change_threshold=0.5,
+                ),
+            ),
+            # The first NVIDIA sample waits for nvidia-smi to start
+            "gpu": SourceSpec(
+                sample_gpu,
+                timeout=1.0,
+                stop=gpu.close,
+                policy=AdaptivePolicy(
+                    metrics=("gpu_temp", "gpu_usage"),
+                    min_interval=1.0,
+                    max_interval=8.0,
+                    change_threshold=3.0,
+                    alert_level=Config.TEMP_WARNING,
+                    alert_margin=10.0,
+                ),
+            ),
+            "fans": SourceSpec(sample_fans, timeout=0.5),
+            # Battery capacity moves about once a minute; AC changes reset it
+            "power": SourceSpec(
+                sample_power,
+                interval=5.0,
+                timeout=0.5,
+                low_power=True,
+                policy=AdaptivePolicy(
+                    metrics=("battery_percent", "on_ac"),
+                    min_interval=5.0,
+                    max_interval=30.0,
+                ),
+            ),
+        }
+
+    @property
+    def sources(self) -> Dict[str, SourceSpec]:
+        """Get the configured sample sources"""
+        if self._sources is None:
+            self._sources = self._default_sources()
+        return {
+            name: spec if isinstance(spec, SourceSpec) else SourceSpec(spec)
+            for name, spec in self._sources.items()
+        }
+
+    @property
+    def workers(self) -> Dict[str, SourceWorker]:
+        """Get the per-source workers (created on first use)"""
+        if self._workers is None:
+            self._workers = {
+                name: SourceWorker(name, spec, spec.interval or self.interval)
+                for name, spec in self.sources.items()
+            }
+        return self._workers
+
+    # ========== Scheduling ==========
+
+    @property
+    def background(self) -> bool:
+        """Check if no window is currently showing the telemetry"""
+        return self._background
+
+    def set_background(self, background: bool):
+        """
+        Mark the telemetry as unseen (window hidden or minimized to tray).
+
+        In the background every source backs off towards
+        BACKGROUND_MAX_INTERVAL; coming back to the foreground resamples
+        everything on the next tick.
+        """
+        if background == self._background:
+            return
+        self._background = background
+        if not background:
+            with self._sample_lock:
+                self._update_low_power(None)
+                for worker in self.workers.values():
+                    worker.reset()
+            self._wakeup.set()
+
+    @property
+    def low_power(self) -> bool:
+        """Check if only the low-power sources are being sampled"""
+        return self._low_power
+
+    def _update_low_power(self, on_ac: Optional[bool]):
+        """Enter low-power mode on battery while no window is showing"""
+        low_power = self._background and on_ac is False
+        if low_power != self._low_power:
+            self._low_power = low_power
+            state = "entering" if low_power else "leaving"
+            print(f"Telemetry: {state} low-power monitoring")
+
+    def _active_workers(self) -> List[SourceWorker]:
+        """Get the workers that are sampled in the current mode"""
+        workers = list(self.workers.values())
+        if self._low_power:
+            workers = [w for w in workers if w.spec.low_power]
+        return workers
+
+    def _log_wakeup(self, now: float):
+        """Count a wakeup of the sampler or of a thread waiting on it"""
+        with self._lock:
+            self._wakeups.append(now)
+            self._trim_wakeups(now)
+            self._wakeup_count += 1
+
+    def _trim_wakeups(self, now: float):
+        """Drop wakeups older than a minute (caller holds self._lock)"""
+        while self._wakeups and self._wakeups[0] <= now - 60.0:
+            self._wakeups.popleft()
+
+    def _recent_wakeups(self, now: float) -> int:
+        """Count the wakeups within the last minute"""
+        with self._lock:
+            self._trim_wakeups(now)
+            return len(self._wakeups)
+
+    def next_due_in(self) -> float:
+        """Seconds until the next tick, honouring the low-power wakeup budget"""
+        now = time.monotonic()
+        due = [w.next_due for w in self._active_workers() if not w.busy]
+        delay = max(0.0, min(due) - now) if due else self.interval
+        if (
+            self._low_power
+            and self.wakeup_budget > 0
+            and self._recent_wakeups(now) >= self.wakeup_budget
+        ):
+            # Out of budget: wait until the oldest wakeup leaves the window
+            delay = max(delay, self._wakeups[0] + 60.0 - now)
+        return delay
+
+    def stats(self) -> SamplerStats:
+        """Report the sampler's own wakeups and CPU time"""
+        workers = self.workers
+        return SamplerStats(
+            low_power=self._low_power,
+            wakeups=self._wakeup_count,
+            wakeups_last_minute=self._recent_wakeups(time.monotonic()),
+            wakeup_budget=self.wakeup_budget,
+            cpu_time_s=self._cpu_time + sum(w.cpu_time for w in workers.values()),
+            source_runs={name: w.runs for name, w in workers.items()},
+        )
+
+    def request_sample(self, name: str):
+        """Run a source on the next tick (e.g. after a hardware event)"""
+        worker = (self._workers or {}).get(name)
+        if worker is not None:
+            worker.next_due = 0.0
+            self._wakeup.set()
+
+    def intervals(self) -> Dict[str, float]:
+        """Get the current interval of every source"""
+        return {name: w.interval for name, w in self.workers.items()}
+
+    # ========== Sampling ==========
+
+    def sample_once(self) -> TelemetryFrame:
+        """
+        Run every due source concurrently and publish the merged frame.
+
+        Each source is waited on until its own timeout; a source that misses
+        it (or is still stuck from an earlier tick) keeps its last result and
+        is listed in the frame's stale_sources. In low-power mode only the
+        low-power sources run, and any due within the batch window run now
+        so they share this wakeup.
+        """
+        with self._sample_lock:
+            cpu_started = time.thread_time()
+            started = time.monotonic()
+            self._log_wakeup(started)
+            pending = []
+            fresh = set()
+            background = self._background
+            low_power = self._low_power
+            slack = LOW_POWER_BATCH_WINDOW if low_power else SCHEDULE_SLACK
+            for worker in self.workers.values():
+                # Late result from an earlier tick
+                if worker.collect(background):
+                    fresh.add(worker.name)
+            for worker in self._active_workers():
+                if worker.busy or started < worker.next_due - slack:
+                    continue
+                pending.append((started + worker.spec.timeout, worker))
+                worker.submit()
+
+            for deadline, worker in sorted(pending, key=lambda p: p[0]):
+                future = worker.future
+                if future is None:
+                    continue
+                try:
+                    future.exception(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    print(f"Telemetry source '{worker.name}' timed out")
+                if worker.collect(background):
+                    fresh.add(worker.name)
+
+            frame = TelemetryFrame(timestamp=time.time(), low_power=low_power)
+            for name, worker in self.workers.items():
+                for key, value in worker.result.items():
+                    setattr(frame, key, value)
+                if worker.busy:
+                    frame.stale_sources.append(name)
+                if name in fresh:
+                    frame.fresh_sources.append(name)
+            self.ring.push(frame)
+            self._update_low_power(frame.on_ac)
+            self._cpu_time += time.thread_time() - cpu_started
+
+        with self._new_frame:
+            self._new_frame.notify_all()
+
+        for callback in list(self._subscribers):
+            try:
+                callback(frame)
+            except Exception as e:
+                print(f"Telemetry subscriber error: {e}")
+        return frame
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[TelemetryFrame]:
+        """
+        Get the most recent frame.
+
+        If max_age is given and the newest frame is older than that (e.g. no
+        front-end is keeping the sampler running), a fresh tick is sampled.
+        """
+        frame = self.ring.latest()
+        if max_age is not None and (
+            frame is None or time.time() - frame.timestamp > max_age
+        ):
+            frame = self.sample_once()
+        return frame
+
+    def wait_for_frame(
+        self, after_seq: int = 0, timeout: Optional[float] = None
+    ) -> Optional[TelemetryFrame]:
+        """
+        Block until a frame newer than after_seq is published.
+
+        Returns None on timeout or when wake_waiters() is called. A timeout
+        wakes the CPU without a frame to show for it, so it is counted as a
+        wakeup in stats(); in low-power mode wait without one.
+        """
+        generation = self._wait_generation
+
+        def has_new_frame():
+            frame = self.ring.latest()
+            new = frame is not None and frame.seq > after_seq
+            return new or self._wait_generation != generation
+
+        with self._new_frame:
+            woken = self._new_frame.wait_for(has_new_frame, timeout)
+        frame = self.ring.latest()
+        if frame is not None and frame.seq > after_seq:
+            return frame
+        if not woken:
+            self._log_wakeup(time.monotonic())
+        return None
+
+    def wake_waiters(self):
+        """Make every wait_for_frame() call return (e.g. on shutdown)"""
+        with self._new_frame:
+            self._wait_generation += 1
+            self._new_frame.notify_all()
+
+    def history(self, count: Optional[int] = None) -> List[TelemetryFrame]:
+        """Get recent frames, oldest first"""
+        return self.ring.history(count)
+
+    # ========== Subscribers ==========
+
+    def subscribe(self, callback: Callable[[TelemetryFrame], None]):
+        """Call `callback(frame)` from the sampler thread on every tick"""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[TelemetryFrame], None]):
+        """Stop delivering frames to a callback"""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    # ========== Lifecycle ==========
+
+    def acquire(self):
+        """Register a consumer; the sampler thread runs while any are held"""
+        with self._lock:
+            self._refcount += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._stop_event.clear()
+                self._wakeup.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="telemetry-sampler", daemon=True
+                )
+                self._thread.start()
+
+    def release(self):
+        """Drop a consumer; the thread stops when the last one is released"""
+        thread = None
+        with self._lock:
+            if self._refcount == 0:
+                return
+            self._refcount -= 1
+            if self._refcount == 0:
+                self._stop_event.set()
+                self._wakeup.set()
+                thread, self._thread = self._thread, None
+                stopped = list((self._workers or {}).values())
+                for worker in stopped:
+                    worker.stop()
+            else:
+                stopped = []
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval + 1)
+        for worker in stopped:
+            if worker.spec.stop is not None:
+                try:
+                    worker.spec.stop()
+                except Exception as e:
+                    print(f"Telemetry source '{worker.name}' failed to stop: {e}")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the sampler thread is active"""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def consumers(self) -> int:
+        """Number of consumers currently holding the sampler"""
+        return self._refcount
+
+    def _run(self):
+        """Sampler thread main loop"""
+        while not self._stop_event.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                print(f"Telemetry sampling error: {e}")
+            # Sleep until the next source is due instead of a fixed tick
+            self._wakeup.wait(max(0.01, self.next_due_in()))
+            self._wakeup.clear()
+
+
+# Global singleton
+_sampler: Optional[TelemetrySampler] = None
+
+
+def get_sampler() -> TelemetrySampler:
+    """Get singleton telemetry sampler instance"""
+    global _sampler
+    if _sampler is None:
+        _sampler = TelemetrySampler()
+    return _sampler
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Sensor Handle Module for Linux Armoury
+Keeps frequently sampled procfs/sysfs files open and re-reads them with
+os.pread() instead of opening and closing them on every monitoring tick.
+"""
+
+import errno
+import os
+import threading
+from typing import Dict, Optional
+
+# Errors that mean the open descriptor points at a node that went away
+# (hwmon/drm hotplug, driver rebind). The handle is reopened once on these.
+REOPEN_ERRNOS = {errno.ENODEV, errno.ESTALE, errno.EBADF, errno.ENXIO}
+
+# Most sysfs attributes fit in a page; procfs files grow the buffer as needed
+DEFAULT_BUFFER_SIZE = 4096
+
+
+class SensorHandle:
+    """A persistent read-only file descriptor for a single sensor file"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fd: Optional[int] = None
+        self._bufsize = DEFAULT_BUFFER_SIZE
+        self._lock = threading.Lock()
+        self.reopen_count = 0
+
+    def _open(self) -> int:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        return self._fd
+
+    def _close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _pread_all(self, fd: int) -> bytes:
+        """Read the whole file from offset 0, growing the buffer if needed"""
+        data = os.pread(fd, self._bufsize, 0)
+        if len(data) < self._bufsize:
+            return data
+
+        # File is larger than our buffer (e.g. /proc/stat on many-core
+        # systems). Keep reading and remember the size for the next tick.
+        chunks = [data]
+        offset = len(data)
+        while True:
+            chunk = os.pread(fd, self._bufsize, offset)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            offset += len(chunk)
+        while self._bufsize <= offset:
+            self._bufsize *= 2
+        return b"".join(chunks)
+
+    def read_bytes(self) -> bytes:
+        """Read the current file contents, reopening once after hotplug"""
+        with self._lock:
+            try:
+                return self._pread_all(self._open())
+            except OSError as e:
+                if e.errno not in REOPEN_ERRNOS:
+                    self._close()
+                    raise
+            # The node was replaced underneath us - reopen and retry once
+            self._close()
+            self.reopen_count += 1
+            return self._pread_all(self._open())
+
+    def read(self) -> str:
+        """Read the current file contents as text"""
+        return self.read_bytes().decode(errors="replace")
+
+    def close(self):
+        """Close the underlying descriptor"""
+        with self._lock:
+            self._close()
+
+
+class SensorHandlePool:
+    """Shared pool of persistent sensor handles keyed by path"""
+
+    def __init__(self):
+        self._handles: Dict[str, SensorHandle] = {}
+        self._lock = threading.Lock()
+
+    def get_handle(self, path: str) -> SensorHandle:
+        """Get (or create) the handle for a path"""
+        handle = self._handles.get(path)
+        if handle is None:
+            with self._lock:
+                handle = self._handles.get(path)
+                if handle is None:
+                    handle = SensorHandle(path)
+                    self._handles[path] = handle
+        return handle
+
+    def read_bytes(self, path: str) -> bytes:
+        """Read a file through its persistent handle, b"" on failure"""
+        handle = self.get_handle(path)
+        try:
+            return handle.read_bytes()
+        except OSError:
+            # Missing/unreadable files are not cached so they can appear later
+            self.release(path)
+            return b""
+
+    def read(self, path: str) -> str:
+        """Read a file through its persistent handle, "" on failure"""
+        return self.read_bytes(path).decode(errors="replace")
+
+    def read_int(self, path: str) -> Optional[int]:
+        """Read an integer sensor value (e.g. millidegrees, RPM)"""
+        try:
+            return int(self.read_bytes(path).strip() or b"x")
+        except ValueError:
+            return None
+
+    def release(self, path: str):
+        """Close and forget the handle for a path"""
+        with self._lock:
+            handle = self._handles.pop(path, None)
+        if handle:
+            handle.close()
+
+    def close_all(self):
+        """Close every open handle"""
+        with self._lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        for handle in handles:
+            handle.close()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+
+# Global singleton
+_sensor_pool: Optional[SensorHandlePool] = None
+
+
+def get_sensor_pool() -> SensorHandlePool:
+    """Get singleton sensor handle pool instance"""
+    global _sensor_pool
+    if _sensor_pool is None:
+        _sensor_pool = SensorHandlePool()
+    return _sensor_pool
@@ -12,6 +12,12 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from .proc_stat import CPU_TIME_FIELDS, ProcStatSnapshot
+from .process_scanner import ProcessScanner
+from .sensor_handles import get_sensor_pool
+
 
 @dataclass
 class CpuStats:
@@ -26,6 +32,10 @@ class CpuStats:
 
     # Per-core usage
     core_usage: List[float] = field(default_factory=list)
+    core_user_percent: List[float] = field(default_factory=list)
+    core_system_percent: List[float] = field(default_factory=list)
+    core_idle_percent: List[float] = field(default_factory=list)
+    core_iowait_percent: List[float] = field(default_factory=list)
     core_count: int = 0
     thread_count: int = 0
 
@@ -153,11 +163,15 @@ class SystemMonitor:
     def __init__(self):
         # Previous values for rate calculations
         self._prev_cpu_times = None
-        self._prev_per_core_times = None
+        self._prev_core_table: Optional[np.ndarray] = None
         self._prev_net_stats = {}
         self._prev_disk_stats = {}
         self._prev_time = time.time()
 
+        # Persistent handles for files re-read on every tick
+        self._sensors = get_sensor_pool()
+        self._process_scanner = ProcessScanner()
+
         # History for graphs (last 60 samples)
         self.cpu_history = deque(maxlen=60)
         self.mem_history = deque(maxlen=60)
@@ -218,10 +232,14 @@ class SystemMonitor:
         except Exception:
             return ""
 
+    def _read_sensor(self, path: str) -> str:
+        """Read a frequently sampled file through the shared handle pool"""
+        return self._sensors.read(path)
+
     def _parse_meminfo(self) -> Dict[str, int]:
         """Parse /proc/meminfo"""
         result = {}
-        content = self._read_file("/proc/meminfo")
+        content = self._read_sensor("/proc/meminfo")
         for line in content.split("\n"):
             if ":" in line:
                 key, value = line.split(":", 1)
@@ -231,27 +249,33 @@ class SystemMonitor:
                     result[key.strip()] = int(match.group(1))
         return result
 
-    def _parse_cpu_stat(self) -> Tuple[List[int], List[List[int]]]:
-        """Parse /proc/stat for CPU times"""
-        content = self._read_file("/proc/stat")
-        lines = content.split("\n")
-
-        total_times = []
-        per_core_times = []
+    def read_proc_stat(self) -> ProcStatSnapshot:
+        """Read /proc/stat once for the current sampling tick"""
+        return ProcStatSnapshot.parse(self._read_sensor("/proc/stat"))
 
-        for line in lines:
-            if line.startswith("cpu "):
-                # Total CPU
-                parts = line.split()[1:]
-                total_times = [int(x) for x in parts[:7]]
-            elif line.startswith("cpu") and line[3].isdigit():
-                # Per-core
-                parts = line.split()[1:]
-                per_core_times.append([int(x) for x in parts[:7]])
-
-        return total_times, per_core_times
+    @staticmethod
+    def _core_table(snapshot: ProcStatSnapshot) -> np.ndarray:
+        """View the per-core CPU times as a (cores, fields) int64 table"""
+        return np.frombuffer(snapshot.core_times, dtype=np.int64).reshape(
+            -1, CPU_TIME_FIELDS
+        )
 
-    def get_cpu_stats(self) -> CpuStats:
+    @staticmethod
+    def _core_percentages(
+        current: np.ndarray, previous: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Compute per-core user/system/idle/iowait percentages"""
+        # Cores may come and go (hotplug) - compare the ones present in both
+        count = min(len(current), len(previous))
+        deltas = current[:count] - previous[:count]
+        totals = np.maximum(deltas.sum(axis=1), 1)
+        # user, nice, system, idle, iowait, irq, softirq
+        scaled = deltas * (100.0 / totals)[:, None]
+        user = scaled[:, 0] + scaled[:, 1]
+        system = scaled[:, 2] + scaled[:, 5] + scaled[:, 6]
+        return user, system, scaled[:, 3], scaled[:, 4]
+
+    def get_cpu_stats(self, snapshot: Optional[ProcStatSnapshot] = None) -> CpuStats:
         """Get current CPU statistics"""
         stats = CpuStats()
 
@@ -262,9 +286,11 @@ class SystemMonitor:
         stats.core_count = self._cpu_cores
         stats.thread_count = self._cpu_threads
 
-        # Parse CPU times
-        current_times, per_core_times = self._parse_cpu_stat()
-        current_time = time.time()
+        # Parse CPU times (one /proc/stat read shared by the whole tick)
+        if snapshot is None:
+            snapshot = self.read_proc_stat()
+        current_times = snapshot.total_times
+        current_time = snapshot.timestamp
 
         if self._prev_cpu_times and len(current_times) >= 7:
             # Calculate deltas
@@ -280,20 +306,21 @@ class SystemMonitor:
             stats.iowait_percent = (deltas[4] / total) * 100
             stats.usage_percent = 100 - stats.idle_percent
 
-        # Per-core usage
-        if self._prev_per_core_times and per_core_times:
-            for i, (curr, prev) in enumerate(
-                zip(per_core_times, self._prev_per_core_times)
-            ):
-                if len(curr) >= 4 and len(prev) >= 4:
-                    deltas = [c - p for c, p in zip(curr, prev)]
-                    total = sum(deltas) or 1
-                    usage = 100 - (deltas[3] / total * 100)  # 100 - idle
-                    stats.core_usage.append(round(usage, 1))
+        # Per-core usage, computed for all cores at once
+        core_table = self._core_table(snapshot)
+        if self._prev_core_table is not None and len(core_table):
+            user, system, idle, iowait = self._core_percentages(
+                core_table, self._prev_core_table
+            )
+            stats.core_usage = np.round(100 - idle, 1).tolist()
+            stats.core_user_percent = np.round(user, 1).tolist()
+            stats.core_system_percent = np.round(system, 1).tolist()
+            stats.core_idle_percent = np.round(idle, 1).tolist()
+            stats.core_iowait_percent = np.round(iowait, 1).tolist()
 
         # Store for next calculation
         self._prev_cpu_times = current_times
-        self._prev_per_core_times = per_core_times
+        self._prev_core_table = core_table
         self._prev_time = current_time
 
         # Frequencies
@@ -301,9 +328,9 @@ class SystemMonitor:
             # Try cpufreq first
             freq_path = "/sys/devices/system/cpu/cpu0/cpufreq"
             if os.path.exists(freq_path):
-                cur_freq = self._read_file(f"{freq_path}/scaling_cur_freq")
-                min_freq = self._read_file(f"{freq_path}/scaling_min_freq")
-                max_freq = self._read_file(f"{freq_path}/scaling_max_freq")
+                cur_freq = self._read_sensor(f"{freq_path}/scaling_cur_freq")
+                min_freq = self._read_sensor(f"{freq_path}/scaling_min_freq")
+                max_freq = self._read_sensor(f"{freq_path}/scaling_max_freq")
 
                 if cur_freq:
                     stats.current_freq_mhz = int(cur_freq) / 1000
@@ -314,7 +341,7 @@ class SystemMonitor:
 
                 # Per-core frequencies
                 for i in range(stats.thread_count):
-                    core_freq = self._read_file(
+                    core_freq = self._read_sensor(
                         f"/sys/devices/system/cpu/cpu{i}/cpufreq/scaling_cur_freq"
                     )
                     if core_freq:
@@ -323,7 +350,7 @@ class SystemMonitor:
             pass
 
         # Load averages
-        loadavg = self._read_file("/proc/loadavg")
+        loadavg = self._read_sensor("/proc/loadavg")
         if loadavg:
             parts = loadavg.split()
             if len(parts) >= 3:
@@ -332,12 +359,8 @@ class SystemMonitor:
                 stats.load_15min = float(parts[2])
 
         # Context switches and interrupts
-        stat_content = self._read_file("/proc/stat")
-        for line in stat_content.split("\n"):
-            if line.startswith("ctxt"):
-                stats.context_switches = int(line.split()[1])
-            elif line.startswith("intr"):
-                stats.interrupts = int(line.split()[1])
+        stats.context_switches = snapshot.context_switches
+        stats.interrupts = snapshot.interrupts
 
         # Add to history
         self.cpu_history.append(stats.usage_percent)
@@ -447,7 +470,7 @@ class SystemMonitor:
                 continue
 
         # Get I/O stats from /proc/diskstats
-        diskstats = self._read_file("/proc/diskstats")
+        diskstats = self._read_sensor("/proc/diskstats")
         io_stats = {}
         for line in diskstats.split("\n"):
             parts = line.split()
@@ -474,7 +497,7 @@ class SystemMonitor:
         interfaces = []
 
         # Read /proc/net/dev
-        net_dev = self._read_file("/proc/net/dev")
+        net_dev = self._read_sensor("/proc/net/dev")
         current_time = time.time()
         time_delta = current_time - self._prev_time if self._prev_time else 1
 
@@ -561,41 +584,30 @@ class SystemMonitor:
         processes: List[ProcessInfo] = []
 
         try:
-            # Use ps command for process info
-            cmd = ["ps", "aux", "--sort", f"-{'%cpu' if sort_by == 'cpu' else '%mem'}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-            if result.returncode != 0:
-                return processes
-
-            lines = result.stdout.strip().split("\n")[
-                1 : count + 1
-            ]  # Skip header, get top N
-
-            for line in lines:
-                parts = line.split(None, 10)  # Split max 11 parts
-                if len(parts) < 11:
-                    continue
-
+            mem_total = self._process_scanner.mem_total()
+            scanner = self._process_scanner
+            for sample in scanner.top(count, sort_by):
                 proc = ProcessInfo()
-                proc.user = parts[0]
-                proc.pid = int(parts[1])
-                proc.cpu_percent = float(parts[2])
-                proc.mem_percent = float(parts[3])
-                proc.mem_mb = 0  # Would need to calculate from RSS
-                proc.status = parts[7] if len(parts) > 7 else ""
-                proc.command = parts[10] if len(parts) > 10 else ""
-                proc.name = (
-                    os.path.basename(proc.command.split()[0]) if proc.command else ""
-                )
-
+                proc.pid = sample.pid
+                proc.name = sample.name
+                proc.user = scanner.get_user(sample.pid)
+                proc.cpu_percent = round(sample.cpu_percent, 1)
+                proc.mem_mb = sample.rss_bytes / (1024 * 1024)
+                if mem_total:
+                    proc.mem_percent = round(sample.rss_bytes * 100 / mem_total, 1)
+                proc.status = sample.state
+                proc.nice = sample.nice
+                proc.threads = sample.threads
+                proc.command = scanner.get_command(sample.pid, sample.name)
                 processes.append(proc)
         except Exception as e:
             print(f"Error getting processes: {e}")
 
         return processes
 
-    def get_system_overview(self) -> SystemOverview:
+    def get_system_overview(
+        self, snapshot: Optional[ProcStatSnapshot] = None
+    ) -> SystemOverview:
         """Get system overview information"""
         info = SystemOverview()
 
@@ -639,14 +651,12 @@ class SystemMonitor:
 
         # Boot time
         try:
-            stat = self._read_file("/proc/stat")
-            for line in stat.split("\n"):
-                if line.startswith("btime"):
-                    btime = int(line.split()[1])
-                    info.boot_time = time.strftime(
-                        "%Y-%m-%d %H:%M", time.localtime(btime)
-                    )
-                    break
+            if snapshot is None:
+                snapshot = self.read_proc_stat()
+            if snapshot.boot_time:
+                info.boot_time = time.strftime(
+                    "%Y-%m-%d %H:%M", time.localtime(snapshot.boot_time)
+                )
         except Exception:
             pass
 
@@ -664,7 +674,7 @@ class SystemMonitor:
 
         # Process and thread count
         try:
-            loadavg = self._read_file("/proc/loadavg")
+            loadavg = self._read_sensor("/proc/loadavg")
             if loadavg:
                 parts = loadavg.split()
                 if len(parts) >= 4:
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Telemetry Shared Memory Module for Linux Armoury
+Publishes the latest telemetry frame into an mmap'd file so overlays and
+status-bar scripts can read it at high rates without D-Bus round trips.
+
+Segment layout (little endian, version 1):
+
+    offset  size  field
+    0       4     magic b"LATM"
+    4       2     layout version
+    6       2     header size (bytes)
+    8       4     payload size (bytes)
+    12      4     reserved
+    16      8     seqlock counter (odd while a frame is being written)
+    24      ...   payload (PAYLOAD_FORMAT)
+
+Readers copy the payload between two reads of the seqlock counter and
+retry if the counter was odd or changed in between. Each reader holds a
+shared flock on the file; the exporter only keeps the sampler running
+while such a lock is held.
+"""
+
+import fcntl
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Optional
+
+from .sampler import TelemetryFrame, TelemetrySampler, get_sampler
+
+SHM_MAGIC = b"LATM"
+SHM_VERSION = 1
+# RuntimeDirectory of the system service (data/systemd/linux-armoury.service)
+SHM_DIR = "/run/linux-armoury"
+SHM_FILENAME = "telemetry"
+SHM_MAX_FANS = 8
+
+HEADER_FORMAT = "<4sHHI4x"
+SEQ_FORMAT = "<Q"
+# timestamp, frame seq, cpu usage/temp/freq, gpu usage/temp/power,
+# ram usage/used/total, battery percent, on_ac, fan count, fan rpms
+PAYLOAD_FORMAT = f"<dQfffffffIIhbB{SHM_MAX_FANS}I"
+
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SEQ_OFFSET = HEADER_SIZE
+PAYLOAD_OFFSET = SEQ_OFFSET + struct.calcsize(SEQ_FORMAT)
+PAYLOAD_SIZE = struct.calcsize(PAYLOAD_FORMAT)
+SEGMENT_SIZE = PAYLOAD_OFFSET + PAYLOAD_SIZE
+
+# Give up on a torn read after this many attempts (writer stalled mid-frame)
+READ_RETRIES = 100
+
+# Seconds between the exporter's checks for attached readers
+READER_POLL_INTERVAL = 2.0
+
+
+def default_shm_path() -> str:
+    """Get the path the system service publishes the segment at"""
+    return os.path.join(SHM_DIR, SHM_FILENAME)
+
+
+def _opt_float(value: Optional[float]) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _from_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+class TelemetryShmWriter:
+    """Writes telemetry frames into the shared segment"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_shm_path()
+        os.makedirs(os.path.dirname(self.path), mode=0o755, exist_ok=True)
+
+        # Build the segment next to its final name so readers never map a
+        # half-initialized file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, SEGMENT_SIZE)
+            self._map = mmap.mmap(fd, SEGMENT_SIZE, mmap.MAP_SHARED)
+        finally:
+            os.close(fd)
+        struct.pack_into(
+            HEADER_FORMAT,
+            self._map,
+            0,
+            SHM_MAGIC,
+            SHM_VERSION,
+            PAYLOAD_OFFSET,
+            PAYLOAD_SIZE,
+        )
+        self._seq = 0
+        os.replace(tmp_path, self.path)
+
+    def write(self, frame: TelemetryFrame):
+        """Publish a frame under the seqlock"""
+        fans = list(frame.fan_rpms[:SHM_MAX_FANS])
+        fan_count = len(fans)
+        fans.extend([0] * (SHM_MAX_FANS - fan_count))
+        payload = struct.pack(
+            PAYLOAD_FORMAT,
+            frame.timestamp,
+            frame.seq,
+            frame.cpu_usage,
+            _opt_float(frame.cpu_temp),
+            frame.cpu_freq_mhz,
+            frame.gpu_usage,
+            _opt_float(frame.gpu_temp),
+            frame.gpu_power_w,
+            frame.ram_usage,
+            max(0, frame.ram_used_mb),
+            max(0, frame.ram_total_mb),
+            -1 if frame.battery_percent is None else frame.battery_percent,
+            -1 if frame.on_ac is None else int(frame.on_ac),
+            fan_count,
+            *fans,
+        )
+
+        self._seq += 1  # odd: write in progress
+        struct.pack_into(SEQ_FORMAT, self._map, SEQ_OFFSET, self._seq)
+        self._map[PAYLOAD_OFFSET:SEGMENT_SIZE] = payload
+        self._seq += 1  # even: frame complete
+        struct.pack_into(SEQ_FORMAT, self._map, SEQ_OFFSET, self._seq)
+
+    def close(self, unlink: bool = True):
+        """Unmap the segment and optionally remove the file"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class TelemetryShmReader:
+    """Maps the shared segment and reads consistent frames from it"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_shm_path()
+        # The shared lock tells the exporter a reader is attached
+        self._fd = os.open(self.path, os.O_RDONLY)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_SH)
+            self._map = mmap.mmap(
+                self._fd, SEGMENT_SIZE, mmap.MAP_SHARED, mmap.PROT_READ
+            )
+        except (OSError, ValueError):
+            os.close(self._fd)
+            raise
+
+        magic, version, payload_offset, payload_size = struct.unpack_from(
+            HEADER_FORMAT, self._map, 0
+        )
+        if magic != SHM_MAGIC or version != SHM_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported telemetry segment: {self.path}")
+        if payload_offset != PAYLOAD_OFFSET or payload_size != PAYLOAD_SIZE:
+            self.close()
+            raise ValueError(f"Unexpected telemetry layout: {self.path}")
+
+    def read(self) -> Optional[TelemetryFrame]:
+        """Read the latest complete frame, None if none was published yet"""
+        for _ in range(READ_RETRIES):
+            seq1 = struct.unpack_from(SEQ_FORMAT, self._map, SEQ_OFFSET)[0]
+            if seq1 & 1:
+                continue
+            values = struct.unpack_from(PAYLOAD_FORMAT, self._map, PAYLOAD_OFFSET)
+            seq2 = struct.unpack_from(SEQ_FORMAT, self._map, SEQ_OFFSET)[0]
+            if seq1 == seq2:
+                if seq1 == 0:
+                    return None
+                return self._to_frame(values)
+        return None
+
+    @staticmethod
+    def _to_frame(values) -> TelemetryFrame:
+        fan_count = values[13]
+        return TelemetryFrame(
+            timestamp=values[0],
+            seq=values[1],
+            cpu_usage=values[2],
+            cpu_temp=_from_float(values[3]),
+            cpu_freq_mhz=values[4],
+            gpu_usage=values[5],
+            gpu_temp=_from_float(values[6]),
+            gpu_power_w=values[7],
+            ram_usage=values[8],
+            ram_used_mb=values[9],
+            ram_total_mb=values[10],
+            battery_percent=None if values[11] < 0 else values[11],
+            on_ac=None if values[12] < 0 else bool(values[12]),
+            fan_rpms=list(values[14 : 14 + fan_count]),
+        )
+
+    def close(self):
+        """Unmap the segment and detach from the exporter"""
+        self._map.close()
+        os.close(self._fd)
+
+
+class TelemetryExporter:
+    """Keeps the shared segment updated while readers are attached"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        sampler: Optional[TelemetrySampler] = None,
+    ):
+        self.path = path or default_shm_path()
+        self.sampler = sampler or get_sampler()
+        self._writer: Optional[TelemetryShmWriter] = None
+        self._lock_fd: Optional[int] = None
+        self._sampling = False
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Create the segment and start watching for readers"""
+        if self._writer is not None:
+            return True
+        try:
+            self._writer = TelemetryShmWriter(self.path)
+            self._lock_fd = os.open(self.path, os.O_RDONLY)
+        except OSError as e:
+            print(f"Failed to create telemetry segment {self.path}: {e}")
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            return False
+        self.sampler.subscribe(self._writer.write)
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._watch_readers, name="telemetry-readers", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Stop publishing and remove the segment"""
+        if self._writer is None:
+            return
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._set_sampling(False)
+        self.sampler.unsubscribe(self._writer.write)
+        self._writer.close()
+        self._writer = None
+        os.close(self._lock_fd)
+        self._lock_fd = None
+
+    def readers_attached(self) -> bool:
+        """Check if any reader holds its shared lock on the segment"""
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        return False
+
+    def check_readers(self):
+        """Run the sampler only while someone reads the segment"""
+        self._set_sampling(self.readers_attached())
+
+    def _set_sampling(self, sampling: bool):
+        if sampling == self._sampling:
+            return
+        self._sampling = sampling
+        if sampling:
+            self.sampler.acquire()
+        else:
+            self.sampler.release()
+
+    def _watch_readers(self):
+        """Poll for readers attaching and detaching"""
+        while not self._stop_event.is_set():
+            self.check_readers()
+            self._stop_event.wait(READER_POLL_INTERVAL)
+
+    @property
+    def is_active(self) -> bool:
+        """Check if the segment is being published"""
+        return self._writer is not None
+
+    @property
+    def is_sampling(self) -> bool:
+        """Check if a reader is keeping the sampler running"""
+        return self._sampling
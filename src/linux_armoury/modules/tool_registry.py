@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tool Registry Module for Linux Armoury
+Resolves external command line tools once per process and shares the
+result between SystemUtils and the hardware controllers, so availability
+checks don't walk $PATH or fork `which`/`--version` probes on every call.
+
+A resolved tool stays cached until $PATH changes or its binary's mtime
+changes (upgraded, replaced or removed). Missing tools are re-checked
+after NEGATIVE_TTL seconds so a freshly installed tool is picked up.
+"""
+
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+# External tools used across Linux Armoury
+KNOWN_TOOLS = (
+    "asusctl",
+    "supergfxctl",
+    "gz302-rgb",
+    "ryzenadj",
+    "cpupower",
+    "nvidia-smi",
+    "sensors",
+    "pwrcfg",
+    "powerprofilesctl",
+    "xrandr",
+    "wlr-randr",
+    "gnome-randr",
+    "kscreen-doctor",
+)
+
+# Seconds before a missing tool is looked up again
+NEGATIVE_TTL = 30.0
+
+
+@dataclass
+class ToolEntry:
+    """Cached lookup result for one tool"""
+
+    name: str
+    path: Optional[str] = None
+    mtime: float = 0.0
+    # Monotonic deadline for re-checking a missing tool
+    expires: float = 0.0
+
+
+class ToolRegistry:
+    """Process-wide cache of external tool locations"""
+
+    def __init__(self, negative_ttl: float = NEGATIVE_TTL):
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, ToolEntry] = {}
+        self._search_path: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _lookup(self, name: str, search_path: str) -> ToolEntry:
+        """Walk the search path for a tool"""
+        path = shutil.which(name, path=search_path)
+        if path is not None:
+            try:
+                return ToolEntry(name, path, os.stat(path).st_mtime)
+            except OSError:
+                pass
+        return ToolEntry(name, expires=time.monotonic() + self.negative_ttl)
+
+    def _is_valid(self, entry: ToolEntry) -> bool:
+        """Check if a cached entry still describes the installed tool"""
+        if entry.path is None:
+            return time.monotonic() < entry.expires
+        try:
+            return os.stat(entry.path).st_mtime == entry.mtime
+        except OSError:
+            return False
+
+    def which(self, name: str) -> Optional[str]:
+        """Get the full path of a tool, None if it is not installed"""
+        with self._lock:
+            search_path = os.environ.get("PATH", os.defpath)
+            if search_path != self._search_path:
+                self._entries.clear()
+                self._search_path = search_path
+
+            entry = self._entries.get(name)
+            if entry is None or not self._is_valid(entry):
+                entry = self._lookup(name, search_path)
+                self._entries[name] = entry
+            return entry.path
+
+    def has(self, name: str) -> bool:
+        """Check if a tool is installed"""
+        return self.which(name) is not None
+
+    def resolve_all(
+        self, names: Iterable[str] = KNOWN_TOOLS
+    ) -> Dict[str, Optional[str]]:
+        """Resolve several tools at once (e.g. at startup)"""
+        return {name: self.which(name) for name in names}
+
+    def invalidate(self, name: Optional[str] = None):
+        """Forget one tool (or all tools) so the next check looks it up again"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+
+# Global singleton
+_tool_registry: Optional[ToolRegistry] = None
+
+
+def get_tool_registry() -> ToolRegistry:
+    """Get singleton tool registry instance"""
+    global _tool_registry
+    if _tool_registry is None:
+        _tool_registry = ToolRegistry()
+    return _tool_registry
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Uevent Monitor Module for Linux Armoury
+Listens for kernel uevents on a NETLINK_KOBJECT_UEVENT socket so AC adapter
+plug/unplug is noticed the moment it happens instead of on the next poll.
+The AC state is read from the power supplies' `online` attributes rather
+than inferred from battery status strings. When the socket can't be opened,
+callers fall back to polling the same attributes.
+"""
+
+import errno
+import os
+import socket
+import threading
+from typing import Callable, Dict, List, Optional
+
+# Netlink uevent constants (linux/netlink.h)
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_KERNEL_GROUP = 1
+
+POWER_SUPPLY_ROOT = "/sys/class/power_supply"
+
+# Supply types that power the laptop when online (everything but batteries)
+AC_SUPPLY_TYPES = ("Mains", "USB", "USB_C", "USB_PD", "USB_PD_DRP", "Wireless")
+
+UeventCallback = Callable[[Optional[Dict[str, str]]], None]
+
+
+def parse_uevent(data: bytes) -> Optional[Dict[str, str]]:
+    """
+    Parse a kernel uevent datagram ("action@devpath\\0KEY=VALUE\\0...").
+
+    Messages re-broadcast by udev (prefixed with "libudev") are ignored.
+    """
+    if data.startswith(b"libudev"):
+        return None
+    parts = data.split(b"\0")
+    if not parts or b"@" not in parts[0]:
+        return None
+    action, _, devpath = parts[0].decode("utf-8", "replace").partition("@")
+    event = {"ACTION": action, "DEVPATH": devpath}
+    for part in parts[1:]:
+        key, sep, value = part.decode("utf-8", "replace").partition("=")
+        if sep:
+            event[key] = value
+    return event
+
+
+def _read_attr(path: str) -> str:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+
+def read_ac_online(root: str = POWER_SUPPLY_ROOT) -> Optional[bool]:
+    """
+    Check if any AC-type power supply is online.
+
+    Returns None when the machine has no AC-type supply at all.
+    """
+    try:
+        supplies = sorted(os.listdir(root))
+    except OSError:
+        return None
+    found = False
+    for name in supplies:
+        path = os.path.join(root, name)
+        if _read_attr(os.path.join(path, "type")) not in AC_SUPPLY_TYPES:
+            continue
+        online = _read_attr(os.path.join(path, "online"))
+        if not online:
+            continue
+        found = True
+        if online == "1":
+            return True
+    return False if found else None
+
+
+class UeventListener(threading.Thread):
+    """Receives kernel uevents, optionally filtered by subsystem"""
+
+    def __init__(
+        self, on_event: UeventCallback, subsystems: Optional[List[str]] = None
+    ):
+        super().__init__(name="uevent-listener", daemon=True)
+        self._on_event = on_event
+        self._subsystems = set(subsystems) if subsystems else None
+        self._sock: Optional[socket.socket] = None
+        self._running = False
+
+    def connect(self) -> bool:
+        """Open and bind the uevent socket (kernel group, no privileges needed)"""
+        try:
+            sock = socket.socket(
+                socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT
+            )
+        except (OSError, AttributeError):
+            return False
+        try:
+            sock.bind((0, UEVENT_KERNEL_GROUP))
+            sock.settimeout(1.0)
+        except OSError:
+            sock.close()
+            return False
+        self._sock = sock
+        return True
+
+    def handle(self, data: bytes):
+        """Dispatch one raw datagram (also used to inject events in tests)"""
+        event = parse_uevent(data)
+        if event is None:
+            return
+        if self._subsystems and event.get("SUBSYSTEM") not in self._subsystems:
+            return
+        self._on_event(event)
+
+    def run(self):
+        self._running = True
+        while self._running and self._sock is not None:
+            try:
+                data = self._sock.recv(65536)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if e.errno == errno.ENOBUFS:
+                    # Events were dropped; let the receiver resync its state
+                    self._on_event(None)
+                    continue
+                break
+            self.handle(data)
+        self._close()
+
+    def stop(self):
+        """Stop the listener thread"""
+        self._running = False
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(timeout=2)
+        self._close()
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+class PowerSupplyMonitor:
+    """Tracks AC adapter state from power_supply uevents"""
+
+    def __init__(self, root: str = POWER_SUPPLY_ROOT):
+        self.root = root
+        self._on_ac: Optional[bool] = None
+        self._callbacks: List[Callable[[Optional[bool]], None]] = []
+        self._listener: Optional[UeventListener] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Start listening for uevents, False if only polling is possible"""
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive():
+                return True
+            listener = UeventListener(self.handle_event, ["power_supply"])
+            if not listener.connect():
+                self._listener = None
+                return False
+            self._listener = listener
+            listener.start()
+        self.refresh()
+        return True
+
+    def stop(self):
+        """Stop the uevent listener"""
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+
+    @property
+    def is_event_driven(self) -> bool:
+        """Check if AC changes are delivered by uevents"""
+        return self._listener is not None and self._listener.is_alive()
+
+    @property
+    def on_ac(self) -> Optional[bool]:
+        """Current AC state (re-read from sysfs when not event-driven)"""
+        if not self.is_event_driven or self._on_ac is None:
+            return self.refresh()
+        return self._on_ac
+
+    def refresh(self) -> Optional[bool]:
+        """Re-read the AC state and notify callbacks if it changed"""
+        on_ac = read_ac_online(self.root)
+        with self._lock:
+            changed = on_ac != self._on_ac
+            self._on_ac = on_ac
+        if changed:
+            for callback in list(self._callbacks):
+                try:
+                    callback(on_ac)
+                except Exception as e:
+                    print(f"Power supply callback error: {e}")
+        return on_ac
+
+    def handle_event(self, event: Optional[Dict[str, str]]):
+        """Handle a power_supply uevent (None means events were lost)"""
+        if event is None or event.get("SUBSYSTEM") == "power_supply":
+            # Read every supply: an event for one (e.g. the battery) says
+            # nothing about the others, and USB-C chargers come and go
+            self.refresh()
+
+    def add_callback(self, callback: Callable[[Optional[bool]], None]):
+        """Call `callback(on_ac)` whenever the AC state changes"""
+        if callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[Optional[bool]], None]):
+        """Stop notifying a callback"""
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+
+# Global singleton
+_power_supply_monitor: Optional[PowerSupplyMonitor] = None
+
+
+def get_power_supply_monitor() -> PowerSupplyMonitor:
+    """Get singleton power supply monitor instance"""
+    global _power_supply_monitor
+    if _power_supply_monitor is None:
+        _power_supply_monitor = PowerSupplyMonitor()
+    return _power_supply_monitor
@@ -7,10 +7,64 @@ import json
 import logging
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+
+from .modules.profile_engine import ApplyReport, ProfileEngine, ProfileStep
 
 logger = logging.getLogger("LinuxArmoury")
 
+# Armoury Crate GPU mode names used by profiles, mapped to supergfxctl modes
+# (GpuMode values; the hardware modules are imported only when applying)
+GPU_MODE_ALIASES = {
+    "ultimate": "AsusMuxDgpu",
+    "eco": "Integrated",
+    "standard": "Hybrid",
+}
+
+# Platform profile names that mean the same fan behaviour
+FAN_PROFILE_ALIASES = {
+    "silent": "quiet",
+    "power-saver": "quiet",
+    "low-power": "quiet",
+    "battery": "quiet",
+    "gaming": "performance",
+}
+
+# Power profile names to try for each fan behaviour, best match first. The
+# backends differ: sysfs has low-power/quiet, ppd power-saver, pwrcfg battery
+POWER_PROFILE_CANDIDATES = {
+    "quiet": ("quiet", "low-power", "power-saver", "battery"),
+    "balanced": ("balanced",),
+    "performance": ("performance", "gaming"),
+}
+
+
+def _normalize_fan_profile(name: Optional[str]) -> str:
+    name = (name or "").lower()
+    return FAN_PROFILE_ALIASES.get(name, name)
+
+
+def _power_profile_for(fan_curve: str, available: List[str]) -> Optional[str]:
+    """Pick the available power profile matching a profile's fan curve"""
+    by_name = {name.lower(): name for name in available}
+    wanted = _normalize_fan_profile(fan_curve)
+    for candidate in (fan_curve.lower(),) + POWER_PROFILE_CANDIDATES.get(wanted, ()):
+        if candidate in by_name:
+            return by_name[candidate]
+    return None
+
+
+# Fast (PPT) limit headroom over the STAPM limit, as App.set_tdp applies it
+TDP_FAST_HEADROOM_W = 5
+
+
+def _gpu_mode_name(mode) -> Optional[str]:
+    return mode.value if mode else None
+
+
+def _round_tdp_limits(limits: Optional[Dict[str, float]]) -> Dict[str, int]:
+    return {key: round(watts) for key, watts in (limits or {}).items()}
+
 
 @dataclass
 class SystemProfile:
@@ -117,6 +171,9 @@ class ProfileManager:
         self.config_dir = Path.home() / ".config" / "linux-armoury" / "profiles"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.custom_profiles: Dict[str, SystemProfile] = {}
+        self.last_report: Optional[ApplyReport] = None
+        self._engine: Optional[ProfileEngine] = None
+        self._engine_app = None
         self._load_custom_profiles()
 
     def _load_custom_profiles(self):
@@ -185,6 +242,9 @@ class ProfileManager:
         """
         Apply all settings from a profile to the application
 
+        Only settings that differ from the current hardware state are
+        written; if one fails, the ones already changed are restored.
+
         Args:
             profile: Profile to apply
             app: Application instance
@@ -194,60 +254,30 @@ class ProfileManager:
         """
         try:
             logger.info(f"Applying profile: {profile.name}")
-            success = True
-
-            # TDP
-            if hasattr(app, "set_tdp"):
-                try:
-                    app.set_tdp(profile.tdp_watts)
-                except Exception as e:
-                    logger.error(f"Failed to set TDP: {e}")
-                    success = False
-
-            # GPU mode
-            if hasattr(app, "gpu_controller") and app.gpu_controller:
-                try:
-                    app.gpu_controller.set_mode(profile.gpu_mode)
-                except Exception as e:
-                    logger.error(f"Failed to set GPU mode: {e}")
-                    success = False
-
-            # Fan curve
-            if hasattr(app, "fan_controller") and app.fan_controller:
-                try:
-                    app.fan_controller.set_curve(profile.fan_curve)
-                except Exception as e:
-                    logger.error(f"Failed to set fan curve: {e}")
-                    success = False
+            engine = self._get_engine(app)
+            report = engine.apply(profile.name, self._profile_targets(profile, app))
+            self.last_report = report
+            success = report.success
 
-            # RGB
-            if hasattr(app, "keyboard_controller") and app.keyboard_controller:
-                try:
-                    app.keyboard_controller.set_brightness(profile.rgb_brightness)
-                    if profile.rgb_effect != "Off":
-                        app.keyboard_controller.set_effect(profile.rgb_effect)
-                except Exception as e:
-                    logger.error(f"Failed to set RGB: {e}")
-                    success = False
-
-            # Battery
-            if hasattr(app, "battery_controller") and app.battery_controller:
-                try:
-                    app.battery_controller.set_charge_limit(profile.battery_limit)
-                except Exception as e:
-                    logger.error(f"Failed to set battery limit: {e}")
-                    success = False
+            for step in report.failed:
+                logger.error(f"Failed to set {step.name}: {step.message}")
+            logger.info(report.summary())
 
             # Show notification
             if hasattr(app, "show_toast"):
-                status = "applied successfully" if success else "applied with errors"
+                if success:
+                    status = "applied successfully"
+                elif report.rolled_back:
+                    status = "failed; changes were rolled back"
+                else:
+                    status = "applied with errors"
                 app.show_toast(
                     f"Profile '{profile.name}' {status}",
                     "success" if success else "warning",
                 )
 
             # Save current profile to config
-            if hasattr(app, "config"):
+            if success and hasattr(app, "config"):
                 app.config.set("last_tdp_profile", profile.name)
 
             logger.info(f"Profile {profile.name} applied - success: {success}")
@@ -259,6 +289,136 @@ class ProfileManager:
                 app.show_toast(f"Failed to apply profile: {e}", "error")
             return False
 
+    def _get_engine(self, app) -> ProfileEngine:
+        """Get the apply engine for an application's controllers"""
+        if self._engine is None or self._engine_app is not app:
+            self._engine = ProfileEngine(self._build_steps(app))
+            self._engine_app = app
+        return self._engine
+
+    @staticmethod
+    def _build_steps(app) -> List[ProfileStep]:
+        """Create a step for each setting the hardware supports"""
+        from .modules.gpu_control import GpuMode
+        from .modules.keyboard_control import AuraEffect
+        from .modules.overclocking_control import get_overclocking_controller
+        from .system_utils import SystemUtils
+
+        steps = []
+
+        fans = getattr(app, "fan_controller", None)
+        if fans:
+            # Fan curves follow the platform profile on ASUS laptops. First:
+            # pwrcfg, asusctl and ppd set power limits along with it, which
+            # would race with (and override) the TDP step
+            steps.append(
+                ProfileStep(
+                    "fan_profile",
+                    read=SystemUtils.get_current_power_profile,
+                    write=SystemUtils.set_power_profile,
+                    normalize=_normalize_fan_profile,
+                )
+            )
+
+        overclocking = get_overclocking_controller()
+        if overclocking.ryzenadj_available:
+            # The engine diffs all three limits, so write them as they are
+            steps.append(
+                ProfileStep(
+                    "tdp",
+                    read=lambda: overclocking.current_tdp_limits() or None,
+                    write=lambda limits: overclocking.set_ryzenadj_tdp(
+                        limits.get("stapm"), limits.get("fast"), limits.get("slow")
+                    ),
+                    stage=1,
+                    normalize=_round_tdp_limits,
+                )
+            )
+
+        keyboard = getattr(app, "keyboard_controller", None)
+        if keyboard and keyboard.is_supported():
+            steps.append(
+                ProfileStep(
+                    "kbd_brightness",
+                    read=keyboard.get_brightness,
+                    write=keyboard.set_brightness,
+                    stage=1,
+                )
+            )
+        if keyboard and (keyboard.has_aura() or keyboard.has_gz302_rgb()):
+            steps.append(
+                ProfileStep(
+                    "kbd_effect",
+                    read=lambda: None,
+                    write=lambda effect: keyboard.set_effect(AuraEffect(effect)),
+                    stage=1,
+                )
+            )
+
+        battery = getattr(app, "battery_controller", None)
+        if battery and battery.is_supported():
+            steps.append(
+                ProfileStep(
+                    "charge_limit",
+                    read=battery.get_charge_limit,
+                    write=battery.set_charge_limit,
+                    stage=1,
+                )
+            )
+
+        gpu = getattr(app, "gpu_controller", None)
+        if gpu and gpu.supergfxctl_available:
+            # Last, and only once everything else worked: a mode switch may
+            # need a logout and can't simply be undone, so its failure leaves
+            # the other settings in place
+            steps.append(
+                ProfileStep(
+                    "gpu_mode",
+                    read=lambda: _gpu_mode_name(gpu.get_current_mode()),
+                    write=lambda mode: gpu.set_gpu_mode(GpuMode(mode)),
+                    stage=2,
+                    best_effort=True,
+                )
+            )
+
+        return steps
+
+    @staticmethod
+    def _profile_targets(profile: SystemProfile, app) -> Dict[str, Any]:
+        """Map a profile onto the engine's step values"""
+        from .modules.gpu_control import GpuMode
+        from .system_utils import SystemUtils
+
+        gpu_mode = GpuMode.from_string(
+            GPU_MODE_ALIASES.get(profile.gpu_mode.lower(), profile.gpu_mode)
+        )
+        # Profiles asking for a mode the machine lacks (e.g. Ultimate
+        # without a MUX) keep the current one
+        gpu = getattr(app, "gpu_controller", None)
+        if gpu_mode and (gpu is None or gpu_mode not in gpu.get_supported_modes()):
+            gpu_mode = None
+
+        targets: Dict[str, Any] = {
+            "tdp": {
+                "stapm": profile.tdp_watts,
+                "fast": profile.tdp_watts + TDP_FAST_HEADROOM_W,
+                "slow": profile.tdp_watts,
+            },
+            "fan_profile": _power_profile_for(
+                profile.fan_curve, SystemUtils.get_available_power_profiles()
+            ),
+            "kbd_effect": None if profile.rgb_effect == "Off" else profile.rgb_effect,
+            "charge_limit": profile.battery_limit,
+            "gpu_mode": gpu_mode.value if gpu_mode else None,
+        }
+
+        # Profiles store brightness in percent, the LED in levels
+        keyboard = getattr(app, "keyboard_controller", None)
+        if keyboard:
+            max_level = keyboard.get_max_brightness()
+            targets["kbd_brightness"] = round(profile.rgb_brightness * max_level / 100)
+        return targets
+
     def export_profile(self, profile: SystemProfile, filepath: Path) -> bool:
         """Export a profile to a file"""
         try:
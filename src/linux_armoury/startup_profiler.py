@@ -0,0 +1,100 @@
+"""
+Startup Profiler for Linux Armoury
+Records how long each component takes to import and initialize, for the
+`--profile-startup` report
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class StartupEvent:
+    """One timed startup step"""
+
+    name: str
+    kind: str  # "import", "init", "warmup" or "milestone"
+    start_ms: float  # Since the profiler was created
+    duration_ms: float
+    thread: str
+
+
+class StartupProfiler:
+    """Collects startup timings from any thread"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events: List[StartupEvent] = []
+        self._lock = threading.Lock()
+
+    def _now_ms(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    @contextmanager
+    def measure(self, name: str, kind: str = "init") -> Iterator[None]:
+        """Time the enclosed block"""
+        start = self._now_ms()
+        try:
+            yield
+        finally:
+            self._record(name, kind, start, self._now_ms() - start)
+
+    def mark(self, name: str):
+        """Record a point in time, e.g. the first frame being drawn"""
+        self._record(name, "milestone", self._now_ms(), 0.0)
+
+    def _record(self, name: str, kind: str, start_ms: float, duration_ms: float):
+        event = StartupEvent(
+            name, kind, start_ms, duration_ms, threading.current_thread().name
+        )
+        with self._lock:
+            self.events.append(event)
+
+    def milestone(self, name: str) -> Optional[float]:
+        """Time of a recorded milestone in ms, None if not reached yet"""
+        with self._lock:
+            for event in self.events:
+                if event.kind == "milestone" and event.name == name:
+                    return event.start_ms
+        return None
+
+    def totals(self) -> Dict[str, float]:
+        """Total time per kind of step"""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for event in self.events:
+                if event.kind != "milestone":
+                    totals[event.kind] = totals.get(event.kind, 0.0) + event.duration_ms
+        return totals
+
+    def report(self) -> str:
+        """Format a per-component timing table"""
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e.start_ms)
+        lines = ["Startup profile (ms since start, duration, kind, component):"]
+        for event in events:
+            duration = "" if event.kind == "milestone" else f"{event.duration_ms:8.1f}"
+            thread = "" if event.thread == "MainThread" else f"  [{event.thread}]"
+            lines.append(
+                f"  {event.start_ms:8.1f} {duration:>8}  {event.kind:<9} "
+                f"{event.name}{thread}"
+            )
+        totals = ", ".join(f"{k} {v:.1f} ms" for k, v in self.totals().items())
+        if totals:
+            lines.append(f"Totals: {totals}")
+        return "\n".join(lines)
+
+
+# Global singleton
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """Get singleton startup profiler instance"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler()
+    return _startup_profiler
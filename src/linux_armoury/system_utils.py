@@ -5,10 +5,19 @@ System utilities for hardware detection and monitoring
 
 import os
 import re
-import shutil
 import subprocess
 from typing import Dict, List, Optional, Tuple
 
+from .modules.display_topology import (
+    DisplayOutput,
+    DisplayTopology,
+    get_topology_cache,
+)
+from .modules.hwmon_index import get_hwmon_index
+from .modules.privileged_helper import get_privileged_helper
+from .modules.process_index import get_process_index
+from .modules.tool_registry import get_tool_registry
+
 
 class DisplayBackend:
     """Enum-like class for display backend types"""
@@ -21,6 +30,20 @@ class DisplayBackend:
 class SystemUtils:
     """System utility functions for hardware detection and monitoring"""
 
+    # Process name fragments that indicate a game or launcher is running
+    GAMING_APPS = [
+        "steam",
+        "lutris",
+        "heroic",
+        "bottles",
+        "wine",
+        "proton",
+        "gamemoded",
+        "gamemode",
+        "minecraft",
+        "dotnet",
+    ]
+
     @staticmethod
     def get_display_backend() -> str:
         """
@@ -84,82 +107,40 @@ class SystemUtils:
             return SystemUtils._get_primary_display_x11()
 
     @staticmethod
-    def _get_primary_display_x11() -> str:
-        """Get primary display for X11"""
-        try:
-            result = subprocess.run(
-                ["xrandr", "--query"], capture_output=True, text=True, timeout=5
-            )
+    def get_display_topology(force: bool = False) -> DisplayTopology:
+        """
+        Get the (cached) display topology for the current backend.
 
-            # Look for connected displays
-            for line in result.stdout.split("\n"):
-                # First try to find primary display
-                if " connected primary" in line:
-                    return line.split()[0]
+        Args:
+            force: Re-query the display tool even if the cache is fresh
 
-            # If no primary, find first connected display
-            for line in result.stdout.split("\n"):
-                if " connected" in line and "disconnected" not in line:
-                    return line.split()[0]
+        Returns:
+            DisplayTopology: Parsed outputs, modes and current mode
+        """
+        if SystemUtils.get_display_backend() == DisplayBackend.WAYLAND:
+            tool = SystemUtils.get_wayland_tool()
+        else:
+            tool = "xrandr"
+        return get_topology_cache().get(tool, force)
 
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            print(f"Error detecting X11 display: {e}")
+    @staticmethod
+    def _primary_output(tool: Optional[str]) -> Optional[DisplayOutput]:
+        """Get the primary output from the cached topology of a tool"""
+        return get_topology_cache().get(tool).primary
 
+    @staticmethod
+    def _get_primary_display_x11() -> str:
+        """Get primary display for X11"""
+        output = SystemUtils._primary_output("xrandr")
         # Fallback to common default
-        return "eDP-1"
+        return output.name if output else "eDP-1"
 
     @staticmethod
     def _get_primary_display_wayland() -> str:
         """Get primary display for Wayland"""
-        tool = SystemUtils.get_wayland_tool()
-
-        if tool == "wlr-randr":
-            try:
-                result = subprocess.run(
-                    ["wlr-randr"], capture_output=True, text=True, timeout=5
-                )
-                # Parse wlr-randr output - first output is usually the display name
-                for line in result.stdout.split("\n"):
-                    if line and not line.startswith(" "):
-                        # Output name is the first word
-                        return line.split()[0]
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error detecting Wayland display with wlr-randr: {e}")
-
-        elif tool == "kscreen-doctor":
-            try:
-                result = subprocess.run(
-                    ["kscreen-doctor", "-o"], capture_output=True, text=True, timeout=5
-                )
-                # Parse kscreen-doctor output
-                for line in result.stdout.split("\n"):
-                    if "Output" in line:
-                        match = re.search(r"Output:\s+(\d+)\s+(\S+)", line)
-                        if match:
-                            return match.group(2)
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error detecting Wayland display with kscreen-doctor: {e}")
-
-        # Fallback - try to detect from GNOME settings
-        try:
-            result = subprocess.run(
-                [
-                    "gsettings",
-                    "get",
-                    "org.gnome.desktop.interface",
-                    "text-scaling-factor",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=2,
-            )
-            # If gsettings works, we're probably on GNOME
-            # GNOME Wayland uses display IDs like 'eDP-1'
-            return "eDP-1"
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            pass
-
-        return "eDP-1"
+        output = SystemUtils._primary_output(SystemUtils.get_wayland_tool())
+        # GNOME Wayland (no query tool) uses display IDs like 'eDP-1'
+        return output.name if output else "eDP-1"
 
     @staticmethod
     def get_display_resolution() -> Tuple[int, int]:
@@ -179,54 +160,17 @@ class SystemUtils:
     @staticmethod
     def _get_display_resolution_x11() -> Tuple[int, int]:
         """Get display resolution for X11"""
-        try:
-            result = subprocess.run(
-                ["xrandr", "--query"], capture_output=True, text=True, timeout=5
-            )
-
-            for line in result.stdout.split("\n"):
-                if "*" in line:  # Current resolution marked with *
-                    match = re.search(r"(\d+)x(\d+)", line)
-                    if match:
-                        return (int(match.group(1)), int(match.group(2)))
-
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            print(f"Error getting X11 resolution: {e}")
-
+        output = SystemUtils._primary_output("xrandr")
+        if output and output.resolution:
+            return output.resolution
         return (1920, 1080)  # Fallback default resolution
 
     @staticmethod
     def _get_display_resolution_wayland() -> Tuple[int, int]:
         """Get display resolution for Wayland"""
-        tool = SystemUtils.get_wayland_tool()
-
-        if tool == "wlr-randr":
-            try:
-                result = subprocess.run(
-                    ["wlr-randr"], capture_output=True, text=True, timeout=5
-                )
-                # Parse resolution from wlr-randr output
-                # Format: "  2560x1600 px, 60.000000 Hz (current)"
-                for line in result.stdout.split("\n"):
-                    if "current" in line.lower():
-                        match = re.search(r"(\d+)x(\d+)", line)
-                        if match:
-                            return (int(match.group(1)), int(match.group(2)))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error getting Wayland resolution with wlr-randr: {e}")
-
-        elif tool == "kscreen-doctor":
-            try:
-                result = subprocess.run(
-                    ["kscreen-doctor", "-o"], capture_output=True, text=True, timeout=5
-                )
-                for line in result.stdout.split("\n"):
-                    match = re.search(r"(\d+)x(\d+)@", line)
-                    if match:
-                        return (int(match.group(1)), int(match.group(2)))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error getting Wayland resolution with kscreen-doctor: {e}")
-
+        output = SystemUtils._primary_output(SystemUtils.get_wayland_tool())
+        if output and output.resolution:
+            return output.resolution
         return (1920, 1080)  # Fallback default resolution
 
     @staticmethod
@@ -261,133 +205,28 @@ class SystemUtils:
 
     @staticmethod
     def _get_supported_refresh_rates_x11() -> List[int]:
-        rates = set()
-        try:
-            # Get current resolution first
-            width, height = SystemUtils._get_display_resolution_x11()
-            res_str = f"{width}x{height}"
-
-            result = subprocess.run(
-                ["xrandr", "--query"], capture_output=True, text=True, timeout=5
-            )
-
-            # Parse output
-            # 1920x1080     60.00*+  120.00  144.00
-            for line in result.stdout.split("\n"):
-                if res_str in line:
-                    # Extract all numbers that look like rates
-                    # Skip the resolution part
-                    parts = line.split()
-                    if parts[0] == res_str:
-                        for part in parts[1:]:
-                            # Remove * and +
-                            clean_part = part.replace("*", "").replace("+", "")
-                            try:
-                                rate = float(clean_part)
-                                rates.add(int(round(rate)))
-                            except ValueError:
-                                pass
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            print(f"Error getting X11 rates: {e}")
-
-        return sorted(list(rates))
+        output = SystemUtils._primary_output("xrandr")
+        return output.rates_for() if output else []
 
     @staticmethod
     def _get_supported_refresh_rates_wayland() -> List[int]:
-        rates = set()
-        tool = SystemUtils.get_wayland_tool()
-
-        if tool == "wlr-randr":
-            try:
-                result = subprocess.run(["wlr-randr"], capture_output=True, text=True)
-                # Output format needs parsing. Usually lists modes.
-                # 1920x1080 px, 144.000000 Hz
-                # 1920x1080 px, 60.000000 Hz
-
-                # Let's get current resolution first
-                width, height = SystemUtils._get_display_resolution_wayland()
-                res_str = f"{width}x{height}"
-
-                for line in result.stdout.split("\n"):
-                    if res_str in line and "Hz" in line:
-                        match = re.search(r"(\d+\.?\d*)\s*Hz", line)
-                        if match:
-                            rates.add(int(round(float(match.group(1)))))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-
-        elif tool == "kscreen-doctor":
-            # kscreen-doctor -o output
-            # Mode: 1920x1080@144 ...
-            # Mode: 1920x1080@60 ...
-            try:
-                width, height = SystemUtils._get_display_resolution_wayland()
-                res_str = f"{width}x{height}"
-
-                result = subprocess.run(
-                    ["kscreen-doctor", "-o"], capture_output=True, text=True
-                )
-                for line in result.stdout.split("\n"):
-                    if "Mode:" in line and res_str in line:
-                        match = re.search(r"@(\d+)", line)
-                        if match:
-                            rates.add(int(match.group(1)))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-                pass
-
-        return sorted(list(rates))
+        output = SystemUtils._primary_output(SystemUtils.get_wayland_tool())
+        return output.rates_for() if output else []
 
     @staticmethod
     def _get_current_refresh_rate_x11() -> Optional[int]:
         """Get refresh rate for X11"""
-        try:
-            result = subprocess.run(
-                ["xrandr", "--query"], capture_output=True, text=True, timeout=5
-            )
-
-            for line in result.stdout.split("\n"):
-                if "*" in line:  # Current mode
-                    match = re.search(r"(\d+\.\d+)\*", line)
-                    if match:
-                        return int(float(match.group(1)))
-
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-            print(f"Error getting refresh rate: {e}")
-
+        output = SystemUtils._primary_output("xrandr")
+        if output and output.current_rate is not None:
+            return int(output.current_rate)
         return None
 
     @staticmethod
     def _get_current_refresh_rate_wayland() -> Optional[int]:
         """Get refresh rate for Wayland"""
-        tool = SystemUtils.get_wayland_tool()
-
-        if tool == "wlr-randr":
-            try:
-                result = subprocess.run(
-                    ["wlr-randr"], capture_output=True, text=True, timeout=5
-                )
-                # Parse refresh rate from wlr-randr output
-                # Format: "  2560x1600 px, 60.000000 Hz (current)"
-                for line in result.stdout.split("\n"):
-                    if "current" in line.lower():
-                        match = re.search(r"(\d+\.?\d*)\s*Hz", line)
-                        if match:
-                            return int(float(match.group(1)))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error getting Wayland refresh rate with wlr-randr: {e}")
-
-        elif tool == "kscreen-doctor":
-            try:
-                result = subprocess.run(
-                    ["kscreen-doctor", "-o"], capture_output=True, text=True, timeout=5
-                )
-                for line in result.stdout.split("\n"):
-                    match = re.search(r"@(\d+)", line)
-                    if match:
-                        return int(match.group(1))
-            except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
-                print(f"Error getting Wayland refresh rate with kscreen-doctor: {e}")
-
+        output = SystemUtils._primary_output(SystemUtils.get_wayland_tool())
+        if output and output.current_rate is not None:
+            return int(output.current_rate)
         return None
 
     @staticmethod
@@ -411,6 +250,7 @@ class SystemUtils:
     @staticmethod
     def _set_refresh_rate_x11(rate: int) -> Tuple[bool, str]:
         """Set refresh rate for X11"""
+        # Both values come from the same cached query
         display = SystemUtils._get_primary_display_x11()
         width, height = SystemUtils._get_display_resolution_x11()
 
@@ -426,6 +266,7 @@ class SystemUtils:
                 text=True,
                 timeout=10,
             )
+            get_topology_cache().invalidate()
 
             if result.returncode == 0:
                 return (True, f"Refresh rate set to {rate} Hz")
@@ -459,6 +300,7 @@ class SystemUtils:
                     text=True,
                     timeout=10,
                 )
+                get_topology_cache().invalidate()
 
                 if result.returncode == 0:
                     return (True, f"Refresh rate set to {rate} Hz (Wayland)")
@@ -477,6 +319,7 @@ class SystemUtils:
                     text=True,
                     timeout=10,
                 )
+                get_topology_cache().invalidate()
 
                 if result.returncode == 0:
                     return (True, f"Refresh rate set to {rate} Hz (Wayland/KDE)")
@@ -495,24 +338,14 @@ class SystemUtils:
         Returns:
             Optional[float]: Temperature in Celsius
         """
-        try:
-            # Try different hwmon paths
-            hwmon_paths = [
-                "/sys/class/hwmon/hwmon0/temp1_input",
-                "/sys/class/hwmon/hwmon1/temp1_input",
-                "/sys/class/hwmon/hwmon2/temp1_input",
-                "/sys/class/hwmon/hwmon3/temp1_input",
-            ]
-
-            for path in hwmon_paths:
-                if os.path.exists(path):
-                    with open(path, "r") as f:
-                        # Temperature in millidegrees
-                        temp = int(f.read().strip()) / 1000.0
-                        if 0 < temp < 150:  # Sanity check
-                            return temp
+        temp = get_hwmon_index().cpu_temperature()
+        if temp is not None and 0 < temp < 150:  # Sanity check
+            return temp
 
+        try:
             # Try sensors command if available
+            if not SystemUtils.check_command_exists("sensors"):
+                return None
             result = subprocess.run(
                 ["sensors", "-A"], capture_output=True, text=True, timeout=2
             )
@@ -537,28 +370,13 @@ class SystemUtils:
         Returns:
             Optional[float]: Temperature in Celsius
         """
+        # Method 1: hwmon index (amdgpu edge, ...); None while the GPU sleeps
+        hwmon = get_hwmon_index()
+        if hwmon.role("gpu") is not None:
+            return hwmon.gpu_temperature()
+
         try:
-            # Method 1: Try reading from sysfs (amdgpu)
-            base_path = "/sys/class/hwmon"
-            if os.path.exists(base_path):
-                for item in os.listdir(base_path):
-                    path = os.path.join(base_path, item)
-                    name_file = os.path.join(path, "name")
-                    if os.path.exists(name_file):
-                        try:
-                            with open(name_file, "r") as f:
-                                name = f.read().strip()
-
-                            if name == "amdgpu":
-                                # Try temp1_input (usually edge)
-                                temp_path = os.path.join(path, "temp1_input")
-                                if os.path.exists(temp_path):
-                                    with open(temp_path, "r") as f:
-                                        return int(f.read().strip()) / 1000.0
-                        except Exception:
-                            continue
-
-            # Method 2: Fallback to sensors command
+            # Method 2: Fallback to sensors command (no GPU hwmon to wake)
             if SystemUtils.check_command_exists("sensors"):
                 result = subprocess.run(
                     ["sensors"], capture_output=True, text=True, timeout=2
@@ -626,7 +444,8 @@ class SystemUtils:
 
     @staticmethod
     def check_command_exists(command: str) -> bool:
-        return shutil.which(command) is not None
+        """Check if a command is installed (cached in the tool registry)"""
+        return get_tool_registry().has(command)
 
     @staticmethod
     def get_current_power_profile() -> Optional[str]:
@@ -724,11 +543,10 @@ class SystemUtils:
         """
         # 1. pwrcfg
         if SystemUtils.check_command_exists("pwrcfg"):
-            try:
-                subprocess.run(["pkexec", "pwrcfg", profile], check=True)
+            success, _, stderr = get_privileged_helper().run(["pwrcfg", profile])
+            if success:
                 return True, f"Set profile to {profile}"
-            except subprocess.CalledProcessError as e:
-                return False, f"pwrcfg failed: {e}"
+            return False, f"pwrcfg failed: {stderr.strip()}"
 
         # 2. asusctl
         if SystemUtils.check_command_exists("asusctl"):
@@ -765,16 +583,12 @@ class SystemUtils:
             except subprocess.CalledProcessError as e:
                 return False, f"powerprofilesctl failed: {e}"
 
-        # 4. Sysfs (requires root)
+        # 4. Sysfs (requires root, or the privileged helper)
         platform_profile_path = "/sys/firmware/acpi/platform_profile"
-        try:
-            with open(platform_profile_path, "w") as f:
-                f.write(profile)
+        success, error = get_privileged_helper().write(platform_profile_path, profile)
+        if success:
             return True, f"Set profile to {profile}"
-        except PermissionError:
-            return False, "Permission denied (need root)"
-        except Exception as e:
-            return False, f"Error: {e}"
+        return False, f"Error: {error}"
 
     @staticmethod
     def get_current_tdp() -> Optional[int]:
@@ -825,21 +639,10 @@ class SystemUtils:
     @staticmethod
     def find_hwmon_path(name_pattern: str) -> Optional[str]:
         """Find a hwmon path by matching its name file"""
-        base_path = "/sys/class/hwmon"
-        if not os.path.exists(base_path):
-            return None
-
-        for item in os.listdir(base_path):
-            path = os.path.join(base_path, item)
-            name_file = os.path.join(path, "name")
-            if os.path.exists(name_file):
-                try:
-                    with open(name_file, "r") as f:
-                        name = f.read().strip()
-                        if name_pattern in name:
-                            return path
-                except Exception:
-                    continue
+        index = get_hwmon_index()
+        for chip in index.chips():
+            if name_pattern in chip:
+                return index.chip_dirs(chip)[0]
         return None
 
     @staticmethod
@@ -877,14 +680,7 @@ class SystemUtils:
             List[str]: Process names
         """
         try:
-            result = subprocess.run(
-                ["ps", "-eo", "comm"], capture_output=True, text=True, timeout=2
-            )
-
-            if result.returncode == 0:
-                processes = result.stdout.split("\n")[1:]  # Skip header
-                return [p.strip() for p in processes if p.strip()]
-
+            return get_process_index().names()
         except Exception as e:
             print(f"Error getting processes: {e}")
 
@@ -898,27 +694,9 @@ class SystemUtils:
         Returns:
             bool: True if gaming app detected
         """
-        gaming_apps = [
-            "steam",
-            "lutris",
-            "heroic",
-            "bottles",
-            "wine",
-            "proton",
-            "gamemoded",
-            "gamemode",
-            "minecraft",
-            "dotnet",
-        ]
-
-        processes = SystemUtils.get_running_processes()
-        process_lower = [p.lower() for p in processes]
-
-        for game_app in gaming_apps:
-            if any(game_app in p for p in process_lower):
-                return True
-
-        return False
+        index = get_process_index()
+        index.watch(SystemUtils.GAMING_APPS)
+        return index.has_match()
 
     @staticmethod
     def detect_laptop_model() -> Optional[Dict[str, str]]:
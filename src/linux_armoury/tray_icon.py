@@ -442,12 +442,15 @@ class SystemTrayIcon:
         cpu_temp: Optional[float] = None,
         battery: Optional[int] = None,
         profile: Optional[str] = None,
+        gpu_asleep: bool = False,
     ):
         """Update tooltip with current status"""
         parts = ["Linux Armoury"]
 
         if cpu_temp is not None:
             parts.append(f"CPU: {cpu_temp:.0f}°C")
+        if gpu_asleep:
+            parts.append("dGPU asleep")
         if battery is not None:
             parts.append(f"Battery: {battery}%")
         if profile:
@@ -2,11 +2,24 @@
 Custom widgets for Linux Armoury
 """
 
-from .monitoring_graph import LiveMonitoringGraph, MultiGraphPanel
+from .graph_panel import GRAPH_BACKENDS, MultiGraphPanel, create_graph
+from .sparkline import SparklineGraph
 from .toast import ToastNotification
 
 __all__ = [
     "ToastNotification",
     "LiveMonitoringGraph",
     "MultiGraphPanel",
+    "SparklineGraph",
+    "GRAPH_BACKENDS",
+    "create_graph",
 ]
+
+
+def __getattr__(name):
+    # The matplotlib graph is imported only when it is actually used
+    if name == "LiveMonitoringGraph":
+        from .monitoring_graph import LiveMonitoringGraph
+
+        return LiveMonitoringGraph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
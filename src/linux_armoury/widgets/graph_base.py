@@ -0,0 +1,177 @@
+"""
+Shared parts of the live graph widgets
+Sample storage and the value/statistics labels, used by both the Tk canvas
+sparkline and the matplotlib graph
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import customtkinter as ctk
+import numpy as np
+
+
+class GraphBuffer:
+    """
+    Fixed-size sample window backed by a preallocated NumPy array
+
+    Every sample is stored twice, so the window (oldest to newest) is always
+    one contiguous slice and never has to be copied. Min/avg/max of the
+    positive samples are kept up to date in O(1) amortized per push.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._buf = np.zeros(2 * size, dtype=np.float64)
+        self.clear()
+
+    def clear(self):
+        """Reset the window to zeros"""
+        self._buf.fill(0.0)
+        self._head = 0  # Slot of the oldest sample
+        self._serial = 0  # Samples pushed so far
+        self._sum = 0.0
+        self._valid = 0
+        # Monotonic (serial, value) queues for the rolling min and max
+        self._min_q: Deque[Tuple[int, float]] = deque()
+        self._max_q: Deque[Tuple[int, float]] = deque()
+
+    def push(self, value: float):
+        """Append a sample, dropping the oldest"""
+        value = float(value)
+        old = float(self._buf[self._head])
+        if old > 0:
+            self._sum -= old
+            self._valid -= 1
+
+        self._buf[self._head] = value
+        self._buf[self._head + self.size] = value
+        self._head = (self._head + 1) % self.size
+        if self._head == 0:
+            # Once per lap, drop the rounding error of the running sum
+            window = self.window()
+            self._sum = float(window[window > 0].sum())
+
+        serial = self._serial
+        self._serial += 1
+        if value > 0:
+            if self._head != 0:
+                self._sum += value
+            self._valid += 1
+            while self._min_q and self._min_q[-1][1] >= value:
+                self._min_q.pop()
+            self._min_q.append((serial, value))
+            while self._max_q and self._max_q[-1][1] <= value:
+                self._max_q.pop()
+            self._max_q.append((serial, value))
+
+        expired = serial - self.size
+        while self._min_q and self._min_q[0][0] <= expired:
+            self._min_q.popleft()
+        while self._max_q and self._max_q[0][0] <= expired:
+            self._max_q.popleft()
+
+    def window(self) -> np.ndarray:
+        """The samples from oldest to newest (a view, not a copy)"""
+        return self._buf[self._head : self._head + self.size]
+
+    def stats(self) -> Optional[Tuple[float, float, float]]:
+        """Min, average and max of the positive samples (None if none)"""
+        if not self._valid:
+            return None
+        return self._min_q[0][1], self._sum / self._valid, self._max_q[0][1]
+
+
+class GraphResampler:
+    """
+    Turns irregularly timed samples into one point per fixed step
+
+    The graphs space their points evenly, so samples arriving every 0.5-8 s
+    (adaptive sampling) would stretch and squeeze the time axis. A gap of
+    several steps repeats the previous value until the new sample's step;
+    further samples within a step already drawn are dropped.
+    """
+
+    def __init__(self, step: float, limit: int = 3600):
+        self.step = step
+        self.limit = limit  # Most points returned for one gap
+        self.clear()
+
+    def clear(self):
+        """Forget the previous sample"""
+        self._origin: Optional[float] = None
+        self._slot = 0
+        self._last = 0.0
+
+    def feed(self, timestamp: float, value: float) -> List[float]:
+        """Get the graph points due up to a new sample, oldest first"""
+        if self._origin is None:
+            self._origin = timestamp
+            self._last = value
+            return [value]
+        slot = math.floor((timestamp - self._origin) / self.step)
+        if slot < self._slot:
+            # The clock went backwards: continue from this sample
+            self._origin = timestamp
+            self._slot = 0
+            self._last = value
+            return [value]
+        gap = slot - self._slot
+        if gap == 0:
+            return []
+        points = [self._last] * (min(gap, self.limit) - 1) + [value]
+        self._slot = slot
+        self._last = value
+        return points
+
+
+class GraphLabels:
+    """Current value and min/avg/max labels under a graph"""
+
+    def __init__(self, master, color: str, unit: str):
+        self.unit = unit
+
+        self.value_label = ctk.CTkLabel(
+            master, text=f"0{unit}", font=("Arial", 12, "bold"), text_color=color
+        )
+        self.value_label.pack(pady=(0, 10))
+
+        stats_frame = ctk.CTkFrame(master, fg_color="transparent")
+        stats_frame.pack(pady=(0, 5))
+
+        self.min_label = ctk.CTkLabel(
+            stats_frame, text=f"Min: 0{unit}", font=("Arial", 8), text_color="#888888"
+        )
+        self.min_label.pack(side="left", padx=5)
+
+        self.avg_label = ctk.CTkLabel(
+            stats_frame, text=f"Avg: 0{unit}", font=("Arial", 8), text_color="#888888"
+        )
+        self.avg_label.pack(side="left", padx=5)
+
+        self.max_label = ctk.CTkLabel(
+            stats_frame, text=f"Max: 0{unit}", font=("Arial", 8), text_color="#888888"
+        )
+        self.max_label.pack(side="left", padx=5)
+
+        # Last text per label, so unchanged labels aren't reconfigured
+        self._text: Dict[ctk.CTkLabel, str] = {}
+
+    def _set(self, label: ctk.CTkLabel, text: str):
+        if self._text.get(label) != text:
+            self._text[label] = text
+            label.configure(text=text)
+
+    def update(self, value: float, stats: Optional[Tuple[float, float, float]]):
+        """Show the latest value and the window statistics"""
+        self._set(self.value_label, f"{value:.1f}{self.unit}")
+        if stats:
+            min_val, avg_val, max_val = stats
+            self._set(self.min_label, f"Min: {min_val:.1f}{self.unit}")
+            self._set(self.avg_label, f"Avg: {avg_val:.1f}{self.unit}")
+            self._set(self.max_label, f"Max: {max_val:.1f}{self.unit}")
+
+    def set_color(self, color: str):
+        """Change the value label color"""
+        self.value_label.configure(text_color=color)
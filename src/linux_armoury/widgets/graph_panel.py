@@ -0,0 +1,87 @@
+"""
+Graph Panel Widget
+Creates live graphs for the configured backend and lays several out together
+"""
+
+import customtkinter as ctk
+
+from ..config import Config
+from .sparkline import SparklineGraph
+
+# "sparkline" draws on a Tk canvas; "matplotlib" loads the full chart widget
+GRAPH_BACKENDS = ("sparkline", "matplotlib")
+
+
+def create_graph(master, title: str, backend: str = Config.GRAPH_BACKEND, **kwargs):
+    """
+    Create a live graph widget
+
+    Args:
+        master: Parent widget
+        title: Graph title
+        backend: One of GRAPH_BACKENDS (unknown values use the sparkline)
+        **kwargs: max_points, color, unit, min_val and max_val
+    """
+    if backend == "matplotlib":
+        # Imported on demand: matplotlib is slow to import
+        from .monitoring_graph import LiveMonitoringGraph
+
+        return LiveMonitoringGraph(master, title, **kwargs)
+    return SparklineGraph(master, title, **kwargs)
+
+
+class MultiGraphPanel(ctk.CTkFrame):
+    """
+    Panel containing multiple monitoring graphs
+    """
+
+    def __init__(self, master, graphs: list, backend: str = Config.GRAPH_BACKEND):
+        """
+        Initialize multi-graph panel
+
+        Args:
+            master: Parent widget
+            graphs: List of graph configurations.
+                Each item should be a dict with keys like "title" and "color".
+            backend: Graph backend, one of GRAPH_BACKENDS
+        """
+        super().__init__(master, fg_color="transparent")
+
+        self.graphs = {}
+
+        # Configure grid
+        self.grid_rowconfigure(0, weight=1)
+        for i in range(len(graphs)):
+            self.grid_columnconfigure(i, weight=1)
+
+        # Create graphs
+        for i, config in enumerate(graphs):
+            graph = create_graph(
+                self,
+                title=config.get("title", f"Graph {i+1}"),
+                backend=backend,
+                max_points=config.get("max_points", 60),
+                color=config.get("color", "#ff0066"),
+                unit=config.get("unit", "%"),
+                min_val=config.get("min_val", 0),
+                max_val=config.get("max_val", 100),
+            )
+            graph.grid(row=0, column=i, padx=5, pady=5, sticky="nsew")
+
+            # Store reference
+            self.graphs[config.get("name", f"graph_{i}")] = graph
+
+    def update(self, data: dict):
+        """
+        Update all graphs with new data
+
+        Args:
+            data: Dictionary of graph_name: value pairs
+        """
+        for name, value in data.items():
+            if name in self.graphs:
+                self.graphs[name].update_data(value)
+
+    def get_graph(self, name: str):
+        """Get a specific graph by name"""
+        return self.graphs.get(name)
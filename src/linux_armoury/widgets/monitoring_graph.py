@@ -4,16 +4,121 @@ Displays live system metrics with matplotlib
 """
 
 import logging
-from collections import deque
+from typing import Tuple
 
 import customtkinter as ctk
 import numpy as np
+from matplotlib.axes import Axes
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+from .graph_base import GraphBuffer, GraphLabels
 
 logger = logging.getLogger("LinuxArmoury")
 
 
+def create_graph_figure(
+    max_points: int, unit: str, min_val: float, max_val: float
+) -> Tuple[Figure, Axes]:
+    """Create the styled figure and axes of a monitoring graph"""
+    fig = Figure(figsize=(6, 2.5), facecolor="#2a2a2a", dpi=90)
+    ax = fig.add_subplot(111)
+    ax.set_facecolor("#1a1a1a")
+
+    # Style the plot
+    ax.spines["top"].set_visible(False)
+    ax.spines["right"].set_visible(False)
+    ax.spines["left"].set_color("#444444")
+    ax.spines["bottom"].set_color("#444444")
+    ax.tick_params(colors="#888888", labelsize=8)
+    ax.set_ylim(min_val, max_val)
+    ax.set_xlim(0, max_points)
+    ax.grid(True, alpha=0.2, color="#444444", linestyle="--")
+
+    # Remove x-axis labels (time is implicit)
+    ax.set_xticks([])
+
+    # Y-axis label
+    ax.set_ylabel(unit, color="#888888", fontsize=9)
+    return fig, ax
+
+
+class GraphRenderer:
+    """
+    Draws a GraphBuffer with blitting
+
+    The axes, grid and labels are rendered once and cached as a background;
+    each update restores it and redraws only the line and the fill, whose
+    vertices are updated in place.
+    """
+
+    def __init__(
+        self,
+        fig: Figure,
+        ax: Axes,
+        buffer: GraphBuffer,
+        color: str,
+        baseline: float = 0.0,
+    ):
+        self.fig = fig
+        self.ax = ax
+        self.buffer = buffer
+        n = buffer.size
+        x = np.arange(n, dtype=np.float64)
+
+        (self.line,) = ax.plot(
+            x, buffer.window(), color=color, linewidth=2, antialiased=True
+        )
+
+        # Fill polygon: baseline corner, the samples, the other baseline corner
+        verts = np.empty((n + 2, 2))
+        verts[0] = (x[0], baseline)
+        verts[1:-1, 0] = x
+        verts[1:-1, 1] = baseline
+        verts[-1] = (x[-1], baseline)
+        self.fill = Polygon(verts, closed=True, facecolor=color, alpha=0.3)
+        self.fill.set_edgecolor("none")
+        ax.add_patch(self.fill)
+        self._fill_y = self.fill.get_path().vertices[1 : n + 1, 1]
+
+        # Drawn only by us, on top of the cached background
+        self.line.set_animated(True)
+        self.fill.set_animated(True)
+        self._background = None
+        fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn background (also after resizes)"""
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        self.ax.draw_artist(self.fill)
+        self.ax.draw_artist(self.line)
+
+    def render(self):
+        """Show the buffer's current window"""
+        window = self.buffer.window()
+        self.line.set_ydata(window)
+        self._fill_y[:] = window
+
+        canvas = self.fig.canvas
+        if self._background is None:
+            # Nothing cached yet: a full draw caches it
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background)
+        self._draw_artists()
+        canvas.blit(self.ax.bbox)
+
+    def set_color(self, color: str):
+        """Change the line and fill color"""
+        self.line.set_color(color)
+        self.fill.set_facecolor(color)
+        self.fig.canvas.draw_idle()
+
+
 class LiveMonitoringGraph(ctk.CTkFrame):
     """
     A widget that displays a live graph of system metrics
@@ -51,7 +156,7 @@ class LiveMonitoringGraph(ctk.CTkFrame):
         self.max_val = max_val
 
         # Data storage
-        self.data = deque([0] * max_points, maxlen=max_points)
+        self.buffer = GraphBuffer(max_points)
 
         # Title label
         title_label = ctk.CTkLabel(
@@ -60,63 +165,28 @@ class LiveMonitoringGraph(ctk.CTkFrame):
         title_label.pack(pady=(10, 5))
 
         # Create matplotlib figure
-        self.fig = Figure(figsize=(6, 2.5), facecolor="#2a2a2a", dpi=90)
-        self.ax = self.fig.add_subplot(111)
-        self.ax.set_facecolor("#1a1a1a")
-
-        # Style the plot
-        self.ax.spines["top"].set_visible(False)
-        self.ax.spines["right"].set_visible(False)
-        self.ax.spines["left"].set_color("#444444")
-        self.ax.spines["bottom"].set_color("#444444")
-        self.ax.tick_params(colors="#888888", labelsize=8)
-        self.ax.set_ylim(min_val, max_val)
-        self.ax.set_xlim(0, max_points)
-        self.ax.grid(True, alpha=0.2, color="#444444", linestyle="--")
-
-        # Remove x-axis labels (time is implicit)
-        self.ax.set_xticks([])
-
-        # Y-axis label
-        self.ax.set_ylabel(unit, color="#888888", fontsize=9)
-
-        # Initial line
-        (self.line,) = self.ax.plot([], [], color=color, linewidth=2, antialiased=True)
-
-        # Fill area under line
-        self.fill = None
+        self.fig, self.ax = create_graph_figure(max_points, unit, min_val, max_val)
 
         # Embed in CustomTkinter
         self.canvas = FigureCanvasTkAgg(self.fig, self)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=(0, 5))
 
-        # Current value label
-        self.value_label = ctk.CTkLabel(
-            self, text=f"0{unit}", font=("Arial", 12, "bold"), text_color=color
+        # Line and fill area under it
+        self.renderer = GraphRenderer(
+            self.fig, self.ax, self.buffer, color, baseline=min_val
         )
-        self.value_label.pack(pady=(0, 10))
+        self.line = self.renderer.line
 
-        # Statistics labels (min/avg/max)
-        stats_frame = ctk.CTkFrame(self, fg_color="transparent")
-        stats_frame.pack(pady=(0, 5))
-
-        self.min_label = ctk.CTkLabel(
-            stats_frame, text=f"Min: 0{unit}", font=("Arial", 8), text_color="#888888"
-        )
-        self.min_label.pack(side="left", padx=5)
-
-        self.avg_label = ctk.CTkLabel(
-            stats_frame, text=f"Avg: 0{unit}", font=("Arial", 8), text_color="#888888"
-        )
-        self.avg_label.pack(side="left", padx=5)
-
-        self.max_label = ctk.CTkLabel(
-            stats_frame, text=f"Max: 0{unit}", font=("Arial", 8), text_color="#888888"
-        )
-        self.max_label.pack(side="left", padx=5)
+        # Current value and min/avg/max labels
+        self.labels = GraphLabels(self, color, unit)
 
         logger.debug(f"Monitoring graph created: {title}")
 
+    @property
+    def data(self) -> np.ndarray:
+        """Displayed samples, oldest first"""
+        return self.buffer.window()
+
     def update_data(self, value: float):
         """
         Update graph with new data point
@@ -124,103 +194,23 @@ class LiveMonitoringGraph(ctk.CTkFrame):
         Args:
             value: New value to add to graph
         """
-        # Add new data point
-        self.data.append(value)
-
-        # Update line data
-        x = np.arange(len(self.data))
-        y = list(self.data)
-        self.line.set_data(x, y)
-
-        # Update fill
-        if self.fill:
-            self.fill.remove()
-        self.fill = self.ax.fill_between(x, y, 0, alpha=0.3, color=self.color)
-
-        # Update current value label
-        self.value_label.configure(text=f"{value:.1f}{self.unit}")
-
-        # Update statistics
-        valid_data = [d for d in self.data if d > 0]
-        if valid_data:
-            min_val = min(valid_data)
-            avg_val = sum(valid_data) / len(valid_data)
-            max_val = max(valid_data)
-
-            self.min_label.configure(text=f"Min: {min_val:.1f}{self.unit}")
-            self.avg_label.configure(text=f"Avg: {avg_val:.1f}{self.unit}")
-            self.max_label.configure(text=f"Max: {max_val:.1f}{self.unit}")
-
-        # Redraw canvas
+        self.buffer.push(value)
+
         try:
-            self.canvas.draw_idle()
+            self.renderer.render()
         except Exception as e:
             logger.debug(f"Graph draw error: {e}")
 
+        self.labels.update(value, self.buffer.stats())
+
     def clear(self):
         """Clear all data from the graph"""
-        self.data = deque([0] * self.max_points, maxlen=self.max_points)
+        self.buffer.clear()
         self.update_data(0)
         logger.debug(f"Graph cleared: {self.title}")
 
     def set_color(self, color: str):
         """Change the line color"""
         self.color = color
-        self.line.set_color(color)
-        self.value_label.configure(text_color=color)
-        self.canvas.draw_idle()
-
-
-class MultiGraphPanel(ctk.CTkFrame):
-    """
-    Panel containing multiple monitoring graphs
-    """
-
-    def __init__(self, master, graphs: list):
-        """
-        Initialize multi-graph panel
-
-        Args:
-            master: Parent widget
-            graphs: List of graph configurations.
-                Each item should be a dict with keys like "title" and "color".
-        """
-        super().__init__(master, fg_color="transparent")
-
-        self.graphs = {}
-
-        # Configure grid
-        self.grid_rowconfigure(0, weight=1)
-        for i in range(len(graphs)):
-            self.grid_columnconfigure(i, weight=1)
-
-        # Create graphs
-        for i, config in enumerate(graphs):
-            graph = LiveMonitoringGraph(
-                self,
-                title=config.get("title", f"Graph {i+1}"),
-                max_points=config.get("max_points", 60),
-                color=config.get("color", "#ff0066"),
-                unit=config.get("unit", "%"),
-                min_val=config.get("min_val", 0),
-                max_val=config.get("max_val", 100),
-            )
-            graph.grid(row=0, column=i, padx=5, pady=5, sticky="nsew")
-
-            # Store reference
-            self.graphs[config.get("name", f"graph_{i}")] = graph
-
-    def update(self, data: dict):
-        """
-        Update all graphs with new data
-
-        Args:
-            data: Dictionary of graph_name: value pairs
-        """
-        for name, value in data.items():
-            if name in self.graphs:
-                self.graphs[name].update_data(value)
-
-    def get_graph(self, name: str) -> LiveMonitoringGraph:
-        """Get a specific graph by name"""
-        return self.graphs.get(name)
+        self.renderer.set_color(color)
+        self.labels.set_color(color)
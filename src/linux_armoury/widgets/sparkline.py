@@ -0,0 +1,227 @@
+"""
+Sparkline Graph Widget
+Displays live system metrics on a native Tk canvas, without matplotlib
+"""
+
+import logging
+import tkinter as tk
+
+import customtkinter as ctk
+import numpy as np
+
+from .graph_base import GraphBuffer, GraphLabels
+
+logger = logging.getLogger("LinuxArmoury")
+
+BACKGROUND = "#1a1a1a"
+GRID_COLOR = "#333333"
+FILL_ALPHA = 0.3
+
+
+def blend(color: str, background: str, alpha: float) -> str:
+    """Mix two #rrggbb colors (Tk canvas items have no transparency)"""
+    fg = [int(color[i : i + 2], 16) for i in (1, 3, 5)]
+    bg = [int(background[i : i + 2], 16) for i in (1, 3, 5)]
+    mixed = [round(f * alpha + b * (1 - alpha)) for f, b in zip(fg, bg)]
+    return "#{:02x}{:02x}{:02x}".format(*mixed)
+
+
+class SparklineGraph(ctk.CTkFrame):
+    """
+    A lightweight live graph with the same API as LiveMonitoringGraph
+
+    The line and the fill under it are two canvas items created once; every
+    update only moves their coordinates. The detailed matplotlib chart is
+    loaded when it is opened.
+    """
+
+    HEIGHT = 120
+
+    def __init__(
+        self,
+        master,
+        title: str,
+        max_points: int = 60,
+        color: str = "#ff0066",
+        unit: str = "%",
+        min_val: float = 0,
+        max_val: float = 100,
+    ):
+        """
+        Initialize sparkline graph
+
+        Args:
+            master: Parent widget
+            title: Graph title
+            max_points: Maximum number of data points to display
+            color: Line color
+            unit: Unit of measurement
+            min_val: Minimum Y-axis value
+            max_val: Maximum Y-axis value
+        """
+        super().__init__(master, fg_color="#2a2a2a", corner_radius=8)
+
+        self.title = title
+        self.max_points = max_points
+        self.color = color
+        self.unit = unit
+        self.min_val = min_val
+        self.max_val = max_val
+
+        # Data storage
+        self.buffer = GraphBuffer(max_points)
+        self.details = None
+
+        # Title row with a button for the detailed chart
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.pack(fill="x", padx=10, pady=(10, 5))
+        ctk.CTkLabel(
+            header, text=title, font=("Arial", 14, "bold"), text_color="#ffffff"
+        ).pack(side="left", expand=True)
+        ctk.CTkButton(
+            header,
+            text="⤢",
+            width=28,
+            height=24,
+            fg_color="transparent",
+            hover_color="#444444",
+            command=self.open_details,
+        ).pack(side="right")
+
+        self.canvas = tk.Canvas(
+            self, height=self.HEIGHT, bg=BACKGROUND, highlightthickness=0
+        )
+        self.canvas.pack(fill="both", expand=True, padx=10, pady=(0, 5))
+
+        # Coordinate buffers, (re)built for the canvas size on <Configure>
+        self._height = self.HEIGHT
+        self._line_coords = np.zeros(2 * max_points)
+        self._fill_coords = np.zeros(2 * max_points + 4)
+        self._sized = False
+
+        self._fill = self.canvas.create_polygon(
+            0, 0, 0, 0, 0, 0, fill=blend(color, BACKGROUND, FILL_ALPHA), outline=""
+        )
+        self._line = self.canvas.create_line(0, 0, 0, 0, fill=color, width=2)
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        # Current value and min/avg/max labels
+        self.labels = GraphLabels(self, color, unit)
+
+        logger.debug(f"Sparkline graph created: {title}")
+
+    @property
+    def data(self) -> np.ndarray:
+        """Displayed samples, oldest first"""
+        return self.buffer.window()
+
+    def resize(self, width: int, height: int):
+        """Lay the graph out for a canvas size"""
+        width, height = max(width, 2), max(height, 2)
+        self._height = height
+
+        x = np.linspace(0, width - 1, self.max_points)
+        self._line_coords[0::2] = x
+        # Fill polygon: baseline corner, the samples, the other baseline corner
+        self._fill_coords[0:2] = (x[0], height)
+        self._fill_coords[2:-2:2] = x
+        self._fill_coords[-2:] = (x[-1], height)
+        self._sized = True
+
+        # Static grid at quarter heights, behind the data
+        self.canvas.delete("grid")
+        for fraction in (0.25, 0.5, 0.75):
+            y = round(height * fraction)
+            self.canvas.create_line(
+                0, y, width, y, fill=GRID_COLOR, dash=(2, 4), tags="grid"
+            )
+        self.canvas.tag_lower("grid")
+        self._redraw()
+
+    def _on_resize(self, event):
+        self.resize(event.width, event.height)
+
+    def _redraw(self):
+        """Move the line and fill to the buffer's current window"""
+        if not self._sized:
+            return
+        span = (self.max_val - self.min_val) or 1
+        window = np.clip(self.buffer.window(), self.min_val, self.max_val)
+        usable = self._height - 2
+        y = self._height - 1 - (window - self.min_val) * (usable / span)
+
+        self._line_coords[1::2] = y
+        self._fill_coords[3:-2:2] = y
+        self.canvas.coords(self._line, self._line_coords.tolist())
+        self.canvas.coords(self._fill, self._fill_coords.tolist())
+
+    def update_data(self, value: float):
+        """
+        Update graph with new data point
+
+        Args:
+            value: New value to add to graph
+        """
+        self.buffer.push(value)
+        self._redraw()
+        self.labels.update(value, self.buffer.stats())
+
+        if self.details is not None:
+            try:
+                self.details.update_data(value)
+            except tk.TclError:
+                # The detail window was closed
+                self.details = None
+
+    def clear(self):
+        """Clear all data from the graph"""
+        self.buffer.clear()
+        self.update_data(0)
+        logger.debug(f"Graph cleared: {self.title}")
+
+    def set_color(self, color: str):
+        """Change the line color"""
+        self.color = color
+        self.canvas.itemconfigure(self._line, fill=color)
+        self.canvas.itemconfigure(self._fill, fill=blend(color, BACKGROUND, FILL_ALPHA))
+        self.labels.set_color(color)
+        if self.details is not None:
+            self.details.set_color(color)
+
+    def open_details(self):
+        """Open the detailed matplotlib chart in its own window"""
+        if self.details is not None:
+            try:
+                self.details.winfo_toplevel().lift()
+                return
+            except tk.TclError:
+                self.details = None
+
+        # Loaded on demand: matplotlib is slow to import
+        from .monitoring_graph import LiveMonitoringGraph
+
+        window = ctk.CTkToplevel(self)
+        window.title(self.title)
+        window.geometry("640x360")
+        self.details = LiveMonitoringGraph(
+            window,
+            self.title,
+            max_points=self.max_points,
+            color=self.color,
+            unit=self.unit,
+            min_val=self.min_val,
+            max_val=self.max_val,
+        )
+        self.details.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Start from the history shown here
+        history = self.buffer.window()
+        for value in history[:-1]:
+            self.details.buffer.push(value)
+        self.details.update_data(history[-1])
+        window.protocol("WM_DELETE_WINDOW", self._close_details)
+
+    def _close_details(self):
+        if self.details is not None:
+            self.details.winfo_toplevel().destroy()
+        self.details = None
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for capability_cache.py
+"""
+
+import os
+
+import pytest
+
+from linux_armoury.modules import capability_cache
+from linux_armoury.modules.capability_cache import CapabilityCache
+from linux_armoury.modules.hardware_detection import (
+    HardwareCapabilities,
+    HardwareFeature,
+)
+from linux_armoury.modules.tool_registry import get_tool_registry
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """Fake DMI product name and a $PATH with one tool in it"""
+    product = tmp_path / "product_name"
+    product.write_text("ROG Flow Z13 GZ302EA\n")
+    monkeypatch.setattr(capability_cache, "DMI_PRODUCT_NAME", str(product))
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "asusctl"
+    tool.write_text("#!/bin/sh\n")
+    tool.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    sys_module = tmp_path / "module"
+    (sys_module / "asus_wmi").mkdir(parents=True)
+    monkeypatch.setattr(capability_cache, "SYS_MODULE", str(sys_module))
+
+    return {
+        "product": product,
+        "sys_module": sys_module,
+        "bin_dir": bin_dir,
+        "tool": tool,
+        "cache_file": str(tmp_path / "cache" / "capabilities.json"),
+    }
+
+
+class Probe:
+    """Probe callable that counts its runs"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def touch(path, mtime):
+    """Set a file's mtime"""
+    os.utime(path, (mtime, mtime))
+
+
+class TestCapabilityCache:
+    """Test probe results persist and expire with their key"""
+
+    def test_probe_runs_once_across_instances(self, env):
+        """Test a second process reads the result from disk"""
+        probe = Probe(True)
+        assert CapabilityCache(env["cache_file"]).get("keyboard.aura", probe)
+        assert CapabilityCache(env["cache_file"]).get("keyboard.aura", probe)
+        assert probe.calls == 1
+
+    def test_product_change_invalidates(self, env):
+        """Test a different DMI product name discards the cache"""
+        probe = Probe(["quiet", "balanced"])
+        CapabilityCache(env["cache_file"]).get("profiles", probe)
+        env["product"].write_text("ROG Zephyrus G14\n")
+        CapabilityCache(env["cache_file"]).get("profiles", probe)
+        assert probe.calls == 2
+
+    def test_kernel_change_invalidates(self, env, monkeypatch):
+        """Test booting another kernel discards the cache"""
+        probe = Probe(True)
+        CapabilityCache(env["cache_file"]).get("gpu.nvidia_smi", probe)
+        uname = os.uname()
+        fake = os.uname_result(uname[:2] + ("6.99.0-test",) + uname[3:])
+        monkeypatch.setattr(os, "uname", lambda: fake)
+        CapabilityCache(env["cache_file"]).get("gpu.nvidia_smi", probe)
+        assert probe.calls == 2
+
+    def test_tool_upgrade_invalidates(self, env):
+        """Test a replaced binary discards results that depend on it"""
+        touch(env["tool"], 1_000_000)
+        probe = Probe(True)
+        CapabilityCache(env["cache_file"]).get("keyboard.aura", probe, ("asusctl",))
+        CapabilityCache(env["cache_file"]).get("keyboard.aura", probe, ("asusctl",))
+        assert probe.calls == 1
+
+        touch(env["tool"], 2_000_000)
+        CapabilityCache(env["cache_file"]).get("keyboard.aura", probe, ("asusctl",))
+        assert probe.calls == 2
+
+    def test_tool_install_invalidates(self, env):
+        """Test installing a probed tool discards the cache"""
+        probe = Probe(False)
+        CapabilityCache(env["cache_file"]).get("tools.ryzenadj", probe, ("ryzenadj",))
+        tool = env["bin_dir"] / "ryzenadj"
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        get_tool_registry().invalidate("ryzenadj")
+        CapabilityCache(env["cache_file"]).get("tools.ryzenadj", probe, ("ryzenadj",))
+        assert probe.calls == 2
+
+    def test_path_difference_kept(self, env, monkeypatch, tmp_path):
+        """Test processes with different $PATHs share results for the same tools"""
+        probe = Probe(True)
+        CapabilityCache(env["cache_file"]).get("keyboard.aura", probe, ("asusctl",))
+        other_dir = tmp_path / "other"
+        other_dir.mkdir()
+        monkeypatch.setenv(
+            "PATH", os.pathsep.join([str(other_dir), str(env["bin_dir"])])
+        )
+        CapabilityCache(env["cache_file"]).get("keyboard.aura", probe, ("asusctl",))
+        assert probe.calls == 1
+
+    def test_module_load_invalidates(self, env):
+        """Test loading an out-of-tree driver discards the cache"""
+        probe = Probe({"features": []})
+        CapabilityCache(env["cache_file"]).get("hardware", probe)
+        (env["sys_module"] / "asus_armoury").mkdir()
+        CapabilityCache(env["cache_file"]).get("hardware", probe)
+        assert probe.calls == 2
+
+    def test_module_rebuild_invalidates(self, env):
+        """Test a rebuilt module (new srcversion) discards the cache"""
+        srcversion = env["sys_module"] / "asus_wmi" / "srcversion"
+        srcversion.write_text("A1\n")
+        probe = Probe({"features": []})
+        CapabilityCache(env["cache_file"]).get("hardware", probe)
+        srcversion.write_text("B2\n")
+        CapabilityCache(env["cache_file"]).get("hardware", probe)
+        assert probe.calls == 2
+
+    def test_rejected_result_not_persisted(self, env):
+        """Test a result refused by persist_if is only cached in-process"""
+        probe = Probe(False)
+        cache = CapabilityCache(env["cache_file"])
+        cache.get("keyboard.aura", probe, ("asusctl",), persist_if=bool)
+        cache.get("keyboard.aura", probe, ("asusctl",), persist_if=bool)
+        assert probe.calls == 1
+
+        CapabilityCache(env["cache_file"]).get(
+            "keyboard.aura", probe, ("asusctl",), persist_if=bool
+        )
+        assert probe.calls == 2
+
+    def test_corrupt_file_ignored(self, env):
+        """Test an unreadable cache file just means probing again"""
+        os.makedirs(os.path.dirname(env["cache_file"]))
+        with open(env["cache_file"], "w") as f:
+            f.write("{not json")
+        assert CapabilityCache(env["cache_file"]).get("x", Probe(3)) == 3
+
+    def test_invalidate_one(self, env):
+        """Test invalidating an entry re-probes only that entry"""
+        cache = CapabilityCache(env["cache_file"])
+        aura, gz302 = Probe(True), Probe(False)
+        cache.get("keyboard.aura", aura)
+        cache.get("keyboard.gz302_rgb", gz302)
+        cache.invalidate("keyboard.aura")
+
+        cache = CapabilityCache(env["cache_file"])
+        cache.get("keyboard.aura", aura)
+        cache.get("keyboard.gz302_rgb", gz302)
+        assert (aura.calls, gz302.calls) == (2, 1)
+
+
+class TestHardwareCapabilities:
+    """Test capabilities survive the trip through the cache file"""
+
+    def test_dict_round_trip(self):
+        """Test to_dict()/from_dict() keep features and paths"""
+        caps = HardwareCapabilities(
+            is_asus_laptop=True,
+            laptop_model="GZ302EA",
+            features={HardwareFeature.CHARGE_CONTROL, HardwareFeature.FAN_CURVES},
+            fan_curve_paths=["/sys/devices/platform/asus-nb-wmi/fan_curve_1"],
+        )
+        data = caps.to_dict()
+        assert data["features"] == ["CHARGE_CONTROL", "FAN_CURVES"]
+        assert HardwareCapabilities.from_dict(data) == caps
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for cli.py startup cost
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cold import of linux_armoury.cli, as reported by `python -X importtime`.
+# Currently ~30 ms; the budget leaves room for slow CI machines
+CLI_IMPORT_BUDGET_MS = 100
+
+HARDWARE_MODULES = (
+    "linux_armoury.system_utils",
+    "linux_armoury.modules.battery_control",
+    "linux_armoury.modules.fan_control",
+    "linux_armoury.modules.keyboard_control",
+    "linux_armoury.modules.hardware_detection",
+    "linux_armoury.modules.overclocking_control",
+    "linux_armoury.modules.sampler",
+)
+
+
+def run_python(*args):
+    """Run a fresh interpreter that can import the package"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, timeout=60
+    )
+
+
+def cli_import_ms() -> float:
+    """Cumulative import time of linux_armoury.cli in ms"""
+    result = run_python("-X", "importtime", "-c", "import linux_armoury.cli")
+    for line in result.stderr.splitlines():
+        if line.endswith("| linux_armoury.cli"):
+            return int(line.split("|")[1]) / 1000
+    raise AssertionError(result.stderr)
+
+
+class TestCliStartup:
+    """Test the CLI starts without loading hardware modules"""
+
+    @pytest.mark.parametrize("argv", [["--list"], ["--version"], ["--help"]])
+    def test_no_hardware_access(self, argv):
+        """Test --list/--version/--help import no hardware module or run tools"""
+        code = (
+            "import subprocess, sys\n"
+            "def refuse(*args, **kwargs):\n"
+            "    raise AssertionError(f'subprocess started: {args}')\n"
+            "subprocess.Popen = refuse\n"
+            "from linux_armoury.cli import main\n"
+            f"sys.argv = ['linux-armoury-cli', *{argv!r}]\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print([m for m in {HARDWARE_MODULES!r} if m in sys.modules])\n"
+        )
+        result = run_python("-c", code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+    def test_cold_start_budget(self):
+        """Test importing the CLI stays within the cold start budget"""
+        # Best of three to keep a busy machine from failing the test
+        best = min(cli_import_ms() for _ in range(3))
+        assert best < CLI_IMPORT_BUDGET_MS, f"CLI import took {best:.1f} ms"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
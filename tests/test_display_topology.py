@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for display_topology.py
+"""
+
+import pytest
+
+from linux_armoury.modules import display_topology
+from linux_armoury.modules.display_topology import (
+    DisplayTopology,
+    DisplayTopologyCache,
+)
+
+XRANDR_OUTPUT = """Screen 0: minimum 320 x 200, current 2560 x 1600, maximum 8192 x 8192
+eDP-1 connected primary 2560x1600+0+0 (normal left inverted) 345mm x 215mm
+   2560x1600    165.00*+  120.00    60.00
+   1920x1200     60.00
+HDMI-1 disconnected (normal left inverted right x axis y axis)
+DP-1 connected 1920x1080+2560+0 (normal) 527mm x 296mm
+   1920x1080     60.00 +  144.00
+"""
+
+WLR_RANDR_OUTPUT = """eDP-1 "BOE 0x0A1B (eDP-1)"
+  Enabled: yes
+  Modes:
+    2560x1600 px, 165.000000 Hz (preferred, current)
+    2560x1600 px, 60.000000 Hz
+    1920x1200 px, 60.000000 Hz
+  Position: 0,0
+HDMI-A-1 "Dell U2720Q"
+  Enabled: no
+  Modes:
+    3840x2160 px, 60.000000 Hz (preferred)
+"""
+
+KSCREEN_OUTPUT = """Output: 1 eDP-1 enabled connected priority 1 Panel \
+Modes: 0:2560x1600@165*! 1:2560x1600@120 2:2560x1600@60 3:1920x1200@60 \
+Geometry: 0,0 2560x1600 Scale: 1
+Output: 2 DP-1 disabled disconnected priority 0 DisplayPort Modes: \
+Geometry: 0,0 0x0
+"""
+
+
+class TestParsers:
+    """Test cases for display tool output parsers"""
+
+    def test_parse_xrandr(self):
+        """Test xrandr outputs, primary, current mode and rates"""
+        topology = DisplayTopology.parse_xrandr(XRANDR_OUTPUT)
+        assert [o.name for o in topology.outputs] == ["eDP-1", "HDMI-1", "DP-1"]
+        primary = topology.primary
+        assert primary.name == "eDP-1"
+        assert primary.resolution == (2560, 1600)
+        assert primary.current_rate == 165.0
+        assert primary.rates_for() == [60, 120, 165]
+        assert not topology.get_output("HDMI-1").connected
+        assert topology.get_output("DP-1").rates_for("1920x1080") == [60, 144]
+
+    def test_parse_xrandr_without_primary(self):
+        """Test the first connected output is used when none is primary"""
+        text = XRANDR_OUTPUT.replace("connected primary", "connected")
+        assert DisplayTopology.parse_xrandr(text).primary.name == "eDP-1"
+
+    def test_parse_wlr_randr(self):
+        """Test wlr-randr outputs and modes"""
+        topology = DisplayTopology.parse_wlr_randr(WLR_RANDR_OUTPUT)
+        primary = topology.primary
+        assert primary.name == "eDP-1"
+        assert primary.resolution == (2560, 1600)
+        assert primary.current_rate == 165.0
+        assert primary.rates_for() == [60, 165]
+        assert not topology.get_output("HDMI-A-1").connected
+
+    def test_parse_kscreen_doctor(self):
+        """Test kscreen-doctor outputs and current mode markers"""
+        topology = DisplayTopology.parse_kscreen_doctor(KSCREEN_OUTPUT)
+        primary = topology.primary
+        assert primary.name == "eDP-1"
+        assert primary.resolution == (2560, 1600)
+        assert primary.current_rate == 165.0
+        assert primary.rates_for() == [60, 120, 165]
+        assert not topology.get_output("DP-1").connected
+
+    def test_parse_empty(self):
+        """Test empty output yields no primary display"""
+        assert DisplayTopology.parse("xrandr", "").primary is None
+        assert DisplayTopology.parse("gnome-randr", "anything").outputs == []
+
+
+class TestDisplayTopologyCache:
+    """Test cases for DisplayTopologyCache"""
+
+    @pytest.fixture
+    def queries(self, monkeypatch):
+        calls = []
+
+        def fake_query(tool):
+            calls.append(tool)
+            return DisplayTopology.parse_xrandr(XRANDR_OUTPUT)
+
+        monkeypatch.setattr(display_topology, "query_topology", fake_query)
+        monkeypatch.setattr(display_topology, "drm_fingerprint", lambda: ())
+        return calls
+
+    def test_single_query_while_fresh(self, queries):
+        """Test repeated lookups share one query"""
+        cache = DisplayTopologyCache(ttl=60)
+        for _ in range(5):
+            cache.get("xrandr")
+        assert queries == ["xrandr"]
+
+    def test_invalidate_and_ttl(self, queries):
+        """Test invalidation and expiry trigger a new query"""
+        cache = DisplayTopologyCache(ttl=60)
+        cache.get("xrandr")
+        cache.invalidate()
+        cache.get("xrandr")
+        assert len(queries) == 2
+
+        expired = DisplayTopologyCache(ttl=0)
+        expired.get("xrandr")
+        expired.get("xrandr")
+        assert len(queries) == 4
+
+    def test_drm_change_invalidates(self, queries, monkeypatch):
+        """Test a DRM connector status change triggers a new query"""
+        cache = DisplayTopologyCache(ttl=60)
+        cache.get("xrandr")
+        monkeypatch.setattr(
+            display_topology,
+            "drm_fingerprint",
+            lambda: (("/sys/class/drm/card0-HDMI-A-1/status", "connected"),),
+        )
+        cache.get("xrandr")
+        assert len(queries) == 2
+
+    def test_tool_change_requeries(self, queries):
+        """Test switching display tool does not reuse another tool's data"""
+        cache = DisplayTopologyCache(ttl=60)
+        cache.get("xrandr")
+        cache.get("wlr-randr")
+        assert queries == ["xrandr", "wlr-randr"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
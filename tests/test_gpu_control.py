@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Unit tests for gpu_control.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules.gpu_control import (
+    DgpuPowerGuard,
+    GpuController,
+    GpuLiveStats,
+)
+
+
+def set_power(device, status, suspended_ms=0, control="auto"):
+    """Write fake runtime PM attributes for a device"""
+    power = os.path.join(device, "power")
+    os.makedirs(power, exist_ok=True)
+    with open(os.path.join(power, "control"), "w") as f:
+        f.write(f"{control}\n")
+    with open(os.path.join(power, "runtime_status"), "w") as f:
+        f.write(f"{status}\n")
+    with open(os.path.join(power, "runtime_suspended_time"), "w") as f:
+        f.write(f"{suspended_ms}\n")
+
+
+@pytest.fixture
+def device():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "0000:01:00.0")
+        os.makedirs(path)
+        with open(os.path.join(path, "vendor"), "w") as f:
+            f.write("0x10de\n")
+        with open(os.path.join(path, "device"), "w") as f:
+            f.write("0x2560\n")
+        yield path
+
+
+class TestDgpuPowerGuard:
+    """Test runtime PM tracking for discrete GPUs"""
+
+    def test_runtime_status(self, device):
+        """Test reading the runtime PM status"""
+        guard = DgpuPowerGuard(device)
+        set_power(device, "active")
+        assert guard.runtime_status() == "active"
+        assert not guard.is_asleep()
+        set_power(device, "suspended")
+        assert guard.is_asleep()
+
+    def test_removed_device_is_off(self, device):
+        """Test that a dGPU removed from the bus counts as asleep"""
+        guard = DgpuPowerGuard(os.path.join(device, "missing"))
+        assert guard.runtime_status() == "off"
+        assert guard.is_asleep()
+
+    def test_counts_wakeups(self, device):
+        """Test that a sample spanning a suspend is counted as a wakeup"""
+        guard = DgpuPowerGuard(device)
+        set_power(device, "active", suspended_ms=1000)
+        before = guard.suspended_time()
+        guard.record_sample(50, before)
+        assert guard.wakeups == 0
+
+        before = guard.suspended_time()
+        set_power(device, "active", suspended_ms=1500)
+        guard.record_sample(50, before)
+        assert guard.counters() == {"samples": 2, "skipped_samples": 0, "wakeups": 1}
+
+    def test_idle_release(self, device):
+        """Test that polling pauses after consecutive idle samples"""
+        set_power(device, "active")
+        guard = DgpuPowerGuard(device)
+        for _ in range(guard.IDLE_SAMPLES_BEFORE_RELEASE - 1):
+            assert not guard.record_sample(0, None)
+        assert not guard.in_holdoff()
+        assert guard.record_sample(0, None)
+        assert guard.in_holdoff()
+
+    def test_no_release_without_runtime_pm(self, device):
+        """Test there is no holdoff when runtime PM can't suspend the device"""
+        set_power(device, "active", control="on")
+        guard = DgpuPowerGuard(device)
+        for _ in range(guard.IDLE_SAMPLES_BEFORE_RELEASE):
+            assert not guard.record_sample(0, None)
+        assert not guard.in_holdoff()
+
+    def idle_until_release(self, guard):
+        """Record idle samples until the guard asks for a holdoff"""
+        for _ in range(guard.IDLE_SAMPLES_BEFORE_RELEASE):
+            released = guard.record_sample(0, guard.suspended_time())
+        return released
+
+    def test_futile_release_stops(self, device):
+        """Test holdoffs stop once the device stayed active through one"""
+        set_power(device, "active", suspended_ms=1000)
+        guard = DgpuPowerGuard(device)
+        guard.RELEASE_HOLDOFF = 0.0
+        assert self.idle_until_release(guard)
+        # Still active after the holdoff: something else keeps it awake
+        assert not self.idle_until_release(guard)
+        assert not self.idle_until_release(guard)
+
+        # Once it suspends again, idle releases are worth it again
+        set_power(device, "active", suspended_ms=5000)
+        assert self.idle_until_release(guard)
+
+    def test_successful_release_repeats(self, device):
+        """Test holdoffs continue while the device suspends during them"""
+        set_power(device, "active", suspended_ms=1000)
+        guard = DgpuPowerGuard(device)
+        guard.RELEASE_HOLDOFF = 0.0
+        assert self.idle_until_release(guard)
+        set_power(device, "active", suspended_ms=2000)
+        assert self.idle_until_release(guard)
+
+
+class TestGpuControllerSleep:
+    """Test that a sleeping dGPU is never sampled"""
+
+    @pytest.fixture
+    def controller(self, device):
+        ctrl = GpuController()
+        ctrl.nvidia_gpu_path = device
+        ctrl._power_guards = {device: DgpuPowerGuard(device)}
+        return ctrl
+
+    def test_suspended_dgpu_not_sampled(self, controller, device):
+        """Test that suspended stats are returned without touching the device"""
+        set_power(device, "suspended")
+        calls = []
+
+        def sample():
+            calls.append(1)
+            return GpuLiveStats(gpu_name="RTX", gpu_usage_percent=10)
+
+        stats = controller._sample_guarded(device, sample)
+        assert calls == []
+        assert stats.dgpu_suspended
+        assert stats.vendor == "NVIDIA"
+        assert controller.is_dgpu_asleep()
+        assert controller.get_power_counters()["skipped_samples"] == 1
+
+    def test_active_dgpu_sampled(self, controller, device):
+        """Test that an awake dGPU is sampled and cached"""
+        set_power(device, "active")
+        stats = controller._sample_guarded(
+            device, lambda: GpuLiveStats(gpu_name="RTX", gpu_usage_percent=10)
+        )
+        assert not stats.dgpu_suspended
+        assert stats.gpu_usage_percent == 10
+        assert controller.get_power_counters()["samples"] == 1
+
+    def test_idle_dgpu_left_alone(self, controller, device):
+        """Test that an idle dGPU gets a holdoff served from the cache"""
+        set_power(device, "active")
+        guard = controller._power_guards[device]
+        calls = []
+
+        def sample():
+            calls.append(1)
+            return GpuLiveStats(gpu_name="RTX", gpu_usage_percent=0)
+
+        for _ in range(guard.IDLE_SAMPLES_BEFORE_RELEASE + 3):
+            stats = controller._sample_guarded(device, sample)
+            assert stats.gpu_name == "RTX"
+        assert len(calls) == guard.IDLE_SAMPLES_BEFORE_RELEASE
+        assert guard.skipped_samples == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Unit tests for gpu_identity.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import gpu_identity
+from linux_armoury.modules.gpu_identity import (
+    lookup_pci_name,
+    marketing_name,
+    parse_dpm_table,
+    read_gpu_identity,
+)
+
+PCI_IDS = """\
+# Comment line
+1002  Advanced Micro Devices, Inc. [AMD/ATI]
+\t15bf  Phoenix1 [Radeon 780M]
+\t73df  Navi 22 [Radeon RX 6700/6700 XT/6750 XT / 6800M/6850M XT]
+\t\t1043 16c2  Navi 22 [Radeon RX 6800M]
+10de  NVIDIA Corporation
+\t2560  GA106M [GeForce RTX 3060 Mobile / Max-Q]
+8086  Intel Corporation
+\t46a6  Alder Lake-P GT2 [Iris Xe Graphics]
+"""
+
+SCLK = "0: 500Mhz\n1: 1500Mhz *\n2: 2600Mhz\n"
+MCLK = "0: 96Mhz\n1: 1000Mhz *\n"
+
+
+def write_files(directory, files):
+    """Create sysfs-like attribute files"""
+    os.makedirs(directory, exist_ok=True)
+    for name, value in files.items():
+        with open(os.path.join(directory, name), "w") as f:
+            f.write(value)
+
+
+class TestGpuIdentity:
+    """Test static GPU identity resolution"""
+
+    @pytest.fixture
+    def tmpdir(self):
+        gpu_identity._pci_name_cache.clear()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "pci.ids"), "w") as f:
+                f.write(PCI_IDS)
+            yield tmpdir
+        gpu_identity._pci_name_cache.clear()
+
+    def test_parse_dpm_table(self):
+        """Test parsing DPM levels and the current level"""
+        assert parse_dpm_table(SCLK) == ([500, 1500, 2600], 1500)
+        assert parse_dpm_table("") == ([], None)
+
+    def test_marketing_name(self):
+        """Test extracting the bracketed marketing name"""
+        assert marketing_name("Phoenix1 [Radeon 780M]") == "Radeon 780M"
+        assert marketing_name("Some GPU") == "Some GPU"
+
+    def test_lookup_pci_name(self, tmpdir):
+        """Test pci.ids lookups stay inside the vendor block"""
+        paths = (os.path.join(tmpdir, "missing.ids"), os.path.join(tmpdir, "pci.ids"))
+        assert lookup_pci_name("0x1002", "0x73df", paths).startswith("Navi 22")
+        assert lookup_pci_name("0x10de", "0x2560", paths).startswith("GA106M")
+        assert lookup_pci_name("0x10de", "0x15bf", paths) is None
+
+    def test_read_amd_identity(self, tmpdir):
+        """Test resolving an AMD dGPU from sysfs"""
+        device = os.path.join(tmpdir, "card1", "device")
+        write_files(
+            device,
+            {
+                "vendor": "0x1002\n",
+                "device": "0x73df\n",
+                "uevent": "DRIVER=amdgpu\nPCI_SLOT_NAME=0000:03:00.0\n",
+                "boot_vga": "0\n",
+                "mem_info_vram_total": str(12 * 1024**3),
+                "pp_dpm_sclk": SCLK,
+                "pp_dpm_mclk": MCLK,
+            },
+        )
+        identity = read_gpu_identity(device, (os.path.join(tmpdir, "pci.ids"),))
+        assert identity.vendor == "AMD"
+        assert identity.name.startswith("Radeon RX 6700")
+        assert identity.pci_id == "1002:73df"
+        assert identity.pci_slot == "0000:03:00.0"
+        assert identity.driver == "amdgpu"
+        assert identity.vram_total_mb == 12 * 1024
+        assert identity.gpu_clock_max_mhz == 2600
+        assert identity.mem_clock_max_mhz == 1000
+        assert not identity.is_integrated
+
+    def test_integrated_gpus(self, tmpdir):
+        """Test the boot VGA device (APU, Intel iGPU) counts as integrated"""
+        pci_ids = (os.path.join(tmpdir, "pci.ids"),)
+        apu = os.path.join(tmpdir, "card0", "device")
+        write_files(apu, {"vendor": "0x1002\n", "device": "0x15bf\n", "boot_vga": "1"})
+        identity = read_gpu_identity(apu, pci_ids)
+        assert identity.name == "Radeon 780M"
+        assert identity.is_integrated
+
+        igpu = os.path.join(tmpdir, "card2", "device")
+        write_files(igpu, {"vendor": "0x8086\n", "device": "0x46a6\n", "boot_vga": "1"})
+        identity = read_gpu_identity(igpu, pci_ids)
+        assert identity.name == "Iris Xe Graphics"
+        assert identity.is_integrated
+
+    def test_non_vga_gpus(self, tmpdir):
+        """Test GPUs without boot_vga are told apart by runtime PM"""
+        pci_ids = (os.path.join(tmpdir, "pci.ids"),)
+        dgpu = os.path.join(tmpdir, "card1", "device")
+        write_files(dgpu, {"vendor": "0x10de\n", "device": "0x2560\n"})
+        write_files(os.path.join(dgpu, "power"), {"control": "auto\n"})
+        identity = read_gpu_identity(dgpu, pci_ids, device_attrs=False)
+        assert identity.boot_vga is None
+        assert not identity.is_integrated
+
+        apu = os.path.join(tmpdir, "card0", "device")
+        write_files(apu, {"vendor": "0x1002\n", "device": "0x15bf\n"})
+        write_files(os.path.join(apu, "power"), {"control": "on\n"})
+        assert read_gpu_identity(apu, pci_ids, device_attrs=False).is_integrated
+
+    def test_unknown_device_falls_back(self, tmpdir):
+        """Test the generic name when pci.ids has no entry"""
+        device = os.path.join(tmpdir, "card3", "device")
+        write_files(device, {"vendor": "0x1002\n", "device": "0xffff\n"})
+        identity = read_gpu_identity(device, (os.path.join(tmpdir, "pci.ids"),))
+        assert identity.name == "AMD GPU"
+        assert identity.gpu_clock_max_mhz == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Unit tests for hwmon_index.py
+"""
+
+import os
+import shutil
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import hwmon_index
+from linux_armoury.modules.hwmon_index import HwmonIndex
+
+
+def make_chip(root, entry, name, files, device=None):
+    """Create a fake hwmon directory with a name file and attributes"""
+    hwmon_dir = os.path.join(root, entry)
+    os.makedirs(hwmon_dir)
+    files = dict(files, name=name)
+    for filename, value in files.items():
+        with open(os.path.join(hwmon_dir, filename), "w") as f:
+            f.write(f"{value}\n")
+    if device is not None:
+        os.symlink(device, os.path.join(hwmon_dir, "device"))
+    return hwmon_dir
+
+
+class TestHwmonIndex:
+    """Test hwmon sensor indexing and lookups"""
+
+    @pytest.fixture
+    def root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            hwmon_root = os.path.join(tmpdir, "hwmon")
+            os.makedirs(hwmon_root)
+            yield hwmon_root
+
+    def test_cpu_temperature_prefers_tctl(self, root):
+        """Test that k10temp Tctl is used for the CPU role"""
+        make_chip(
+            root,
+            "hwmon0",
+            "acpitz",
+            {"temp1_input": 30000},
+        )
+        make_chip(
+            root,
+            "hwmon1",
+            "k10temp",
+            {
+                "temp1_input": 61250,
+                "temp1_label": "Tctl",
+                "temp3_input": 55000,
+                "temp3_label": "Tccd1",
+            },
+        )
+        index = HwmonIndex(root)
+        assert index.cpu_temperature() == 61.25
+        assert index.read_temp("k10temp", "tccd1") == 55.0
+
+    def test_gpu_labels(self, root):
+        """Test amdgpu edge/junction/mem lookups"""
+        make_chip(
+            root,
+            "hwmon2",
+            "amdgpu",
+            {
+                "temp1_input": 48000,
+                "temp1_label": "edge",
+                "temp2_input": 52000,
+                "temp2_label": "junction",
+                "temp3_input": 50000,
+                "temp3_label": "mem",
+                "power1_average": 15000000,
+            },
+        )
+        index = HwmonIndex(root)
+        assert index.gpu_temperature() == 48.0
+        assert index.read_role("gpu_junction") == 52.0
+        assert index.read_role("gpu_mem") == 50.0
+        power = index.find("amdgpu", kind="power")
+        assert power is not None and index.read(power) == 15.0
+
+    def test_fans_and_unlabelled_sensors(self, root):
+        """Test fan sensors and default labels"""
+        make_chip(
+            root,
+            "hwmon3",
+            "asus",
+            {
+                "fan1_input": 2400,
+                "fan1_label": "cpu_fan",
+                "fan2_input": 2100,
+            },
+        )
+        index = HwmonIndex(root)
+        fans = index.sensors("asus", "fan")
+        assert [f.label for f in fans] == ["cpu_fan", "fan2"]
+        assert index.read(fans[0]) == 2400
+        assert index.cpu_temperature() is None
+
+    def test_device_dir(self, root):
+        """Test mapping a device back to its hwmon directory"""
+        device = os.path.join(os.path.dirname(root), "card1-device")
+        os.makedirs(device)
+        hwmon_dir = make_chip(root, "hwmon4", "amdgpu", {}, device=device)
+        index = HwmonIndex(root)
+        assert index.device_dir(device) == hwmon_dir
+        assert index.device_dir("/nonexistent") is None
+
+    def make_gpu(self, root, entry, name, boot_vga, status="active"):
+        """Create a GPU device with PCI PM attributes and its hwmon chip"""
+        device = os.path.join(os.path.dirname(root), f"{entry}-device")
+        os.makedirs(os.path.join(device, "power"))
+        with open(os.path.join(device, "boot_vga"), "w") as f:
+            f.write(f"{boot_vga}\n")
+        with open(os.path.join(device, "power", "runtime_status"), "w") as f:
+            f.write(f"{status}\n")
+        files = {"temp1_input": 45000 if boot_vga else 60000, "temp1_label": "edge"}
+        make_chip(root, entry, name, files, device=device)
+        return device
+
+    def test_gpu_role_prefers_boot_vga(self, root):
+        """Test the iGPU chip is used when iGPU and dGPU share a driver"""
+        self.make_gpu(root, "hwmon3", "amdgpu", boot_vga=0)
+        self.make_gpu(root, "hwmon4", "amdgpu", boot_vga=1)
+        index = HwmonIndex(root)
+        assert index.role("gpu").hwmon_dir.endswith("hwmon4")
+        assert index.gpu_temperature() == 45.0
+
+    def test_suspended_gpu_not_read(self, root, monkeypatch):
+        """Test a runtime-suspended dGPU's sensors read None without rebuilds"""
+        device = self.make_gpu(root, "hwmon3", "amdgpu", boot_vga=0)
+        index = HwmonIndex(root)
+        assert index.gpu_temperature() == 60.0
+
+        with open(os.path.join(device, "power", "runtime_status"), "w") as f:
+            f.write("suspended\n")
+        monkeypatch.setattr(index, "rebuild", lambda: pytest.fail("rebuilt"))
+        assert index.gpu_temperature() is None
+
+    def test_rebuild_on_hotplug(self, root, monkeypatch):
+        """Test that added hwmon devices are picked up after the check interval"""
+        monkeypatch.setattr(hwmon_index, "HOTPLUG_CHECK_INTERVAL", 0.0)
+        index = HwmonIndex(root)
+        assert index.cpu_temperature() is None
+
+        make_chip(root, "hwmon5", "coretemp", {"temp1_input": 70000})
+        assert index.cpu_temperature() == 70.0
+
+    def test_lookups_are_cached(self, root, monkeypatch):
+        """Test that reads don't rescan hwmon within the check interval"""
+        make_chip(root, "hwmon6", "k10temp", {"temp1_input": 40000})
+        index = HwmonIndex(root)
+        index.cpu_temperature()
+
+        scans = []
+        monkeypatch.setattr(index, "rebuild", lambda: scans.append(1))
+        for _ in range(5):
+            assert index.cpu_temperature() == 40.0
+        assert scans == []
+
+    def test_removed_sensor_invalidates(self, root):
+        """Test that a vanished sensor file triggers a rebuild"""
+        make_chip(root, "hwmon7", "k10temp", {"temp1_input": 40000})
+        index = HwmonIndex(root)
+        assert index.role("cpu").hwmon_dir.endswith("hwmon7")
+
+        shutil.rmtree(os.path.join(root, "hwmon7"))
+        make_chip(root, "hwmon8", "k10temp", {"temp1_input": 45000})
+        assert index.cpu_temperature() == 45.0
+        assert index.role("cpu").hwmon_dir.endswith("hwmon8")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
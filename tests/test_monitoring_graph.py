@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for monitoring_graph.py
+"""
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from linux_armoury.widgets.graph_base import GraphBuffer, GraphResampler
+from linux_armoury.widgets.monitoring_graph import GraphRenderer, create_graph_figure
+
+
+def brute_stats(window):
+    """Reference min/avg/max over the positive samples"""
+    valid = [v for v in window if v > 0]
+    if not valid:
+        return None
+    return min(valid), sum(valid) / len(valid), max(valid)
+
+
+class TestGraphBuffer:
+    """Test the ring buffer and its rolling aggregates"""
+
+    def test_window_order(self):
+        """Test the window runs from oldest to newest"""
+        buffer = GraphBuffer(4)
+        for value in (1, 2, 3, 4, 5, 6):
+            buffer.push(value)
+        assert list(buffer.window()) == [3, 4, 5, 6]
+
+    def test_window_is_a_view(self):
+        """Test reading the window doesn't copy the samples"""
+        buffer = GraphBuffer(4)
+        buffer.push(1)
+        assert np.shares_memory(buffer.window(), buffer._buf)
+
+    def test_rolling_stats_match_brute_force(self):
+        """Test min/avg/max stay exact as samples enter and leave"""
+        rng = np.random.default_rng(7)
+        buffer = GraphBuffer(10)
+        assert buffer.stats() is None
+        for value in rng.integers(0, 100, 500):
+            buffer.push(value)
+            expected = brute_stats(buffer.window())
+            actual = buffer.stats()
+            if expected is None:
+                assert actual is None
+            else:
+                assert actual == pytest.approx(expected)
+
+    def test_zero_samples_ignored(self):
+        """Test idle (zero) samples don't count towards the statistics"""
+        buffer = GraphBuffer(3)
+        buffer.push(40)
+        buffer.push(0)
+        assert buffer.stats() == (40, 40, 40)
+        buffer.push(0)
+        buffer.push(0)
+        assert buffer.stats() is None
+
+    def test_clear(self):
+        """Test clearing resets samples and statistics"""
+        buffer = GraphBuffer(3)
+        buffer.push(10)
+        buffer.clear()
+        assert list(buffer.window()) == [0, 0, 0]
+        assert buffer.stats() is None
+
+
+class TestGraphResampler:
+    """Test irregular samples are mapped onto evenly spaced points"""
+
+    def test_regular_samples_pass_through(self):
+        """Test one sample per step gives one point each"""
+        resampler = GraphResampler(2.0)
+        points = [resampler.feed(t, v) for t, v in ((0, 10), (2, 20), (4, 30))]
+        assert points == [[10], [20], [30]]
+
+    def test_gap_repeats_previous_value(self):
+        """Test a sample 8 s after the last one fills the steps in between"""
+        resampler = GraphResampler(2.0)
+        resampler.feed(0.0, 10)
+        assert resampler.feed(8.0, 50) == [10, 10, 10, 50]
+
+    def test_fast_samples_dropped_within_step(self):
+        """Test samples every 0.5 s give one point per step"""
+        resampler = GraphResampler(2.0)
+        points = []
+        for i in range(9):
+            points += resampler.feed(i * 0.5, i)
+        assert points == [0, 4, 8]
+
+    def test_long_gap_limited(self):
+        """Test a gap after suspend returns at most limit points"""
+        resampler = GraphResampler(2.0, limit=5)
+        resampler.feed(0.0, 10)
+        assert resampler.feed(3600.0, 50) == [10, 10, 10, 10, 50]
+
+    def test_clock_going_backwards(self):
+        """Test a clock step backwards restarts from the new sample"""
+        resampler = GraphResampler(2.0)
+        resampler.feed(100.0, 10)
+        assert resampler.feed(50.0, 20) == [20]
+        assert resampler.feed(52.0, 30) == [30]
+
+
+class TestGraphRenderer:
+    """Test the blitting renderer on the Agg backend"""
+
+    @pytest.fixture
+    def renderer(self):
+        fig, ax = create_graph_figure(5, "%", 0, 100)
+        FigureCanvasAgg(fig)
+        return GraphRenderer(fig, ax, GraphBuffer(5), "#ff0066")
+
+    def test_background_cached_on_draw(self, renderer):
+        """Test a full draw caches the static background"""
+        assert renderer._background is None
+        renderer.fig.canvas.draw()
+        assert renderer._background is not None
+
+    def test_updates_vertices_in_place(self, renderer):
+        """Test the line and fill follow the buffer without new artists"""
+        renderer.fig.canvas.draw()
+        patches = list(renderer.ax.patches)
+        vertices = renderer.fill.get_path().vertices
+        for value in (10, 20, 30):
+            renderer.buffer.push(value)
+            renderer.render()
+
+        assert list(renderer.line.get_ydata()) == [0, 0, 10, 20, 30]
+        assert renderer.fill.get_path().vertices is vertices
+        assert list(vertices[1:6, 1]) == [0, 0, 10, 20, 30]
+        assert list(renderer.ax.patches) == patches
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Unit tests for nvidia_smi.py
+"""
+
+import os
+import stat
+import sys
+import tempfile
+
+import pytest
+
+from linux_armoury.modules.nvidia_smi import (
+    NVIDIA_QUERY_FIELDS,
+    NvidiaSmiCollector,
+    parse_nvidia_row,
+)
+
+ROW = (
+    "0, NVIDIA GeForce RTX 4060 Laptop GPU, 550.78, 1890, 8001, 3105, 8001, "
+    "37, 12, 0, 0, 8188, 1024, 7164, 58, 41.25, 115.00, [N/A]"
+)
+
+# Prints the canned rows every -lms interval until terminated
+FAKE_NVIDIA_SMI = """\
+#!{python}
+import sys, time
+
+args = sys.argv[1:]
+interval = int(args[args.index("-lms") + 1]) / 1000
+with open({args_file!r}, "w") as f:
+    f.write(" ".join(args))
+rows = {rows!r}
+while True:
+    for row in rows:
+        print(row, flush=True)
+    time.sleep(interval)
+"""
+
+
+def make_fake_smi(directory, rows, exit_after_first=False):
+    """Write a fake nvidia-smi script emitting canned CSV rows"""
+    args_file = os.path.join(directory, "args")
+    script = FAKE_NVIDIA_SMI.format(
+        python=sys.executable, args_file=args_file, rows=rows
+    )
+    if exit_after_first:
+        script = script.replace("    time.sleep(interval)", "    break")
+    path = os.path.join(directory, "nvidia-smi")
+    with open(path, "w") as f:
+        f.write(script)
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path, args_file
+
+
+class TestParseNvidiaRow:
+    """Test CSV row parsing"""
+
+    def test_parse_row(self):
+        """Test a full row maps onto GpuLiveStats"""
+        stats = parse_nvidia_row(ROW)
+        assert stats is not None
+        assert stats.gpu_name == "NVIDIA GeForce RTX 4060 Laptop GPU"
+        assert stats.vendor == "NVIDIA"
+        assert stats.driver == "550.78"
+        assert stats.gpu_clock_mhz == 1890
+        assert stats.gpu_usage_percent == 37
+        assert stats.vram_used_mb == 1024
+        assert stats.gpu_temp_c == 58
+        assert stats.power_draw_w == 41.25
+        assert stats.fan_speed_percent == 0  # [N/A]
+
+    def test_rejects_short_or_error_rows(self):
+        """Test that incomplete rows and error messages are skipped"""
+        assert parse_nvidia_row("0, NVIDIA GeForce") is None
+        assert parse_nvidia_row("No devices were found") is None
+        assert parse_nvidia_row("") is None
+
+
+class TestNvidiaSmiCollector:
+    """Test the streaming collector against a fake nvidia-smi"""
+
+    def test_streams_rows(self):
+        """Test that rows are collected and cached"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            second = ROW.replace("0, NVIDIA", "1, NVIDIA", 1)
+            command, args_file = make_fake_smi(tmpdir, [ROW, second])
+            collector = NvidiaSmiCollector(interval_ms=50, command=command)
+            try:
+                assert collector.start()
+                stats = collector.wait_for_row(timeout=10)
+                assert stats is not None and stats.gpu_temp_c == 58
+                assert collector.wait_for_row(timeout=10, index=1) is not None
+                assert collector.is_running
+                assert collector.last_update > 0
+
+                # latest() hands out copies of the cached row
+                stats.gpu_temp_c = 0
+                assert collector.latest().gpu_temp_c == 58
+            finally:
+                collector.stop()
+
+            assert not collector.is_running
+            assert collector.latest() is None
+            with open(args_file) as f:
+                args = f.read().split()
+            assert args[0] == f"--query-gpu={','.join(NVIDIA_QUERY_FIELDS)}"
+            assert args[-2:] == ["-lms", "50"]
+
+    def test_missing_binary(self):
+        """Test that a missing nvidia-smi doesn't raise"""
+        collector = NvidiaSmiCollector(command="/nonexistent/nvidia-smi")
+        assert not collector.start()
+        assert collector.latest() is None
+
+    def test_exited_process_drops_rows(self):
+        """Test that rows are dropped when nvidia-smi exits on its own"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            command, _ = make_fake_smi(tmpdir, [ROW], exit_after_first=True)
+            collector = NvidiaSmiCollector(interval_ms=50, command=command)
+            try:
+                assert collector.start()
+                collector._thread.join(timeout=10)
+                assert not collector.is_running
+                assert collector.latest() is None
+                # Not relaunched immediately
+                assert not collector.start()
+            finally:
+                collector.stop()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Unit tests for overclocking_control.py
+"""
+
+import pytest
+
+from linux_armoury.modules import overclocking_control
+from linux_armoury.modules.overclocking_control import (
+    OverclockingController,
+    get_overclocking_controller,
+)
+
+RYZENADJ_INFO = """\
+CPU Family: Rembrandt
+SMU BIOS Interface Version: 18
+|        Name         |   Value   |     Parameter      |
+|---------------------|-----------|--------------------|
+| STAPM LIMIT         | {stapm:9.3f} | stapm-limit        |
+| STAPM VALUE         |     7.412 |                    |
+| PPT LIMIT FAST      | {fast:9.3f} | fast-limit         |
+| PPT LIMIT SLOW      | {slow:9.3f} | slow-limit         |
+"""
+
+
+class FakeHelper:
+    """Privileged helper with or without the helper service running"""
+
+    service = False
+
+    def runs_without_prompt(self):
+        return self.service
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    """Controller with RyzenAdj present and privileged calls recorded"""
+    ctrl = OverclockingController()
+    ctrl.ryzenadj_available = True
+    ctrl.calls = []
+    ctrl.reads = 0
+    # Limits in place on the (fake) SMU, in watts
+    ctrl.smu = {"stapm": 25.0, "fast": 35.0, "slow": 25.0}
+    # AC state and seconds spent suspended
+    ctrl.power = [True, 0.0]
+    ctrl.helper = FakeHelper()
+
+    def run_privileged(cmd):
+        if cmd == ["ryzenadj", "-i"]:
+            ctrl.reads += 1
+            return True, RYZENADJ_INFO.format(**ctrl.smu), ""
+        ctrl.calls.append(cmd)
+        for option, value in zip(cmd[1::2], cmd[2::2]):
+            ctrl.smu[option[2:].split("-")[0]] = int(value) / 1000
+        return True, "", ""
+
+    monkeypatch.setattr(ctrl, "_run_privileged", run_privileged)
+    monkeypatch.setattr(ctrl, "_power_context", lambda: tuple(ctrl.power))
+    monkeypatch.setattr(overclocking_control, "get_privileged_helper", FakeHelper)
+    monkeypatch.setattr(FakeHelper, "service", False)
+    return ctrl
+
+
+ALL_LIMITS = [
+    "ryzenadj",
+    "--stapm-limit",
+    "70000",
+    "--fast-limit",
+    "75000",
+    "--slow-limit",
+    "70000",
+]
+
+
+class TestApplyTdp:
+    """Test that TDP writes are skipped when nothing changes"""
+
+    def test_repeated_apply_is_free(self, controller):
+        """Test a second identical apply runs nothing, not even a read"""
+        assert controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert controller.calls == [ALL_LIMITS]
+        assert controller.tdp_limits == {"stapm": 70.0, "fast": 75.0, "slow": 70.0}
+
+        assert controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert len(controller.calls) == 1
+        assert controller.reads == 0
+
+    def test_only_changed_limits_written(self, controller):
+        """Test that limits already in place are left out of the command"""
+        controller.apply_tdp(stapm_limit=25, fast_limit=35, slow_limit=25)
+        controller.apply_tdp(stapm_limit=25, fast_limit=45, slow_limit=25)
+        assert controller.calls[-1] == ["ryzenadj", "--fast-limit", "45000"]
+
+    def test_failed_write_forgets_limits(self, controller, monkeypatch):
+        """Test a failed write makes the next apply write everything"""
+        controller.apply_tdp(stapm_limit=18, fast_limit=20, slow_limit=18)
+        monkeypatch.setattr(controller, "_run_privileged", lambda cmd: (False, "", ""))
+        assert not controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert controller.tdp_limits == {}
+
+    def test_ac_change_is_rewritten(self, controller):
+        """Test limits are written again after an AC change reset them"""
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        controller.power[0] = False
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert controller.calls == [ALL_LIMITS, ALL_LIMITS]
+
+    def test_resume_is_rewritten(self, controller):
+        """Test limits are written again after a suspend/resume cycle"""
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        controller.power[1] += 600.0
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert controller.calls == [ALL_LIMITS, ALL_LIMITS]
+
+    def test_read_back_through_service(self, controller, monkeypatch):
+        """Test limits are read back when the helper service can run ryzenadj"""
+        monkeypatch.setattr(FakeHelper, "service", True)
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        # Reset behind our back, without an AC change or resume we saw
+        controller.smu.update(stapm=25.0, fast=35.0, slow=25.0)
+        controller.apply_tdp(stapm_limit=70, fast_limit=75, slow_limit=70)
+        assert controller.calls == [ALL_LIMITS, ALL_LIMITS]
+        assert controller.reads == 2
+
+    def test_uses_reported_limits(self, controller):
+        """Test limits read back from `ryzenadj -i` prevent redundant writes"""
+        info = controller.get_ryzenadj_info()
+        assert info["STAPM LIMIT"] == 25.0
+        assert info["PPT LIMIT FAST"] == 35.0
+
+        assert controller.apply_tdp(stapm_limit=25, fast_limit=35, slow_limit=25)
+        assert controller.calls == []
+
+    def test_unavailable(self, controller):
+        """Test nothing is attempted without RyzenAdj"""
+        controller.ryzenadj_available = False
+        assert not controller.apply_tdp(stapm_limit=25)
+        assert controller.calls == []
+
+
+class TestSingleton:
+    """Test the shared controller instance"""
+
+    def test_singleton(self, monkeypatch):
+        """Test the controller (and its tool probes) is created once"""
+        monkeypatch.setattr(overclocking_control, "_overclocking_controller", None)
+        assert get_overclocking_controller() is get_overclocking_controller()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Unit tests for privileged_helper.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import privileged_helper
+from linux_armoury.modules.privileged_helper import (
+    HELPER_POLKIT_ACTION,
+    PolkitAuthorizer,
+    PrivilegedHelperClient,
+    SysfsWriter,
+    resolve_command,
+)
+
+GOVERNOR = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+CHARGE_LIMIT = "/sys/class/power_supply/BAT0/charge_control_end_threshold"
+
+
+def make_attr(root, path, value=""):
+    """Create a fake sysfs attribute under root for a /sys path"""
+    target = os.path.join(root, os.path.relpath(path, "/sys"))
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "w") as f:
+        f.write(value)
+    return target
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+@pytest.fixture
+def root():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestSysfsWriter:
+    """Test whitelisted writes against a temporary sysfs root"""
+
+    def test_batch_write(self, root):
+        """Test a whitelisted batch is written in one call"""
+        governor = make_attr(root, GOVERNOR, "powersave")
+        charge = make_attr(root, CHARGE_LIMIT, "100")
+        writer = SysfsWriter(root)
+
+        results = writer.write_batch([(GOVERNOR, "performance"), (CHARGE_LIMIT, "80")])
+        assert results == [(True, ""), (True, "")]
+        assert read(governor) == "performance"
+        assert read(charge) == "80"
+
+    def test_rejected_entry_blocks_batch(self, root):
+        """Test nothing is written when any entry is not whitelisted"""
+        governor = make_attr(root, GOVERNOR, "powersave")
+        make_attr(root, "/sys/kernel/mm/transparent_hugepage/enabled", "never")
+        writer = SysfsWriter(root)
+
+        results = writer.write_batch(
+            [
+                (GOVERNOR, "performance"),
+                ("/sys/kernel/mm/transparent_hugepage/enabled", "always"),
+            ]
+        )
+        assert [ok for ok, _ in results] == [False, False]
+        assert "not allowed" in results[1][1]
+        assert read(governor) == "powersave"
+
+    def test_rejects_paths_outside_whitelist(self, root):
+        """Test traversal, non-sysfs paths and bad values are refused"""
+        make_attr(root, CHARGE_LIMIT, "100")
+        writer = SysfsWriter(root)
+        assert writer.resolve("/etc/passwd") is None
+        assert writer.resolve("/sys/class/power_supply/../../../etc/passwd") is None
+        assert writer.resolve("/sys/class/power_supply/BAT0/../BAT0/uevent") is None
+        assert writer.validate(CHARGE_LIMIT, "80\nmalicious") is not None
+        assert writer.validate(CHARGE_LIMIT, "8" * 1000) is not None
+        assert writer.validate(CHARGE_LIMIT, "80") is None
+
+    def test_rejects_symlink_escape(self, root):
+        """Test a whitelisted name that links outside the root is refused"""
+        with tempfile.TemporaryDirectory() as outside:
+            os.makedirs(os.path.join(root, "class", "power_supply"))
+            os.symlink(outside, os.path.join(root, "class", "power_supply", "BAT0"))
+            writer = SysfsWriter(root)
+            assert writer.resolve(CHARGE_LIMIT) is None
+
+    def test_missing_attribute_not_created(self, root):
+        """Test only existing attributes can be written"""
+        writer = SysfsWriter(root)
+        success, message = writer.write(GOVERNOR, "performance")
+        assert not success
+        assert "Failed to write" in message
+        assert not os.path.exists(os.path.join(root, os.path.relpath(GOVERNOR, "/sys")))
+
+
+class TestResolveCommand:
+    """Test the command whitelist"""
+
+    def test_rejects_unlisted_and_unsafe(self):
+        """Test unknown programs and shell-like arguments are refused"""
+        assert resolve_command([]) is None
+        assert resolve_command(["sh", "-c", "true"]) is None
+        assert resolve_command(["/usr/bin/ryzenadj", "-i"]) is None
+        assert resolve_command(["ryzenadj", "--stapm-limit", "1; reboot"]) is None
+
+
+class TestPrivilegedHelperClient:
+    """Test the client's direct, helper and pkexec paths"""
+
+    def test_direct_write(self, root):
+        """Test writable attributes never reach the helper"""
+        target = make_attr(root, GOVERNOR, "powersave")
+        client = PrivilegedHelperClient()
+        client._helper_write = lambda writes: pytest.fail("helper used")
+        assert client.write(target, "performance") == (True, "")
+        assert read(target) == "performance"
+
+    def test_denied_writes_batched_to_helper(self, monkeypatch):
+        """Test permission-denied writes go to the helper in one batch"""
+
+        def deny(path, mode="r"):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(privileged_helper, "open", deny, raising=False)
+        client = PrivilegedHelperClient()
+        batches = []
+
+        def helper_write(writes):
+            batches.append(list(writes))
+            return [(True, "")] * len(writes)
+
+        client._helper_write = helper_write
+        writes = [(GOVERNOR, "performance"), (CHARGE_LIMIT, "80")]
+        assert client.write_batch(writes) == [(True, ""), (True, "")]
+        assert batches == [writes]
+
+    def test_pkexec_fallback(self, monkeypatch):
+        """Test each write falls back to pkexec without the helper service"""
+
+        def deny(path, mode="r"):
+            raise PermissionError(path)
+
+        monkeypatch.setattr(privileged_helper, "open", deny, raising=False)
+        client = PrivilegedHelperClient()
+        client._helper_write = lambda writes: None
+        pkexec = []
+        client._pkexec_write = lambda path, value: pkexec.append(path) or (True, "")
+        assert client.write_batch([(GOVERNOR, "performance"), (CHARGE_LIMIT, "80")])
+        assert pkexec == [GOVERNOR, CHARGE_LIMIT]
+
+    @pytest.fixture
+    def runs(self, monkeypatch):
+        """Commands run locally, with the process not running as root"""
+        monkeypatch.setattr(privileged_helper.os, "geteuid", lambda: 1000)
+        runs = []
+
+        def run(cmd, timeout):
+            runs.append(cmd)
+            return True, "pkexec", ""
+
+        monkeypatch.setattr(PrivilegedHelperClient, "_run", staticmethod(run))
+        return runs
+
+    def test_run_through_helper(self, runs):
+        """Test a helper result is returned without spawning pkexec"""
+        client = PrivilegedHelperClient()
+        client._helper_run = lambda argv, timeout: (False, "", "bad option")
+        assert client.run(["ryzenadj", "-i"]) == (False, "", "bad option")
+        assert runs == []
+
+    def test_run_permission_failure_falls_back(self, runs):
+        """Test a helper run denied a capability is retried through pkexec"""
+        client = PrivilegedHelperClient()
+        client._helper_run = lambda argv, timeout: (
+            False,
+            "",
+            "Unable to get memory access: Operation not permitted",
+        )
+        assert client.run(["ryzenadj", "-i"]) == (True, "pkexec", "")
+        assert runs == [["pkexec", "ryzenadj", "-i"]]
+
+
+class FakeAuthority:
+    """polkit Authority object recording CheckAuthorization calls"""
+
+    def __init__(self):
+        self.calls = []
+
+    def CheckAuthorization(self, *args, reply_handler, error_handler, **kwargs):
+        self.calls.append((args, reply_handler, error_handler))
+
+    def answer(self, authorized, index=0):
+        """Send the reply of a pending check"""
+        _, reply_handler, _ = self.calls[index]
+        reply_handler((authorized, False, {}))
+
+
+class FakeBus:
+    """System bus serving only the polkit authority"""
+
+    def __init__(self):
+        self.authority = FakeAuthority()
+
+    def get_object(self, name, path, introspect=True):
+        assert name == "org.freedesktop.PolicyKit1"
+        return self.authority
+
+
+class TestPolkitAuthorizer:
+    """Test the service's per-connection polkit checks"""
+
+    def test_checks_sender_once(self):
+        """Test a client is checked once and then remembered"""
+        bus = FakeBus()
+        authorizer = PolkitAuthorizer(bus)
+        answers = []
+        authorizer.check(":1.42", answers.append)
+        args, _, _ = bus.authority.calls[0]
+        assert args[0] == ("system-bus-name", {"name": ":1.42"})
+        assert args[1] == HELPER_POLKIT_ACTION
+        bus.authority.answer(True)
+        authorizer.check(":1.42", answers.append)
+        assert answers == [True, True]
+        assert len(bus.authority.calls) == 1
+
+    def test_concurrent_calls_share_check(self):
+        """Test calls made while a prompt is open wait on the same check"""
+        bus = FakeBus()
+        authorizer = PolkitAuthorizer(bus)
+        answers = []
+        authorizer.check(":1.42", answers.append)
+        authorizer.check(":1.42", answers.append)
+        assert answers == []
+        bus.authority.answer(False)
+        assert answers == [False, False]
+        assert len(bus.authority.calls) == 1
+
+    def test_denied_sender_checked_again(self):
+        """Test a denial isn't remembered, so the next call prompts again"""
+        bus = FakeBus()
+        authorizer = PolkitAuthorizer(bus)
+        authorizer.check(":1.42", lambda ok: None)
+        bus.authority.answer(False)
+        authorizer.check(":1.42", lambda ok: None)
+        assert len(bus.authority.calls) == 2
+
+    def test_polkit_error_denies(self):
+        """Test a failed polkit call answers False"""
+        bus = FakeBus()
+        authorizer = PolkitAuthorizer(bus)
+        answers = []
+        authorizer.check(":1.42", answers.append)
+        _, _, error_handler = bus.authority.calls[0]
+        error_handler(Exception("polkit went away"))
+        assert answers == [False]
+
+    def test_disconnect_fails_pending_and_forgets(self):
+        """Test a client leaving fails its waiting calls and its authorization"""
+        bus = FakeBus()
+        authorizer = PolkitAuthorizer(bus)
+        answers = []
+        authorizer.check(":1.42", answers.append)
+        authorizer.forget(":1.42")
+        assert answers == [False]
+        # The late polkit reply must not authorize the gone client
+        bus.authority.answer(True)
+        authorizer.check(":1.42", answers.append)
+        assert answers == [False]
+        assert len(bus.authority.calls) == 2
+
+    def test_no_sender_denied(self):
+        """Test calls without a sender are refused without asking polkit"""
+        bus = FakeBus()
+        answers = []
+        PolkitAuthorizer(bus).check(None, answers.append)
+        assert answers == [False]
+        assert bus.authority.calls == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
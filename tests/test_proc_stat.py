@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Unit tests for proc_stat.py
+"""
+
+import pytest
+
+from linux_armoury.modules.proc_stat import CPU_TIME_FIELDS, ProcStatSnapshot
+from linux_armoury.modules.system_monitor import SystemMonitor
+
+SAMPLE_STAT = """cpu  100 10 50 1000 20 5 5 0 0 0
+cpu0 50 5 25 500 10 3 2 0 0 0
+cpu1 50 5 25 500 10 2 3 0 0 0
+intr 123456 10 0 0 5
+ctxt 987654
+btime 1700000000
+processes 4321
+procs_running 3
+procs_blocked 1
+softirq 5555 1 2 3
+"""
+
+LATER_STAT = """cpu  200 10 100 1050 20 5 5 0 0 0
+cpu0 150 5 25 500 10 3 2 0 0 0
+cpu1 50 5 75 550 10 2 3 0 0 0
+intr 123999 10 0 0 5
+ctxt 988000
+btime 1700000000
+"""
+
+
+class TestProcStatSnapshot:
+    """Test cases for ProcStatSnapshot parsing"""
+
+    def test_parse_cpu_times(self):
+        """Test aggregate and per-core CPU times"""
+        snap = ProcStatSnapshot.parse(SAMPLE_STAT)
+        assert snap.total_times.tolist() == [100, 10, 50, 1000, 20, 5, 5]
+        assert snap.core_count == 2
+        assert len(snap.core_times) == 2 * CPU_TIME_FIELDS
+        assert snap.core(1).tolist() == [50, 5, 25, 500, 10, 2, 3]
+
+    def test_parse_counters(self):
+        """Test scalar counters parsed in the same pass"""
+        snap = ProcStatSnapshot.parse(SAMPLE_STAT)
+        assert snap.interrupts == 123456
+        assert snap.context_switches == 987654
+        assert snap.boot_time == 1700000000
+        assert snap.processes == 4321
+        assert snap.procs_running == 3
+        assert snap.procs_blocked == 1
+
+    def test_short_cpu_lines_are_padded(self):
+        """Test that old kernels with fewer CPU columns still parse"""
+        snap = ProcStatSnapshot.parse("cpu  1 2 3 4\ncpu0 1 2 3 4\n")
+        assert snap.total_times.tolist() == [1, 2, 3, 4, 0, 0, 0]
+        assert snap.core(0).tolist() == [1, 2, 3, 4, 0, 0, 0]
+
+    def test_empty_content(self):
+        """Test that empty content yields an empty snapshot"""
+        snap = ProcStatSnapshot.parse("")
+        assert len(snap.total_times) == 0
+        assert snap.core_count == 0
+
+
+class TestSystemMonitorSnapshot:
+    """Test that SystemMonitor consumes a shared snapshot"""
+
+    def test_cpu_stats_from_snapshots(self, monkeypatch):
+        """Test CPU usage is computed from snapshots without rereading"""
+        monitor = SystemMonitor()
+
+        def fail_read():
+            raise AssertionError("/proc/stat should not be reread")
+
+        monkeypatch.setattr(monitor, "read_proc_stat", fail_read)
+        monitor.get_cpu_stats(ProcStatSnapshot.parse(SAMPLE_STAT))
+        stats = monitor.get_cpu_stats(ProcStatSnapshot.parse(LATER_STAT))
+
+        # total delta = 100 + 50 + 50 = 200, idle delta = 50
+        assert stats.usage_percent == pytest.approx(75.0)
+        assert stats.user_percent == pytest.approx(50.0)
+        assert stats.system_percent == pytest.approx(25.0)
+        assert stats.core_usage == [100.0, 50.0]
+        assert stats.context_switches == 988000
+        assert stats.interrupts == 123999
+
+    def test_per_core_breakdown(self):
+        """Test vectorized per-core user/system/idle/iowait percentages"""
+        monitor = SystemMonitor()
+        monitor.get_cpu_stats(ProcStatSnapshot.parse(SAMPLE_STAT))
+        stats = monitor.get_cpu_stats(ProcStatSnapshot.parse(LATER_STAT))
+
+        # cpu0: only user time advanced; cpu1: 50 system + 50 idle jiffies
+        assert stats.core_user_percent == [100.0, 0.0]
+        assert stats.core_system_percent == [0.0, 50.0]
+        assert stats.core_idle_percent == [0.0, 50.0]
+        assert stats.core_iowait_percent == [0.0, 0.0]
+
+    def test_core_count_change(self):
+        """Test that a hotplugged core does not break the delta step"""
+        monitor = SystemMonitor()
+        monitor.get_cpu_stats(ProcStatSnapshot.parse(SAMPLE_STAT))
+        stats = monitor.get_cpu_stats(
+            ProcStatSnapshot.parse("cpu  0 0 0 0 0 0 0\ncpu0 60 5 25 500 10 3 2\n")
+        )
+        assert stats.core_usage == [100.0]
+
+    def test_overview_boot_time_from_snapshot(self):
+        """Test boot time comes from the supplied snapshot"""
+        monitor = SystemMonitor()
+        info = monitor.get_system_overview(ProcStatSnapshot.parse(SAMPLE_STAT))
+        assert info.boot_time != ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
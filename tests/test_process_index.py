@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Unit tests for process_index.py
+"""
+
+import os
+import shutil
+import struct
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import process_index
+from linux_armoury.modules.process_index import (
+    CN_MSG_HEADER,
+    NLMSG_HEADER,
+    PROC_EVENT_EXEC,
+    PROC_EVENT_FORK,
+    PROC_EVENT_HEADER,
+    ProcConnectorListener,
+    ProcessNameIndex,
+    compile_name_matcher,
+)
+from linux_armoury.system_utils import SystemUtils
+
+
+def _add_proc(root, pid, name):
+    os.makedirs(os.path.join(root, str(pid)), exist_ok=True)
+    with open(os.path.join(root, str(pid), "comm"), "w") as f:
+        f.write(name + "\n")
+
+
+class TestProcessNameIndex:
+    """Test cases for ProcessNameIndex"""
+
+    @pytest.fixture
+    def proc_root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _add_proc(tmpdir, 1, "systemd")
+            _add_proc(tmpdir, 200, "bash")
+            yield tmpdir
+
+    def test_names(self, proc_root):
+        """Test the initial scan lists every process"""
+        index = ProcessNameIndex(proc_root)
+        assert sorted(index.names()) == ["bash", "systemd"]
+
+    def test_incremental_update(self, proc_root, monkeypatch):
+        """Test only new PIDs are read and vanished PIDs are dropped"""
+        index = ProcessNameIndex(proc_root)
+        index.watch(SystemUtils.GAMING_APPS)
+        assert not index.has_match()
+
+        reads = []
+        original = index._read_name
+        monkeypatch.setattr(
+            index, "_read_name", lambda pid: reads.append(pid) or original(pid)
+        )
+        _add_proc(proc_root, 300, "steamwebhelper")
+        assert index.has_match()
+        assert reads == [300]
+
+        shutil.rmtree(os.path.join(proc_root, "300"))
+        assert not index.has_match()
+        assert reads == [300]
+
+    def test_periodic_full_rescan_catches_exec(self, proc_root, monkeypatch):
+        """Test a full rescan picks up an existing PID that exec'd"""
+        index = ProcessNameIndex(proc_root)
+        index.watch(["lutris"])
+        assert not index.has_match()
+
+        _add_proc(proc_root, 200, "lutris")
+        assert not index.has_match()  # Same PID, not rescanned yet
+        monkeypatch.setattr(process_index, "FULL_RESCAN_INTERVAL", 0)
+        assert index.has_match()
+        assert index.matching() == ["lutris"]
+
+    def test_marked_pids_in_event_mode(self, proc_root, monkeypatch):
+        """Test that with a live listener only marked PIDs are re-read"""
+        index = ProcessNameIndex(proc_root)
+        index.watch(["wine"])
+        index.refresh(full=True)
+
+        class FakeListener:
+            def is_alive(self):
+                return True
+
+            def take_overrun(self):
+                return False
+
+        index._listener = FakeListener()
+        monkeypatch.setattr(
+            index, "_list_pids", lambda: pytest.fail("/proc should not be listed")
+        )
+        _add_proc(proc_root, 400, "wine64-preload")
+        assert not index.has_match()
+        index.mark(400)
+        assert index.has_match()
+
+    def test_watch_recomputes_matches(self, proc_root):
+        """Test changing the watched patterns updates existing matches"""
+        index = ProcessNameIndex(proc_root)
+        index.refresh()
+        index.watch(["bash"])
+        assert index.has_match()
+        index.watch(["zsh"])
+        assert not index.has_match()
+
+
+class TestNameMatcher:
+    """Test cases for the precompiled matcher"""
+
+    def test_substring_match(self):
+        """Test patterns match anywhere in lowercased names"""
+        matcher = compile_name_matcher(["steam", "Proton"])
+        assert matcher.search("steamwebhelper")
+        assert matcher.search("proton-run")
+        assert not matcher.search("firefox")
+
+    def test_empty_patterns(self):
+        """Test an empty pattern list yields no matcher"""
+        assert compile_name_matcher([]) is None
+
+
+class TestProcConnectorListener:
+    """Test cases for proc connector message parsing"""
+
+    @staticmethod
+    def _event(what, data):
+        header = struct.pack(NLMSG_HEADER, 0, 0, 0, 0, 0)
+        cn_msg = struct.pack(CN_MSG_HEADER, 1, 1, 0, 0, 0, 0)
+        return header + cn_msg + struct.pack(PROC_EVENT_HEADER, what, 0, 0) + data
+
+    def test_parse_fork(self):
+        """Test fork events report the child process"""
+        data = self._event(PROC_EVENT_FORK, struct.pack("=IIII", 1, 1, 500, 500))
+        assert ProcConnectorListener.parse_event(data) == (PROC_EVENT_FORK, 500)
+
+    def test_parse_thread_fork_ignored(self):
+        """Test new threads are not reported as processes"""
+        data = self._event(PROC_EVENT_FORK, struct.pack("=IIII", 1, 1, 501, 500))
+        assert ProcConnectorListener.parse_event(data) is None
+
+    def test_parse_exec(self):
+        """Test exec events report the process"""
+        data = self._event(PROC_EVENT_EXEC, struct.pack("=II", 42, 42))
+        assert ProcConnectorListener.parse_event(data) == (PROC_EVENT_EXEC, 42)
+
+    def test_parse_short_message(self):
+        """Test truncated datagrams are ignored"""
+        assert ProcConnectorListener.parse_event(b"\0" * 8) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for process_scanner.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import process_scanner
+from linux_armoury.modules.process_scanner import ProcessScanner
+
+
+def _write_proc(root, pid, comm, utime, stime, starttime, rss=256, state="S"):
+    """Create a fake /proc/[pid] entry"""
+    proc_dir = os.path.join(root, str(pid))
+    os.makedirs(proc_dir, exist_ok=True)
+    # Fields after comm: state ppid pgrp session tty tpgid flags minflt cminflt
+    # majflt cmajflt utime stime cutime cstime priority nice threads
+    # itrealvalue starttime vsize rss
+    fields = [state, "1", "1", "1", "0", "-1", "0", "0", "0", "0", "0"]
+    fields += [str(utime), str(stime), "0", "0", "20", "0", "4", "0"]
+    fields += [str(starttime), "1000000", str(rss)]
+    with open(os.path.join(proc_dir, "stat"), "w") as f:
+        f.write(f"{pid} ({comm}) " + " ".join(fields) + "\n")
+    with open(os.path.join(proc_dir, "cmdline"), "wb") as f:
+        f.write(f"/usr/bin/{comm}\0--flag\0".encode())
+
+
+class TestProcessScanner:
+    """Test cases for ProcessScanner"""
+
+    @pytest.fixture
+    def proc_root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "uptime"), "w") as f:
+                f.write("1000.00 500.00\n")
+            with open(os.path.join(tmpdir, "meminfo"), "w") as f:
+                f.write("MemTotal:       16384000 kB\n")
+            yield tmpdir
+
+    def test_parses_comm_with_spaces_and_parens(self, proc_root):
+        """Test process names containing spaces and parentheses"""
+        _write_proc(proc_root, 42, "Web (Content) x", 10, 5, 100)
+        scanner = ProcessScanner(proc_root)
+        [sample] = scanner.scan()
+        assert sample.pid == 42
+        assert sample.name == "Web (Content) x"
+        assert sample.state == "S"
+        assert sample.threads == 4
+        assert sample.rss_bytes == 256 * scanner.page_size
+
+    def test_interval_cpu_percent(self, proc_root, monkeypatch):
+        """Test CPU% is computed from the jiffies used since the last scan"""
+        hz = os.sysconf("SC_CLK_TCK")
+        _write_proc(proc_root, 10, "busy", 0, 0, 0)
+        _write_proc(proc_root, 11, "idle", 0, 0, 0)
+        scanner = ProcessScanner(proc_root)
+
+        clock = iter([100.0, 102.0])
+        monkeypatch.setattr(process_scanner.time, "monotonic", lambda: next(clock))
+        scanner.scan()
+
+        # busy used one full core for the 2 s interval
+        _write_proc(proc_root, 10, "busy", 2 * hz, 0, 0)
+        samples = {s.pid: s for s in scanner.scan()}
+        assert samples[10].cpu_percent == pytest.approx(100.0)
+        assert samples[11].cpu_percent == 0.0
+
+    def test_pid_reuse_is_not_a_delta(self, proc_root, monkeypatch):
+        """Test a reused PID (new starttime) is treated as a new process"""
+        hz = os.sysconf("SC_CLK_TCK")
+        _write_proc(proc_root, 10, "old", 50 * hz, 0, 0)
+        scanner = ProcessScanner(proc_root)
+
+        clock = iter([100.0, 101.0])
+        monkeypatch.setattr(process_scanner.time, "monotonic", lambda: next(clock))
+        scanner.scan()
+
+        _write_proc(proc_root, 10, "new", hz // 2, 0, 5000)
+        [sample] = scanner.scan()
+        assert sample.name == "new"
+        assert sample.cpu_percent == pytest.approx(50.0, abs=1)
+
+    def test_first_scan_uses_lifetime_average(self, proc_root):
+        """Test the first scan reports lifetime CPU% like ps"""
+        hz = os.sysconf("SC_CLK_TCK")
+        # Started at boot, used 100 s of CPU over 1000 s uptime
+        _write_proc(proc_root, 5, "daemon", 100 * hz, 0, 0)
+        [sample] = ProcessScanner(proc_root).scan()
+        assert sample.cpu_percent == pytest.approx(10.0)
+
+    def test_top_by_memory(self, proc_root):
+        """Test top-N selection by resident memory"""
+        for pid, rss in [(1, 100), (2, 900), (3, 500)]:
+            _write_proc(proc_root, pid, f"p{pid}", 0, 0, 0, rss=rss)
+        top = ProcessScanner(proc_root).top(2, sort_by="mem")
+        assert [p.pid for p in top] == [2, 3]
+
+    def test_command_and_mem_total(self, proc_root):
+        """Test command line and memory total helpers"""
+        _write_proc(proc_root, 7, "game", 0, 0, 0)
+        scanner = ProcessScanner(proc_root)
+        assert scanner.get_command(7) == "/usr/bin/game --flag"
+        assert scanner.get_command(99, "kworker") == "[kworker]"
+        assert scanner.mem_total() == 16384000 * 1024
+
+    def test_vanished_process_skipped(self, proc_root):
+        """Test an entry without a stat file is skipped"""
+        os.makedirs(os.path.join(proc_root, "77"))
+        assert ProcessScanner(proc_root).scan() == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
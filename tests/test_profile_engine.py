@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Unit tests for profile_engine.py
+"""
+
+import threading
+
+import pytest
+
+from linux_armoury.modules.profile_engine import ProfileEngine, ProfileStep
+
+
+class FakeSetting:
+    """In-memory hardware setting recording its writes"""
+
+    def __init__(self, value, fail_on=None):
+        self.value = value
+        self.fail_on = fail_on
+        self.writes = []
+
+    def read(self):
+        return self.value
+
+    def write(self, value):
+        self.writes.append(value)
+        if value == self.fail_on:
+            return False, "rejected"
+        self.value = value
+        return True
+
+
+def make_engine(**settings):
+    """Build an engine with one step per fake setting"""
+    steps = [
+        ProfileStep(name, read=setting.read, write=setting.write)
+        for name, setting in settings.items()
+    ]
+    return ProfileEngine(steps)
+
+
+class TestPlan:
+    """Test that only differing settings are written"""
+
+    def test_unchanged_settings_skipped(self):
+        """Test a second identical apply writes nothing"""
+        fan, battery = FakeSetting("Balanced"), FakeSetting(80)
+        engine = make_engine(fan=fan, battery=battery)
+
+        report = engine.apply("Gaming", {"fan": "Performance", "battery": 80})
+        assert report.success
+        assert [step.name for step in report.steps] == ["fan"]
+        assert report.unchanged == ["battery"]
+        assert battery.writes == []
+
+        report = engine.apply("Gaming", {"fan": "Performance", "battery": 80})
+        assert report.steps == []
+        assert fan.writes == ["Performance"]
+
+    def test_normalized_comparison(self):
+        """Test aliases of the current value count as unchanged"""
+        fan = FakeSetting("quiet")
+        engine = ProfileEngine(
+            [ProfileStep("fan", fan.read, fan.write, normalize=str.lower)]
+        )
+        assert engine.apply("Silent", {"fan": "Quiet"}).steps == []
+
+    def test_unreadable_setting_uses_last_write(self):
+        """Test write-only settings are skipped once applied"""
+        effect = FakeSetting(None)
+        engine = ProfileEngine([ProfileStep("effect", lambda: None, effect.write)])
+        engine.apply("Gaming", {"effect": "Rainbow"})
+        engine.apply("Gaming", {"effect": "Rainbow"})
+        assert effect.writes == ["Rainbow"]
+
+    def test_ignores_unknown_and_none(self):
+        """Test unsupported settings and unset values are left out"""
+        battery = FakeSetting(100)
+        engine = make_engine(battery=battery)
+        report = engine.apply("Work", {"battery": None, "tdp": 35})
+        assert report.steps == [] and report.unchanged == []
+
+
+class TestConcurrency:
+    """Test that independent steps run at the same time"""
+
+    def test_steps_in_a_stage_overlap(self):
+        """Test both writes are in flight together"""
+        barrier = threading.Barrier(2, timeout=2)
+
+        def write(value):
+            barrier.wait()  # Raises BrokenBarrierError if run serially
+            return True
+
+        engine = ProfileEngine(
+            [
+                ProfileStep("rgb", lambda: 0, write),
+                ProfileStep("battery", lambda: 100, write),
+            ]
+        )
+        report = engine.apply("Work", {"rgb": 1, "battery": 80})
+        assert report.success
+        assert all(step.latency_ms >= 0 for step in report.steps)
+
+
+class TestRollback:
+    """Test that a failed step restores the settings already changed"""
+
+    def test_failure_restores_previous_values(self):
+        """Test succeeded steps are written back to their old values"""
+        fan = FakeSetting("Balanced")
+        battery = FakeSetting(80, fail_on=100)
+        engine = make_engine(fan=fan, battery=battery)
+
+        report = engine.apply("Gaming", {"fan": "Performance", "battery": 100})
+        assert not report.success
+        assert [step.name for step in report.failed] == ["battery"]
+        assert report.failed[0].message == "rejected"
+        assert report.rolled_back == ["fan"]
+        assert fan.writes == ["Performance", "Balanced"]
+        assert fan.value == "Balanced"
+        assert "rolled back fan" in report.summary()
+
+    def test_later_stage_skipped_on_failure(self):
+        """Test a later stage never runs after a failure"""
+        battery = FakeSetting(80, fail_on=100)
+        gpu = FakeSetting("Hybrid")
+        engine = ProfileEngine(
+            [
+                ProfileStep("battery", battery.read, battery.write),
+                ProfileStep("gpu", gpu.read, gpu.write, stage=1),
+            ]
+        )
+        report = engine.apply("Gaming", {"battery": 100, "gpu": "AsusMuxDgpu"})
+        assert gpu.writes == []
+        assert [step.name for step in report.steps] == ["battery"]
+
+    def test_best_effort_failure_keeps_earlier_stages(self):
+        """Test a failed best-effort step is reported without a rollback"""
+        fan = FakeSetting("Balanced")
+        gpu = FakeSetting("Hybrid", fail_on="AsusMuxDgpu")
+        engine = ProfileEngine(
+            [
+                ProfileStep("fan", fan.read, fan.write),
+                ProfileStep("gpu", gpu.read, gpu.write, stage=1, best_effort=True),
+            ]
+        )
+        report = engine.apply("Gaming", {"fan": "Performance", "gpu": "AsusMuxDgpu"})
+        assert not report.success
+        assert [step.name for step in report.failed] == ["gpu"]
+        assert report.rolled_back == []
+        assert fan.value == "Performance"
+
+    def test_exception_counts_as_failure(self):
+        """Test a raising step fails cleanly"""
+
+        def boom(value):
+            raise OSError("device busy")
+
+        engine = ProfileEngine([ProfileStep("tdp", lambda: 25, boom)])
+        report = engine.apply("Turbo", {"tdp": 90})
+        assert not report.success
+        assert report.failed[0].message == "device busy"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Unit tests for profile_manager.py
+"""
+
+import pytest
+
+from linux_armoury.modules import overclocking_control
+from linux_armoury.modules.gpu_control import GpuMode
+from linux_armoury.modules.profile_engine import ProfileEngine
+from linux_armoury.profile_manager import ProfileManager, _power_profile_for
+from linux_armoury.system_utils import SystemUtils
+
+SYSFS_CHOICES = ["low-power", "balanced", "performance"]
+PWRCFG_PROFILES = [
+    "emergency",
+    "battery",
+    "efficient",
+    "balanced",
+    "performance",
+    "gaming",
+    "maximum",
+]
+
+
+class TestPowerProfileFor:
+    """Test fan curves are mapped onto the backend's power profile names"""
+
+    @pytest.mark.parametrize(
+        "fan_curve, expected",
+        [
+            ("Performance", "performance"),
+            ("Quiet", "low-power"),
+            ("Silent", "low-power"),
+        ],
+    )
+    def test_sysfs_names(self, fan_curve, expected):
+        """Test sysfs platform_profile gets its lowercase names"""
+        assert _power_profile_for(fan_curve, SYSFS_CHOICES) == expected
+
+    def test_asusctl_names(self):
+        """Test an exact (case-insensitive) match keeps the backend's spelling"""
+        assert _power_profile_for("Silent", ["Quiet", "Balanced"]) == "Quiet"
+
+    def test_pwrcfg_names(self):
+        """Test pwrcfg profiles are picked by behaviour"""
+        assert _power_profile_for("Quiet", PWRCFG_PROFILES) == "battery"
+        assert _power_profile_for("Balanced", PWRCFG_PROFILES) == "balanced"
+
+    def test_no_match(self):
+        """Test an unsupported fan curve is left out"""
+        assert _power_profile_for("Turbo", SYSFS_CHOICES) is None
+
+
+class FakeOverclocking:
+    """Overclocking controller with RyzenAdj present"""
+
+    ryzenadj_available = True
+
+    def __init__(self):
+        self.limits = {"stapm": 25.0, "fast": 30.0, "slow": 25.0}
+        self.writes = []
+
+    def current_tdp_limits(self):
+        return dict(self.limits)
+
+    def set_ryzenadj_tdp(self, stapm_limit=None, fast_limit=None, slow_limit=None):
+        self.writes.append((stapm_limit, fast_limit, slow_limit))
+        self.limits = {"stapm": stapm_limit, "fast": fast_limit, "slow": slow_limit}
+        return True
+
+
+class FakeGpu:
+    """supergfxctl on a laptop without a MUX switch"""
+
+    supergfxctl_available = True
+
+    def get_supported_modes(self):
+        return [GpuMode.INTEGRATED, GpuMode.HYBRID]
+
+    def get_current_mode(self):
+        return GpuMode.HYBRID
+
+    def set_gpu_mode(self, mode):
+        return False, "supergfxctl failed"
+
+
+class FakeApp:
+    """Application with only a fan controller"""
+
+    fan_controller = object()
+    keyboard_controller = None
+    battery_controller = None
+    gpu_controller = None
+
+
+@pytest.fixture
+def overclocking(monkeypatch):
+    """Fake overclocking controller used by the profile steps"""
+    controller = FakeOverclocking()
+    monkeypatch.setattr(
+        overclocking_control, "get_overclocking_controller", lambda: controller
+    )
+    return controller
+
+
+class TestBuildSteps:
+    """Test the order profile settings are written in"""
+
+    def test_power_profile_before_tdp(self, overclocking):
+        """Test the power profile is set in an earlier stage than the TDP"""
+        steps = {step.name: step for step in ProfileManager._build_steps(FakeApp())}
+        assert steps["fan_profile"].stage < steps["tdp"].stage
+
+    def test_tdp_diffs_all_limits(self, overclocking):
+        """Test the TDP step compares and writes stapm, fast and slow together"""
+        engine = ProfileEngine(ProfileManager._build_steps(FakeApp()))
+        target = {"tdp": {"stapm": 70, "fast": 75, "slow": 70}}
+        assert engine.apply("Gaming", target).success
+        assert engine.apply("Gaming", target).unchanged == ["tdp"]
+        assert overclocking.writes == [(70, 75, 70)]
+
+    def test_gpu_mode_is_best_effort(self, overclocking):
+        """Test a failed GPU mode switch doesn't undo the other settings"""
+        app = FakeApp()
+        app.gpu_controller = FakeGpu()
+        steps = {step.name: step for step in ProfileManager._build_steps(app)}
+        assert steps["gpu_mode"].best_effort
+        assert steps["gpu_mode"].read() == "Hybrid"
+
+
+class TestProfileTargets:
+    """Test profiles are mapped onto what the machine supports"""
+
+    @pytest.fixture(autouse=True)
+    def power_profiles(self, monkeypatch):
+        monkeypatch.setattr(
+            SystemUtils, "get_available_power_profiles", lambda: SYSFS_CHOICES
+        )
+
+    def test_unsupported_gpu_mode_dropped(self):
+        """Test Ultimate is left out on a laptop without a MUX"""
+        app = FakeApp()
+        app.gpu_controller = FakeGpu()
+        gaming = ProfileManager.BUILTIN_PROFILES["Gaming"]
+        targets = ProfileManager._profile_targets(gaming, app)
+        assert targets["gpu_mode"] is None
+        assert targets["fan_profile"] == "performance"
+
+    def test_supported_gpu_mode_kept(self):
+        """Test Eco maps onto the Integrated mode"""
+        app = FakeApp()
+        app.gpu_controller = FakeGpu()
+        saver = ProfileManager.BUILTIN_PROFILES["Battery Saver"]
+        assert ProfileManager._profile_targets(saver, app)["gpu_mode"] == "Integrated"
+
+    def test_tdp_fast_limit_headroom(self):
+        """Test the fast limit keeps its headroom over STAPM"""
+        gaming = ProfileManager.BUILTIN_PROFILES["Gaming"]
+        targets = ProfileManager._profile_targets(gaming, FakeApp())
+        assert targets["tdp"] == {"stapm": 70, "fast": 75, "slow": 70}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sampler.py
+"""
+
+import threading
+import time
+
+import pytest
+
+from linux_armoury.modules.sampler import (
+    BACKGROUND_MAX_INTERVAL,
+    AdaptivePolicy,
+    SourceSpec,
+    TelemetryFrame,
+    TelemetryRing,
+    TelemetrySampler,
+)
+
+
+class TestTelemetryRing:
+    """Test cases for TelemetryRing"""
+
+    def test_empty_ring(self):
+        """Test an empty ring has no latest frame"""
+        ring = TelemetryRing(4)
+        assert ring.latest() is None
+        assert ring.history() == []
+        assert len(ring) == 0
+
+    def test_push_assigns_sequence(self):
+        """Test frames are stamped with increasing sequence numbers"""
+        ring = TelemetryRing(4)
+        first = ring.push(TelemetryFrame())
+        second = ring.push(TelemetryFrame())
+        assert (first.seq, second.seq) == (1, 2)
+        assert ring.latest() is second
+
+    def test_overwrites_oldest(self):
+        """Test the ring keeps only the newest `capacity` frames"""
+        ring = TelemetryRing(3)
+        for i in range(5):
+            ring.push(TelemetryFrame(cpu_usage=float(i)))
+        assert len(ring) == 3
+        assert [f.cpu_usage for f in ring.history()] == [2.0, 3.0, 4.0]
+        assert [f.cpu_usage for f in ring.history(2)] == [3.0, 4.0]
+
+
+class TestTelemetrySampler:
+    """Test cases for TelemetrySampler"""
+
+    def _make_sampler(self, calls, interval=0.01):
+        def sample_cpu(frame):
+            calls.append("cpu")
+            frame.cpu_usage = 42.0
+
+        def broken(frame):
+            raise RuntimeError("sensor gone")
+
+        return TelemetrySampler(
+            interval=interval,
+            capacity=8,
+            sources={"cpu": sample_cpu, "broken": broken},
+        )
+
+    def test_sample_once(self):
+        """Test a tick runs every source and survives failing ones"""
+        calls = []
+        sampler = self._make_sampler(calls)
+        frame = sampler.sample_once()
+        assert frame.cpu_usage == 42.0
+        assert calls == ["cpu"]
+        assert sampler.latest() is frame
+
+    def test_latest_is_shared_between_consumers(self):
+        """Test that reading the latest frame does not resample hardware"""
+        calls = []
+        sampler = self._make_sampler(calls)
+        sampler.sample_once()
+        for _ in range(5):
+            sampler.latest(max_age=60)
+        assert calls == ["cpu"]
+
+    def test_latest_resamples_when_stale(self):
+        """Test an on-demand tick is taken when no frame is fresh"""
+        calls = []
+        sampler = self._make_sampler(calls)
+        assert sampler.latest(max_age=60) is not None
+        assert calls == ["cpu"]
+
+    def test_subscribers_receive_frames(self):
+        """Test subscribers are called with each published frame"""
+        sampler = self._make_sampler([])
+        received = []
+        sampler.subscribe(received.append)
+        frame = sampler.sample_once()
+        sampler.unsubscribe(received.append)
+        sampler.sample_once()
+        assert received == [frame]
+
+    def test_acquire_release_refcount(self):
+        """Test the thread runs only while consumers hold the sampler"""
+        sampler = self._make_sampler([])
+        sampler.acquire()
+        sampler.acquire()
+        assert sampler.is_running
+        frame = sampler.wait_for_frame(0, timeout=2)
+        assert frame is not None
+
+        sampler.release()
+        assert sampler.is_running
+        sampler.release()
+        assert not sampler.is_running
+        assert sampler.consumers == 0
+
+    def test_last_release_stops_sources(self):
+        """Test sources release their resources (e.g. nvidia-smi) on stop"""
+        stops = []
+        sampler = TelemetrySampler(
+            interval=0.01,
+            sources={
+                "gpu": SourceSpec(lambda frame: None, stop=lambda: stops.append(1))
+            },
+        )
+        sampler.sample_once()
+        sampler.acquire()
+        sampler.acquire()
+        sampler.release()
+        assert stops == []
+        sampler.release()
+        assert stops == [1]
+
+    def test_wait_for_frame_times_out(self):
+        """Test waiting without a running sampler returns None"""
+        sampler = self._make_sampler([])
+        assert sampler.wait_for_frame(0, timeout=0.05) is None
+        # The idle wakeup is part of the monitor's cost
+        assert sampler.stats().wakeups_last_minute == 1
+
+    def test_wake_waiters(self):
+        """Test a wait without timeout can be released (e.g. on shutdown)"""
+        sampler = self._make_sampler([])
+        timer = threading.Timer(0.05, sampler.wake_waiters)
+        timer.start()
+        started = time.monotonic()
+        assert sampler.wait_for_frame(0, timeout=5) is None
+        timer.join()
+        assert time.monotonic() - started < 2
+        assert sampler.stats().wakeups == 0
+
+    def test_wait_for_frame_wakes_on_publish(self):
+        """Test a waiting consumer is woken by a new frame"""
+        sampler = self._make_sampler([])
+        timer = threading.Timer(0.05, sampler.sample_once)
+        timer.start()
+        frame = sampler.wait_for_frame(0, timeout=2)
+        timer.join()
+        assert frame is not None and frame.seq == 1
+
+
+class TestSourceWorkers:
+    """Test per-source timeouts and cadence"""
+
+    def test_hung_source_does_not_stall_tick(self):
+        """Test a hung source goes stale while the others keep updating"""
+        release = threading.Event()
+        calls = []
+
+        def sample_cpu(frame):
+            frame.cpu_usage = float(len(calls))
+            calls.append("cpu")
+
+        def sample_gpu(frame):
+            release.wait(5)
+            frame.gpu_usage = 99.0
+
+        sampler = TelemetrySampler(
+            interval=0.01,
+            sources={
+                "cpu": sample_cpu,
+                "gpu": SourceSpec(sample_gpu, timeout=0.05),
+            },
+        )
+        try:
+            started = time.monotonic()
+            first = sampler.sample_once()
+            second = sampler.sample_once()
+            assert time.monotonic() - started < 1.0
+            assert first.stale_sources == ["gpu"]
+            assert second.stale_sources == ["gpu"]
+            assert (first.cpu_usage, second.cpu_usage) == (0.0, 1.0)
+            assert second.gpu_usage == 0.0
+        finally:
+            release.set()
+
+        # The late result is picked up by the next tick
+        deadline = time.monotonic() + 2
+        while sampler.workers["gpu"].busy and time.monotonic() < deadline:
+            time.sleep(0.01)
+        frame = sampler.sample_once()
+        assert frame.gpu_usage == 99.0
+        assert frame.stale_sources == []
+        assert "gpu" in frame.fresh_sources
+
+    def test_cadence_reuses_last_result(self):
+        """Test a slow-cadence source is not run on every tick"""
+        calls = []
+
+        def sample_disk(frame):
+            calls.append("disk")
+            frame.disk_usage = 50.0
+
+        sampler = TelemetrySampler(
+            interval=0.01,
+            sources={"disk": SourceSpec(sample_disk, interval=60.0)},
+        )
+        for _ in range(3):
+            frame = sampler.sample_once()
+            assert frame.disk_usage == 50.0
+        assert calls == ["disk"]
+
+    def test_fresh_sources(self):
+        """Test only sources that ran this tick are listed as fresh"""
+
+        def sample_cpu(frame):
+            frame.cpu_usage = 10.0
+
+        def sample_disk(frame):
+            frame.disk_usage = 50.0
+
+        sampler = TelemetrySampler(
+            interval=0.01,
+            sources={
+                "cpu": sample_cpu,
+                "disk": SourceSpec(sample_disk, interval=60.0),
+            },
+        )
+        assert sampler.sample_once().fresh_sources == ["cpu", "disk"]
+        time.sleep(0.02)
+        assert sampler.sample_once().fresh_sources == ["cpu"]
+
+    def test_failed_source_clears_its_fields(self):
+        """Test that a failing source leaves its fields at their defaults"""
+        state = {"fail": False}
+
+        def sample_memory(frame):
+            if state["fail"]:
+                raise OSError("meminfo gone")
+            frame.ram_usage = 30.0
+
+        sampler = TelemetrySampler(interval=0.01, sources={"memory": sample_memory})
+        assert sampler.sample_once().ram_usage == 30.0
+        state["fail"] = True
+        assert sampler.sample_once().ram_usage == 0.0
+
+
+class TestAdaptivePolicy:
+    """Test adaptive sampling intervals"""
+
+    def _policy(self):
+        return AdaptivePolicy(
+            metrics=("cpu_temp",),
+            min_interval=0.25,
+            max_interval=8.0,
+            change_threshold=2.0,
+            alert_level=85.0,
+            alert_margin=10.0,
+        )
+
+    def test_backs_off_when_idle(self):
+        """Test the interval doubles while the metric holds steady"""
+        policy = self._policy()
+        steady = {"cpu_temp": 50.0}
+        interval = 0.25
+        seen = []
+        for _ in range(7):
+            interval = policy.next_interval(interval, steady, steady)
+            seen.append(interval)
+        assert seen == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+    def test_fast_when_changing_or_near_alert(self):
+        """Test a moving or hot metric is sampled at the minimum interval"""
+        policy = self._policy()
+        assert policy.next_interval(8.0, {"cpu_temp": 50.0}, {"cpu_temp": 55.0}) == 0.25
+        assert policy.next_interval(8.0, {"cpu_temp": 50.0}, {"cpu_temp": 51.0}) == 8.0
+        hot = {"cpu_temp": 80.0}
+        assert policy.next_interval(8.0, hot, hot) == 0.25
+        assert policy.next_interval(8.0, {}, {"cpu_temp": 50.0}) == 0.25
+
+    def test_background_ignores_changes(self):
+        """Test that hidden windows back off beyond max_interval"""
+        policy = self._policy()
+        interval = policy.next_interval(
+            8.0, {"cpu_temp": 50.0}, {"cpu_temp": 60.0}, background=True
+        )
+        assert interval == 16.0
+        interval = policy.next_interval(
+            BACKGROUND_MAX_INTERVAL, {}, {"cpu_temp": 50.0}, background=True
+        )
+        assert interval == BACKGROUND_MAX_INTERVAL
+        hot = {"cpu_temp": 90.0}
+        assert policy.next_interval(16.0, hot, hot, background=True) == 0.25
+
+    def test_sampler_schedules_by_policy(self):
+        """Test the sampler applies the policy and resets on foreground"""
+        values = iter([50.0, 50.0, 50.0, 70.0])
+
+        def sample_cpu(frame):
+            frame.cpu_temp = next(values)
+
+        spec = SourceSpec(
+            sample_cpu,
+            policy=AdaptivePolicy(
+                metrics=("cpu_temp",), min_interval=0.5, max_interval=4.0
+            ),
+        )
+        sampler = TelemetrySampler(interval=1.0, sources={"cpu": spec})
+        worker = sampler.workers["cpu"]
+        sampler.sample_once()
+        assert sampler.intervals() == {"cpu": 0.5}  # First reading
+        worker.next_due = 0.0
+        sampler.sample_once()
+        assert worker.interval == 1.0
+        assert 0.5 < sampler.next_due_in() <= 1.0
+
+        sampler.set_background(True)
+        worker.next_due = 0.0
+        sampler.sample_once()
+        assert worker.interval == 2.0
+        sampler.set_background(False)
+        assert worker.interval == 1.0 and worker.next_due == 0.0
+        assert sampler.sample_once().cpu_temp == 70.0
+        assert worker.interval == 0.5
+
+
+class TestLowPowerMode:
+    """Test low-power monitoring on battery with the window hidden"""
+
+    def _make_sampler(self, calls, on_ac=False, budget=6):
+        def sample_cpu(frame):
+            calls.append("cpu")
+            frame.cpu_usage = 10.0
+
+        def sample_power(frame):
+            calls.append("power")
+            frame.on_ac = on_ac
+
+        return TelemetrySampler(
+            interval=1.0,
+            sources={
+                "cpu": sample_cpu,
+                "power": SourceSpec(sample_power, low_power=True),
+            },
+            wakeup_budget=budget,
+        )
+
+    def test_enters_only_hidden_on_battery(self):
+        """Test low-power mode needs both battery power and a hidden window"""
+        sampler = self._make_sampler([])
+        sampler.sample_once()
+        assert not sampler.low_power
+        sampler.set_background(True)
+        sampler.sample_once()
+        assert sampler.low_power
+        sampler.set_background(False)
+        assert not sampler.low_power
+
+        on_ac = self._make_sampler([], on_ac=True)
+        on_ac.set_background(True)
+        on_ac.sample_once()
+        assert not on_ac.low_power
+
+    def test_samples_only_low_power_sources(self):
+        """Test other sources are dropped and their last values kept"""
+        calls = []
+        sampler = self._make_sampler(calls)
+        sampler.set_background(True)
+        sampler.sample_once()
+        calls.clear()
+        for worker in sampler.workers.values():
+            worker.next_due = 0.0
+        frame = sampler.sample_once()
+        assert calls == ["power"]
+        assert frame.low_power
+        assert frame.cpu_usage == 10.0
+
+    def test_batches_due_sources(self):
+        """Test sources due within the batch window share one wakeup"""
+        calls = []
+        sampler = self._make_sampler(calls)
+        sampler.set_background(True)
+        sampler.sample_once()
+        calls.clear()
+        sampler.workers["power"].next_due = time.monotonic() + 5.0
+        sampler.sample_once()
+        assert calls == ["power"]
+
+    def test_wakeup_budget(self):
+        """Test the next tick is deferred once the budget is spent"""
+        sampler = self._make_sampler([], budget=2)
+        sampler.set_background(True)
+        sampler.sample_once()
+        for worker in sampler.workers.values():
+            worker.next_due = 0.0
+        sampler.sample_once()
+        assert sampler.low_power
+        assert sampler.next_due_in() > 50.0
+
+        sampler.set_background(False)
+        assert sampler.next_due_in() == 0.0
+
+    def test_wakeup_log_stays_bounded(self):
+        """Test wakeups older than a minute are dropped on every tick"""
+        sampler = self._make_sampler([])
+        old = time.monotonic() - 120.0
+        sampler._wakeups.extend(old + i for i in range(30))
+        sampler.sample_once()
+        assert len(sampler._wakeups) == 1
+
+    def test_reports_own_cost(self):
+        """Test the sampler reports its wakeups and CPU time"""
+        sampler = self._make_sampler([])
+        sampler.sample_once()
+        for worker in sampler.workers.values():
+            worker.next_due = 0.0
+        sampler.sample_once()
+        stats = sampler.stats()
+        assert stats.wakeups == 2
+        assert stats.wakeups_last_minute == 2
+        assert stats.cpu_time_s >= 0.0
+        assert stats.source_runs == {"cpu": 2, "power": 2}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sensor_handles.py
+"""
+
+import errno
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import sensor_handles
+from linux_armoury.modules.sensor_handles import SensorHandle, SensorHandlePool
+
+
+def _write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+class TestSensorHandle:
+    """Test cases for SensorHandle"""
+
+    def test_rereads_without_reopening(self):
+        """Test that updated contents are seen through the same descriptor"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "temp1_input")
+            _write(path, "45000\n")
+            handle = SensorHandle(path)
+            assert handle.read() == "45000\n"
+            fd = handle._fd
+
+            with open(path, "r+") as f:
+                f.write("52000\n")
+            assert handle.read() == "52000\n"
+            assert handle._fd == fd
+            handle.close()
+
+    def test_large_file_grows_buffer(self):
+        """Test that files larger than the default buffer are read fully"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "stat")
+            content = "cpu 1 2 3 4\n" * 2000
+            _write(path, content)
+            handle = SensorHandle(path)
+            assert handle.read() == content
+            assert handle._bufsize > len(content)
+            handle.close()
+
+    def test_reopens_after_enodev(self, monkeypatch):
+        """Test that a vanished node is reopened once and read again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "fan1_input")
+            _write(path, "2400\n")
+            handle = SensorHandle(path)
+            handle.read()
+
+            real_pread = os.pread
+            calls = {"n": 0}
+
+            def flaky_pread(fd, n, offset):
+                calls["n"] += 1
+                if calls["n"] == 1:
+                    raise OSError(errno.ENODEV, "No such device")
+                return real_pread(fd, n, offset)
+
+            monkeypatch.setattr(sensor_handles.os, "pread", flaky_pread)
+            assert handle.read() == "2400\n"
+            assert handle.reopen_count == 1
+            handle.close()
+
+
+class TestSensorHandlePool:
+    """Test cases for SensorHandlePool"""
+
+    def test_read_int(self):
+        """Test integer sensor reads"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "fan1_input")
+            _write(path, "3100\n")
+            pool = SensorHandlePool()
+            assert pool.read_int(path) == 3100
+            assert len(pool) == 1
+            pool.close_all()
+            assert len(pool) == 0
+
+    def test_missing_file_not_cached(self):
+        """Test that missing files return empty values and are not pooled"""
+        pool = SensorHandlePool()
+        assert pool.read("/nonexistent/sensor") == ""
+        assert pool.read_int("/nonexistent/sensor") is None
+        assert len(pool) == 0
+
+    def test_handle_shared_per_path(self):
+        """Test that the same path maps to the same handle"""
+        pool = SensorHandlePool()
+        assert pool.get_handle("/proc/loadavg") is pool.get_handle("/proc/loadavg")
+        pool.close_all()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sparkline.py
+"""
+
+import os
+import subprocess
+import sys
+import tkinter as tk
+
+import pytest
+
+from linux_armoury.widgets.sparkline import SparklineGraph, blend
+
+
+@pytest.fixture
+def root():
+    try:
+        window = tk.Tk()
+    except tk.TclError:
+        pytest.skip("No display available")
+    yield window
+    window.destroy()
+
+
+class TestBlend:
+    """Test fill color blending"""
+
+    def test_blend(self):
+        """Test colors mix by alpha"""
+        assert blend("#ffffff", "#000000", 1.0) == "#ffffff"
+        assert blend("#ffffff", "#000000", 0.0) == "#000000"
+        assert blend("#ff0066", "#1a1a1a", 0.3) == "#5f1231"
+
+
+class TestLazyMatplotlib:
+    """Test that the widgets package doesn't load matplotlib"""
+
+    def test_widgets_import_without_matplotlib(self):
+        """Test matplotlib is loaded only for the detailed graph"""
+        code = (
+            "import sys, linux_armoury.widgets as w; "
+            "print('matplotlib' in sys.modules); "
+            "w.LiveMonitoringGraph; "
+            "print('matplotlib' in sys.modules)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=60,
+        )
+        assert result.stdout.split() == ["False", "True"], result.stderr
+
+
+class TestSparklineGraph:
+    """Test the canvas graph (needs a display)"""
+
+    def test_moves_existing_items(self, root):
+        """Test updates reuse the canvas items and follow the data"""
+        graph = SparklineGraph(root, "CPU", max_points=5)
+        graph.resize(101, 52)
+        items = graph.canvas.find_all()
+
+        for value in (0, 25, 50, 75, 100):
+            graph.update_data(value)
+
+        assert graph.canvas.find_all() == items
+        line = graph.canvas.coords(graph._line)
+        assert line[0::2] == [0, 25, 50, 75, 100]
+        assert line[1::2] == [51, 38.5, 26, 13.5, 1]
+        assert graph.buffer.stats() == (25, 62.5, 100)
+
+    def test_clear(self, root):
+        """Test clearing flattens the line"""
+        graph = SparklineGraph(root, "GPU", max_points=3)
+        graph.resize(30, 12)
+        graph.update_data(80)
+        graph.clear()
+        assert graph.canvas.coords(graph._line)[1::2] == [11, 11, 11]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Unit tests for startup_profiler.py
+"""
+
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from linux_armoury.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler:
+    """Test startup timing collection"""
+
+    def test_measure_records_event(self):
+        """Test a measured block is recorded with its kind"""
+        profiler = StartupProfiler()
+        with profiler.measure("customtkinter", "import"):
+            pass
+        (event,) = profiler.events
+        assert event.name == "customtkinter"
+        assert event.kind == "import"
+        assert event.duration_ms >= 0
+        assert event.thread == "MainThread"
+
+    def test_measure_records_on_error(self):
+        """Test a failing block is still timed"""
+        profiler = StartupProfiler()
+        with pytest.raises(RuntimeError):
+            with profiler.measure("fan_controller"):
+                raise RuntimeError("no hwmon")
+        assert [e.name for e in profiler.events] == ["fan_controller"]
+
+    def test_milestone(self):
+        """Test milestones are found by name once reached"""
+        profiler = StartupProfiler()
+        assert profiler.milestone("first frame") is None
+        profiler.mark("first frame")
+        assert profiler.milestone("first frame") >= 0
+
+    def test_totals_per_kind(self):
+        """Test totals add up durations and skip milestones"""
+        profiler = StartupProfiler()
+        profiler._record("a", "import", 0.0, 2.0)
+        profiler._record("b", "import", 2.0, 3.0)
+        profiler._record("c", "init", 5.0, 1.5)
+        profiler.mark("first frame")
+        assert profiler.totals() == {"import": 5.0, "init": 1.5}
+
+    def test_report_marks_background_threads(self):
+        """Test the report lists components and names worker threads"""
+        profiler = StartupProfiler()
+        profiler.mark("first frame")
+
+        def warm_up():
+            with profiler.measure("asusd_client"):
+                pass
+
+        thread = threading.Thread(target=warm_up, name="warm-up")
+        thread.start()
+        thread.join()
+
+        report = profiler.report()
+        assert "first frame" in report
+        assert "asusd_client  [warm-up]" in report
+        assert report.splitlines()[-1].startswith("Totals: init")
+
+
+class TestLazyGuiImports:
+    """Test the GUI module doesn't load hardware controllers on import"""
+
+    def test_gui_import_skips_controllers(self):
+        """Test controllers are imported on first use, not with the window"""
+        pytest.importorskip("customtkinter")
+        code = (
+            "import sys, linux_armoury.gui; "
+            "print(sorted(m for m in ("
+            "'linux_armoury.modules.asusd_client', "
+            "'linux_armoury.modules.fan_control', "
+            "'linux_armoury.modules.keyboard_control', "
+            "'linux_armoury.modules.battery_control', "
+            "'linux_armoury.modules.gpu_control') if m in sys.modules))"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            timeout=60,
+        )
+        assert result.stdout.strip() == "[]", result.stderr
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Unit tests for telemetry_shm.py
+"""
+
+import os
+import struct
+import tempfile
+
+import pytest
+
+from linux_armoury.modules import telemetry_shm
+from linux_armoury.modules.sampler import TelemetryFrame, TelemetrySampler
+from linux_armoury.modules.telemetry_shm import (
+    SEQ_FORMAT,
+    SEQ_OFFSET,
+    TelemetryExporter,
+    TelemetryShmReader,
+    TelemetryShmWriter,
+)
+
+
+class TestTelemetryShm:
+    """Test cases for the shared telemetry segment"""
+
+    def test_round_trip(self):
+        """Test a written frame is read back intact"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "linux-armoury", "telemetry")
+            writer = TelemetryShmWriter(path)
+            reader = TelemetryShmReader(path)
+            assert reader.read() is None
+
+            writer.write(
+                TelemetryFrame(
+                    seq=7,
+                    timestamp=1234.5,
+                    cpu_usage=25.0,
+                    cpu_temp=61.5,
+                    gpu_temp=None,
+                    ram_used_mb=4096,
+                    ram_total_mb=16384,
+                    battery_percent=80,
+                    on_ac=True,
+                    fan_rpms=[2100, 2300],
+                )
+            )
+            frame = reader.read()
+            assert frame.seq == 7
+            assert frame.timestamp == 1234.5
+            assert frame.cpu_usage == pytest.approx(25.0)
+            assert frame.cpu_temp == pytest.approx(61.5)
+            assert frame.gpu_temp is None
+            assert frame.ram_total_mb == 16384
+            assert frame.battery_percent == 80
+            assert frame.on_ac is True
+            assert frame.fan_rpms == [2100, 2300]
+
+            reader.close()
+            writer.close()
+            assert not os.path.exists(path)
+
+    def test_missing_values_round_trip(self):
+        """Test unknown battery/AC values stay unknown"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "telemetry")
+            writer = TelemetryShmWriter(path)
+            writer.write(TelemetryFrame(seq=1, timestamp=1.0))
+            frame = TelemetryShmReader(path).read()
+            assert frame.battery_percent is None
+            assert frame.on_ac is None
+            assert frame.fan_rpms == []
+            writer.close()
+
+    def test_reader_rejects_torn_frame(self, monkeypatch):
+        """Test a frame caught mid-write (odd sequence) is not returned"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "telemetry")
+            writer = TelemetryShmWriter(path)
+            writer.write(TelemetryFrame(seq=1, timestamp=1.0))
+            struct.pack_into(SEQ_FORMAT, writer._map, SEQ_OFFSET, 3)
+            monkeypatch.setattr(telemetry_shm, "READ_RETRIES", 3)
+            assert TelemetryShmReader(path).read() is None
+            writer.close()
+
+    def test_reader_rejects_foreign_file(self):
+        """Test mapping a file with the wrong magic fails"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "telemetry")
+            with open(path, "wb") as f:
+                f.write(b"\0" * telemetry_shm.SEGMENT_SIZE)
+            with pytest.raises(ValueError):
+                TelemetryShmReader(path)
+
+    def test_exporter_publishes_sampler_frames(self):
+        """Test the exporter mirrors every sampler tick into the segment"""
+
+        def sample_cpu(frame):
+            frame.cpu_usage = 33.0
+
+        sampler = TelemetrySampler(interval=60, sources={"cpu": sample_cpu})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "telemetry")
+            exporter = TelemetryExporter(path, sampler)
+            assert exporter.start()
+            sampler.sample_once()
+            frame = TelemetryShmReader(path).read()
+            assert frame is not None
+            assert frame.cpu_usage == pytest.approx(33.0)
+            exporter.stop()
+            assert not exporter.is_active
+            assert sampler.consumers == 0
+
+    def test_exporter_samples_only_with_readers(self):
+        """Test the sampler runs only while a reader is attached"""
+        sampler = TelemetrySampler(interval=60, sources={})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "telemetry")
+            exporter = TelemetryExporter(path, sampler)
+            assert exporter.start()
+            exporter.check_readers()
+            assert sampler.consumers == 0
+
+            reader = TelemetryShmReader(path)
+            exporter.check_readers()
+            assert exporter.is_sampling
+            assert sampler.consumers == 1
+
+            reader.close()
+            exporter.check_readers()
+            assert not exporter.is_sampling
+            assert sampler.consumers == 0
+            exporter.stop()
+
+    def test_default_path_is_service_runtime_dir(self):
+        """Test readers look where the system service publishes"""
+        assert telemetry_shm.default_shm_path() == "/run/linux-armoury/telemetry"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tool_registry.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules.tool_registry import ToolRegistry
+
+
+def make_tool(directory, name):
+    """Create an executable stub in a directory"""
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write("#!/bin/sh\n")
+    os.chmod(path, 0o755)
+    return path
+
+
+class TestToolRegistry:
+    """Test cached tool lookups"""
+
+    @pytest.fixture
+    def bin_dir(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setenv("PATH", tmpdir)
+            yield tmpdir
+
+    def test_finds_installed_tool(self, bin_dir):
+        """Test that an executable on PATH is resolved"""
+        path = make_tool(bin_dir, "asusctl")
+        registry = ToolRegistry()
+        assert registry.which("asusctl") == path
+        assert registry.has("asusctl")
+        assert not registry.has("supergfxctl")
+
+    def test_lookup_is_cached(self, bin_dir, monkeypatch):
+        """Test that PATH is only walked once for a resolved tool"""
+        make_tool(bin_dir, "ryzenadj")
+        registry = ToolRegistry()
+        registry.which("ryzenadj")
+
+        calls = []
+        original = registry._lookup
+        monkeypatch.setattr(
+            registry, "_lookup", lambda *a: calls.append(a) or original(*a)
+        )
+        for _ in range(5):
+            assert registry.has("ryzenadj")
+        assert calls == []
+
+    def test_revalidates_on_path_change(self, bin_dir, monkeypatch):
+        """Test that changing PATH drops cached results"""
+        registry = ToolRegistry()
+        assert not registry.has("sensors")
+        with tempfile.TemporaryDirectory() as other:
+            path = make_tool(other, "sensors")
+            monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{other}")
+            assert registry.which("sensors") == path
+
+    def test_revalidates_on_mtime_change(self, bin_dir):
+        """Test that a replaced or removed binary is looked up again"""
+        path = make_tool(bin_dir, "pwrcfg")
+        registry = ToolRegistry()
+        assert registry.has("pwrcfg")
+
+        os.utime(path, (0, 0))
+        assert registry.which("pwrcfg") == path
+        os.unlink(path)
+        assert not registry.has("pwrcfg")
+
+    def test_negative_result_expires(self, bin_dir):
+        """Test that a missing tool is re-checked after the negative TTL"""
+        registry = ToolRegistry(negative_ttl=60)
+        assert not registry.has("xrandr")
+        make_tool(bin_dir, "xrandr")
+        assert not registry.has("xrandr")  # still cached as missing
+
+        registry.invalidate("xrandr")
+        assert registry.has("xrandr")
+
+        expiring = ToolRegistry(negative_ttl=0)
+        assert not expiring.has("wlr-randr")
+        make_tool(bin_dir, "wlr-randr")
+        assert expiring.has("wlr-randr")
+
+    def test_resolve_all(self, bin_dir):
+        """Test resolving several tools at once"""
+        path = make_tool(bin_dir, "kscreen-doctor")
+        result = ToolRegistry().resolve_all(["kscreen-doctor", "nvidia-smi"])
+        assert result == {"kscreen-doctor": path, "nvidia-smi": None}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
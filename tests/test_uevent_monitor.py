@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for uevent_monitor.py
+"""
+
+import os
+import tempfile
+
+import pytest
+
+from linux_armoury.modules.uevent_monitor import (
+    PowerSupplyMonitor,
+    UeventListener,
+    parse_uevent,
+    read_ac_online,
+)
+
+AC_UNPLUG = (
+    b"change@/devices/LNXSYSTM:00/ACPI0003:00/power_supply/AC0\0"
+    b"ACTION=change\0"
+    b"DEVPATH=/devices/LNXSYSTM:00/ACPI0003:00/power_supply/AC0\0"
+    b"SUBSYSTEM=power_supply\0"
+    b"POWER_SUPPLY_NAME=AC0\0"
+    b"POWER_SUPPLY_TYPE=Mains\0"
+    b"POWER_SUPPLY_ONLINE=0\0"
+    b"SEQNUM=4242\0"
+)
+
+USB_ADD = (
+    b"add@/devices/pci0000:00/0000:00:14.0/usb1/1-2\0"
+    b"ACTION=add\0"
+    b"DEVPATH=/devices/pci0000:00/0000:00:14.0/usb1/1-2\0"
+    b"SUBSYSTEM=usb\0"
+)
+
+
+def write_supply(root, name, **attrs):
+    """Create a fake /sys/class/power_supply entry"""
+    path = os.path.join(root, name)
+    os.makedirs(path, exist_ok=True)
+    for attr, value in attrs.items():
+        with open(os.path.join(path, attr), "w") as f:
+            f.write(f"{value}\n")
+
+
+class TestParseUevent:
+    """Test kernel uevent parsing"""
+
+    def test_parse_power_supply_event(self):
+        """Test an AC unplug event is parsed into its keys"""
+        event = parse_uevent(AC_UNPLUG)
+        assert event is not None
+        assert event["ACTION"] == "change"
+        assert event["SUBSYSTEM"] == "power_supply"
+        assert event["POWER_SUPPLY_ONLINE"] == "0"
+        assert event["DEVPATH"].endswith("/AC0")
+
+    def test_ignores_udev_and_garbage(self):
+        """Test udev re-broadcasts and malformed datagrams are skipped"""
+        assert parse_uevent(b"libudev\0\xfe\xed\xca\xfe") is None
+        assert parse_uevent(b"") is None
+        assert parse_uevent(b"no-at-sign\0KEY=VALUE\0") is None
+
+
+class TestReadAcOnline:
+    """Test AC state detection from power_supply attributes"""
+
+    @pytest.fixture
+    def root(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield tmpdir
+
+    def test_mains_online(self, root):
+        """Test a Mains supply decides the AC state"""
+        write_supply(root, "BAT0", type="Battery", status="Not charging")
+        write_supply(root, "AC0", type="Mains", online=1)
+        assert read_ac_online(root) is True
+        write_supply(root, "AC0", type="Mains", online=0)
+        assert read_ac_online(root) is False
+
+    def test_usb_c_charger(self, root):
+        """Test any online AC-type supply counts, e.g. a USB-C charger"""
+        write_supply(root, "AC0", type="Mains", online=0)
+        write_supply(root, "ucsi-source-psy-USBC000:001", type="USB", online=1)
+        assert read_ac_online(root) is True
+
+    def test_no_ac_supply(self, root):
+        """Test None is returned when there is no AC-type supply"""
+        write_supply(root, "BAT0", type="Battery", status="Discharging")
+        assert read_ac_online(root) is None
+        assert read_ac_online(os.path.join(root, "missing")) is None
+
+
+class TestPowerSupplyMonitor:
+    """Test event-driven AC switching with injected uevents"""
+
+    def test_injected_event_fires_callback(self):
+        """Test a power_supply uevent re-reads the state and notifies"""
+        with tempfile.TemporaryDirectory() as root:
+            write_supply(root, "AC0", type="Mains", online=1)
+            monitor = PowerSupplyMonitor(root)
+            changes = []
+            monitor.add_callback(changes.append)
+            assert monitor.refresh() is True
+
+            listener = UeventListener(monitor.handle_event, ["power_supply"])
+            write_supply(root, "AC0", type="Mains", online=0)
+            listener.handle(USB_ADD)  # Filtered out by subsystem
+            assert changes == [True]
+            listener.handle(AC_UNPLUG)
+            assert changes == [True, False]
+
+            # Repeated events without a change don't re-notify
+            listener.handle(AC_UNPLUG)
+            assert changes == [True, False]
+
+    def test_lost_events_resync(self):
+        """Test a dropped-events notification triggers a re-read"""
+        with tempfile.TemporaryDirectory() as root:
+            write_supply(root, "AC0", type="Mains", online=0)
+            monitor = PowerSupplyMonitor(root)
+            changes = []
+            monitor.add_callback(changes.append)
+            monitor.handle_event(None)
+            assert changes == [False]
+
+    def test_polling_fallback(self):
+        """Test on_ac re-reads sysfs when no listener is running"""
+        with tempfile.TemporaryDirectory() as root:
+            write_supply(root, "AC0", type="Mains", online=1)
+            monitor = PowerSupplyMonitor(root)
+            assert not monitor.is_event_driven
+            assert monitor.on_ac is True
+            write_supply(root, "AC0", type="Mains", online=0)
+            assert monitor.on_ac is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])